@@ -1 +1,5 @@
-from .artus_api_new import ArtusAPI_V2
\ No newline at end of file
+from .artus_api_new import ArtusAPI_V2
+from .async_artus_api import AsyncArtusAPI
+from .hand_group import HandGroup
+from .trajectory import Trajectory, TrajectoryPlayer
+from .pose_library import PoseLibrary
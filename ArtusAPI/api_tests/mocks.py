@@ -84,3 +84,35 @@ def build_api(
             **kwargs,
         )
     return api, comm
+
+
+class FakeClock:
+    """Manually advanced clock for code that takes ``clock`` and ``sleep`` callables.
+
+    Calling the instance returns ``now``; tests move time by assigning or
+    incrementing ``now``. ``sleep`` records the requested duration and moves
+    time forward by it plus ``oversleep``, to mimic late wake-ups.
+
+    Attributes:
+        now: Current time in seconds.
+        oversleep: Extra seconds added to every ``sleep``.
+        sleeps: Durations passed to ``sleep``, in order.
+    """
+
+    def __init__(self, now: float = 0.0, oversleep: float = 0.0):
+        """Starts the clock.
+
+        Args:
+            now: Initial time in seconds.
+            oversleep: Extra seconds added to every ``sleep``.
+        """
+        self.now = now
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
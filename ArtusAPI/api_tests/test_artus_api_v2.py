@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import struct
 import unittest
+
+import numpy as np
 from unittest.mock import MagicMock, patch
 
 from ArtusAPI.api_tests.mocks import build_api, make_communication_mock, patched_artus_api_v2_constructor
@@ -122,6 +124,16 @@ class TestArtusAPIV2Mocked(unittest.TestCase):
         sid = api.get_joint_angles(start_reg=reg)
         self.assertEqual(sid, 3)
 
+    def test_get_joint_angles_without_force_sensors_raises(self):
+        """Verifies reading fingertip forces on a robot without sensors raises instead of sending a 0-register read."""
+        comm = MagicMock()
+        api, comm = build_api(robot_type="artus_lite", hand_type="left", communication_mock=comm)
+        api.awake = True
+        reg = ModbusMap().modbus_reg_map["feedback_force_sensor_start_reg"]
+        with self.assertRaises(ValueError):
+            api.get_joint_angles(start_reg=reg)
+        comm.receive_data.assert_not_called()
+
     def test_helper_fill_dict_from_feedback(self):
         """Verifies helper_fill_dict_from_feedback_data maps feedback values to joint names in order."""
         api, _ = build_api()
@@ -222,12 +234,15 @@ class TestArtusAPIV2Mocked(unittest.TestCase):
         api.calibrate(joint=0)
         comm.send_data.assert_called()
 
-    def test_get_hand_feedback_data_patched(self):
-        """Verifies get_hand_feedback_data succeeds with get_joint_angles patched, for a lite hand."""
-        api, _ = build_api(robot_type="artus_lite", hand_type="left")
+    def test_get_hand_feedback_data_lite(self):
+        """Verifies get_hand_feedback_data returns a truthy snapshot for a lite hand."""
+        comm = MagicMock()
+        comm.receive_data.side_effect = lambda amount_dat, start: [0] * amount_dat
+        api, comm = build_api(robot_type="artus_lite", hand_type="left", communication_mock=comm)
         api.awake = True
-        with patch.object(api, "get_joint_angles", return_value={}):
-            self.assertTrue(api.get_hand_feedback_data())
+        snapshot = api.get_hand_feedback_data()
+        self.assertTrue(snapshot)
+        self.assertEqual(set(snapshot), {"timestamp", "status", "position", "force", "velocity"})
 
     def test_get_config_writes_wifi_and_reads_ip(self):
         """Verifies get_config sends a trigger and payload write for each of SSID and password."""
@@ -254,13 +269,52 @@ class TestArtusAPIV2Mocked(unittest.TestCase):
         # odd-length strings are zero-padded to fill the last register
         self.assertEqual(api.string_to_registers("A"), [0x4100])
 
-    def test_get_hand_feedback_data_talos_with_force_patch(self):
-        """Verifies get_hand_feedback_data succeeds for a talos hand with angles and fingertip forces patched."""
-        api, _ = build_api(robot_type="artus_talos", hand_type="left")
+    def test_get_hand_feedback_data_talos_includes_fingertip_forces(self):
+        """Verifies get_hand_feedback_data decodes every talos feedback type, fingertip forces included."""
+        comm = MagicMock()
+        comm.receive_data.side_effect = lambda amount_dat, start: [0] * amount_dat
+        api, comm = build_api(robot_type="artus_talos", hand_type="left", communication_mock=comm)
         api.awake = True
-        with patch.object(api, "get_joint_angles", return_value={}):
-            with patch.object(api, "get_fingertip_forces", return_value={}):
-                self.assertTrue(api.get_hand_feedback_data())
+        snapshot = api.get_hand_feedback_data()
+        self.assertTrue(snapshot)
+        self.assertEqual(set(snapshot["fingertip_forces"]), set(api._robot_handler.robot.force_sensors))
+        self.assertEqual(len(snapshot["temperature"]), 6)
+
+    def test_get_hand_feedback_data_coalesces_reads(self):
+        """Verifies get_hand_feedback_data plans contiguous reads of at most 125 registers."""
+        comm = MagicMock()
+        comm.receive_data.side_effect = lambda amount_dat, start: [0] * amount_dat
+        api, comm = build_api(robot_type="artus_dex", hand_type="left", communication_mock=comm)
+        api.awake = True
+        api.get_hand_feedback_data()
+        reads = [(c.kwargs["start"], c.kwargs["amount_dat"]) for c in comm.receive_data.call_args_list]
+        # status+position+force, velocity+temperature, voltage
+        self.assertEqual(reads, [(200, 86), (350, 59), (1000, 2)])
+        self.assertTrue(all(count <= 125 for _, count in reads))
+
+    def test_get_hand_feedback_data_decodes_each_field(self):
+        """Verifies fields are sliced out of a shared read buffer and mirrored into hand_joints."""
+        regs = ModbusMap().modbus_reg_map
+        bank = {}
+        bank[regs["feedback_register"]] = 0x21
+        bank[regs["feedback_position_start_reg"]] = (10 << 8) | 20  # thumb_spread=10, thumb_flex=20
+        w0, w1 = struct.unpack("<HH", struct.pack("<f", 1.5))
+        bank[regs["feedback_force_start_reg"]] = w0
+        bank[regs["feedback_force_start_reg"] + 1] = w1
+        bank[regs["feedback_velocity_start_reg"]] = 0xFFFF  # -1
+        comm = MagicMock()
+        comm.receive_data.side_effect = lambda amount_dat, start: [bank.get(start + i, 0) for i in range(amount_dat)]
+        api, comm = build_api(robot_type="artus_lite", hand_type="left", communication_mock=comm)
+        api.awake = True
+        snapshot = api.get_hand_feedback_data()
+        self.assertEqual(snapshot["status"], 0x21)
+        self.assertEqual(snapshot["position"]["thumb_spread"], 10)
+        self.assertEqual(snapshot["position"]["thumb_flex"], 20)
+        self.assertAlmostEqual(snapshot["force"]["thumb_spread"], 1.5)
+        self.assertEqual(snapshot["velocity"]["thumb_spread"], -1)
+        joints = api._robot_handler.robot.hand_joints
+        self.assertEqual(joints["thumb_flex"].feedback_angle, 20)
+        self.assertEqual(joints["thumb_spread"].feedback_velocity, -1)
 
     def test_set_get_joint_angles_sends_fc17_request(self):
         """Verifies set_get_joint_angles issues one send_receive_data call with matching read/write args."""
@@ -338,6 +392,85 @@ class TestArtusAPIV2Mocked(unittest.TestCase):
             self.assertIsNone(api.set_get_joint_angles({"thumb_spread": {"target_angle": 5}}))
         comm.send_receive_data.assert_not_called()
 
+    def test_set_joint_targets_matches_dict_api(self):
+        """Verifies an array setpoint sends the same position words as the equivalent name-keyed dict."""
+        angles = np.arange(16) * 3.0
+        api, comm = build_api()
+        api.awake = True
+        api.last_time = 0.0
+        self.assertTrue(api.set_joint_angles({name: {"target_angle": a} for name, a in zip(api._robot_handler.robot.joint_names, angles)}))
+        dict_cmd = comm.send_data.call_args[0][0]
+        api, comm = build_api()
+        api.awake = True
+        api.last_time = 0.0
+        self.assertTrue(api.set_joint_targets(positions=angles))
+        self.assertEqual(comm.send_data.call_args[0], (dict_cmd, CommandType.TARGET_COMMAND.value))
+
+    def test_set_joint_targets_streaming_posts_without_dicts(self):
+        """Verifies array setpoints are posted to the streamer and never go through the dict setters."""
+        api, comm = build_api()
+        api.awake = True
+        api.control_type = api.control_types["velocity"]
+        api._streamer = MagicMock()
+        api._streamer.is_streaming.return_value = True
+        with patch.object(api._robot_handler, "set_joint_angles", side_effect=AssertionError("dict path used")):
+            self.assertTrue(api.set_joint_targets(velocities=np.full(16, 50), forces=np.full(16, 1.5)))
+        posted = [c.args[0][0] for c in api._streamer.post.call_args_list]
+        self.assertEqual(posted, [ModbusMap().modbus_reg_map["target_velocity_start_reg"],
+                                  ModbusMap().modbus_reg_map["target_force_start_reg"]])
+        comm.send_data.assert_not_called()
+
+    def test_set_joint_targets_rejects_wrong_length(self):
+        """Verifies a setpoint array of the wrong length raises and nothing is sent."""
+        api, comm = build_api()
+        api.awake = True
+        with self.assertRaises(ValueError):
+            api.set_joint_targets(positions=np.zeros(5))
+        self.assertFalse(api.set_joint_targets())
+        comm.send_data.assert_not_called()
+
+    def test_get_joint_feedback_array(self):
+        """Verifies feedback comes back as a float64 array in joint index order."""
+        api, comm = build_api()
+        api.awake = True
+        comm.receive_data.return_value = [0x0102] * 8
+        feedback = api.get_joint_feedback_array()
+        comm.receive_data.assert_called_with(amount_dat=8, start=ModbusMap().modbus_reg_map["feedback_position_start_reg"])
+        self.assertEqual(feedback.dtype, np.float64)
+        np.testing.assert_array_equal(feedback, [1, 2] * 8)
+        feedback[0] = 99
+        self.assertEqual(api._robot_handler.robot.hand_joints["thumb_spread"].feedback_angle, 1)
+        with self.assertRaises(ValueError):
+            api.get_joint_feedback_array("feedback_voltage_start_reg")
+
+
+    def test_combined_targets_merge_blocks_into_one_write(self):
+        """Verifies velocity and force targets go out as one write and one send slot in velocity control."""
+        api, comm = build_api()
+        api.awake = True
+        api.control_type = 2
+        api.combined_targets = True
+        with patch.object(api, "wait_for_com_freq") as wait:
+            api.set_joint_targets(velocities=np.full(16, 40.0), forces=np.full(16, 1.5))
+        comm.send_data.assert_called_once()
+        command = comm.send_data.call_args.args[0]
+        velocity_start = ModbusMap().modbus_reg_map["target_velocity_start_reg"]
+        force_start = ModbusMap().modbus_reg_map["target_force_start_reg"]
+        self.assertEqual(command[0], force_start)
+        self.assertEqual(command[1 + velocity_start - force_start:], [40] * 16)
+        self.assertEqual(wait.call_count, 1)
+
+    def test_combined_targets_split_when_span_exceeds_pdu(self):
+        """Verifies position, force and velocity (165 registers) need two writes in position control."""
+        api, comm = build_api()
+        api.awake = True
+        api.combined_targets = True
+        api.set_joint_targets(positions=np.zeros(16), velocities=np.full(16, 40.0), forces=np.full(16, 1.5))
+        starts = [c.args[0][0] for c in comm.send_data.call_args_list]
+        self.assertEqual(starts, [ModbusMap().modbus_reg_map["target_position_start_reg"],
+                                  ModbusMap().modbus_reg_map["target_velocity_start_reg"]])
+        self.assertTrue(all(len(c.args[0]) - 1 <= 123 for c in comm.send_data.call_args_list))
+
 
 if __name__ == "__main__":
     unittest.main()
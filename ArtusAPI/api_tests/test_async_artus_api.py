@@ -0,0 +1,212 @@
+"""Tests for AsyncArtusAPI and the asyncio transports (no hardware)."""
+
+import asyncio
+import struct
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from ArtusAPI.async_artus_api import AsyncArtusAPI
+from ArtusAPI.common.ModbusMap import CommandType, ModbusMap
+from ArtusAPI.communication.async_communication import AsyncNewCommunication
+from ArtusAPI.communication.new_communication import ActuatorState
+from ArtusAPI.pose_library import PoseLibrary
+
+
+def make_async_communication_mock() -> MagicMock:
+    """Builds a mock standing in for AsyncNewCommunication.
+
+    Returns:
+        A MagicMock whose bus methods are AsyncMocks with sane defaults.
+    """
+    m = MagicMock()
+    m.open_connection = AsyncMock()
+    m.close_connection = MagicMock()
+    m.send_data = AsyncMock(return_value=True)
+    m.receive_data = AsyncMock(return_value=0)
+    m.send_receive_data = AsyncMock(return_value=0)
+    m.wait_for_ready = AsyncMock(return_value=ActuatorState.ACTUATOR_IDLE.value)
+    m._check_robot_state = AsyncMock(return_value=ActuatorState.ACTUATOR_IDLE.value)
+    return m
+
+
+def build_async_api(robot_type="artus_lite", hand_type="left", comm=None, **kwargs):
+    """Constructs AsyncArtusAPI with AsyncNewCommunication mocked.
+
+    Returns:
+        A tuple of (AsyncArtusAPI instance, communication mock).
+    """
+    comm = comm or make_async_communication_mock()
+    with patch("ArtusAPI.async_artus_api.AsyncNewCommunication", return_value=comm):
+        api = AsyncArtusAPI(robot_type=robot_type, hand_type=hand_type,
+                            communication_channel_identifier="MOCK", **kwargs)
+    return api, comm
+
+
+class TestAsyncArtusAPI(unittest.IsolatedAsyncioTestCase):
+    """Verifies AsyncArtusAPI mirrors ArtusAPI_V2 on top of awaitable transports."""
+
+    async def test_async_context_manager_connects_and_disconnects(self):
+        """Verifies ``async with`` opens and closes the transport."""
+        api, comm = build_async_api()
+        async with api as hand:
+            self.assertIs(hand, api)
+            comm.open_connection.assert_awaited_once()
+        comm.close_connection.assert_called_once()
+
+    async def test_wake_up_sets_awake_when_ready(self):
+        """Verifies wake_up sends the start command and marks the hand awake."""
+        api, comm = build_async_api()
+        await api.wake_up()
+        comm.send_data.assert_awaited_once()
+        self.assertTrue(api.awake)
+
+    async def test_set_joint_angles_sends_position_command(self):
+        """Verifies set_joint_angles awaits one position block write."""
+        api, comm = build_async_api()
+        api.last_time = 0.0
+        ok = await api.set_joint_angles({"thumb_spread": {"target_angle": 10}})
+        self.assertTrue(ok)
+        cmd, command_type = comm.send_data.await_args.args
+        self.assertEqual(cmd[0], ModbusMap().modbus_reg_map["target_position_start_reg"])
+        self.assertEqual(command_type, CommandType.TARGET_COMMAND.value)
+
+    async def test_set_joint_targets_and_feedback_array(self):
+        """Verifies the array setpoint and feedback entry points mirror ArtusAPI_V2."""
+        api, comm = build_async_api()
+        api.last_time = 0.0
+        self.assertTrue(await api.set_joint_targets(positions=np.zeros(16)))
+        cmd, _ = comm.send_data.await_args.args
+        self.assertEqual(cmd, [ModbusMap().modbus_reg_map["target_position_start_reg"]] + [0] * 8)
+        comm.receive_data.return_value = [5, 0] * 16
+        speeds = await api.get_joint_feedback_array("feedback_velocity_start_reg")
+        np.testing.assert_array_equal(speeds, [5, 0] * 8)
+
+    async def test_execute_pose_sends_compiled_frames(self):
+        """Verifies a PoseLibrary pose goes out as its prebuilt frames."""
+        api, comm = build_async_api(robot_type="artus_lite")
+        api.last_time = 0.0
+        library = PoseLibrary()
+        library.add("flex", {"index_flex": {"index": 5, "target_angle": 30}})
+        self.assertTrue(await library.execute(api, "flex"))
+        frames = [c.args[0] for c in comm.send_data.await_args_list]
+        self.assertEqual(frames, list(library.compiled_pose(api, "flex").frames.values()))
+
+    async def test_pacing_awaits_instead_of_blocking(self):
+        """Verifies back-to-back commands yield to the loop via asyncio.sleep."""
+        api, comm = build_async_api(communication_frequency=20)
+        with patch("ArtusAPI.async_artus_api.asyncio.sleep", new=AsyncMock()) as sleep:
+            await api.set_joint_angles({"thumb_spread": {"target_angle": 10}})
+            await api.set_joint_angles({"thumb_spread": {"target_angle": 20}})
+        self.assertEqual(sleep.await_count, 2)
+        first, second = (c.args[0] for c in sleep.await_args_list)
+        self.assertLessEqual(first, 0.05)
+        # the patched sleep does not advance the clock: the second slot is one period after the first deadline
+        self.assertAlmostEqual(second - first, 0.05, delta=0.01)
+
+    async def test_get_voltage(self):
+        """Verifies get_voltage decodes a two-register float."""
+        w0, w1 = struct.unpack("<HH", struct.pack("<f", 12.5))
+        api, comm = build_async_api()
+        comm.receive_data.return_value = [w0, w1]
+        self.assertAlmostEqual(await api.get_voltage(), 12.5, places=4)
+
+    async def test_get_hand_feedback_data_coalesces_reads(self):
+        """Verifies the snapshot uses the same planned reads as ArtusAPI_V2."""
+        api, comm = build_async_api(robot_type="artus_dex")
+        comm.receive_data.side_effect = lambda amount_dat, start: [0] * amount_dat
+        snapshot = await api.get_hand_feedback_data()
+        reads = [(c.kwargs["start"], c.kwargs["amount_dat"]) for c in comm.receive_data.await_args_list]
+        self.assertEqual(reads, [(200, 86), (350, 59), (1000, 2)])
+        self.assertIn("timestamp", snapshot)
+        self.assertEqual(len(snapshot["position"]), 18)
+
+    async def test_set_get_joint_angles_uses_fc17(self):
+        """Verifies set_get_joint_angles awaits one send_receive_data call."""
+        api, comm = build_async_api()
+        comm.send_receive_data.return_value = [0] * 8
+        out = await api.set_get_joint_angles({"thumb_spread": {"target_angle": 5}})
+        read_start, read_count, write_start, values = comm.send_receive_data.await_args.args
+        self.assertEqual(read_start, ModbusMap().modbus_reg_map["feedback_position_start_reg"])
+        self.assertEqual(read_count, 8)
+        self.assertEqual(len(values), 8)
+        self.assertEqual(len(out), 16)
+
+    async def test_two_hands_share_one_loop(self):
+        """Verifies a slow read on one hand does not block the other hand's reads."""
+        right_done = asyncio.Event()
+        left_comm = make_async_communication_mock()
+        right_comm = make_async_communication_mock()
+
+        async def left_receive(amount_dat, start):
+            # only completes once the right hand has been served meanwhile
+            await asyncio.wait_for(right_done.wait(), timeout=1)
+            return [0] * amount_dat
+
+        async def right_receive(amount_dat, start):
+            right_done.set()
+            return [0] * amount_dat
+
+        left_comm.receive_data.side_effect = left_receive
+        right_comm.receive_data.side_effect = right_receive
+        left, _ = build_async_api(comm=left_comm)
+        right, _ = build_async_api(hand_type="right", comm=right_comm)
+        left_angles, right_angles = await asyncio.gather(left.get_joint_angles(), right.get_joint_angles())
+        self.assertEqual(len(left_angles), 16)
+        self.assertEqual(len(right_angles), 16)
+
+
+class TestAsyncNewCommunication(unittest.IsolatedAsyncioTestCase):
+    """Verifies AsyncNewCommunication delegates to a mocked async transport."""
+
+    def _make_nc(self, transport):
+        """Builds an AsyncNewCommunication wired to ``transport``."""
+        with patch("ArtusAPI.communication.async_communication.AsyncRS485_RTU", return_value=transport):
+            return AsyncNewCommunication(port="MOCK")
+
+    async def test_receive_data_delegates(self):
+        """Verifies receive_data awaits the transport with [start, count]."""
+        transport = MagicMock()
+        transport.receive = AsyncMock(return_value=[1, 2])
+        nc = self._make_nc(transport)
+        self.assertEqual(await nc.receive_data(amount_dat=2, start=201), [1, 2])
+        transport.receive.assert_awaited_once_with([201, 2])
+
+    async def test_transactions_are_serialized(self):
+        """Verifies concurrent tasks never overlap inside the transport."""
+        in_flight = 0
+        peak = 0
+
+        async def receive(data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 0
+
+        transport = MagicMock()
+        transport.receive = AsyncMock(side_effect=receive)
+        nc = self._make_nc(transport)
+        await asyncio.gather(*(nc.receive_data() for _ in range(5)))
+        self.assertEqual(peak, 1)
+
+    async def test_wait_for_ready_returns_on_acceptable_state(self):
+        """Verifies wait_for_ready polls until an acceptable state is reported."""
+        transport = MagicMock()
+        transport.receive = AsyncMock(side_effect=[ActuatorState.ACTUATOR_BUSY.value,
+                                                   ActuatorState.ACTUATOR_READY.value])
+        nc = self._make_nc(transport)
+        result = await nc.wait_for_ready(timeout=1, poll_interval=0)
+        self.assertEqual(result, ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual(nc.ntrips, 2)
+
+    async def test_unknown_method_raises(self):
+        """Verifies an unknown communication method is rejected."""
+        with self.assertRaises(ValueError):
+            AsyncNewCommunication(port="MOCK", communication_method="CAN")
+
+
+if __name__ == "__main__":
+    unittest.main()
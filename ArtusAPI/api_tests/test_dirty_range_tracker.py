@@ -0,0 +1,213 @@
+"""Tests for DirtyRangeTracker and dirty-range target writes in NewCommunication."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from ArtusAPI.api_tests.mocks import FakeClock, build_api
+from ArtusAPI.common.ModbusMap import CommandType
+from ArtusAPI.common.register_layout import REGISTER_ADDRESSES
+from ArtusAPI.communication import DirtyRangeTracker
+from ArtusAPI.communication.new_communication import NewCommunication
+
+
+class TestDirtyRangeTracker(unittest.TestCase):
+    """Verifies writes are trimmed to the changed span, skipped or sent in full when due."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tracker = DirtyRangeTracker(refresh_interval=1.0, clock=self.clock)
+        self.frame = [1, 10, 11, 12, 13, 14, 15]
+        self.tracker.acknowledge(self.tracker.plan(self.frame))
+
+    def test_first_write_is_a_full_frame(self):
+        """Verifies an unknown block is written in full."""
+        self.assertEqual(self.tracker.plan([50, 1, 2, 3]), [50, 1, 2, 3])
+
+    def test_unchanged_frame_is_skipped(self):
+        """Verifies nothing is written when the hand already holds the targets."""
+        self.assertTrue(self.tracker.is_current(self.frame))
+        self.assertIsNone(self.tracker.plan(list(self.frame)))
+        self.assertEqual(self.tracker.get_stats()['skipped'], 1)
+        self.assertEqual(self.tracker.get_stats()['registers_saved'], 6)
+
+    def test_changed_registers_are_trimmed_to_one_span(self):
+        """Verifies the write covers the first to the last changed register only."""
+        self.assertEqual(self.tracker.plan([1, 10, 11, 99, 13, 98, 15]), [3, 99, 13, 98])
+        self.tracker.acknowledge([3, 99, 13, 98])
+        self.assertTrue(self.tracker.is_current([1, 10, 11, 99, 13, 98, 15]))
+        self.assertEqual(self.tracker.plan([1, 10, 11, 99, 13, 98, 0]), [6, 0])
+
+    def test_refresh_interval_forces_full_frame(self):
+        """Verifies a full frame goes out once the refresh interval has passed."""
+        self.clock.now = 1.0
+        self.assertFalse(self.tracker.is_current(self.frame))
+        self.assertEqual(self.tracker.plan(self.frame), self.frame)
+        self.tracker.acknowledge(self.frame)
+        self.assertIsNone(self.tracker.plan(self.frame))
+
+    def test_partial_writes_do_not_postpone_refresh(self):
+        """Verifies only full frames restart the refresh interval."""
+        self.clock.now = 0.6
+        self.tracker.acknowledge(self.tracker.plan([1, 10, 11, 12, 13, 14, 0]))
+        self.clock.now = 1.0
+        self.assertEqual(self.tracker.plan([1, 10, 11, 12, 13, 14, 0]), [1, 10, 11, 12, 13, 14, 0])
+
+    def test_merged_write_updates_every_block_it_spans(self):
+        """Verifies a write spanning several blocks updates each of them, so none looks current when stale."""
+        self.tracker.acknowledge([10, 1, 1])
+        self.tracker.acknowledge([1, 20, 21, 22, 23, 24, 25, 0, 0, 0, 2, 2])
+        self.assertFalse(self.tracker.is_current([10, 1, 1]))
+        self.assertTrue(self.tracker.is_current([10, 2, 2]))
+        self.assertTrue(self.tracker.is_current([1, 20, 21, 22, 23, 24, 25]))
+        self.tracker.acknowledge([10, 1, 1])
+        self.assertFalse(self.tracker.is_current([1, 20, 21, 22, 23, 24, 25, 0, 0, 0, 2, 2]))
+        self.tracker.fail([1, 20, 21, 22, 23, 24, 25, 0, 0, 0, 1, 1])
+        self.assertEqual(self.tracker.plan([10, 1, 1]), [10, 1, 1])
+
+    def test_merged_write_acknowledges_each_member(self):
+        """Verifies a merged write records its member blocks, not one block of the merged span."""
+        self.tracker.invalidate()
+        members = [[1, 20, 21], [6, 2, 2]]
+        self.tracker.acknowledge([1, 20, 21, 0, 0, 2, 2], members=members)
+        self.assertTrue(self.tracker.is_current([1, 20, 21]))
+        self.assertTrue(self.tracker.is_current([6, 2, 2]))
+        self.assertEqual(self.tracker.plan([6, 2, 3]), [7, 3])
+
+    def test_failed_write_forces_full_frame(self):
+        """Verifies a failed write makes the next write of the block a full frame."""
+        self.tracker.fail([3, 99])
+        self.assertEqual(self.tracker.plan(self.frame), self.frame)
+        self.tracker.invalidate()
+        self.assertFalse(self.tracker.is_current(self.frame))
+
+
+class TestDirtyRangeWrites(unittest.TestCase):
+    """Verifies NewCommunication and ArtusAPI_V2 only transmit changed target registers."""
+
+    def setUp(self):
+        self.transport = MagicMock()
+        self.transport.send.return_value = True
+        with patch("ArtusAPI.communication.new_communication.RS485_RTU", return_value=self.transport):
+            self.comm = NewCommunication(port="MOCK", communication_method="RS485_RTU")
+        self.comm.enable_dirty_range_writes(refresh_interval=60.0)
+        self.target = CommandType.TARGET_COMMAND.value
+
+    def sent(self):
+        return [c.args[0] for c in self.transport.send.call_args_list]
+
+    def test_send_data_writes_only_changes(self):
+        """Verifies repeated targets are skipped and changed ones trimmed."""
+        self.comm.send_data([1, 5, 6, 7, 8], self.target)
+        self.comm.send_data([1, 5, 6, 7, 8], self.target)
+        self.comm.send_data([1, 5, 9, 7, 8], self.target)
+        self.assertEqual(self.sent(), [[1, 5, 6, 7, 8], [2, 9]])
+        self.assertEqual(self.comm.get_dirty_range_stats()['partial_frames'], 1)
+
+    def test_setup_commands_and_errors_invalidate(self):
+        """Verifies setup commands, reconnections and failed writes force full frames."""
+        self.comm.send_data([1, 5, 6], self.target)
+        self.comm.send_data([2])  # e.g. reset
+        self.comm.send_data([1, 5, 6], self.target)
+        self.comm.open_connection()
+        self.comm.send_data([1, 5, 6], self.target)
+        self.transport.send.side_effect = ConnectionError
+        with self.assertRaises(ConnectionError):
+            self.comm.send_data([1, 5, 7], self.target)
+        self.transport.send.side_effect = None
+        self.comm.send_data([1, 5, 7], self.target)
+        self.assertEqual(self.sent(), [[1, 5, 6], [2], [1, 5, 6], [1, 5, 6], [2, 7], [1, 5, 7]])
+
+    def test_read_write_transactions_are_acknowledged(self):
+        """Verifies targets written through FC 0x17 count as held by the hand."""
+        self.transport.send_receive.return_value = [0]
+        self.comm.send_receive_data(201, 1, 1, [5, 6])
+        self.assertFalse(self.comm.needs_write([1, 5, 6]))
+        self.comm.send_data([1, 5, 6], self.target)
+        self.transport.send.assert_not_called()
+
+    def test_failed_batch_writes_are_not_acknowledged(self):
+        """Verifies sequential batch writes count as held only once they succeed."""
+        del self.transport.batch  # plain transport: batch_data runs the operations one by one
+        self.transport.send.side_effect = ConnectionError
+        with self.assertRaises(ConnectionError):
+            self.comm.batch_data([('write', 1, [5, 5, 5, 5])])
+        self.assertTrue(self.comm.needs_write([1, 5, 5, 5, 5]))
+        self.transport.send.side_effect = None
+        self.transport.send.return_value = False
+        self.comm.batch_data([('write', 1, [5, 5, 5, 5])])
+        self.assertTrue(self.comm.needs_write([1, 5, 5, 5, 5]))
+        self.transport.send.return_value = True
+        self.comm.batch_data([('write', 1, [5, 5, 5, 5])])
+        self.assertFalse(self.comm.needs_write([1, 5, 5, 5, 5]))
+
+    def test_failed_pipelined_batch_writes_are_not_acknowledged(self):
+        """Verifies a failed pipelined batch forgets every block and a refused write is not held."""
+        self.comm.send_data([1, 5, 5, 5, 5], self.target)
+        self.transport.batch.side_effect = ConnectionError
+        with self.assertRaises(ConnectionError):
+            self.comm.batch_data([('write', 1, [6, 6, 6, 6])])
+        self.assertTrue(self.comm.needs_write([1, 5, 5, 5, 5]))
+        self.transport.batch.side_effect = None
+        self.transport.batch.return_value = [False, [0]]
+        self.comm.batch_data([('write', 1, [6, 6, 6, 6]), ('read_write', 201, 1, 50, [7])])
+        self.assertTrue(self.comm.needs_write([1, 6, 6, 6, 6]))
+        self.assertFalse(self.comm.needs_write([50, 7]))
+
+    def test_api_combined_writes_keep_each_block_current(self):
+        """Verifies a merged velocity + force write does not leave the velocity block looking current."""
+        api, _ = build_api(communication_mock=self.comm)
+        api.awake = True
+        api.control_type = 2
+        slow, fast = np.full(16, 20.0), np.full(16, 60.0)
+        with patch.object(api, 'wait_for_com_freq'):
+            api.set_joint_targets(velocities=slow, forces=np.full(16, 1.0))
+            api.combined_targets = True
+            api.set_joint_targets(velocities=fast, forces=np.full(16, 2.0))
+            api.combined_targets = False
+            self.transport.send.reset_mock()
+            api.set_joint_targets(velocities=slow, forces=np.full(16, 2.0))
+        velocity_start = REGISTER_ADDRESSES['target_velocity_start_reg']
+        self.assertEqual([cmd[0] for cmd in self.sent()], [velocity_start])
+
+    def test_api_combined_unchanged_targets_spend_no_send_slot(self):
+        """Verifies resending the same targets with combined and dirty-range writes on costs no transaction."""
+        api, _ = build_api(communication_mock=self.comm)
+        api.awake = True
+        api.control_type = 3
+        api.combined_targets = True
+        targets = dict(positions=np.full(16, 10.0), velocities=np.full(16, 40.0), forces=np.full(16, 1.5))
+        with patch.object(api, 'wait_for_com_freq') as wait:
+            api.set_joint_targets(**targets)
+            self.assertEqual(self.transport.send.call_count, 2)  # position + force merged, velocity alone
+            self.transport.send.reset_mock()
+            wait.reset_mock()
+            api.set_joint_targets(**targets)
+        self.transport.send.assert_not_called()
+        wait.assert_not_called()
+
+    def test_disabled_by_default(self):
+        """Verifies every target command is written in full unless enabled."""
+        self.comm.disable_dirty_range_writes()
+        self.comm.send_data([1, 5, 6], self.target)
+        self.comm.send_data([1, 5, 6], self.target)
+        self.assertEqual(self.sent(), [[1, 5, 6], [1, 5, 6]])
+        self.assertTrue(self.comm.needs_write([1, 5, 6]))
+        self.assertIsNone(self.comm.get_dirty_range_stats())
+
+    def test_api_skips_send_slot_for_unchanged_blocks(self):
+        """Verifies set_joint_angles spends no send slot on a block the hand already holds."""
+        api, comm = build_api()
+        api.awake = True
+        api.control_type = 3
+        comm.needs_write.side_effect = lambda cmd: cmd[0] != 1  # position block unchanged
+        with patch.object(api, 'wait_for_com_freq') as wait:
+            api.set_joint_angles({'thumb_flex': {'target_angle': 0}})
+        sent = [c.args[0][0] for c in comm.send_data.call_args_list]
+        self.assertNotIn(1, sent)
+        self.assertEqual(wait.call_count, len(sent))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Tests for the shared-memory feedback ring and its writer in the API feedback path."""
+
+import multiprocessing
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from ArtusAPI.api_tests.mocks import build_api
+from ArtusAPI.communication.feedback_ring import FeedbackRing, record_dtype
+
+
+def read_latest_position(name, queue):
+    """Child-process reader: attaches to the ring and sends back the latest positions."""
+    with FeedbackRing.attach(name) as ring:
+        queue.put((ring.count, ring.latest()['position'].tolist()))
+
+
+class TestFeedbackRing(unittest.TestCase):
+    """Verifies record layout, wrap-around and torn-read rejection."""
+
+    def setUp(self):
+        self.ring = FeedbackRing.create(num_joints=4, num_fingertips=2, capacity=8)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def write(self, n):
+        self.ring.write(float(n), status=n, position=np.full(4, n), fingertip=np.full((2, 3), -n))
+
+    def test_latest_and_missing_fields(self):
+        """Verifies the latest record comes back and unset fields are NaN."""
+        self.assertIsNone(self.ring.latest())
+        self.write(1)
+        self.write(2)
+        record = self.ring.latest()
+        self.assertEqual((record['timestamp'], record['status'], record['sequence']), (2.0, 2, 4))
+        self.assertEqual(record['position'].tolist(), [2.0] * 4)
+        self.assertEqual(record['fingertip'].shape, (2, 3))
+        self.assertTrue(np.isnan(record['velocity']).all())
+        self.assertEqual(self.ring.dtype, record_dtype(4, 2))
+
+    def test_window_wraps_around(self):
+        """Verifies windows are oldest first and limited to the ring capacity."""
+        for n in range(20):
+            self.write(n)
+        self.assertEqual(len(self.ring), 8)
+        self.assertEqual(self.ring.window(3)['status'].tolist(), [17, 18, 19])
+        self.assertEqual(self.ring.window(100)['timestamp'].tolist(), [float(n) for n in range(12, 20)])
+
+    def test_read_since_returns_each_record_once(self):
+        """Verifies incremental reads return new records only."""
+        self.write(0)
+        records, count = self.ring.read_since(0)
+        self.assertEqual((len(records), count), (1, 1))
+        self.write(1)
+        self.write(2)
+        records, count = self.ring.read_since(count)
+        self.assertEqual((records['status'].tolist(), count), ([1, 2], 3))
+
+    def test_record_being_written_is_skipped(self):
+        """Verifies a record whose sequence is odd (mid-write) is not returned."""
+        self.write(0)
+        self.write(1)
+        self.ring.records[1]['sequence'] = 2 * 1 + 1
+        self.assertEqual(self.ring.window(2)['status'].tolist(), [0])
+        self.assertIsNone(self.ring.latest(retries=1))
+
+    def test_reader_in_another_process(self):
+        """Verifies a separate process attaches by name and reads the latest record."""
+        self.write(7)
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        process = context.Process(target=read_latest_position, args=(self.ring.name, queue))
+        process.start()
+        count, position = queue.get(timeout=20)
+        process.join(5)
+        self.assertEqual((count, position), (1, [7.0] * 4))
+        self.write(8)  # still mapped after the reader exited
+        self.assertEqual(self.ring.latest()['status'], 8)
+
+    def test_attach_rejects_foreign_block(self):
+        """Verifies attaching to a block that is not a ring fails."""
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(create=True, size=128)
+        try:
+            with self.assertRaises(ValueError):
+                FeedbackRing.attach(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+
+class TestApiFeedbackRing(unittest.TestCase):
+    """Verifies get_hand_feedback_data publishes to the ring."""
+
+    def test_snapshot_is_published(self):
+        """Verifies positions, fingertips and NaN for unreported feedback."""
+        comm = MagicMock()
+        comm.receive_data.side_effect = lambda amount_dat, start: [0] * amount_dat
+        api, _ = build_api(robot_type="artus_talos", hand_type="left", communication_mock=comm)
+        ring = api.enable_feedback_ring(capacity=4)
+        try:
+            reader = FeedbackRing.attach(ring.name)
+            snapshot = api.get_hand_feedback_data()
+            record = reader.latest()
+            self.assertEqual(record['timestamp'], snapshot['timestamp'])
+            self.assertEqual(record['position'].shape, (len(api._robot_handler.robot.joint_state),))
+            self.assertEqual(record['fingertip'].shape, (5, 3))
+            self.assertFalse(np.isnan(record['position']).any())
+            reader.close()
+        finally:
+            api.disable_feedback_ring()
+        self.assertIsNone(api._feedback_ring)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Tests for the hand broker: call forwarding, feedback fan-out and write arbitration."""
+
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+from multiprocessing import AuthenticationError
+
+from ArtusAPI.broker import BrokerClient, HandBroker
+
+
+class FakeHand:
+    """Records calls; ``gate`` can hold commands to queue several up."""
+
+    def __init__(self):
+        self.calls = []
+        self.feedback_reads = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def get_hand_feedback_data(self):
+        self.feedback_reads += 1
+        return {'status': 6, 'position': {'thumb_spread': 1.0}, 'timestamp': time.time()}
+
+    def set_joint_angles(self, joint_angles, injected_control_type=None):
+        self.gate.wait(2.0)
+        self.calls.append(('set_joint_angles', joint_angles))
+        return True
+
+    def get_robot_status(self):
+        self.calls.append(('get_robot_status',))
+        return 6
+
+    def calibrate(self, joint=0):
+        raise ValueError(f"joint {joint} is not calibratable")
+
+    def _private(self):
+        return 'secret'
+
+
+@unittest.skipIf(os.name == 'nt', "Unix socket tests")
+class TestHandBroker(unittest.TestCase):
+    """Runs a broker and clients over a Unix socket in one process."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.directory.name, 'broker.sock')
+        self.key_file = os.path.join(self.directory.name, 'broker.key')
+        self.hand = FakeHand()
+        self.clients = []
+        self.broker = None
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        if self.broker is not None:
+            self.broker.stop()
+        self.directory.cleanup()
+
+    def start(self, **kwargs):
+        self.broker = HandBroker(self.hand, address=self.address, authkey_file=self.key_file, **kwargs)
+        self.broker.start()
+
+    def connect(self, **kwargs):
+        kwargs.setdefault('authkey_file', self.key_file)
+        client = BrokerClient(self.address, timeout=2.0, **kwargs)
+        self.clients.append(client)
+        return client
+
+    def test_calls_are_forwarded(self):
+        """Verifies results and exceptions come back and private methods are refused."""
+        self.start(feedback_frequency=None)
+        client = self.connect()
+        self.assertTrue(client.set_joint_angles({'thumb_flex': {'target_angle': 10}}))
+        self.assertEqual(client.get_robot_status(), 6)
+        with self.assertRaisesRegex(ValueError, 'joint 3'):
+            client.calibrate(joint=3)
+        with self.assertRaises(AttributeError):
+            client.call('_private')
+        with self.assertRaises(AttributeError):
+            client.no_such_method()
+        self.assertEqual(self.hand.calls[0], ('set_joint_angles', {'thumb_flex': {'target_angle': 10}}))
+        self.assertEqual(self.broker.get_stats()['errors'], 1)
+
+    def test_feedback_read_once_and_fanned_out(self):
+        """Verifies every subscriber gets the same snapshots from a single read per cycle."""
+        self.start(feedback_frequency=50)
+        first, second = self.connect(), self.connect()
+        silent = self.connect(subscribe=False)
+        snapshot = first.wait_for_feedback(timeout=1.0)
+        self.assertIsNotNone(snapshot)
+        self.assertIsNotNone(second.wait_for_feedback(timeout=1.0))
+        time.sleep(0.1)
+        stats = self.broker.get_stats()
+        self.assertEqual(stats['clients'], 3)
+        self.assertEqual(self.hand.feedback_reads, stats['feedback_cycles'])
+        self.assertEqual(first.get_feedback()['position'], {'thumb_spread': 1.0})
+        self.assertIsNone(silent.get_feedback())
+
+    def test_higher_priority_holds_the_hand(self):
+        """Verifies lower-priority writes are rejected while a higher priority holds the hand."""
+        self.start(feedback_frequency=None, hold_time=0.2)
+        controller, gui = self.connect(priority=10), self.connect(priority=0)
+        controller.set_joint_angles({'a': 1})
+        with self.assertRaises(PermissionError):
+            gui.set_joint_angles({'a': 2})
+        self.assertEqual(gui.get_robot_status(), 6)  # reads are not arbitrated
+        time.sleep(0.25)
+        self.assertTrue(gui.set_joint_angles({'a': 3}))
+        self.assertTrue(controller.set_joint_angles({'a': 4}))  # higher priority takes over at once
+        self.assertEqual([call[1] for call in self.hand.calls if call[0] == 'set_joint_angles'],
+                         [{'a': 1}, {'a': 3}, {'a': 4}])
+        self.assertEqual(self.broker.get_stats()['rejected'], 1)
+
+    def test_queue_serves_higher_priority_first(self):
+        """Verifies queued commands run highest priority first."""
+        self.start(feedback_frequency=None, hold_time=0.0)
+        low, high = self.connect(priority=0), self.connect(priority=5)
+        self.hand.gate.clear()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(low.set_joint_angles({'first': 0})))]
+        threads[0].start()
+        time.sleep(0.1)  # the first call is now blocked inside the hand
+        for client, name in ((low, 'low'), (high, 'high')):
+            threads.append(threading.Thread(target=lambda c=client, n=name: results.append(c.set_joint_angles({n: 0}))))
+            threads[-1].start()
+            time.sleep(0.05)
+        self.hand.gate.set()
+        for thread in threads:
+            thread.join(2.0)
+        self.assertEqual([call[1] for call in self.hand.calls], [{'first': 0}, {'high': 0}, {'low': 0}])
+        self.assertEqual(results, [True] * 3)
+
+    def test_key_file_and_socket_are_private(self):
+        """Verifies the generated key and the socket are readable by the owner only, and bad keys are refused."""
+        self.start(feedback_frequency=None)
+        self.assertEqual(stat.S_IMODE(os.stat(self.key_file).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(self.address).st_mode), 0o600)
+        with self.assertRaises(AuthenticationError):
+            self.connect(authkey=b'guess')
+        self.assertEqual(self.connect().get_robot_status(), 6)
+        with self.assertRaises(ValueError):
+            HandBroker(self.hand, address=self.address, authkey=b'')
+
+    def test_live_socket_is_not_taken_over(self):
+        """Verifies a second broker refuses a live address but replaces a stale socket file."""
+        self.start(feedback_frequency=None)
+        with self.assertRaises(ConnectionError):
+            HandBroker(self.hand, address=self.address, authkey_file=self.key_file).start()
+        self.assertEqual(self.connect().get_robot_status(), 6)  # the probe did not disturb the first broker
+        self.broker.stop()
+        with open(self.address, 'w'):
+            pass  # socket file left behind by a crashed broker
+        self.start(feedback_frequency=None)
+        self.assertEqual(self.connect().get_robot_status(), 6)
+
+    def test_broker_stop_fails_pending_calls(self):
+        """Verifies clients see a ConnectionError once the broker goes away."""
+        self.start(feedback_frequency=None)
+        client = self.connect()
+        self.broker.stop()
+        client._receiver.join(1.0)
+        with self.assertRaises(ConnectionError):
+            client.get_robot_status()
+
+
+if __name__ == '__main__':
+    unittest.main()
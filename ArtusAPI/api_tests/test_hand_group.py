@@ -0,0 +1,89 @@
+"""Tests for HandGroup concurrent dispatch and skew reporting."""
+
+import time
+import unittest
+
+import numpy as np
+
+from ArtusAPI import HandGroup
+from ArtusAPI.api_tests.mocks import build_api, make_communication_mock
+
+TRANSACTION_TIME = 0.02
+
+
+def slow_communication_mock():
+    """Communication mock whose transactions take TRANSACTION_TIME seconds."""
+    comm = make_communication_mock()
+
+    def send_data(*args, **kwargs):
+        time.sleep(TRANSACTION_TIME)
+        return True
+
+    def receive_data(amount_dat=1, start=0):
+        time.sleep(TRANSACTION_TIME)
+        return [0] * amount_dat
+
+    comm.send_data.side_effect = send_data
+    comm.receive_data.side_effect = receive_data
+    return comm
+
+
+class TestHandGroup(unittest.TestCase):
+    """Verifies hands are driven concurrently and feedback comes back aligned."""
+
+    def setUp(self):
+        self.left, self.left_comm = build_api(hand_type='left', communication_mock=slow_communication_mock())
+        self.right, self.right_comm = build_api(hand_type='right', communication_mock=slow_communication_mock())
+        for api in (self.left, self.right):
+            api.awake = True
+            api.control_type = 3
+            api.last_time = time.perf_counter() - 1.0  # first send slot is free
+        self.group = HandGroup({'left': self.left, 'right': self.right})
+        self.addCleanup(self.group.close)
+
+    def test_setpoints_are_sent_concurrently(self):
+        """Verifies both hands transact in parallel rather than back to back."""
+        positions = np.zeros(16)
+        start = time.perf_counter()
+        results = self.group.set_joint_targets(positions={'left': positions, 'right': positions})
+        elapsed = time.perf_counter() - start
+        self.assertEqual(results, {'left': True, 'right': True})
+        self.left_comm.send_data.assert_called_once()
+        self.right_comm.send_data.assert_called_once()
+        self.assertLess(elapsed, 2 * TRANSACTION_TIME)
+        self.assertLess(self.group.last_skew, TRANSACTION_TIME / 2)
+
+    def test_only_named_hands_are_commanded(self):
+        """Verifies hands missing from the setpoints are left alone."""
+        results = self.group.set_joint_angles({'right': {'thumb_flex': {'index': 1, 'target_angle': 10}}})
+        self.assertEqual(list(results), ['right'])
+        self.left_comm.send_data.assert_not_called()
+        with self.assertRaises(KeyError):
+            self.group.set_joint_targets(positions={'middle': np.zeros(16)})
+
+    def test_feedback_snapshot_is_aligned(self):
+        """Verifies feedback from all hands is returned in one snapshot with its skew."""
+        snapshot = self.group.get_joint_feedback_array()
+        self.assertEqual(set(snapshot['hands']), {'left', 'right'})
+        self.assertEqual(snapshot['hands']['left'].shape, (16,))
+        self.assertLess(snapshot['skew'], TRANSACTION_TIME / 2)
+        self.assertAlmostEqual(snapshot['timestamp'], time.time(), delta=1.0)
+        stats = self.group.get_skew_stats()
+        self.assertEqual(stats['feedback']['count'], 1)
+        self.assertEqual(stats['last'], snapshot['skew'])
+
+    def test_error_is_raised_after_all_hands_finish(self):
+        """Verifies one failing hand does not abandon the others mid-call."""
+        self.left_comm.send_data.side_effect = ConnectionError("link down")
+        with self.assertRaises(ConnectionError):
+            self.group.set_joint_targets(positions={'left': np.zeros(16), 'right': np.zeros(16)})
+        self.right_comm.send_data.assert_called_once()
+
+    def test_empty_group_is_rejected(self):
+        """Verifies a group needs at least one hand."""
+        with self.assertRaises(ValueError):
+            HandGroup({})
+
+
+if __name__ == '__main__':
+    unittest.main()
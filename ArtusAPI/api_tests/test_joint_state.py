@@ -0,0 +1,96 @@
+"""Tests for the array-backed joint state behind BLDCRobot.hand_joints."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from ArtusAPI.commands.new_commands import NewCommands
+from ArtusAPI.robot import Robot
+from ArtusAPI.robot.bldc_robot.joint_state import HandJoints, JointState
+
+
+class TestJointState(unittest.TestCase):
+    """Verifies vectorized target writes, clamping, feedback and the dict view."""
+
+    def setUp(self):
+        """Builds a left ARTUS Lite (thumb_spread rotates -1)."""
+        self.robot = Robot(robot_type="artus_lite", hand_type="left", logger=logging.getLogger("test_joint_state")).robot
+        self.state = self.robot.joint_state
+
+    def test_hand_joints_is_a_view(self):
+        """Verifies hand_joints keeps the Joint attribute API and shares the arrays."""
+        self.assertIsInstance(self.robot.hand_joints, HandJoints)
+        self.assertIs(self.robot.hand_joints.state, self.state)
+        self.assertEqual(list(self.robot.hand_joints), self.robot.joint_names)
+        joint = self.robot.hand_joints["index_flex"]
+        self.assertEqual(joint.index, self.state.index_of["index_flex"])
+        self.assertEqual((joint.min_angle, joint.max_angle), (0, 90))
+        joint.target_angle = 30
+        self.assertEqual(self.state.target_angle[joint.index], 30)
+        self.assertIsNone(joint.target_velocity)
+        joint.target_force = None
+        self.assertIsNone(joint.target_force)
+
+    def test_set_by_index_order_independent(self):
+        """Verifies unsorted index dicts give the same targets as sorted ones, with rotation applied."""
+        self.robot.set_joint_angles({"b": {"index": 5, "target_angle": 45}, "a": {"index": 0, "target_angle": 10}})
+        self.assertEqual(self.robot.hand_joints["thumb_spread"].target_angle, -10)
+        self.assertEqual(self.robot.hand_joints["index_flex"].target_angle, 45)
+
+    def test_set_by_name_returns_control_bits_and_clamps(self):
+        """Verifies the control bitmask, skipping unknown names and one vectorized clamp."""
+        with self.assertLogs("test_joint_state", level="WARNING") as logs:
+            bits = self.robot.set_joint_angles_by_name({
+                "index_flex": {"target_angle": 200, "target_velocity": 100},
+                "middle_flex": {"target_angle": -5, "target_force": 2.5},
+                "not_a_joint": {"target_angle": 1},
+            })
+        self.assertEqual(bits, 0b111)
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(self.robot.hand_joints["index_flex"].target_angle, 90)
+        self.assertEqual(self.robot.hand_joints["middle_flex"].target_angle, 0)
+        self.assertEqual(self.robot.hand_joints["index_flex"].target_velocity, 100)
+        self.assertEqual(self.robot.hand_joints["middle_flex"].target_force, 2.5)
+
+    def test_set_joint_targets_arrays(self):
+        """Verifies whole-hand array targets apply rotation, clamp, and report the control bits."""
+        angles = np.full(16, 30.0)
+        angles[5] = 500
+        with self.assertLogs("test_joint_state", level="WARNING"):
+            bits = self.robot.set_joint_targets(positions=angles, forces=np.ones(16))
+        self.assertEqual(bits, 0b101)
+        self.assertEqual(self.robot.hand_joints["thumb_spread"].target_angle, -30)
+        self.assertEqual(self.robot.hand_joints["index_flex"].target_angle, 90)
+        self.assertIsNone(self.robot.hand_joints["index_flex"].target_velocity)
+        with self.assertRaises(ValueError):
+            self.state.set_target_array("target_velocity", np.zeros((2, 8)))
+
+    def test_feedback_written_to_arrays(self):
+        """Verifies feedback lands in the arrays and short packages are rejected like before."""
+        feedback = list(range(16))
+        self.assertEqual(self.robot.get_joint_angles(feedback, "feedback_position_start_reg"), feedback)
+        np.testing.assert_array_equal(self.state.feedback_angle, feedback)
+        self.assertEqual(self.robot.hand_joints["pinky_d2"].feedback_angle, 15)
+        self.assertIsNone(self.robot.get_joint_angles([1, 2], "feedback_velocity_start_reg"))
+
+    def test_packers_read_arrays(self):
+        """Verifies NewCommands packs the same words from HandJoints as from plain joint views."""
+        self.robot.set_joint_angles_by_name({"thumb_spread": {"target_angle": 20, "target_force": 3.0}})
+        commands = NewCommands(num_joints=16, logger=logging.getLogger("test_joint_state"))
+        plain = dict(self.robot.hand_joints)
+        for packer in (commands.get_target_position_command, commands.get_target_velocity_command,
+                       commands.get_target_force_command):
+            self.assertEqual(packer(self.robot.hand_joints), packer(plain))
+
+    def test_standalone_state(self):
+        """Verifies JointState can be used without a robot."""
+        state = JointState(["a", "b"], min_angles=[-10, 0], max_angles=[10, 5], rotation_directions=[1, -1])
+        state.set_targets("target_angle", [0, 1], [20, 3])
+        np.testing.assert_array_equal(state.clamp_target_angles(), [0, 1])
+        np.testing.assert_array_equal(state.target_angle, [10, 0])
+        self.assertEqual(state.targets_or_zero("target_velocity").tolist(), [0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for the Modbus TCP gateway in front of an RS485 transport."""
+
+import asyncio
+import os
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from pymodbus.exceptions import ModbusIOException
+
+from ArtusAPI.artus_api_new import ArtusAPI_V2
+from ArtusAPI.common.ModbusMap import ActuatorState, CommandType
+from ArtusAPI.common.register_layout import REGISTER_ADDRESSES as REG
+from ArtusAPI.communication import modbus_pdu
+from ArtusAPI.communication.Modbus_TCP.modbus_tcp import ModbusTCP
+from ArtusAPI.communication.RS485_RTU.rs485_rtu import RS485_RTU
+from ArtusAPI.gateway import ModbusTCPGateway
+from ArtusAPI.simulator import HandSimulator, RTUSimulatorServer
+
+
+def fake_transport(delay=0.0):
+    """Transport mock whose reads return the register addresses and take ``delay`` seconds."""
+    transport = MagicMock()
+
+    def receive(data):
+        time.sleep(delay)
+        return list(range(data[0], data[0] + data[1])) if data[1] > 1 else data[0]
+
+    transport.receive.side_effect = receive
+    transport.send.return_value = True
+    transport.send_receive.return_value = [42]
+    return transport
+
+
+class TestGatewayRequests(unittest.TestCase):
+    """Verifies request translation, caching and error responses without sockets."""
+
+    def setUp(self):
+        self.transport = fake_transport()
+        self.gateway = ModbusTCPGateway(self.transport, cache_ttl=10.0)
+
+    def request(self, pdu):
+        return asyncio.run(self.gateway.handle_pdu(pdu))
+
+    def test_reads_are_cached_until_a_write(self):
+        """Verifies repeat and enclosed reads hit the cache and writes invalidate it."""
+        self.assertEqual(modbus_pdu.parse_response(0x03, self.request(modbus_pdu.build_read_holding_registers(200, 4))),
+                         [200, 201, 202, 203])
+        self.assertEqual(modbus_pdu.parse_response(0x03, self.request(modbus_pdu.build_read_holding_registers(201, 2))),
+                         [201, 202])
+        self.assertEqual(self.transport.receive.call_count, 1)
+        self.request(modbus_pdu.build_write_multiple_registers(1, [5, 6]))
+        self.transport.send.assert_called_with([1, 5, 6], CommandType.TARGET_COMMAND.value)
+        self.request(modbus_pdu.build_read_holding_registers(200, 4))
+        self.assertEqual(self.transport.receive.call_count, 2)
+        self.assertEqual(self.gateway.get_stats()['cache_hits'], 1)
+
+    def test_single_register_writes(self):
+        """Verifies FC 0x06 to the command register is a setup command, elsewhere a target write."""
+        self.assertEqual(self.request(modbus_pdu.build_write_single_register(0, 0x0B03)),
+                         modbus_pdu.build_write_response(0x06, 0, 0x0B03))
+        self.transport.send.assert_called_with([0x0B03], CommandType.SETUP_COMMANDS.value)
+        self.request(modbus_pdu.build_write_single_register(150, 7))
+        self.transport.send.assert_called_with([150, 7], CommandType.TARGET_COMMAND.value)
+
+    def test_read_write(self):
+        """Verifies FC 0x17 goes upstream as send_receive."""
+        response = self.request(modbus_pdu.build_read_write_multiple_registers(1003, 1, 150, [7]))
+        self.assertEqual(modbus_pdu.parse_response(0x17, response), [42])
+        self.transport.send_receive.assert_called_with(1003, 1, 150, [7])
+
+    def test_errors_become_exception_responses(self):
+        """Verifies bad counts, unsupported functions and upstream failures are answered, not dropped."""
+        self.assertEqual(self.request(modbus_pdu.build_read_holding_registers(200, 1)[:3] + b'\x00\x00'),
+                         modbus_pdu.build_exception_response(0x03, 0x03))
+        self.assertEqual(self.request(b'\x2b\x0e\x01\x00'), modbus_pdu.build_exception_response(0x2b, 0x01))
+        self.transport.receive.side_effect = ModbusIOException("No response received")
+        self.assertEqual(self.request(modbus_pdu.build_read_holding_registers(500, 2)),
+                         modbus_pdu.build_exception_response(0x03, 0x0B))
+        self.assertEqual(self.gateway.get_stats()['errors'], 3)
+
+    def test_concurrent_identical_reads_share_one_transaction(self):
+        """Verifies reads waiting on the same registers are served by one upstream read."""
+        gateway = ModbusTCPGateway(fake_transport(delay=0.05), cache_ttl=0.0)
+        pdu = modbus_pdu.build_read_holding_registers(200, 8)
+
+        async def three_clients():
+            return await asyncio.gather(*(gateway.handle_pdu(pdu) for _ in range(3)))
+
+        responses = asyncio.run(three_clients())
+        self.assertEqual(len(set(responses)), 1)
+        self.assertEqual(gateway.get_stats()['upstream'], 1)
+        self.assertEqual(gateway.get_stats()['coalesced'], 2)
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "pseudo-terminals need POSIX")
+class TestGatewayEndToEnd(unittest.TestCase):
+    """Serves a simulated RTU hand to several Modbus TCP clients."""
+
+    def test_clients_share_one_rtu_hand(self):
+        """Verifies an ArtusAPI_V2 and a raw ModbusTCP client drive and read the same hand."""
+        sim = HandSimulator(robot_type="artus_lite", time_constant=0.01, transition_time=0.01)
+        with RTUSimulatorServer(sim) as rtu:
+            upstream = RS485_RTU(port=rtu.port, baudrate=115200, timeout=0.2, slave_address=sim.slave_address)
+            upstream.open()
+            self.addCleanup(upstream.close)
+            with ModbusTCPGateway(upstream, host='127.0.0.1', port=0) as gateway:
+                api = ArtusAPI_V2(communication_method="Modbus_TCP", communication_channel_identifier=gateway.address,
+                                  robot_type="artus_lite", hand_type="left")
+                self.addCleanup(api.disconnect)
+                monitor = ModbusTCP(host='127.0.0.1', port=gateway.port, slave_address=sim.slave_address)
+                monitor.open()
+                self.addCleanup(monitor.close)
+
+                api.wake_up()
+                self.assertEqual(monitor.receive([REG['feedback_register'], 1]) & 0xF, ActuatorState.ACTUATOR_ACTIVE.value)
+                snapshot = api.get_hand_feedback_data()
+                self.assertEqual(snapshot['status'] & 0xF, ActuatorState.ACTUATOR_ACTIVE.value)
+                self.assertEqual(monitor.receive([REG['slave_id_reg'], 1]), sim.slave_address)
+                self.assertEqual(gateway.get_stats()['clients'], 2)
+                self.assertEqual(gateway.get_stats()['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for ArtusAPI.communication.modbus_pdu against pymodbus' own encoders (no hardware)."""
+
+import unittest
+
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersRequest,
+    ReadWriteMultipleRegistersRequest,
+    WriteMultipleRegistersRequest,
+    WriteSingleRegisterRequest,
+)
+
+from ArtusAPI.communication import modbus_pdu
+
+
+def pymodbus_pdu(request) -> bytes:
+    """Returns the full PDU (function code + body) pymodbus builds for ``request``."""
+    return bytes([request.function_code]) + request.encode()
+
+
+class TestModbusPDU(unittest.TestCase):
+    """Verifies request PDUs are byte-identical to pymodbus and responses decode."""
+
+    def test_read_holding_registers_matches_pymodbus(self):
+        """Verifies FC 0x03 request bytes."""
+        self.assertEqual(modbus_pdu.build_read_holding_registers(201, 8),
+                         pymodbus_pdu(ReadHoldingRegistersRequest(address=201, count=8)))
+
+    def test_write_single_register_matches_pymodbus(self):
+        """Verifies FC 0x06 request bytes."""
+        self.assertEqual(modbus_pdu.build_write_single_register(0, 0x030B),
+                         pymodbus_pdu(WriteSingleRegisterRequest(address=0, registers=[0x030B])))
+
+    def test_write_multiple_registers_matches_pymodbus(self):
+        """Verifies FC 0x10 request bytes."""
+        values = [0x1E3C, 0x2D00, 0x7F80]
+        self.assertEqual(modbus_pdu.build_write_multiple_registers(1, values),
+                         pymodbus_pdu(WriteMultipleRegistersRequest(address=1, registers=values)))
+
+    def test_read_write_matches_pymodbus(self):
+        """Verifies FC 0x17 request bytes."""
+        values = [10, 20, 30]
+        expected = pymodbus_pdu(ReadWriteMultipleRegistersRequest(
+            read_address=201, read_count=8, write_address=1, write_registers=values))
+        self.assertEqual(modbus_pdu.build_read_write_multiple_registers(201, 8, 1, values), expected)
+
+    def test_signed_values_wrap_to_uint16(self):
+        """Verifies negative target velocities are sent as two's complement."""
+        pdu = modbus_pdu.build_write_multiple_registers(150, [-1, 2])
+        self.assertEqual(pdu[-4:], b"\xff\xff\x00\x02")
+
+    def test_count_limits(self):
+        """Verifies per-function register limits are enforced."""
+        with self.assertRaises(ValueError):
+            modbus_pdu.build_read_holding_registers(0, 126)
+        with self.assertRaises(ValueError):
+            modbus_pdu.build_write_multiple_registers(0, [0] * 124)
+        with self.assertRaises(ValueError):
+            modbus_pdu.build_read_write_multiple_registers(0, 1, 0, [0] * 122)
+
+    def test_parse_read_response(self):
+        """Verifies register responses decode big-endian."""
+        self.assertEqual(modbus_pdu.parse_response(0x03, b"\x03\x04\x00\x01\xff\xff"), [1, 0xFFFF])
+
+    def test_parse_write_response(self):
+        """Verifies write echoes decode to True."""
+        self.assertTrue(modbus_pdu.parse_response(0x10, b"\x10\x00\x01\x00\x03"))
+
+    def test_parse_exception_response(self):
+        """Verifies exception responses raise with the exception code."""
+        with self.assertRaises(modbus_pdu.ModbusExceptionResponse) as ctx:
+            modbus_pdu.parse_response(0x03, b"\x83\x02")
+        self.assertEqual(ctx.exception.exception_code, 2)
+
+    def test_mbap_round_trip(self):
+        """Verifies MBAP headers encode and decode symmetrically."""
+        frame = modbus_pdu.encode_mbap(0x1234, 7, b"\x03\x00\xc8\x00\x01")
+        tid, unit, length = modbus_pdu.decode_mbap(frame[:modbus_pdu.MBAP_HEADER_SIZE])
+        self.assertEqual((tid, unit, length), (0x1234, 7, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -142,5 +142,20 @@ class TestNewCommands(unittest.TestCase):
         self.assertEqual(out, [2, 0x4142])
 
 
+    def test_combine_target_commands_fills_gaps_within_pdu(self):
+        """Verifies blocks are merged in address order, zero-filled, while the span fits one write."""
+        position, force, velocity = [1, 11, 12], [50, 21, 22, 23, 24], [150, 31, 32]
+        merged = NewCommands.combine_target_commands([velocity, position, force])
+        # registers 1..53 fit, extending to 152 would span 152 registers (> 123)
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[0][:3], [1, 11, 12])
+        self.assertEqual(len(merged[0]) - 1, 53)
+        self.assertEqual(merged[0][1 + 49:], [21, 22, 23, 24])
+        self.assertEqual(set(merged[0][3:50]), {0})
+        self.assertEqual(merged[1], velocity)
+        self.assertEqual(NewCommands.combine_target_commands([force, velocity]), [[50, 21, 22, 23, 24] + [0] * 96 + [31, 32]])
+        self.assertEqual(NewCommands.combine_target_commands([force, velocity], max_registers=100), [force, velocity])
+
+
 if __name__ == "__main__":
     unittest.main()
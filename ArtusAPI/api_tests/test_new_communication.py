@@ -4,7 +4,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from ArtusAPI.communication.new_communication import NewCommunication, ActuatorState
-from ArtusAPI.common.ModbusMap import ModbusMap, TrajectoryReturn
+from ArtusAPI.common.ModbusMap import CommandType, ModbusMap, TrajectoryReturn
 
 
 class TestNewCommunicationMocked(unittest.TestCase):
@@ -97,6 +97,62 @@ class TestNewCommunicationMocked(unittest.TestCase):
         logged = " ".join(str(c.args[0]) for c in log_info.call_args_list)
         self.assertIn(TrajectoryReturn.TRAJECTORY_COMPLETE.name, logged)
 
+    def test_wait_for_ready_fast_start_and_latency(self):
+        """Verifies a quick transition is seen without a fixed sleep and its latency is recorded."""
+        inst = MagicMock()
+        inst.receive.side_effect = [ActuatorState.ACTUATOR_BUSY.value] * 3 + [ActuatorState.ACTUATOR_IDLE.value]
+        nc = self._make_nc(inst)
+        with patch("ArtusAPI.communication.new_communication.time.sleep") as sleep:
+            state, latency = nc.wait_for_ready(timeout=1, return_latency=True)
+        self.assertEqual(state, ActuatorState.ACTUATOR_IDLE.value)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.005, 0.01, 0.02])
+        self.assertLess(latency, 0.1)
+        stats = nc.get_transition_stats()
+        self.assertEqual(stats["states"]["ACTUATOR_IDLE"]["count"], 1)
+        self.assertEqual(stats["last_latency"], latency)
+
+    def test_wait_for_ready_timeout_returns_none(self):
+        """Verifies the deadline ends the wait with None and is counted."""
+        inst = MagicMock()
+        inst.receive.return_value = ActuatorState.ACTUATOR_BUSY.value
+        nc = self._make_nc(inst)
+        self.assertIsNone(nc.wait_for_ready(timeout=0.02))
+        self.assertEqual(nc.get_transition_stats()["timeouts"], 1)
+
+    def test_batch_data_runs_sequentially_without_pipelining(self):
+        """Verifies batch_data falls back to one transaction per operation on serial transports."""
+        inst = MagicMock(spec=["open", "close", "send", "receive", "send_receive"])
+        inst.receive.return_value = 0x21
+        inst.send.return_value = True
+        nc = self._make_nc(inst)
+        results = nc.batch_data([("write", 1, [5, 6]), ("read", 200, 1)])
+        self.assertEqual(results, [True, [0x21]])
+        inst.send.assert_called_once_with([1, 5, 6], CommandType.TARGET_COMMAND.value)
+        inst.receive.assert_called_once_with([200, 1])
+
+    def test_batch_data_delegates_to_pipelined_transport(self):
+        """Verifies batch_data hands the whole batch to a transport that can pipeline it."""
+        inst = MagicMock()
+        inst.batch.return_value = [True]
+        nc = self._make_nc(inst)
+        self.assertEqual(nc.batch_data([("write", 1, [5])]), [True])
+        inst.batch.assert_called_once_with([("write", 1, [5])])
+
+
+    def test_batch_receive_data_coalesces_fields(self):
+        """Verifies scattered fields are read in the planned ranges and returned per key."""
+        inst = MagicMock()
+        inst.receive.side_effect = lambda request: list(range(request[0], request[0] + request[1]))
+        del inst.batch
+        nc = self._make_nc(inst)
+        fields = [("voltage", 1000, 2), ("status", 200, 1), ("temperature", 1002, 1)]
+        result = nc.batch_receive_data(fields)
+        self.assertEqual([c.args[0] for c in inst.receive.call_args_list], [[200, 1], [1000, 3]])
+        self.assertEqual(result, {"status": [200], "voltage": [1000, 1001], "temperature": [1002]})
+        nc.configure_read_planner(max_gap=0)
+        self.assertEqual(nc.batch_receive_data([(200, 1), (202, 1)]), {(200, 1): [200], (202, 1): [202]})
+        self.assertEqual(inst.receive.call_count, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for the deadline-based PacingScheduler."""
+
+import time
+import unittest
+from unittest.mock import patch
+
+from ArtusAPI.api_tests.mocks import FakeClock, build_api
+from ArtusAPI.communication.pacing_scheduler import PacingScheduler
+
+
+class TestPacingScheduler(unittest.TestCase):
+    """Verifies slot placement, missed-deadline accounting and jitter statistics."""
+
+    def make(self, period=0.02, oversleep=0.0):
+        self.clock = FakeClock(now=100.0, oversleep=oversleep)
+        return PacingScheduler(period, spin_threshold=0.0, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_first_slot_is_immediate_then_one_period_apart(self):
+        """Verifies deadlines advance by exactly one period and each wait sleeps once."""
+        pacer = self.make()
+        self.assertEqual(pacer.wait(), 100.0)
+        self.assertEqual(self.clock.sleeps, [])
+        self.clock.now += 0.005  # time spent sending
+        self.assertAlmostEqual(pacer.wait(), 100.02)
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.015)
+
+    def test_oversleep_does_not_drift(self):
+        """Verifies late wake-ups are reported as jitter but the next deadline stays on the grid."""
+        pacer = self.make(oversleep=0.002)
+        deadlines = [pacer.wait() for _ in range(5)]
+        self.assertEqual([round(d - 100.0, 6) for d in deadlines], [0.0, 0.02, 0.04, 0.06, 0.08])
+        stats = pacer.get_stats()
+        self.assertEqual((stats['slots'], stats['waits'], stats['missed']), (5, 4, 0))
+        self.assertAlmostEqual(stats['mean_jitter'], 0.002)
+        self.assertAlmostEqual(stats['max_jitter'], 0.002)
+        self.assertAlmostEqual(stats['std_jitter'], 0.0, places=6)
+
+    def test_late_caller_reanchors_and_counts_missed(self):
+        """Verifies a caller a full period late is sent at once, counted as missed, and keeps the spacing."""
+        pacer = self.make()
+        pacer.wait()
+        self.clock.now += 0.05
+        self.assertEqual(pacer.wait(), 100.05)
+        self.assertEqual(pacer.get_stats()['missed'], 1)
+        self.assertAlmostEqual(pacer.wait(), 100.07)
+
+    def test_mark_sent_and_reset(self):
+        """Verifies unpaced sends push the next slot back and reset anchors it exactly."""
+        pacer = self.make()
+        pacer.mark_sent()
+        self.assertAlmostEqual(pacer.reserve(), 100.02)
+        pacer.reset(0.0)
+        self.assertEqual(pacer.reserve(), 100.0)
+
+    def test_spin_finishes_on_time(self):
+        """Verifies the hybrid sleep does not return before the real deadline and lands close to it."""
+        pacer = PacingScheduler(0.005)
+        pacer.wait()
+        deadline = pacer.wait()
+        late = time.perf_counter() - deadline
+        self.assertGreaterEqual(late, 0.0)
+        self.assertLess(late, 0.002)
+
+
+class TestApiPacing(unittest.TestCase):
+    """Verifies ArtusAPI_V2 routes its commands through the scheduler."""
+
+    def test_set_home_position_waits_instead_of_dropping(self):
+        """Verifies a home command sent right after another command is delayed, not dropped."""
+        api, comm = build_api()
+        api.awake = True
+        with patch.object(api._pacer, "_sleep") as sleep:
+            api.set_joint_angles({"thumb_spread": {"target_angle": 5}})
+            api.set_home_position()
+        self.assertEqual(comm.send_data.call_count, 2)
+        sleep.assert_called()
+        self.assertEqual(api.get_pacing_stats()['slots'], 2)
+
+    def test_last_time_reanchors_schedule(self):
+        """Verifies assigning last_time keeps working as the old way to skip or force a wait."""
+        api, _ = build_api()
+        api.last_time = 0.0
+        self.assertEqual(api.last_time, 0.0)
+        with patch.object(api._pacer, "_sleep") as sleep:
+            api.wait_for_com_freq()
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Tests for PipelinedModbusTCP against an in-process Modbus TCP server (no hardware)."""
+
+import socket
+import struct
+import threading
+import unittest
+
+from pymodbus.exceptions import ModbusIOException
+
+from ArtusAPI.common.ModbusMap import CommandType
+from ArtusAPI.communication import modbus_pdu
+from ArtusAPI.communication.Modbus_TCP.pipelined_modbus_tcp import PipelinedModbusTCP
+
+
+class ReorderingServer:
+    """Collects ``batch_size`` requests, then answers them in reverse order.
+
+    A client that waits for each response before sending the next request
+    would deadlock against this server, so completing a batch proves the
+    requests were in flight together and matched by transaction id.
+    Read responses return ``start + i``; address 999 answers with an
+    illegal-address exception.
+    """
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.requests = []
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(1)
+        self.port = self._listener.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _recv_exact(self, conn, size):
+        buf = b""
+        while len(buf) < size:
+            chunk = conn.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError
+            buf += chunk
+        return buf
+
+    def _answer(self, pdu):
+        fc = pdu[0]
+        if fc == 0x03:
+            start, count = struct.unpack(">HH", pdu[1:5])
+            if start == 999:
+                return bytes([0x83, 0x02])
+            return struct.pack(f">BB{count}H", fc, 2 * count, *range(start, start + count))
+        if fc == 0x17:
+            start, count = struct.unpack(">HH", pdu[1:5])
+            return struct.pack(f">BB{count}H", fc, 2 * count, *range(start, start + count))
+        return pdu[:5]  # FC 0x06 / 0x10 echo address and value/count
+
+    def _serve(self):
+        conn, _ = self._listener.accept()
+        with conn:
+            try:
+                while True:
+                    batch = []
+                    for _ in range(self.batch_size):
+                        header = self._recv_exact(conn, modbus_pdu.MBAP_HEADER_SIZE)
+                        tid, unit, length = modbus_pdu.decode_mbap(header)
+                        pdu = self._recv_exact(conn, length)
+                        self.requests.append((tid, pdu))
+                        batch.append((tid, unit, pdu))
+                    for tid, unit, pdu in reversed(batch):
+                        conn.sendall(modbus_pdu.encode_mbap(tid, unit, self._answer(pdu)))
+            except (ConnectionError, OSError):
+                pass
+
+    def close(self):
+        self._listener.close()
+
+
+class TestPipelinedModbusTCP(unittest.TestCase):
+    """Verifies out-of-order response matching, batching and the blocking contract."""
+
+    def _connect(self, batch_size):
+        server = ReorderingServer(batch_size)
+        self.addCleanup(server.close)
+        transport = PipelinedModbusTCP(host="127.0.0.1", port=server.port, timeout=1.0, slave_address=3)
+        transport.open()
+        self.addCleanup(transport.close)
+        return server, transport
+
+    def test_batch_shares_one_round_trip(self):
+        """Verifies a write and two reads complete although answered in reverse order."""
+        server, transport = self._connect(batch_size=3)
+        results = transport.batch([
+            ("write", 1, [0x1E3C, 0x2D00]),
+            ("read", 650, 6),
+            ("read", 200, 1),
+        ])
+        self.assertEqual(results, [True, list(range(650, 656)), [200]])
+        self.assertEqual(len({tid for tid, _ in server.requests}), 3)
+
+    def test_submit_returns_futures(self):
+        """Verifies futures resolve independently of submission order."""
+        _, transport = self._connect(batch_size=2)
+        first = transport.submit_read(201, 2)
+        second = transport.submit_read_write(350, 3, 150, [-1, 0, 1])
+        self.assertEqual(second.result(timeout=1), [350, 351, 352])
+        self.assertEqual(first.result(timeout=1), [201, 202])
+
+    def test_blocking_contract(self):
+        """Verifies send/receive behave like ModbusTCP for NewCommunication."""
+        server, transport = self._connect(batch_size=1)
+        self.assertTrue(transport.send([0x0B, 0x03], CommandType.SETUP_COMMANDS.value))
+        self.assertEqual(server.requests[-1][1], modbus_pdu.build_write_single_register(0, 0x030B))
+        self.assertEqual(transport.receive([200, 1]), 200)
+        self.assertEqual(transport.receive([201, 2]), [201, 202])
+
+    def test_exception_response_fails_only_its_future(self):
+        """Verifies a Modbus exception for one request leaves the others intact."""
+        _, transport = self._connect(batch_size=2)
+        bad = transport.submit_read(999, 1)
+        good = transport.submit_read(200, 1)
+        self.assertEqual(good.result(timeout=1), [200])
+        with self.assertRaises(modbus_pdu.ModbusExceptionResponse):
+            bad.result(timeout=1)
+
+    def test_unanswered_request_times_out(self):
+        """Verifies a missing response surfaces as ModbusIOException."""
+        _, transport = self._connect(batch_size=2)
+        transport.timeout = 0.1
+        with self.assertRaises(ModbusIOException):
+            transport.receive([200, 1], max_retries=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
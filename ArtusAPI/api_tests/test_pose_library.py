@@ -0,0 +1,113 @@
+"""Tests for PoseLibrary compilation and ArtusAPI_V2.execute_pose."""
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ArtusAPI import PoseLibrary
+from ArtusAPI.api_tests.mocks import build_api
+from ArtusAPI.common.ModbusMap import CommandType
+
+POSES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'hand_poses')
+
+
+class TestPoseLibrary(unittest.TestCase):
+    """Verifies poses are validated, encoded once per hand and sent as prebuilt frames."""
+
+    def setUp(self):
+        self.api, self.comm = build_api(robot_type='artus_lite', hand_type='left')
+        self.api.awake = True
+        self.api.control_type = 3
+        self.library = PoseLibrary(POSES_DIR)
+
+    def test_frames_match_set_joint_angles_encoding(self):
+        """Verifies compiled frames are the registers set_joint_angles would send."""
+        pose = self.library.compiled_pose(self.api, 'grasp_example')
+        self.api._robot_handler.set_joint_angles(self.library.get('grasp_example'), name=True)
+        hand_joints = self.api._robot_handler.robot.hand_joints
+        commands = self.api._command_handler
+        self.assertEqual(pose.frames['position'], commands.get_target_position_command(hand_joints))
+        self.assertEqual(pose.frames['velocity'], commands.get_target_velocity_command(hand_joints))
+        self.assertEqual(pose.frames['force'], commands.get_target_force_command(hand_joints))
+
+    def test_execute_sends_prebuilt_frames_without_encoding(self):
+        """Verifies executing a pose packs nothing and updates the joint targets."""
+        pose = self.library.compiled_pose(self.api, 'grasp_open')
+        commands = self.api._command_handler
+        with mock.patch.object(commands, 'get_target_position_command', side_effect=AssertionError), \
+             mock.patch.object(commands, 'get_target_velocity_command', side_effect=AssertionError), \
+             mock.patch.object(commands, 'get_target_force_command', side_effect=AssertionError):
+            self.assertTrue(self.library.execute(self.api, 'grasp_open'))
+        sent = [c.args for c in self.comm.send_data.call_args_list]
+        self.assertEqual(sent, [(pose.frames['position'], CommandType.TARGET_COMMAND.value),
+                                (pose.frames['velocity'], CommandType.TARGET_COMMAND.value),
+                                (pose.frames['force'], CommandType.TARGET_COMMAND.value)])
+        np.testing.assert_array_equal(self.api._robot_handler.robot.joint_state.target_angle, pose.target_angle)
+
+    def test_control_type_selects_frames(self):
+        """Verifies velocity control sends the velocity and force frames only."""
+        self.api.control_type = 2
+        pose = self.library.compiled_pose(self.api, 'grasp_open')
+        self.library.execute(self.api, 'grasp_open')
+        sent = [c.args[0] for c in self.comm.send_data.call_args_list]
+        self.assertEqual(sent, [pose.frames['velocity'], pose.frames['force']])
+
+    def test_read_feedback_ends_with_one_read_write_transaction(self):
+        """Verifies read_feedback writes the last frame in one FC 0x17 and returns positions."""
+        pose = self.library.compiled_pose(self.api, 'grasp_example')
+        self.comm.send_receive_data.return_value = [0x0A14] * 8
+        feedback = self.library.execute(self.api, 'grasp_example', read_feedback=True)
+        self.comm.send_receive_data.assert_called_once()
+        _, _, write_start, values = self.comm.send_receive_data.call_args.args
+        self.assertEqual([write_start, *values], pose.frames['force'])
+        sent = [c.args[0] for c in self.comm.send_data.call_args_list]
+        self.assertEqual(sent, [pose.frames['position'], pose.frames['velocity']])
+        self.assertEqual(feedback.shape, (16,))
+
+    def test_read_feedback_follows_control_type(self):
+        """Verifies read_feedback in velocity control writes the velocity and force frames, not position."""
+        self.api.control_type = 2
+        pose = self.library.compiled_pose(self.api, 'grasp_example')
+        self.comm.send_receive_data.return_value = [0x0A14] * 8
+        self.library.execute(self.api, 'grasp_example', read_feedback=True)
+        sent = [c.args[0] for c in self.comm.send_data.call_args_list]
+        self.assertEqual(sent, [pose.frames['velocity']])
+        _, _, write_start, values = self.comm.send_receive_data.call_args.args
+        self.assertEqual([write_start, *values], pose.frames['force'])
+
+    def test_compilation_is_cached_per_hand(self):
+        """Verifies poses are encoded once per robot/side and re-encoded after a change."""
+        first = self.library.compile(self.api)
+        self.assertIs(self.library.compile(self.api)['grasp_open'], first['grasp_open'])
+        right, _ = build_api(robot_type='artus_lite', hand_type='right')
+        self.assertIsNot(self.library.compile(right)['grasp_open'], first['grasp_open'])
+        self.library.add('grasp_open', {'thumb_flex': {'index': 1, 'target_angle': 10}})
+        self.assertIsNot(self.library.compile(self.api)['grasp_open'], first['grasp_open'])
+
+    def test_validation_against_robot_model(self):
+        """Verifies unknown joints and wrong indices are rejected and limits are clamped."""
+        self.library.add('elbow', {'elbow_flex': {'target_angle': 10}})
+        self.library.add('shifted', {'thumb_flex': {'index': 4, 'target_angle': 10}})
+        self.library.add('too_far', {'index_flex': {'index': 5, 'target_angle': 200}})
+        compiled = self.library.compile(self.api)
+        self.assertNotIn('elbow', compiled)
+        with self.assertRaises(ValueError):
+            self.library.compiled_pose(self.api, 'shifted')
+        with self.assertRaises(KeyError):
+            self.library.compiled_pose(self.api, 'missing')
+        self.assertEqual(compiled['too_far'].clamped, ('index_flex',))
+        self.assertEqual(compiled['too_far'].target_angle[5], 90)
+
+    def test_angles_only_uses_robot_defaults(self):
+        """Verifies angles_only ignores stored velocity and force."""
+        library = PoseLibrary(POSES_DIR, angles_only=True)
+        pose = library.compiled_pose(self.api, 'grasp_example')
+        robot = self.api._robot_handler.robot
+        self.assertTrue(np.all(pose.target_velocity == robot.default_velocity))
+        self.assertTrue(np.all(pose.target_force == robot.default_force))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for ArtusAPI.communication.read_planner (no hardware)."""
+
+import unittest
+
+from ArtusAPI.communication.read_planner import MAX_READ_REGISTERS, ReadPlanner, plan_register_reads
+
+
+class TestPlanRegisterReads(unittest.TestCase):
+    """Verifies contiguous read planning under the Modbus register cap."""
+
+    def test_adjacent_fields_share_one_read(self):
+        """Verifies the status register and positions merge into a single read."""
+        plan = plan_register_reads([("status", 200, 1), ("position", 201, 8)])
+        self.assertEqual(plan, [(200, 9, [("status", 0, 1), ("position", 1, 8)])])
+
+    def test_gap_is_bridged_within_cap(self):
+        """Verifies fields separated by unused registers still merge when the span fits."""
+        plan = plan_register_reads([("position", 201, 8), ("force", 250, 32)])
+        self.assertEqual(len(plan), 1)
+        start, count, members = plan[0]
+        self.assertEqual((start, count), (201, 81))
+        self.assertEqual(members[1], ("force", 49, 32))
+
+    def test_cap_splits_reads(self):
+        """Verifies no planned read exceeds the 125-register limit."""
+        fields = [("position", 201, 9), ("force", 250, 36), ("velocity", 350, 18), ("voltage", 1000, 2)]
+        plan = plan_register_reads(fields)
+        self.assertEqual([(s, c) for s, c, _ in plan], [(201, 85), (350, 18), (1000, 2)])
+        self.assertTrue(all(c <= MAX_READ_REGISTERS for _, c, _ in plan))
+
+    def test_unsorted_input(self):
+        """Verifies fields are planned in address order regardless of input order."""
+        plan = plan_register_reads([("voltage", 1000, 2), ("status", 200, 1)])
+        self.assertEqual([s for s, _, _ in plan], [200, 1000])
+
+    def test_max_gap_limits_bridging(self):
+        """Verifies max_gap keeps distant fields in separate reads."""
+        plan = plan_register_reads([("position", 201, 8), ("force", 250, 32)], max_gap=10)
+        self.assertEqual(len(plan), 2)
+
+    def test_oversized_field_raises(self):
+        """Verifies a field larger than one read is rejected."""
+        with self.assertRaises(ValueError):
+            plan_register_reads([("huge", 0, 200)])
+
+
+class TestReadPlanner(unittest.TestCase):
+    """Verifies plan caching per request signature and slicing fields back out."""
+
+    def test_scattered_health_registers(self):
+        """Verifies status, errors, voltage and temperature need three reads and slice back per field."""
+        planner = ReadPlanner()
+        fields = [("status", 200, 1), ("errors", 500, 32), ("voltage", 1000, 2), ("temperature", 1002, 1)]
+        plan = planner.plan(fields)
+        self.assertEqual([(s, c) for s, c, _ in plan], [(200, 1), (500, 32), (1000, 3)])
+        buffers = [[7], list(range(32)), [0x41C0, 0, 35]]
+        self.assertEqual(ReadPlanner.split(plan, buffers),
+                         {"status": [7], "errors": list(range(32)), "voltage": [0x41C0, 0], "temperature": [35]})
+
+    def test_plan_is_cached_per_signature(self):
+        """Verifies a repeated request reuses its plan and a different one is planned anew."""
+        planner = ReadPlanner()
+        first = planner.plan([(200, 1), (201, 8)])
+        self.assertIs(planner.plan([(200, 1), (201, 8)]), first)
+        self.assertEqual(first, ((200, 9, (((200, 1), 0, 1), ((201, 8), 1, 8))),))
+        planner.plan([(200, 1)])
+        self.assertEqual(planner.get_stats(), {"hits": 1, "misses": 2, "cached": 2})
+
+    def test_gap_threshold_and_pdu_size(self):
+        """Verifies max_gap and max_registers are applied to planned reads."""
+        self.assertEqual(len(ReadPlanner(max_gap=10).plan([("a", 201, 8), ("b", 250, 32)])), 2)
+        self.assertEqual(len(ReadPlanner(max_registers=40).plan([("a", 201, 8), ("b", 250, 32)])), 2)
+        self.assertEqual(len(ReadPlanner().plan([("a", 201, 8), ("b", 250, 32)])), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the adaptive wait_for_ready polling (ReadyPoll, TransitionStats)."""
+
+import unittest
+
+from ArtusAPI.api_tests.mocks import FakeClock
+from ArtusAPI.common.ModbusMap import ActuatorState
+from ArtusAPI.communication.ready_poller import READY_STATES, ReadyPoll, TransitionStats
+
+IDLE = ActuatorState.ACTUATOR_IDLE.value
+BUSY = ActuatorState.ACTUATOR_BUSY.value
+RESET = ActuatorState.ACTUATOR_RESET.value
+
+
+class TestReadyPoll(unittest.TestCase):
+    """Verifies backoff, deadlines, target sets and settle handling."""
+
+    def setUp(self):
+        self.clock = FakeClock(now=50.0)
+
+    def test_backoff_doubles_to_cap_and_stops_at_deadline(self):
+        """Verifies 5 ms doubling to 100 ms, the last delay trimmed to the deadline."""
+        poll = ReadyPoll(timeout=0.3, clock=self.clock)
+        delays = []
+        while (delay := poll.next_delay()) is not None:
+            delays.append(round(delay, 6))
+            self.clock.now += delay
+        self.assertEqual(delays, [0.005, 0.01, 0.02, 0.04, 0.08, 0.1, 0.045])
+
+    def test_accepts_immediately_and_reports_latency(self):
+        """Verifies the first matching poll finishes the wait and latency runs from the start."""
+        poll = ReadyPoll(acceptable_state=[IDLE, RESET], clock=self.clock)
+        self.assertEqual(poll.acceptable_states, frozenset((IDLE, RESET)))
+        self.assertEqual(poll.observe(BUSY | 0x20), (BUSY, False, True))
+        self.clock.now += 0.04
+        self.assertEqual(poll.observe(IDLE), (IDLE, True, True))
+        self.assertAlmostEqual(poll.latency, 0.04)
+        self.assertEqual(ReadyPoll(clock=self.clock).acceptable_states, READY_STATES)
+
+    def test_settle_waits_for_the_hand_to_move(self):
+        """Verifies an unchanged acceptable state is held back until the hand moves or settle_timeout passes."""
+        poll = ReadyPoll(settle_timeout=0.2, clock=self.clock)
+        self.assertFalse(poll.observe(IDLE)[1])
+        self.assertFalse(poll.observe(RESET)[1])
+        self.assertTrue(poll.observe(IDLE)[1])
+
+        poll = ReadyPoll(settle_timeout=0.2, clock=self.clock)
+        self.assertFalse(poll.observe(IDLE)[1])
+        self.clock.now += 0.2
+        self.assertTrue(poll.observe(IDLE)[1])
+
+        poll = ReadyPoll(settle_timeout=0.2, clock=self.clock)
+        poll.observe(IDLE)
+        self.assertTrue(poll.observe(ActuatorState.ACTUATOR_ACTIVE.value)[1])
+
+    def test_explicit_deadline_overrides_timeout(self):
+        """Verifies an absolute deadline replaces the relative timeout."""
+        poll = ReadyPoll(timeout=100, deadline=self.clock.now + 0.001, clock=self.clock)
+        self.clock.now += 0.002
+        self.assertIsNone(poll.next_delay())
+
+
+class TestTransitionStats(unittest.TestCase):
+    """Verifies per-state aggregation."""
+
+    def test_stats(self):
+        """Verifies count/mean/max per state name and timeout counting."""
+        stats = TransitionStats()
+        stats.record(IDLE, 0.02)
+        stats.record(IDLE, 0.04)
+        stats.record_timeout()
+        snapshot = stats.get_stats()
+        self.assertEqual(snapshot["timeouts"], 1)
+        self.assertEqual(snapshot["last_latency"], 0.04)
+        self.assertEqual(snapshot["states"]["ACTUATOR_IDLE"]["count"], 2)
+        self.assertAlmostEqual(snapshot["states"]["ACTUATOR_IDLE"]["mean"], 0.03)
+        self.assertEqual(snapshot["states"]["ACTUATOR_IDLE"]["max"], 0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
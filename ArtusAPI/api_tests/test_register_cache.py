@@ -0,0 +1,97 @@
+"""Tests for RegisterCache and cached reads in NewCommunication."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ArtusAPI.api_tests.mocks import FakeClock
+from ArtusAPI.common.ModbusMap import CommandType, ModbusMap
+from ArtusAPI.communication.new_communication import NewCommunication
+from ArtusAPI.communication.register_cache import RegisterCache
+
+REG = ModbusMap().modbus_reg_map
+
+
+class TestRegisterCache(unittest.TestCase):
+    """Verifies TTL expiry, per-field statistics and invalidation."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = RegisterCache({'feedback_voltage_start_reg': 1.0, 'slave_id_reg': 10.0}, clock=self.clock)
+        self.voltage = REG['feedback_voltage_start_reg']
+
+    def test_entries_expire_after_ttl(self):
+        """Verifies a read is served until its time-to-live passes."""
+        self.assertTrue(self.cache.caches(self.voltage))
+        self.assertFalse(self.cache.caches(REG['feedback_position_start_reg']))
+        self.assertIsNone(self.cache.get(self.voltage, 2))
+        self.cache.put(self.voltage, 2, [1, 2])
+        self.clock.now = 0.9
+        self.assertEqual(self.cache.get(self.voltage, 2), [1, 2])
+        self.clock.now = 1.0
+        self.assertIsNone(self.cache.get(self.voltage, 2))
+
+    def test_stats_per_field(self):
+        """Verifies hits and misses are counted per register and in total."""
+        self.cache.get(self.voltage, 2)
+        self.cache.put(self.voltage, 2, [1, 2])
+        self.cache.get(self.voltage, 2)
+        self.cache.get(REG['slave_id_reg'], 1)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        self.assertEqual(stats['fields']['feedback_voltage_start_reg'], {'hits': 1, 'misses': 1})
+        self.assertEqual(stats['fields']['slave_id_reg'], {'hits': 0, 'misses': 1})
+
+    def test_invalidate(self):
+        """Verifies invalidation drops every entry."""
+        self.cache.put(self.voltage, 2, [1, 2])
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get(self.voltage, 2))
+        self.assertEqual(self.cache.get_stats()['invalidations'], 1)
+
+
+class TestCachedReceiveData(unittest.TestCase):
+    """Verifies NewCommunication serves cached registers and drops them on commands."""
+
+    def setUp(self):
+        self.transport = MagicMock()
+        self.transport.receive.return_value = [0x41C0, 0]
+        with patch("ArtusAPI.communication.new_communication.RS485_RTU", return_value=self.transport):
+            self.comm = NewCommunication(port="MOCK", communication_method="RS485_RTU")
+        self.comm.enable_register_cache()
+
+    def test_repeated_reads_hit_the_cache(self):
+        """Verifies a dashboard polling voltage only reaches the bus once per TTL."""
+        for _ in range(5):
+            self.assertEqual(self.comm.receive_data(2, REG['feedback_voltage_start_reg']), [0x41C0, 0])
+        self.assertEqual(self.transport.receive.call_count, 1)
+        self.assertEqual(self.comm.get_register_cache_stats()['hits'], 4)
+
+    def test_uncached_registers_always_read(self):
+        """Verifies feedback positions and status are never cached."""
+        self.comm.receive_data(8, REG['feedback_position_start_reg'])
+        self.comm.receive_data(8, REG['feedback_position_start_reg'])
+        self.comm.receive_data()
+        self.assertEqual(self.transport.receive.call_count, 3)
+
+    def test_commands_invalidate(self):
+        """Verifies clear errors (a command-register write) forces fresh reads, targets do not."""
+        errors = REG['feedback_actuator_error_reg']
+        self.comm.receive_data(32, errors)
+        self.comm.send_data([1, 0], CommandType.TARGET_COMMAND.value)
+        self.comm.receive_data(32, errors)
+        self.assertEqual(self.transport.receive.call_count, 1)
+        self.comm.send_data([0x1A])
+        self.comm.receive_data(32, errors)
+        self.assertEqual(self.transport.receive.call_count, 2)
+
+    def test_disabled_cache_reads_live(self):
+        """Verifies disabling the cache sends every read to the hand."""
+        self.comm.disable_register_cache()
+        self.comm.receive_data(2, REG['feedback_voltage_start_reg'])
+        self.comm.receive_data(2, REG['feedback_voltage_start_reg'])
+        self.assertEqual(self.transport.receive.call_count, 2)
+        self.assertIsNone(self.comm.get_register_cache_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
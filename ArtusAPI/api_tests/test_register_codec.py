@@ -0,0 +1,121 @@
+"""Bit-identity tests for ArtusAPI.commands.register_codec against the scalar struct encoding."""
+
+import math
+import random
+import struct
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from ArtusAPI.commands import register_codec
+from ArtusAPI.commands.new_commands import NewCommands
+
+
+# scalar reference implementations (the pre-NumPy NewCommands code paths)
+def ref_int8_pairs(values):
+    clamped = [max(-128, min(127, int(v))) for v in values]
+    if len(clamped) % 2:
+        clamped.append(0)
+    return [((clamped[i] & 0xFF) << 8 | (clamped[i + 1] & 0xFF)) & 0xFFFF for i in range(0, len(clamped), 2)]
+
+
+def ref_int16(values):
+    return [max(-32768, min(32767, int(v))) for v in values]
+
+
+def ref_float_words(values):
+    out = []
+    for v in values:
+        raw = struct.pack('<f', round(v, 2))
+        out += [struct.unpack('<H', raw[2:])[0], struct.unpack('<H', raw[:2])[0]]
+    return out
+
+
+def ref_decode_int8_pairs(data):
+    out = []
+    for value in data:
+        for byte in ((value >> 8) & 0xFF, value & 0xFF):
+            out.append(byte if byte < 128 else byte - 256)
+    return out
+
+
+def ref_decode_float(data):
+    return [round(struct.unpack('<f', struct.pack('<HH', data[i], data[i + 1]))[0], 2)
+            for i in range(0, len(data) - 1, 2)]
+
+
+def ref_decode_uint32(data):
+    return [struct.unpack('<I', struct.pack('<HH', data[i], data[i + 1]))[0] for i in range(0, len(data) - 1, 2)]
+
+
+def same_floats(a, b):
+    """Compares float lists bitwise (NaN == NaN)."""
+    return [struct.pack('<d', x) for x in a] == [struct.pack('<d', x) for x in b]
+
+
+class TestRegisterCodec(unittest.TestCase):
+    """Compares every codec function with the scalar reference on random inputs."""
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def random_words(self, n):
+        return [self.rng.randrange(0x10000) for _ in range(n)]
+
+    def test_encoders_match_reference(self):
+        """Verifies int8 pairs, int16 and float words for odd/even and out-of-range inputs."""
+        for n in (1, 6, 16, 17, 18):
+            angles = [self.rng.uniform(-200, 200) for _ in range(n)]
+            self.assertEqual(register_codec.encode_int8_pairs(angles), ref_int8_pairs(angles))
+            velocities = [self.rng.randint(-40000, 40000) for _ in range(n)]
+            self.assertEqual(register_codec.encode_int16(velocities), ref_int16(velocities))
+            forces = [self.rng.uniform(-50, 50) for _ in range(n)] + [0.0, -0.0, 0.285, 1.005, 2.675]
+            self.assertEqual(register_codec.encode_float32_words(forces), ref_float_words(forces))
+
+    def test_decoders_match_reference(self):
+        """Verifies int8/int16/float/uint32 decoding of random register blocks, incl. the 30-register fingertip block."""
+        for n in (1, 2, 9, 30, 36, 125):
+            data = self.random_words(n)
+            self.assertEqual(register_codec.decode_int8_pairs(data), ref_decode_int8_pairs(data))
+            self.assertEqual(register_codec.decode_int16(data), [((v + 2**15) % 2**16 - 2**15) for v in data])
+            self.assertTrue(same_floats(register_codec.decode_float32(data), ref_decode_float(data)))
+            self.assertEqual(register_codec.decode_uint32(data), ref_decode_uint32(data))
+
+    def test_special_float_patterns(self):
+        """Verifies NaN, infinities and denormals decode like struct."""
+        data = [0x0000, 0x7FC0, 0x0000, 0x7F80, 0x0000, 0xFF80, 0x0001, 0x0000]
+        decoded = register_codec.decode_float32(data)
+        self.assertTrue(math.isnan(decoded[0]))
+        self.assertTrue(same_floats(decoded, ref_decode_float(data)))
+
+    def test_returns_python_scalars(self):
+        """Verifies results are plain int/float, not NumPy scalars."""
+        self.assertIs(type(register_codec.encode_int8_pairs([1, 2])[0]), int)
+        self.assertIs(type(register_codec.decode_float32([0, 0x4020])[0]), float)
+
+    def test_on_clamp_reports_out_of_range(self):
+        """Verifies clamped values are reported once and in-range input is silent."""
+        on_clamp = MagicMock()
+        register_codec.encode_int8_pairs([0, 200, -129.7], on_clamp=on_clamp)
+        on_clamp.assert_called_once_with([200, -129])
+        on_clamp.reset_mock()
+        register_codec.encode_int16([1, -2], on_clamp=on_clamp)
+        on_clamp.assert_not_called()
+
+    def test_new_commands_dex_round_trip(self):
+        """Verifies the 18-joint position/force packers through NewCommands."""
+        nc = NewCommands(num_joints=18, logger=MagicMock())
+        angles = [self.rng.randint(-90, 90) for _ in range(18)]
+        forces = [round(self.rng.uniform(0, 40), 2) for _ in range(18)]
+        joints = {i: SimpleNamespace(target_angle=a, target_force=f, target_velocity=None)
+                  for i, (a, f) in enumerate(zip(angles, forces))}
+        position_cmd = nc.get_target_position_command(joints)
+        self.assertEqual(position_cmd[1:], ref_int8_pairs(angles))
+        self.assertEqual(nc.get_decoded_feedback_data(position_cmd[1:], "feedback_position_start_reg"), angles)
+        force_cmd = nc.get_target_force_command(joints)
+        self.assertEqual(force_cmd[1:], ref_float_words(forces))
+        self.assertEqual(nc.get_target_velocity_command(joints)[1:], [0] * 18)
+
+
+if __name__ == "__main__":
+    unittest.main()
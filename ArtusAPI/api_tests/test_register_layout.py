@@ -0,0 +1,72 @@
+"""Tests for ArtusAPI.common.register_layout."""
+
+import math
+import unittest
+from unittest.mock import patch
+
+from ArtusAPI.api_tests.mocks import build_api
+from ArtusAPI.common import register_layout
+from ArtusAPI.common.ModbusMap import ModbusMap
+from ArtusAPI.common.register_layout import RegisterLayout, get_register_layout
+
+
+class TestRegisterLayout(unittest.TestCase):
+    """Verifies the compiled layout matches ModbusMap and is shared and read-only."""
+
+    def setUp(self):
+        """Compiles the layout of a 6-joint, 5-sensor hand."""
+        self.m = ModbusMap()
+        self.layout = get_register_layout(6, 5)
+
+    def test_addresses_match_modbus_map(self):
+        """Verifies every key keeps its ModbusMap address."""
+        self.assertEqual(dict(self.layout.addresses), self.m.modbus_reg_map)
+        for key, field in self.layout.fields.items():
+            self.assertEqual(field.address, self.m.modbus_reg_map[key])
+            self.assertEqual(field.words_per_value, self.m.data_type_multiplier_map[key])
+
+    def test_read_sizes(self):
+        """Verifies per-joint, fixed-size and fingertip read sizes."""
+        sizes = self.layout.read_sizes
+        for key in ("feedback_position_start_reg", "feedback_force_start_reg", "feedback_velocity_start_reg",
+                    "feedback_temperature_start_reg", "feedback_actuator_error_reg"):
+            self.assertEqual(sizes[key], math.ceil(self.m.data_type_multiplier_map[key] * 6), key)
+        self.assertEqual(sizes["feedback_register"], 1)
+        self.assertEqual(sizes["slave_id_reg"], 1)
+        self.assertEqual(sizes["feedback_voltage_start_reg"], 2)
+        self.assertEqual(sizes["feedback_force_sensor_start_reg"], 30)
+        self.assertEqual(get_register_layout(16).read_sizes["feedback_position_start_reg"], 8)
+
+    def test_decoders(self):
+        """Verifies error reports decode as uint32 and slave ids as uint8 despite their multipliers."""
+        self.assertEqual(self.layout.fields["feedback_actuator_error_reg"].decoder, register_layout.DECODE_UINT32)
+        self.assertEqual(self.layout.fields["feedback_force_start_reg"].decoder, register_layout.DECODE_FLOAT32)
+        self.assertEqual(self.layout.fields["slave_id_reg"].decoder, register_layout.DECODE_UINT8)
+        self.assertEqual(self.layout.fields["feedback_position_start_reg"].decoder, register_layout.DECODE_INT8_PAIRS)
+
+    def test_reverse_index(self):
+        """Verifies address -> key lookups and unknown addresses."""
+        self.assertEqual(self.layout.key_for_address(201), "feedback_position_start_reg")
+        self.assertIsNone(self.layout.key_for_address(9999))
+
+    def test_layout_is_cached_and_frozen(self):
+        """Verifies one shared instance per joint/sensor count whose mappings cannot be mutated."""
+        self.assertIs(get_register_layout(6, 5), self.layout)
+        with self.assertRaises(TypeError):
+            self.layout.addresses["command_register"] = 5
+        with self.assertRaises(Exception):
+            self.layout.fields["command_register"].address = 5
+
+    def test_api_does_not_rebuild_modbus_map(self):
+        """Verifies getters use the compiled layout instead of constructing ModbusMap per call."""
+        api, comm = build_api(robot_type="artus_talos")
+        api.awake = True
+        comm.receive_data.return_value = [0] * 3
+        with patch("ArtusAPI.common.ModbusMap.ModbusMap.__init__", side_effect=AssertionError("ModbusMap rebuilt")):
+            api.get_joint_angles()
+        comm.receive_data.assert_called_with(amount_dat=3, start=201)
+        self.assertIsInstance(api._register_layout, RegisterLayout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the shared multi-drop RS485Bus and its per-hand handles."""
+
+import threading
+import time
+import unittest
+
+from ArtusAPI.communication.new_communication import NewCommunication
+from ArtusAPI.communication.RS485_RTU import RS485Bus, RS485BusHandle
+
+
+class FakeTransport:
+    """Single-slave transport stand-in that records which slave each call went to."""
+
+    def __init__(self, port, baudrate, timeout, logger, slave_address):
+        self.slave_address = slave_address
+        self.opened = 0
+        self.closed = 0
+        self.calls = []
+        self.active = 0
+        self.overlaps = 0
+        self._lock = threading.Lock()
+
+    def open(self):
+        self.opened += 1
+
+    def close(self):
+        self.closed += 1
+
+    def _call(self, kind):
+        with self._lock:
+            self.active += 1
+            if self.active > 1:
+                self.overlaps += 1
+        self.calls.append((kind, self.slave_address))
+        time.sleep(0.001)
+        with self._lock:
+            self.active -= 1
+        return [self.slave_address]
+
+    def send(self, data, command, **kwargs):
+        return self._call('send')
+
+    def receive(self, data, **kwargs):
+        return self._call('receive')
+
+    def send_receive(self, read_start, read_count, write_start, values, **kwargs):
+        return self._call('send_receive')
+
+
+class TestRS485Bus(unittest.TestCase):
+    """Verifies port refcounting, addressing, exclusivity and round-robin turns."""
+
+    def make_bus(self):
+        return RS485Bus(port='/dev/fake', transport_class=FakeTransport)
+
+    def test_port_opens_once_and_closes_after_last_handle(self):
+        """Verifies the port follows the first open and the last close."""
+        bus = self.make_bus()
+        left, right = bus.handle(0x10), bus.handle(0x20)
+        left.open()
+        right.open()
+        self.assertEqual(bus._transport.opened, 1)
+        left.close()
+        self.assertTrue(bus.is_open())
+        self.assertEqual(bus._transport.closed, 0)
+        right.close()
+        self.assertFalse(bus.is_open())
+        self.assertEqual(bus._transport.closed, 1)
+
+    def test_each_call_is_addressed_to_its_handle(self):
+        """Verifies the shared transport is pointed at the calling hand's slave ID."""
+        bus = self.make_bus()
+        left, right = bus.handle(0x10), bus.handle(0x20)
+        left.open()
+        right.open()
+        self.assertEqual(left.receive([200, 1]), [0x10])
+        self.assertEqual(right.send([1], 1), [0x20])
+        self.assertEqual(left.send_receive(201, 16, 1, [0]), [0x10])
+        self.assertEqual(bus._transport.calls, [('receive', 0x10), ('send', 0x20), ('send_receive', 0x10)])
+        self.assertEqual(left.get_stats()['transactions'], 2)
+
+    def test_duplicate_slave_address_is_rejected(self):
+        """Verifies two open handles cannot share a slave ID."""
+        bus = self.make_bus()
+        bus.handle(0x10).open()
+        with self.assertRaises(ValueError):
+            bus.handle(0x10).open()
+
+    def test_transact_on_closed_handle_raises(self):
+        """Verifies a handle must be opened before it can use the bus."""
+        bus = self.make_bus()
+        with self.assertRaises(ConnectionError):
+            bus.handle(0x10).receive([200, 1])
+
+    def test_concurrent_hands_alternate_without_overlap(self):
+        """Verifies busy hands take turns and never transact at the same time."""
+        bus = self.make_bus()
+        handles = [bus.handle(address) for address in (0x10, 0x20, 0x30)]
+        for handle in handles:
+            handle.open()
+        start = threading.Barrier(len(handles))
+
+        def worker(handle):
+            start.wait()
+            for _ in range(20):
+                handle.receive([200, 1])
+
+        threads = [threading.Thread(target=worker, args=(handle,)) for handle in handles]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        transport = bus._transport
+        self.assertEqual(transport.overlaps, 0)
+        served = [address for _, address in transport.calls]
+        self.assertEqual(len(served), 60)
+        # once all three are queued no hand is served twice in a row
+        middle = served[5:-5]
+        repeats = sum(1 for a, b in zip(middle, middle[1:]) if a == b)
+        self.assertEqual(repeats, 0)
+        for handle in handles:
+            self.assertEqual(handle.get_stats()['transactions'], 20)
+
+
+class TestSharedBusRegistry(unittest.TestCase):
+    """Verifies the process-wide bus registry and NewCommunication integration."""
+
+    def setUp(self):
+        saved = dict(RS485Bus._shared)
+        self.addCleanup(lambda: (RS485Bus._shared.clear(), RS485Bus._shared.update(saved)))
+
+    def test_shared_returns_one_bus_per_port(self):
+        """Verifies repeated lookups share a bus and a baud mismatch is rejected."""
+        bus = RS485Bus.shared('/dev/fake-shared', baudrate=115200)
+        self.assertIs(RS485Bus.shared('/dev/fake-shared', baudrate=115200), bus)
+        with self.assertRaises(ValueError):
+            RS485Bus.shared('/dev/fake-shared', baudrate=57600)
+
+    def test_new_communication_uses_bus_handle(self):
+        """Verifies RS485_RTU_Shared hands NewCommunication a handle on the given bus."""
+        bus = RS485Bus(port='/dev/fake', transport_class=FakeTransport)
+        left = NewCommunication(port=bus, slave_address=0x10, communication_method='RS485_RTU_Shared')
+        right = NewCommunication(port=bus, slave_address=0x20, communication_method='RS485_RTU_Shared')
+        self.assertIsInstance(left.communicator, RS485BusHandle)
+        self.assertIs(left.communicator.bus, right.communicator.bus)
+        self.assertEqual(right.communicator.slave_address, 0x20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the raw-framing RS485_RTU_Raw transport (no hardware).
+
+Request frames are checked byte-for-byte against what pymodbus builds for
+the same operation (the baseline used by test_rtu_packet_parity), and
+response handling is exercised with a fake serial port and, where
+pseudo-terminals are available, against the hand simulator.
+"""
+
+import os
+import struct
+import unittest
+from unittest.mock import MagicMock
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+from pymodbus.framer.rtu import FramerRTU
+from pymodbus.pdu import DecodePDU
+from pymodbus.pdu.register_message import ReadWriteMultipleRegistersRequest
+
+from ArtusAPI.api_tests.test_rtu_packet_parity import (
+    RECEIVE_CASES,
+    SEND_CASES,
+    SLAVE_ID,
+    build_pymodbus_frame,
+    expected_library_call,
+)
+from ArtusAPI.common.ModbusMap import ActuatorState, CommandType, ModbusMap
+from ArtusAPI.communication import modbus_pdu
+from ArtusAPI.communication.RS485_RTU.rs485_rtu_raw import RS485_RTU_Raw
+from ArtusAPI.communication.new_communication import NewCommunication
+from ArtusAPI.simulator import HandSimulator, RTUSimulatorServer
+
+
+def rtu_frame(pdu: bytes, slave=SLAVE_ID) -> bytes:
+    """Wraps a PDU into an RTU frame with CRC."""
+    frame = bytes([slave]) + pdu
+    return frame + struct.pack('<H', modbus_pdu.crc16(frame))
+
+
+class FakeSerial:
+    """Minimal pyserial stand-in: records writes and serves queued response bytes."""
+
+    def __init__(self):
+        self.written = []
+        self.pending = bytearray()
+        self.responses = []
+
+    def reset_input_buffer(self):
+        self.pending.clear()
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        if self.responses:
+            self.pending += self.responses.pop(0)
+        return len(data)
+
+    def readinto(self, buffer):
+        n = min(len(buffer), len(self.pending))
+        buffer[:n] = self.pending[:n]
+        del self.pending[:n]
+        return n
+
+    def close(self):
+        pass
+
+
+class TestRS485RTURaw(unittest.TestCase):
+    """Verifies framing, response validation and the send/receive contract."""
+
+    def setUp(self):
+        self.rtu = RS485_RTU_Raw(port="MOCK", slave_address=SLAVE_ID, logger=MagicMock())
+        self.serial = FakeSerial()
+        self.rtu.serial = self.serial
+
+    def test_send_frames_match_pymodbus(self):
+        """Verifies every CommandType produces the pymodbus wire bytes."""
+        for name, data, command in SEND_CASES:
+            with self.subTest(name):
+                kind, address, payload = expected_library_call(data, command)
+                expected = build_pymodbus_frame(kind, address, payload)
+                # echo responses: FC6 echoes the request, FC16 echoes address + count
+                self.serial.responses.append(expected if kind == "write_single" else expected[:6] + struct.pack(
+                    '<H', modbus_pdu.crc16(expected[:6])))
+                self.assertTrue(self.rtu.send(data, command))
+                self.assertEqual(self.serial.written[-1], expected)
+
+    def test_receive_frames_match_pymodbus(self):
+        """Verifies read requests match pymodbus and responses decode like RS485_RTU."""
+        for name, (address, count) in RECEIVE_CASES:
+            with self.subTest(name):
+                values = list(range(1, count + 1))
+                self.serial.responses.append(rtu_frame(modbus_pdu.build_register_response(0x03, values)))
+                result = self.rtu.receive([address, count])
+                self.assertEqual(self.serial.written[-1], build_pymodbus_frame("read_holding", address, None, count))
+                self.assertEqual(result, values[0] if count == 1 else values)
+
+    def test_send_receive_frame_matches_pymodbus(self):
+        """Verifies the FC 0x17 request bytes and the decoded read block."""
+        request = ReadWriteMultipleRegistersRequest(read_address=200, read_count=2, write_address=150,
+                                                    write_registers=[100, 0xFFFF], dev_id=SLAVE_ID, transaction_id=0)
+        self.serial.responses.append(rtu_frame(modbus_pdu.build_register_response(0x17, [0x0031, 7])))
+        self.assertEqual(self.rtu.send_receive(200, 2, 150, [100, -1]), [0x0031, 7])
+        self.assertEqual(self.serial.written[-1], FramerRTU(DecodePDU(False)).buildFrame(request))
+
+    def test_bad_crc_is_retried_then_raised(self):
+        """Verifies a corrupted response raises ModbusIOException after the retries."""
+        corrupt = bytearray(rtu_frame(modbus_pdu.build_register_response(0x03, [1])))
+        corrupt[-1] ^= 0xFF
+        self.serial.responses = [bytes(corrupt)] * 2
+        with self.assertRaises(ModbusIOException):
+            self.rtu.receive([200, 1], max_retries=2, retry_delay=0)
+        self.assertEqual(len(self.serial.written), 2)
+
+    def test_timeout_raises_modbus_io_exception(self):
+        """Verifies a silent slave surfaces as ModbusIOException."""
+        with self.assertRaises(ModbusIOException):
+            self.rtu.receive([200, 1], max_retries=1, retry_delay=0)
+
+    def test_exception_response_raises_with_code(self):
+        """Verifies a Modbus exception response is raised with its code, like RS485_RTU's error results."""
+        self.serial.responses.append(rtu_frame(modbus_pdu.build_exception_response(0x03, 0x02)))
+        with self.assertRaises(modbus_pdu.ModbusExceptionResponse) as ctx:
+            self.rtu.receive([200, 1], max_retries=1)
+        self.assertEqual(ctx.exception.exception_code, 0x02)
+
+    def test_unopened_port_raises_connection_exception(self):
+        """Verifies transactions before open() fail like a lost connection."""
+        self.rtu.serial = None
+        with self.assertRaises(ConnectionException):
+            self.rtu.receive([200, 1], max_retries=1)
+
+    def test_selectable_from_new_communication(self):
+        """Verifies NewCommunication constructs the raw transport by name."""
+        comm = NewCommunication(port="MOCK", slave_address=SLAVE_ID, communication_method="RS485_RTU_Raw")
+        self.assertIsInstance(comm.communicator, RS485_RTU_Raw)
+        self.assertEqual(comm.communicator.slave_address, SLAVE_ID)
+
+    @unittest.skipUnless(hasattr(os, "openpty"), "pseudo-terminals need POSIX")
+    def test_against_simulator_over_pty(self):
+        """Verifies setup, read and read/write transactions against the simulator."""
+        reg = ModbusMap().modbus_reg_map
+        sim = HandSimulator(robot_type="artus_lite", transition_time=0.0)
+        with RTUSimulatorServer(sim) as server:
+            transport = RS485_RTU_Raw(port=server.port, timeout=0.2, slave_address=sim.slave_address)
+            transport.open()
+            self.addCleanup(transport.close)
+            self.assertTrue(transport.send([0x0B, 3], CommandType.SETUP_COMMANDS.value))
+            self.assertEqual(transport.receive([reg["feedback_register"], 1]) & 0xF, ActuatorState.ACTUATOR_ACTIVE.value)
+            self.assertTrue(transport.send([reg["target_velocity_start_reg"], 10, 20], CommandType.TARGET_COMMAND.value))
+            self.assertEqual(transport.send_receive(reg["slave_id_reg"], 1, reg["target_velocity_start_reg"], [7]),
+                             sim.slave_address)
+            self.assertEqual(sim.registers[reg["target_velocity_start_reg"]:reg["target_velocity_start_reg"] + 2], [7, 20])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Tests for session recording at the NewCommunication boundary and replay without hardware."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pymodbus.exceptions import ModbusIOException
+
+from ArtusAPI.common.ModbusMap import ActuatorState, CommandType
+from ArtusAPI.communication.new_communication import NewCommunication
+from ArtusAPI.communication.session_log import (RECEIVE, SEND, SEND_RECEIVE, ReplayMismatchError,
+                                                ReplayTransport, read_session_log)
+
+
+class TestSessionLog(unittest.TestCase):
+    """Records a session through a mock transport and replays it."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'session.bin')
+        self.transport = MagicMock()
+        self.transport.last_retries = 0
+        self.transport.send.return_value = True
+        with patch("ArtusAPI.communication.new_communication.RS485_RTU", return_value=self.transport):
+            self.comm = NewCommunication(port="MOCK", communication_method="RS485_RTU")
+
+    def tearDown(self):
+        self.comm.stop_recording()
+        self.directory.cleanup()
+
+    def record_session(self):
+        """Records a setup command, a target write, reads, a read-write and a timeout."""
+        self.comm.start_recording(self.path)
+        self.comm.send_data([0x1A])
+        self.comm.send_data([1, 5, 6], CommandType.TARGET_COMMAND.value)
+        self.transport.receive.side_effect = [ActuatorState.ACTUATOR_READY.value, [1, 2, 3],
+                                              ModbusIOException("No response received")]
+        self.comm.receive_data()
+        self.comm.receive_data(3, 201)
+        with self.assertRaises(ModbusIOException):
+            self.comm.receive_data(3, 201)
+        self.transport.send_receive.return_value = [7, 8]
+        self.comm.send_receive_data(201, 2, 1, [5, 6])
+        return self.comm.stop_recording()
+
+    def replay(self, **kwargs):
+        transport = ReplayTransport(self.path, **kwargs)
+        comm = NewCommunication(port=transport, communication_method="Replay")
+        comm.open_connection()
+        return transport, comm
+
+    def test_log_round_trip(self):
+        """Verifies every call is written with its payload and result."""
+        self.assertEqual(self.record_session(), 6)
+        self.assertIs(self.comm.communicator, self.transport)
+        wall_start, records = read_session_log(self.path)
+        self.assertAlmostEqual(wall_start, time.time(), delta=5)
+        self.assertEqual([record.kind for record in records], [SEND, SEND, RECEIVE, RECEIVE, RECEIVE, SEND_RECEIVE])
+        self.assertEqual(records[1].request, (CommandType.TARGET_COMMAND.value, [1, 5, 6]))
+        self.assertEqual(records[2].result, ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual(records[4].error, ('ModbusIOException', 'Modbus Error: [Input/Output] No response received'))
+        self.assertEqual(records[5].request, (201, 2, 1, [5, 6]))
+        self.assertLess(os.path.getsize(self.path), 400)
+
+    def test_replay_returns_recorded_results(self):
+        """Verifies results and errors come back in order without hardware."""
+        self.record_session()
+        transport, comm = self.replay(speed=None)
+        self.assertTrue(comm.send_data([0x1A]))
+        self.assertTrue(comm.send_data([1, 5, 6], CommandType.TARGET_COMMAND.value))
+        self.assertEqual(comm.receive_data(), ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual(comm.receive_data(3, 201), [1, 2, 3])
+        with self.assertRaises(ModbusIOException):
+            comm.receive_data(3, 201)
+        self.assertEqual(comm.send_receive_data(201, 2, 1, [5, 6]), [7, 8])
+        self.assertEqual(transport.remaining(), 0)
+        with self.assertRaises(ConnectionError):
+            comm.receive_data()
+
+    def test_strict_and_lenient_matching(self):
+        """Verifies a diverging request raises when strict and is counted otherwise."""
+        self.record_session()
+        _, comm = self.replay(speed=None)
+        with self.assertRaises(ReplayMismatchError):
+            comm.send_data([0x1B])
+        transport, comm = self.replay(speed=None, strict=False)
+        comm.send_data([0x1B])
+        self.assertEqual(comm.receive_data(), ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual((transport.mismatches, transport.position), (1, 3))
+
+    def test_replay_speed(self):
+        """Verifies replay keeps the recorded pacing, compressed by the speed factor."""
+        self.comm.start_recording(self.path)
+        self.transport.receive.side_effect = lambda data: time.sleep(0.05) or 0
+        for _ in range(3):
+            self.comm.receive_data()
+        self.comm.stop_recording()
+        _, records = read_session_log(self.path)
+        recorded = records[-1].start + records[-1].duration - records[0].start
+
+        _, comm = self.replay(speed=2.0)
+        began = time.perf_counter()
+        for _ in range(3):
+            comm.receive_data()
+        self.assertAlmostEqual(time.perf_counter() - began, recorded / 2.0, delta=0.03)
+
+    def test_wait_for_ready_against_recording(self):
+        """Verifies wait_for_ready sees the recorded state sequence and reaches READY."""
+        self.comm.start_recording(self.path)
+        states = [ActuatorState.ACTUATOR_BUSY.value] * 3 + [ActuatorState.ACTUATOR_READY.value]
+        self.transport.receive.side_effect = states
+        self.assertEqual(self.comm.wait_for_ready(timeout=1, acceptable_state=ActuatorState.ACTUATOR_READY.value),
+                         ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual(self.comm.stop_recording(), 4)
+
+        transport, comm = self.replay()
+        self.assertEqual(comm.wait_for_ready(timeout=1, acceptable_state=ActuatorState.ACTUATOR_READY.value),
+                         ActuatorState.ACTUATOR_READY.value)
+        self.assertEqual((comm.ntrips, transport.remaining()), (4, 0))
+
+    def test_pipelined_batch_is_recorded_as_single_calls(self):
+        """Verifies a transport batch is logged so it replays on a sequential transport."""
+        self.transport.batch.return_value = [[1, 2], True]
+        self.comm.start_recording(self.path)
+        self.comm.batch_data([('read', 201, 2), ('write', 1, [5, 6])])
+        self.comm.stop_recording()
+        _, records = read_session_log(self.path)
+        self.assertEqual([(record.kind, record.request) for record in records],
+                         [(RECEIVE, (201, 2)), (SEND, (CommandType.TARGET_COMMAND.value, [1, 5, 6]))])
+        _, comm = self.replay(speed=None)
+        self.assertEqual(comm.batch_data([('read', 201, 2), ('write', 1, [5, 6])]), [[1, 2], True])
+
+
+if __name__ == '__main__':
+    unittest.main()
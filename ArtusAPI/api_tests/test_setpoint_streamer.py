@@ -0,0 +1,139 @@
+"""Tests for ArtusAPI.communication.setpoint_streamer.SetpointStreamer (no hardware)."""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from ArtusAPI.api_tests.mocks import build_api
+from ArtusAPI.common.ModbusMap import CommandType
+from ArtusAPI.communication.setpoint_streamer import SetpointStreamer
+
+
+class TestSetpointStreamer(unittest.TestCase):
+    """Verifies the latest-wins mailbox and the I/O thread lifecycle."""
+
+    def _make_streamer(self, period=0.005):
+        """Builds a streamer around a mock communication handler.
+
+        Args:
+            period: Communication period in seconds.
+
+        Returns:
+            A (streamer, communication mock) tuple.
+        """
+        comm = MagicMock()
+        streamer = SetpointStreamer(communication_handler=comm, communication_period=period)
+        self.addCleanup(streamer.stop)
+        return streamer, comm
+
+    def _wait_for(self, predicate, timeout=1.0):
+        """Polls ``predicate`` until it is true or ``timeout`` elapses."""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.001)
+        return False
+
+    def test_post_coalesces_same_block(self):
+        """Verifies a newer command for the same start register replaces the pending one."""
+        streamer, comm = self._make_streamer()
+        streamer.post([1, 0x0101])
+        streamer.post([1, 0x0202])
+        self.assertEqual(streamer.pending(), 1)
+        self.assertEqual(streamer.get_stats()["coalesced"], 1)
+
+    def test_sends_latest_value_only(self):
+        """Verifies only the freshest setpoint of a block reaches the bus."""
+        streamer, comm = self._make_streamer()
+        for value in range(10):
+            streamer.post([1, value])
+        streamer.start()
+        self.assertTrue(self._wait_for(lambda: comm.send_data.call_count >= 1))
+        time.sleep(0.02)
+        comm.send_data.assert_called_once_with([1, 9], CommandType.TARGET_COMMAND.value)
+
+    def test_distinct_blocks_all_sent_in_order(self):
+        """Verifies position, velocity and force blocks each get their own write, oldest first."""
+        streamer, comm = self._make_streamer(period=0.001)
+        streamer.post([1, 5])
+        streamer.post([150, 100])
+        streamer.post([50, 0, 0])
+        streamer.start()
+        self.assertTrue(self._wait_for(lambda: comm.send_data.call_count == 3))
+        starts = [c.args[0][0] for c in comm.send_data.call_args_list]
+        self.assertEqual(starts, [1, 150, 50])
+
+    def test_paces_writes_at_period(self):
+        """Verifies consecutive writes are at least one communication period apart."""
+        streamer, comm = self._make_streamer(period=0.02)
+        stamps = []
+        comm.send_data.side_effect = lambda *a: stamps.append(time.perf_counter())
+        streamer.start()
+        streamer.post([1, 1])
+        self.assertTrue(self._wait_for(lambda: len(stamps) == 1))
+        streamer.post([1, 2])
+        self.assertTrue(self._wait_for(lambda: len(stamps) == 2))
+        self.assertGreaterEqual(stamps[1] - stamps[0], 0.019)
+
+    def test_write_error_keeps_thread_alive(self):
+        """Verifies a failing write is counted and the thread keeps serving the mailbox."""
+        streamer, comm = self._make_streamer(period=0.001)
+        comm.send_data.side_effect = [IOError("bus"), True]
+        streamer.start()
+        streamer.post([1, 1])
+        self.assertTrue(self._wait_for(lambda: streamer.errors == 1))
+        streamer.post([1, 2])
+        self.assertTrue(self._wait_for(lambda: streamer.sent == 1))
+        self.assertTrue(streamer.is_running())
+        self.assertIsInstance(streamer.last_error, IOError)
+
+    def test_stop_joins_thread_and_drops_pending(self):
+        """Verifies stop() exits the thread and clears the mailbox."""
+        streamer, comm = self._make_streamer(period=10)
+        streamer.start()
+        streamer.post([1, 1])  # sent immediately
+        self.assertTrue(self._wait_for(lambda: comm.send_data.call_count == 1))
+        streamer.post([1, 2])  # waits for the next 10 s slot
+        streamer.stop()
+        self.assertFalse(streamer.is_running())
+        self.assertEqual(streamer.pending(), 0)
+        self.assertEqual(comm.send_data.call_count, 1)
+
+
+class TestArtusAPIV2Streaming(unittest.TestCase):
+    """Verifies ArtusAPI_V2 routes target commands through the streamer when enabled."""
+
+    def test_set_joint_angles_posts_without_blocking(self):
+        """Verifies set_joint_angles posts to the mailbox and never waits on the bus in streaming mode."""
+        api, comm = build_api(communication_frequency=1)
+        self.addCleanup(api.stop_streaming)
+        gate = threading.Event()
+        comm.send_data.side_effect = lambda *a: gate.wait(1.0)
+        api.start_streaming()
+        api.awake = True
+        started = time.perf_counter()
+        for angle in range(5):
+            self.assertTrue(api.set_joint_angles({"thumb_flex": {"target_angle": angle}}))
+        self.assertLess(time.perf_counter() - started, 0.5)
+        gate.set()
+        stats = api.get_streaming_stats()
+        self.assertEqual(stats["posted"], 5)
+
+    def test_streaming_constructor_flag(self):
+        """Verifies streaming=True starts the streamer and disconnect() stops it."""
+        api, comm = build_api(streaming=True)
+        self.assertTrue(api.is_streaming())
+        api.disconnect()
+        self.assertFalse(api.is_streaming())
+
+    def test_not_streaming_by_default(self):
+        """Verifies the default API keeps the synchronous write path."""
+        api, _ = build_api()
+        self.assertFalse(api.is_streaming())
+        self.assertIsNone(api.get_streaming_stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
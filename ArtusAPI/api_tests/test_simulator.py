@@ -0,0 +1,158 @@
+"""Tests for ArtusAPI.simulator, including the real transports against it (no hardware)."""
+
+import os
+import time
+import unittest
+
+from ArtusAPI.api_tests.mocks import FakeClock
+from ArtusAPI.artus_api_new import ArtusAPI_V2
+from ArtusAPI.commands import NewCommands
+from ArtusAPI.common.ModbusMap import ActuatorState, CommandType, ModbusMap, TrajectoryReturn
+from ArtusAPI.communication import modbus_pdu
+from ArtusAPI.communication.Modbus_TCP.pipelined_modbus_tcp import PipelinedModbusTCP
+from ArtusAPI.communication.RS485_RTU.rs485_rtu import RS485_RTU
+from ArtusAPI.simulator import HandSimulator, ModbusTCPSimulatorServer, RTUSimulatorServer
+
+
+REG = ModbusMap().modbus_reg_map
+
+
+class TestHandSimulator(unittest.TestCase):
+    """Verifies the state machine, dynamics and feedback encoding."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sim = HandSimulator(robot_type="artus_lite", clock=self.clock, time_constant=0.05, transition_time=0.1)
+        self.commands = NewCommands(num_joints=self.sim.num_joints)
+
+    def status(self):
+        raw = self.sim.read_registers(REG["feedback_register"], 1)[0]
+        return raw & 0xF, raw >> 4
+
+    def start(self, control_type=3):
+        self.sim.write_registers(0, [(control_type << 8) | 0x0B], single=True)
+        self.clock.now += 0.2
+
+    def test_start_goes_busy_then_active(self):
+        """Verifies the start command reports BUSY until the transition time elapses."""
+        self.sim.write_registers(0, [(3 << 8) | 0x0B], single=True)
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_BUSY.value)
+        self.clock.now += 0.2
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_ACTIVE.value)
+
+    def test_position_target_converges_first_order(self):
+        """Verifies joints approach their target and the trajectory completes."""
+        self.start()
+        self.sim.write_registers(REG["target_position_start_reg"], [(40 << 8) | 20])
+        self.clock.now += 0.05
+        self.assertEqual(self.status()[1], TrajectoryReturn.TRAJECTORY_RUNNING.value)
+        self.assertTrue(0 < self.sim.position[0] < 40)
+        self.clock.now += 1.0
+        self.assertEqual(self.status()[1], TrajectoryReturn.TRAJECTORY_COMPLETE.value)
+        feedback = self.sim.read_registers(REG["feedback_position_start_reg"], 8)
+        decoded = self.commands.get_decoded_feedback_data(feedback, "feedback_position_start_reg")
+        self.assertEqual(decoded[:2], [40, 20])
+
+    def test_feedback_decodes_with_new_commands(self):
+        """Verifies force, voltage and error feedback round-trip through the API decoders."""
+        self.sim.inject_error(1, 0x20)
+        errors = self.sim.read_registers(REG["feedback_actuator_error_reg"], 2 * self.sim.num_joints)
+        self.assertEqual(self.commands.get_decoded_feedback_data(errors, "feedback_actuator_error_reg")[1], 0x20)
+        voltage = self.sim.read_registers(REG["feedback_voltage_start_reg"], 2)
+        self.assertEqual(self.commands.get_decoded_feedback_data(voltage, "feedback_voltage_start_reg"), [24.0])
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_ERROR.value)
+        self.sim.write_registers(0, [0x1A], single=True)
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_IDLE.value)
+
+    def test_fc17_writes_before_reading(self):
+        """Verifies FC 0x17 applies the write and returns the requested read block."""
+        pdu = modbus_pdu.build_read_write_multiple_registers(REG["slave_id_reg"], 1, REG["target_velocity_start_reg"], [5])
+        self.assertEqual(modbus_pdu.parse_response(0x17, self.sim.handle_pdu(pdu)), [self.sim.slave_address])
+        self.assertEqual(self.sim.registers[REG["target_velocity_start_reg"]], 5)
+
+    def test_config_flow_reports_ip(self):
+        """Verifies the onboard config flow stores the string and reports the IP."""
+        self.sim.write_registers(0, [(1 << 8) | 0x44], single=True)
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_CONFIG.value)
+        self.sim.write_registers(0, [3, *ArtusAPI_V2.string_to_registers("lab")])
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_CONFIG_FINISH.value)
+        self.assertEqual(self.sim.config[1], "lab")
+        self.assertEqual(self.sim.read_registers(REG["feedback_position_start_reg"], 2), [(192 << 8) | 168, (4 << 8) | 2])
+
+    def test_firmware_flow_acks_each_chunk(self):
+        """Verifies firmware chunks are acknowledged and the image is assembled."""
+        self.sim.write_registers(0, [(6 << 8) | 0x11], single=True)
+        self.clock.now += 0.1
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_FLASHING_ACK.value)
+        self.sim.write_registers(0, [0x11, 0x0102, 0x0304])
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_FLASHING.value)
+        self.clock.now += 0.1
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_FLASHING_ACK.value)
+        self.sim.write_registers(0, [0, 0])
+        self.clock.now += 0.1
+        self.assertEqual(self.status()[0], ActuatorState.ACTUATOR_IDLE.value)
+        self.assertEqual(bytes(self.sim.firmware_image), b"\x01\x02\x03\x04")
+
+    def test_out_of_range_read_is_an_exception_response(self):
+        """Verifies reads past the register bank return illegal data address."""
+        pdu = modbus_pdu.build_read_holding_registers(HandSimulator.REGISTER_COUNT - 1, 2)
+        self.assertEqual(self.sim.handle_pdu(pdu), bytes([0x83, 0x02]))
+
+
+class TestSimulatorServers(unittest.TestCase):
+    """Runs the real transports and ArtusAPI_V2 against the simulator servers."""
+
+    def test_artus_api_v2_over_modbus_tcp(self):
+        """Verifies wake_up, set_joint_angles and feedback end to end over TCP."""
+        sim = HandSimulator(robot_type="artus_lite", time_constant=0.01, transition_time=0.01)
+        with ModbusTCPSimulatorServer(sim) as server:
+            api = ArtusAPI_V2(communication_method="Modbus_TCP", communication_channel_identifier=server.address,
+                              robot_type="artus_lite", hand_type="left")
+            self.addCleanup(api.disconnect)
+            api.wake_up()
+            self.assertEqual(sim.state, ActuatorState.ACTUATOR_ACTIVE.value)
+            api.set_joint_angles({"thumb_spread": {"target_angle": 15}})
+            self.assertTrue(api._communication_handler.wait_for_ready(timeout=2))
+            time.sleep(0.2)  # wait_for_ready returns as soon as ACTIVE is seen; let the simulated joint settle
+            angles = api.set_get_joint_angles({"thumb_spread": {"target_angle": 15}})
+            # feedback reports the raw (direction-applied) joint target
+            self.assertEqual(angles["thumb_spread"], api._robot_handler.robot.hand_joints["thumb_spread"].target_angle)
+            self.assertEqual(abs(angles["thumb_spread"]), 15)
+            snapshot = api.get_hand_feedback_data()
+            self.assertEqual(snapshot["position"]["thumb_spread"], angles["thumb_spread"])
+            self.assertEqual(snapshot["status"] & 0xF, ActuatorState.ACTUATOR_ACTIVE.value)
+
+    def test_pipelined_transport_against_simulator(self):
+        """Verifies a pipelined batch is served by the simulator."""
+        sim = HandSimulator(robot_type="artus_talos")
+        sim.set_fingertip_forces([1.5] * 3 * sim.num_force_sensors)
+        with ModbusTCPSimulatorServer(sim, latency=0.001, jitter=0.001, seed=1) as server:
+            transport = PipelinedModbusTCP(host=server.host, port=server.port, slave_address=sim.slave_address)
+            transport.open()
+            self.addCleanup(transport.close)
+            ok, tips, slave_id = transport.batch([
+                ("write", REG["target_position_start_reg"], [0]),
+                ("read", REG["feedback_force_sensor_start_reg"], 6 * sim.num_force_sensors),
+                ("read", REG["slave_id_reg"], 1),
+            ])
+        self.assertTrue(ok)
+        forces = NewCommands(num_joints=sim.num_joints).get_decoded_feedback_data(tips, "feedback_force_sensor_start_reg")
+        self.assertEqual(forces, [1.5] * 3 * sim.num_force_sensors)
+        self.assertEqual(slave_id, [sim.slave_address])
+
+    @unittest.skipUnless(hasattr(os, "openpty"), "pseudo-terminals need POSIX")
+    def test_rs485_rtu_over_pty(self):
+        """Verifies the RS485_RTU transport talks to the simulator through a pty."""
+        sim = HandSimulator(robot_type="artus_lite", transition_time=0.0)
+        with RTUSimulatorServer(sim) as server:
+            transport = RS485_RTU(port=server.port, baudrate=115200, timeout=0.2, slave_address=sim.slave_address)
+            transport.open()
+            self.addCleanup(transport.close)
+            self.assertTrue(transport.send([0x0B, 3], CommandType.SETUP_COMMANDS.value))
+            self.assertEqual(transport.receive([REG["feedback_register"], 1]) & 0xF, ActuatorState.ACTUATOR_ACTIVE.value)
+            self.assertEqual(transport.send_receive(REG["slave_id_reg"], 1, REG["target_velocity_start_reg"], [7]),
+                             sim.slave_address)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for Trajectory generation and the TrajectoryPlayer streaming thread."""
+
+import os
+import time
+import unittest
+
+import numpy as np
+
+from ArtusAPI.api_tests.mocks import build_api
+from ArtusAPI.trajectory import Trajectory, TrajectoryPlayer, pose_to_array
+
+POSES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'hand_poses')
+
+
+class TestTrajectory(unittest.TestCase):
+    """Verifies profile shapes, timing from max_velocity, limits and blending conditions."""
+
+    def test_minimum_jerk_rest_to_rest(self):
+        """Verifies a single segment starts and ends at rest and peaks at 1.875x the mean speed."""
+        trajectory = Trajectory.from_waypoints([[0.0, 10.0], [90.0, 10.0]], times=[0.0, 1.0])
+        np.testing.assert_allclose(trajectory.position([0.0, 1.0]), [[0, 10], [90, 10]])
+        np.testing.assert_allclose(trajectory.velocity([0.0, 1.0]), 0, atol=1e-9)
+        np.testing.assert_allclose(trajectory.acceleration([0.0, 1.0]), 0, atol=1e-9)
+        self.assertAlmostEqual(trajectory.velocity(0.5)[0], 1.875 * 90)
+        np.testing.assert_allclose(trajectory.position(5.0), [90, 10])
+
+    def test_timing_respects_max_velocity(self):
+        """Verifies derived timings keep every joint under its speed limit, for both profiles."""
+        waypoints = [[0, 0, 0], [45, 10, -30], [90, -20, 0], [0, 0, 0]]
+        for profile in ('minimum_jerk', 'cubic'):
+            with self.subTest(profile=profile):
+                trajectory = Trajectory.from_waypoints(waypoints, profile=profile, max_velocity=[100, 50, 100])
+                peak = trajectory.peak_velocity(samples_per_segment=256)
+                self.assertTrue(np.all(peak <= np.array([100, 50, 100]) * 1.001), peak)
+                np.testing.assert_allclose(trajectory.position(trajectory.breaks), waypoints, atol=1e-9)
+
+    def test_cubic_spline_is_smooth_through_waypoints(self):
+        """Verifies the spline's velocity and acceleration are continuous at interior waypoints."""
+        trajectory = Trajectory.from_waypoints([[0], [30], [10], [50]], times=[0, 0.5, 1.0, 1.5], profile='cubic')
+        for knot in trajectory.breaks[1:-1]:
+            for derivative in (1, 2):
+                before = trajectory.evaluate(knot - 1e-9, derivative)
+                after = trajectory.evaluate(knot + 1e-9, derivative)
+                np.testing.assert_allclose(before, after, atol=1e-4)
+
+    def test_blending_start_conditions(self):
+        """Verifies a trajectory can start from a moving state."""
+        trajectory = Trajectory.from_waypoints([[0.0], [10.0]], times=[0, 1], start_velocity=[5.0], start_acceleration=[2.0])
+        self.assertAlmostEqual(trajectory.velocity(0.0)[0], 5.0)
+        self.assertAlmostEqual(trajectory.acceleration(0.0)[0], 2.0)
+        self.assertAlmostEqual(trajectory.position(1.0)[0], 10.0)
+
+    def test_positions_are_clipped_to_limits(self):
+        """Verifies waypoints and samples never leave the joint limits."""
+        trajectory = Trajectory.from_waypoints([[0.0], [120.0]], times=[0, 1], lower=[-10.0], upper=[90.0])
+        self.assertEqual(trajectory.position(1.0)[0], 90.0)
+        self.assertTrue(np.all(trajectory.sample(100)[1] <= 90.0))
+
+    def test_invalid_arguments(self):
+        """Verifies bad profiles, times and missing timing are rejected."""
+        with self.assertRaises(ValueError):
+            Trajectory.from_waypoints([[0], [1]], times=[0, 1], profile='linear')
+        with self.assertRaises(ValueError):
+            Trajectory.from_waypoints([[0], [1]], times=[0.5, 1])
+        with self.assertRaises(ValueError):
+            Trajectory.from_waypoints([[0], [1]])
+        with self.assertRaises(ValueError):
+            Trajectory.from_waypoints([[0]], times=[0])
+
+    def test_pose_to_array_reads_pose_files(self):
+        """Verifies data/hand_poses files map onto joint index order."""
+        names = build_api()[0]._robot_handler.robot.joint_state.joint_names
+        angles = pose_to_array({'thumb_flex': 40, 'thumb_d1': {'index': 3, 'target_angle': 20}}, names, np.zeros(16))
+        np.testing.assert_allclose(angles[:4], [0, 40, 0, 20])
+        grasp = pose_to_array(os.path.join(POSES_DIR, 'grasp_example.json'), names, np.zeros(16))
+        self.assertEqual(grasp[0], -25)
+        with self.assertRaises(ValueError):
+            pose_to_array({'elbow': 10}, names, np.zeros(16))
+
+
+class TestTrajectoryPlayer(unittest.TestCase):
+    """Verifies the player streams setpoints, finishes on target and blends on preemption."""
+
+    def setUp(self):
+        self.api, self.comm = build_api(communication_frequency=500)
+        self.api.awake = True
+        self.api.control_type = 3
+        self.sent = []
+        joint_state = self.api._robot_handler.robot.joint_state
+        self.comm.send_data.side_effect = lambda *args, **kwargs: self.sent.append(joint_state.target_angle.copy()) or True
+        self.player = TrajectoryPlayer(self.api)
+        self.addCleanup(self.player.stop)
+
+    def test_move_to_reaches_pose(self):
+        """Verifies a timed move streams intermediate setpoints and ends on the goal."""
+        goal = np.zeros(16)
+        goal[5] = 60.0
+        self.player.move_to(goal, duration=0.1)
+        self.assertTrue(self.player.wait(timeout=2.0))
+        np.testing.assert_allclose(self.sent[-1], goal)
+        self.assertGreater(len(self.sent), 10)
+        steps = np.diff([setpoint[5] for setpoint in self.sent])
+        self.assertTrue(np.all(steps >= -1e-9))
+        self.assertEqual(self.player.get_stats()['completed'], 1)
+
+    def test_preemption_blends_without_jump(self):
+        """Verifies a new motion started mid-flight continues from the current setpoint."""
+        out = np.zeros(16)
+        out[5] = 90.0
+        self.player.move_to(out, duration=0.3)
+        time.sleep(0.1)
+        self.player.move_to(np.zeros(16), duration=0.2)
+        self.assertTrue(self.player.wait(timeout=2.0))
+        trace = np.array([setpoint[5] for setpoint in self.sent])
+        self.assertGreater(trace.max(), 5.0)
+        self.assertLess(np.abs(np.diff(trace)).max(), 5.0)
+        self.assertAlmostEqual(trace[-1], 0.0)
+        stats = self.player.get_stats()
+        self.assertEqual(stats['preempted'], 1)
+        self.assertEqual(stats['completed'], 1)
+
+    def test_asleep_hand_drops_motion(self):
+        """Verifies the player does not spin on a hand that is not awake."""
+        self.api.set_joint_targets = lambda **kwargs: None  # what an asleep hand returns
+        self.player.move_to(np.ones(16), duration=0.1)
+        self.assertTrue(self.player.wait(timeout=1.0))
+        self.assertEqual(self.sent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
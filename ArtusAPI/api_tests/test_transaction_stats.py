@@ -0,0 +1,117 @@
+"""Tests for transaction latency histograms and their recording in NewCommunication."""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pymodbus.exceptions import ModbusIOException
+
+from ArtusAPI.common.ModbusMap import CommandType
+from ArtusAPI.communication.new_communication import NewCommunication
+from ArtusAPI.communication.transaction_stats import LatencyHistogram, TransactionStats, pdu_sizes
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Verifies bucket accuracy and percentiles."""
+
+    def test_percentiles_within_bucket_error(self):
+        """Verifies percentiles are within ~3% above the exact value."""
+        histogram = LatencyHistogram()
+        for micros in range(1, 10001):
+            histogram.record(micros / 1e6)
+        self.assertEqual(histogram.count, 10000)
+        for percent, exact in ((50, 5000e-6), (90, 9000e-6), (99, 9900e-6)):
+            value = histogram.percentile(percent)
+            self.assertGreaterEqual(value, exact)
+            self.assertLessEqual(value, exact * 1.035)
+        self.assertEqual(histogram.percentile(100), 0.01)
+
+    def test_small_values_are_exact(self):
+        """Verifies latencies under 32 us land in exact buckets."""
+        histogram = LatencyHistogram()
+        histogram.record(5e-6)
+        histogram.record(20e-6)
+        self.assertAlmostEqual(histogram.percentile(50), 5e-6)
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+
+class TestTransactionStats(unittest.TestCase):
+    """Verifies counters per function code and register range, and the periodic dump."""
+
+    def test_record_counts_bytes_retries_and_timeouts(self):
+        """Verifies bytes include framing and retransmissions, and failures are classified."""
+        stats = TransactionStats(frame_overhead=3)
+        request, response = pdu_sizes(0x03, read_count=8)
+        stats.record(0x03, 201, 8, 0.004, request, response)
+        stats.record(0x03, 201, 8, 0.010, request, response, retries=1)
+        stats.record(0x03, 201, 8, 0.200, request, response, retries=2, error=ModbusIOException("No response received"))
+        stats.record(0x03, 201, 8, 0.001, request, response, error=ValueError("bad frame"))
+        (row,) = stats.get_snapshot()['transactions']
+        self.assertEqual((row['function_code'], row['start'], row['count']), (0x03, 201, 8))
+        self.assertEqual(row['transactions'], 4)
+        self.assertEqual(row['retries'], 3)
+        self.assertEqual((row['timeouts'], row['errors']), (1, 1))
+        self.assertEqual(row['request_bytes'], 8 * (1 + 2 + 3 + 1))
+        self.assertEqual(row['response_bytes'], 2 * (2 + 16 + 3))
+        self.assertEqual(row['latency']['count'], 2)
+        self.assertEqual(row['latency']['max'], 0.010)
+
+    def test_periodic_dump_to_file(self):
+        """Verifies snapshots are appended to a file as JSON lines."""
+        stats = TransactionStats()
+        stats.record(0x10, 1, 8, 0.002, *pdu_sizes(0x10, write_count=8))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stats.jsonl')
+            stats.start_dump(0.02, path=path)
+            time.sleep(0.1)
+            stats.stop_dump()
+            with open(path) as file:
+                lines = [json.loads(line) for line in file]
+        self.assertGreaterEqual(len(lines), 2)
+        self.assertEqual(lines[0]['transactions'][0]['function_code'], 0x10)
+
+
+class TestNewCommunicationInstrumentation(unittest.TestCase):
+    """Verifies NewCommunication records every transaction type."""
+
+    def setUp(self):
+        self.transport = MagicMock()
+        self.transport.last_retries = 0
+        self.transport.receive.return_value = [0] * 8
+        with patch("ArtusAPI.communication.new_communication.RS485_RTU", return_value=self.transport):
+            self.comm = NewCommunication(port="MOCK", communication_method="RS485_RTU")
+
+    def rows(self):
+        return {(row['function_code'], row['start'], row['count']): row
+                for row in self.comm.get_transaction_stats()['transactions']}
+
+    def test_function_codes_and_ranges(self):
+        """Verifies commands, targets, reads and read-writes get their own rows."""
+        self.comm.send_data([0x1A])
+        self.comm.send_data([1, 5, 6], CommandType.TARGET_COMMAND.value)
+        self.comm.receive_data(8, 201)
+        self.comm.receive_data(8, 201)
+        self.comm.send_receive_data(201, 8, 1, [5, 6])
+        rows = self.rows()
+        self.assertEqual(set(rows), {(0x06, 0, 1), (0x10, 1, 2), (0x03, 201, 8), (0x17, 201, 8)})
+        self.assertEqual(rows[(0x03, 201, 8)]['transactions'], 2)
+        self.assertEqual(rows[(0x10, 1, 2)]['request_bytes'], 6 + 4 + 3)
+        self.comm.reset_transaction_stats()
+        self.assertEqual(self.rows(), {})
+
+    def test_retries_and_failures(self):
+        """Verifies transport-reported retries and raised timeouts are recorded."""
+        self.transport.last_retries = 2
+        self.comm.receive_data(8, 201)
+        self.transport.receive.side_effect = ModbusIOException("No response received from remote unit")
+        with self.assertRaises(ModbusIOException):
+            self.comm.receive_data(8, 201)
+        row = self.rows()[(0x03, 201, 8)]
+        self.assertEqual((row['retries'], row['timeouts'], row['latency']['count']), (4, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,16 +15,34 @@ See the LICENSE file in the repository for full details.
 import time
 import logging
 import signal
-import math
 from enum import Enum
 from tracemalloc import start
-from .common.ModbusMap import ModbusMap,TrajectoryReturn
+from .common.ModbusMap import TrajectoryReturn
+from .common.register_layout import REGISTER_ADDRESSES, get_register_layout
 from .common.SlaveIDMap import expected_slave_id
 from .commands import NewCommands
 from .communication.new_communication import NewCommunication,ActuatorState,CommandType
+from .communication.setpoint_streamer import SetpointStreamer
+from .communication.pacing_scheduler import PacingScheduler
+from .communication.read_planner import ReadPlanner
+from .communication.feedback_ring import FeedbackRing
+from .communication.modbus_pdu import MAX_READ_WRITE_WRITE_COUNT
 from .robot import Robot
+from .robot.bldc_robot.joint_state import FEEDBACK_FIELDS
+from .pose_library import FRAME_CONTROL_BITS
 from .firmware_update import FirmwareUpdaterNew
 
+# feedback register key -> field name in the snapshot returned by get_hand_feedback_data
+FEEDBACK_SNAPSHOT_FIELDS = {
+    'feedback_register': 'status',
+    'feedback_position_start_reg': 'position',
+    'feedback_force_start_reg': 'force',
+    'feedback_velocity_start_reg': 'velocity',
+    'feedback_temperature_start_reg': 'temperature',
+    'feedback_voltage_start_reg': 'voltage',
+    'feedback_force_sensor_start_reg': 'fingertip_forces',
+}
+
 class ArtusAPI_V2:
     """Newer, single user-facing entry point for controlling an ARTUS hand.
 
@@ -43,13 +61,20 @@ class ArtusAPI_V2:
                 hand_type='left',
                 communication_frequency = 50, # hz
                 logger = None,
-                baudrate = 115200): #115200 for RS485, 250000 for UART
+                baudrate = 115200, #115200 for RS485, 250000 for UART
+                streaming = False,
+                combined_targets = False):
         """Initializes the robot, command, and communication handlers and connects.
 
         Args:
-            communication_method: Transport to use, e.g. 'RS485_RTU' or 'Modbus_TCP'.
+            communication_method: Transport to use, e.g. 'RS485_RTU', 'RS485_RTU_Raw',
+                'RS485_RTU_Shared' (one port shared by several hands),
+                'Modbus_TCP', 'Modbus_TCP_Pipelined' or 'Replay' (plays back a
+                session log recorded with ``start_recording``).
             communication_channel_identifier: Serial port (e.g. 'COM9') or other
-                channel identifier for the chosen communication method.
+                channel identifier for the chosen communication method; an
+                ``RS485Bus`` instance is accepted for 'RS485_RTU_Shared', a
+                session log path or ``ReplayTransport`` for 'Replay'.
             robot_type: Robot variant, e.g. 'artus_talos', 'artus_lite',
                 'artus_lite_plus', 'artus_scorpion', 'artus_dex'.
             hand_type: Hand side, e.g. 'left' or 'right'.
@@ -57,6 +82,13 @@ class ArtusAPI_V2:
             logger: Optional logger instance shared across handlers; a module
                 logger is created if not provided.
             baudrate: Serial baudrate (115200 for RS485, 250000 for UART).
+            streaming: If True, start the background setpoint streamer after
+                connecting so ``set_joint_angles`` returns without blocking
+                on the bus (see ``start_streaming``).
+            combined_targets: If True, target blocks sent together are
+                merged into one register write when their span fits in one
+                Modbus PDU, so an update costs one send slot instead of one
+                per block.
         """
 
         self.robot_type = robot_type
@@ -76,6 +108,8 @@ class ArtusAPI_V2:
                                                     baudrate=baudrate, slave_address=expected_slave_id(robot_type, hand_type))
         self._robot_handler = Robot(robot_type=robot_type,hand_type=hand_type,logger=logger)
         self._command_handler = NewCommands(num_joints=len(self._robot_handler.robot.hand_joints),logger=logger)
+        self._register_layout = get_register_layout(self._robot_handler.robot.number_of_joints,
+                                                    len(self._robot_handler.robot.force_sensors or ()))
 
         if not logger:
             self.logger = logging.getLogger(__name__)
@@ -85,16 +119,27 @@ class ArtusAPI_V2:
         self.state = ActuatorState.ACTUATOR_INITIALIZING.value
 
         self._communication_period = 1 / communication_frequency
+        self._pacer = PacingScheduler(self._communication_period)
         self.last_time = time.perf_counter()
+        # get_hand_feedback_data reads the same fields every call, plan them once
+        self._read_planner = ReadPlanner()
+        self._feedback_ring = None
 
         self.awake = False
 
+        self._streamer = None
+        # merge position/velocity/force writes into one transaction where the span fits
+        self.combined_targets = combined_targets
+
         # set up sigint handler
         self.original_sigint_handler = signal.getsignal(signal.SIGINT)
         signal.signal(signal.SIGINT, self._sigint_handler)
 
         self.connect()
 
+        if streaming:
+            self.start_streaming()
+
     def _sigint_handler(self, signum, frame):
         """Handles SIGINT by putting the hand to sleep before disconnecting.
 
@@ -144,6 +189,8 @@ class ArtusAPI_V2:
 
     def disconnect(self):
         """Closes the communication channel and restores the original SIGINT handler."""
+        self.stop_streaming()
+        self.disable_feedback_ring()
         self._communication_handler.close_connection()
         signal.signal(signal.SIGINT, self.original_sigint_handler)
 
@@ -162,10 +209,10 @@ class ArtusAPI_V2:
 
         self.control_type = control_type
         self._communication_handler.send_data(wake_command)
-        self.last_time = time.perf_counter()
+        self._pacer.mark_sent()
 
         # wait for hand state ready
-        ready_result = self._communication_handler.wait_for_ready(vis=False,timeout=30)
+        ready_result = self._communication_handler.wait_for_ready(vis=False,timeout=30,settle_timeout=0.2)
         if not ready_result:
             self.logger.error("Hand timed out waiting for ready")
         elif ready_result == ActuatorState.ACTUATOR_SLEEP.value:
@@ -176,11 +223,52 @@ class ArtusAPI_V2:
             self.state = ActuatorState.ACTUATOR_IDLE
             self.awake = True
 
+    def start_streaming(self):
+        """Starts the background I/O thread for non-blocking target commands.
+
+        While streaming, ``set_joint_angles`` (and the helpers built on it)
+        only encode the targets and drop them into a latest-wins mailbox;
+        the I/O thread writes them out at ``communication_frequency``.
+        Intermediate setpoints that were superseded before their send slot
+        are coalesced instead of queued.
+        """
+        if self._streamer is None:
+            self._streamer = SetpointStreamer(communication_handler=self._communication_handler,
+                                              communication_period=self._communication_period,
+                                              logger=self.logger,
+                                              pacer=self._pacer)
+        self._streamer.start()
+
+    def stop_streaming(self):
+        """Stops the background I/O thread; pending setpoints are dropped."""
+        if self._streamer is not None:
+            self._streamer.stop()
+
+    def is_streaming(self) -> bool:
+        """Checks whether target commands are going through the streamer.
+
+        Returns:
+            True if the background I/O thread is running.
+        """
+        return self._streamer is not None and self._streamer.is_running()
+
+    def get_streaming_stats(self):
+        """Returns the streamer counters (posted, sent, coalesced, errors, pending).
+
+        Returns:
+            Dict of counters, or None if streaming was never started.
+        """
+        if self._streamer is None:
+            return None
+        return self._streamer.get_stats()
+
     def sleep(self):
         """Sends the sleep command, putting the hand into a low-power/idle state."""
+        if self._streamer is not None:
+            self._streamer.clear()
         sleep_command = self._command_handler.get_sleep_command()
         self._communication_handler.send_data(sleep_command)
-        self.last_time = time.perf_counter()
+        self._pacer.mark_sent()
 
     def clear_errors(self):
         """Explicitly clear latched actuator errors.
@@ -196,7 +284,7 @@ class ArtusAPI_V2:
         """
         clear_errors_command = self._command_handler.get_clear_errors_command()
         self._communication_handler.send_data(clear_errors_command)
-        self.last_time = time.perf_counter()
+        self._pacer.mark_sent()
 
     def get_config(self, wifi_name:str, wifi_pass:str):
         """Writes new WiFi credentials to the hand and reads back its IP.
@@ -243,9 +331,8 @@ class ArtusAPI_V2:
                 self.logger.error("Hand timed out waiting for ready")
             else:
                 self.logger.info(f"Finished writing {labels[config_type]}")
-            time.sleep(0.2)
 
-        feedback_data = self._communication_handler.receive_data(amount_dat=4,start=ModbusMap().modbus_reg_map['feedback_position_start_reg'])
+        feedback_data = self._communication_handler.receive_data(amount_dat=4,start=REGISTER_ADDRESSES['feedback_position_start_reg'])
 
         bytes_out = []
         for reg in feedback_data[:2]: # only first 2 registers contain the IP
@@ -320,12 +407,14 @@ class ArtusAPI_V2:
             calibrate_cmd.append(joint)
         
         self._communication_handler.send_data(calibrate_cmd)
-        time.sleep(3)
-        self.last_time = time.perf_counter()
+        self._pacer.mark_sent()
         self.state = ActuatorState.ACTUATOR_CALIBRATING_STROKE.value
 
-        # wait for hand state ready
-        if not self._communication_handler.wait_for_ready(vis=True,timeout=10):
+        # wait for the hand to start calibrating (up to 3s) and then be ready again
+        ready = self._communication_handler.wait_for_ready(vis=True,timeout=13,settle_timeout=3)
+        # errors and temperatures read while calibrating are stale now
+        self._communication_handler.invalidate_register_cache()
+        if not ready:
             self.logger.error("Hand timed out waiting for ready")
         else:
             self.logger.info("Hand ready")
@@ -372,9 +461,9 @@ class ArtusAPI_V2:
                 using what ``joint_angles`` implies.
 
         Returns:
-            True if the command was sent successfully, False if the joint
-            dictionary contained no valid data. None if the hand is not
-            awake.
+            True if the command was sent (or, while streaming, posted to
+            the streamer mailbox), False if the joint dictionary contained
+            no valid data. None if the hand is not awake.
         """
         if not self._check_awake():
             return
@@ -389,37 +478,197 @@ class ArtusAPI_V2:
         if injected_control_type is not None:
             available_control = (1 << injected_control_type)
 
-        if (available_control & 0b100) != 0 and self.control_type == self.control_types['position']:
-            set_joint_angles_cmd = self._command_handler.get_target_position_command(self._robot_handler.robot.hand_joints)
-            self.wait_for_com_freq()
-            self._communication_handler.send_data(set_joint_angles_cmd,CommandType.TARGET_COMMAND.value)
-            self.last_time = time.perf_counter()
-        if (available_control & 0b10) != 0 and self.control_type >= self.control_types['velocity']:
-            set_joint_angles_cmd = self._command_handler.get_target_velocity_command(self._robot_handler.robot.hand_joints)
+        self._send_target_commands(available_control)
+        return True
+
+    def set_joint_targets(self, positions=None, velocities=None, forces=None):
+        """Sends joint targets to the hand from ordered arrays.
+
+        Array-in counterpart of ``set_joint_angles`` for streaming loops:
+        the arrays are written straight into the robot's ``JointState`` and
+        packed from there, without building per-joint dicts. Which commands
+        go out follows the same control-type rules as ``set_joint_angles``.
+
+        Args:
+            positions: Target angle per joint (NumPy array or sequence) in
+                joint index order, or None.
+            velocities: Target velocity per joint in joint index order, or
+                None.
+            forces: Target force per joint in joint index order, or None.
+
+        Returns:
+            True if the commands were sent (or, while streaming, posted to
+            the streamer mailbox), False if no array was given. None if the
+            hand is not awake.
+
+        Raises:
+            ValueError: If an array does not hold exactly one value per joint.
+        """
+        if not self._check_awake():
+            return
+
+        available_control = self._robot_handler.set_joint_targets(positions, velocities, forces)
+        if available_control == 0:
+            self.logger.warning("No joint target arrays given")
+            return False
+
+        self._send_target_commands(available_control)
+        return True
+
+    def _target_commands(self, available_control: int) -> list:
+        """Packs the robot's current targets into the commands the control type uses.
+
+        Args:
+            available_control: Bitmask of target fields that were updated:
+                0b100 position, 0b10 velocity, 0b1 force. Each field is only
+                packed if the active control type uses it.
+
+        Returns:
+            List of target commands, position before velocity before force.
+        """
+        hand_joints = self._robot_handler.robot.hand_joints
+        target_commands = []
+        if self._uses_target(available_control & 0b100):
+            target_commands.append(self._command_handler.get_target_position_command(hand_joints))
+        if self._uses_target(available_control & 0b10):
+            target_commands.append(self._command_handler.get_target_velocity_command(hand_joints))
+        if self._uses_target(available_control & 0b1):
+            target_commands.append(self._command_handler.get_target_force_command(hand_joints))
+        return target_commands
+
+    def _uses_target(self, control_bit: int) -> bool:
+        """Checks whether the active control type sends a target block.
+
+        Position targets are only sent in position control, velocity
+        targets in velocity control and above, force targets in torque
+        control and above.
+
+        Args:
+            control_bit: 0b100 position, 0b10 velocity or 0b1 force; 0 is
+                never sent.
+
+        Returns:
+            True if the block is part of a command for this control type.
+        """
+        if control_bit == 0b100:
+            return self.control_type == self.control_types['position']
+        if control_bit == 0b10:
+            return self.control_type >= self.control_types['velocity']
+        if control_bit == 0b1:
+            return self.control_type >= self.control_types['torque']
+        return False
+
+    def _send_target_commands(self, available_control: int):
+        """Sends the packed targets (or posts them to the streamer while streaming).
+
+        Args:
+            available_control: Bitmask of target fields that were updated,
+                see ``_target_commands``.
+        """
+        self._send_commands(self._target_commands(available_control))
+
+    def _send_commands(self, target_commands: list):
+        """Sends target commands, each in its own send slot (or posts them while streaming).
+
+        Commands the hand already holds (see ``enable_dirty_range_writes``)
+        are skipped without using a send slot. With ``combined_targets``,
+        the remaining ones are merged into as few writes as fit in a PDU.
+
+        Args:
+            target_commands: ``[start_reg, *words]`` target commands.
+        """
+        if self.is_streaming():
+            # the streamer coalesces per block start, so blocks are posted separately
+            for set_joint_angles_cmd in target_commands:
+                self._streamer.post(set_joint_angles_cmd)
+            return
+        # dirty-range writes: blocks the hand already holds keep their send slot
+        target_commands = [cmd for cmd in target_commands if self._communication_handler.needs_write(cmd)]
+        if self.combined_targets and len(target_commands) > 1:
+            for combined_cmd in self._command_handler.combine_target_commands(target_commands):
+                self.wait_for_com_freq()
+                # each block is acknowledged on its own so an unchanged block is skipped next time
+                self._communication_handler.send_data(combined_cmd,CommandType.TARGET_COMMAND.value,
+                                                      members=self._command_handler.combined_members(combined_cmd, target_commands))
+            return
+        for set_joint_angles_cmd in target_commands:
             self.wait_for_com_freq()
             self._communication_handler.send_data(set_joint_angles_cmd,CommandType.TARGET_COMMAND.value)
-            self.last_time = time.perf_counter()
-        if (available_control & 0b1) != 0 and self.control_type >= self.control_types['torque']:
-            set_joint_angles_cmd = self._command_handler.get_target_force_command(self._robot_handler.robot.hand_joints)
+
+    def execute_pose(self, pose, read_feedback: bool = False):
+        """Sends a pose precompiled by ``PoseLibrary`` without encoding anything.
+
+        The pose's prebuilt frames go out as they are, one write per target
+        block the control type uses (same rules as ``set_joint_angles``),
+        and the robot's ``joint_state`` targets are updated to match.
+
+        Args:
+            pose: ``CompiledPose`` from ``PoseLibrary.compile`` for this
+                hand's robot type and side.
+            read_feedback: If True, the last frame goes out as an FC 0x17
+                that also reads back the joint positions; the others are
+                plain writes. With ``combined_targets``, frames are merged
+                first where the span fits.
+
+        Returns:
+            True once the frames are sent (or posted while streaming); with
+            ``read_feedback`` the position feedback array instead. None if
+            the hand is not awake.
+        """
+        if not self._check_awake():
+            return
+        frames = self._apply_pose(pose)
+        if not read_feedback:
+            self._send_commands(frames)
+            return True
+
+        key = 'feedback_position_start_reg'
+        if not frames:
+            frames = [pose.frames['position']]
+        writes = [(frame, None) for frame in frames]
+        if self.combined_targets:
+            writes = [(combined, self._command_handler.combined_members(combined, frames))
+                      for combined in self._command_handler.combine_target_commands(frames, max_registers=MAX_READ_WRITE_WRITE_COUNT)]
+        for frame, members in writes[:-1]:
             self.wait_for_com_freq()
-            self._communication_handler.send_data(set_joint_angles_cmd,CommandType.TARGET_COMMAND.value)
-            self.last_time = time.perf_counter()
-        return True
+            self._communication_handler.send_data(frame,CommandType.TARGET_COMMAND.value, members=members)
+        write_frame, members = writes[-1]
+        self.wait_for_com_freq()
+        feedback_data = self._communication_handler.send_receive_data(
+            self._register_layout.addresses[key], self._feedback_register_count(key),
+            write_frame[0], write_frame[1:], members=members)
+        decoded = self._command_handler.get_decoded_feedback_data(feedback_data, modbus_key=key)
+        joint_state = self._robot_handler.robot.joint_state
+        joint_state.set_feedback(key, decoded)
+        return joint_state.feedback_angle.copy()
+
+    def _apply_pose(self, pose) -> list:
+        """Copies a compiled pose into ``joint_state`` and picks the frames to send.
+
+        Returns:
+            The pose's frames for the target blocks the control type uses.
+        """
+        joint_state = self._robot_handler.robot.joint_state
+        joint_state.target_angle[:] = pose.target_angle
+        joint_state.target_velocity[:] = pose.target_velocity
+        joint_state.target_force[:] = pose.target_force
+        return [frame for name, frame in pose.frames.items() if self._uses_target(FRAME_CONTROL_BITS[name])]
 
     def _feedback_register_count(self, feedback_reg_key: str) -> int:
-        """Computes how many holding registers to read for a feedback field.
+        """Returns how many holding registers to read for a feedback field.
+
+        Per-joint fields, fingertip forces and single-value fields (status,
+        voltage, slave ID) are all sized by the robot's ``RegisterLayout``.
 
         Args:
             feedback_reg_key: Key in ``ModbusMap.data_type_multiplier_map`` /
                 ``modbus_reg_map`` (e.g. ``feedback_position_start_reg``).
 
         Returns:
-            Number of consecutive 16-bit registers to request.
+            Number of consecutive 16-bit registers to request, precomputed
+            in the robot's ``RegisterLayout``.
         """
-        return math.ceil(
-            ModbusMap().data_type_multiplier_map[feedback_reg_key]
-            * self._robot_handler.robot.number_of_joints
-        )
+        return self._register_layout.read_sizes[feedback_reg_key]
 
     def _set_get_joint_field(self, joint_angles: dict, target_packer, feedback_reg_key: str):
         """Shared FC 0x17 path: write one target field and read matching feedback.
@@ -445,14 +694,13 @@ class ArtusAPI_V2:
         write_cmd = target_packer(self._robot_handler.robot.hand_joints)
         write_start = write_cmd[0]
         write_values = write_cmd[1:]
-        read_start = ModbusMap().modbus_reg_map[feedback_reg_key]
+        read_start = self._register_layout.addresses[feedback_reg_key]
         read_count = self._feedback_register_count(feedback_reg_key)
 
         self.wait_for_com_freq()
         feedback_data = self._communication_handler.send_receive_data(
             read_start, read_count, write_start, write_values
         )
-        self.last_time = time.perf_counter()
 
         decoded = self._command_handler.get_decoded_feedback_data(
             feedback_data, modbus_key=feedback_reg_key
@@ -510,36 +758,136 @@ class ArtusAPI_V2:
             'feedback_force_start_reg',
         )
 
-    def _check_communication_frequency(self,last_time:float):
-        """Checks whether enough time has passed since the last command.
+    @property
+    def last_time(self) -> float:
+        """``time.perf_counter()`` time of the last command slot or unpaced send.
 
-        Necessary so that the messages stay in sync with the configured
-        communication frequency.
+        Assigning it re-anchors the pacing schedule so the next slot is one
+        communication period later.
+        """
+        return self._pacer.last_send
 
-        Args:
-            last_time: Timestamp (from ``time.perf_counter()``) of the last
-                command sent.
+    @last_time.setter
+    def last_time(self, value: float):
+        self._pacer.reset(value)
+
+    def wait_for_com_freq(self):
+        """Blocks until the next send slot of the communication frequency.
+
+        Slots are absolute deadlines one communication period apart (see
+        ``PacingScheduler``): the call sleeps once to the slot and spins
+        the final millisecond, instead of polling.
 
         Returns:
-            True if the time since ``last_time`` is greater than or equal to
-            the communication period, False if a command was sent too
-            recently.
+            True once it is safe to send the next command.
         """
-        current_time = time.perf_counter()
-        if current_time - self.last_time < self._communication_period:
-            self.logger.debug("Command not sent. Communication frequency is too high.")
-            return False
+        self._pacer.wait()
         return True
 
-    def wait_for_com_freq(self):
-        """Blocks until the communication period has elapsed since the last command.
+    def get_transition_stats(self):
+        """Returns how long the hand took to reach the states waited for so far.
 
         Returns:
-            True once it is safe to send the next command.
+            Dict with ``timeouts``, ``last_latency`` and per-ActuatorState
+            ``count``/``mean``/``max`` latencies in seconds, see
+            ``NewCommunication.get_transition_stats``.
         """
-        while not self._check_communication_frequency(self.last_time):
-            time.sleep(0.001)
-        return True
+        return self._communication_handler.get_transition_stats()
+
+    def get_transaction_stats(self):
+        """Returns per-transaction latency histograms and counters for this hand's link.
+
+        Returns:
+            Snapshot with one row per Modbus function code and register
+            range: transactions, bytes, retries, timeouts, errors and
+            latency percentiles, see ``NewCommunication.get_transaction_stats``.
+        """
+        return self._communication_handler.get_transaction_stats()
+
+    def start_recording(self, path: str):
+        """Records every transaction with this hand to a binary session log.
+
+        The log can be replayed without hardware by constructing the API
+        with ``communication_method='Replay'`` and the log path as
+        ``communication_channel_identifier``. See
+        ``NewCommunication.start_recording``.
+
+        Args:
+            path: Log file to create.
+        """
+        self._communication_handler.start_recording(path)
+
+    def stop_recording(self) -> int:
+        """Stops recording and closes the session log.
+
+        Returns:
+            Number of transactions recorded.
+        """
+        return self._communication_handler.stop_recording()
+
+    def get_pacing_stats(self):
+        """Returns the pacing statistics of commands sent to this hand.
+
+        Returns:
+            Dict with ``slots``, ``waits``, ``missed`` and ``mean_jitter`` /
+            ``max_jitter`` / ``std_jitter`` (seconds), see
+            ``PacingScheduler.get_stats``.
+        """
+        return self._pacer.get_stats()
+
+    def enable_dirty_range_writes(self, refresh_interval: float = 1.0):
+        """Only transmits the target registers that changed since the last acknowledged write.
+
+        Unchanged target blocks are skipped without using a send slot and
+        changed ones are trimmed to the changed registers; every block is
+        still written in full at least every ``refresh_interval`` seconds.
+        See ``NewCommunication.enable_dirty_range_writes``.
+
+        Args:
+            refresh_interval: Maximum time in seconds between two full
+                frames of a target block.
+        """
+        self._communication_handler.enable_dirty_range_writes(refresh_interval)
+
+    def disable_dirty_range_writes(self):
+        """Goes back to writing every target block in full."""
+        self._communication_handler.disable_dirty_range_writes()
+
+    def get_dirty_range_stats(self):
+        """Returns the dirty-range counters (full_frames, partial_frames, skipped, registers_saved).
+
+        Returns:
+            Dict of counters, or None if dirty-range writes are disabled.
+        """
+        return self._communication_handler.get_dirty_range_stats()
+
+    def enable_register_cache(self, ttls: dict = None):
+        """Serves repeated slave ID, voltage, temperature and error reads from a short-lived cache.
+
+        Meant for dashboards polling ``get_voltage``, ``get_avg_temperature``
+        or ``get_error_report`` at UI refresh rates, so those reads stop
+        taking bus time from the control loop. ``clear_errors``, ``reset``,
+        ``calibrate`` and every other command empty the cache. See
+        ``NewCommunication.enable_register_cache``.
+
+        Args:
+            ttls: Mapping of register key (e.g. ``'feedback_voltage_start_reg'``)
+                to time-to-live in seconds, or None for the defaults.
+        """
+        self._communication_handler.enable_register_cache(ttls)
+
+    def disable_register_cache(self):
+        """Reads every register from the hand again."""
+        self._communication_handler.disable_register_cache()
+
+    def get_register_cache_stats(self):
+        """Returns the register cache hit/miss counters.
+
+        Returns:
+            Dict with ``hits``, ``misses``, ``invalidations`` and per-register
+            ``fields`` counters, or None if the cache is disabled.
+        """
+        return self._communication_handler.get_register_cache_stats()
 
     def set_home_position(self):
         """Moves the hand to its home position at the default velocity."""
@@ -548,10 +896,11 @@ class ArtusAPI_V2:
         # create hand joint dict with zero value angles
         self._robot_handler.set_home_position()
         robot_set_home_position_cmd = self._command_handler.get_target_position_command(self._robot_handler.robot.hand_joints)
-        if not self._check_communication_frequency(self.last_time):
-            return False
+        if self.is_streaming():
+            self._streamer.post(robot_set_home_position_cmd)
+            return
+        self.wait_for_com_freq()
         self._communication_handler.send_data(robot_set_home_position_cmd,CommandType.TARGET_COMMAND.value)
-        self.last_time = time.perf_counter()
 
     def get_voltage(self):
         """Reads the hand's supply voltage feedback.
@@ -562,10 +911,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_voltage_start_reg']
         start_reg_key = 'feedback_voltage_start_reg'
-
-        amount_data = 2 # 1 float 
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key] # 1 float
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -573,7 +921,7 @@ class ArtusAPI_V2:
         self.logger.info(f"Voltage: {decoded_feedback_data[0]}")
         return decoded_feedback_data[0]
     
-    def get_joint_angles(self,start_reg=ModbusMap().modbus_reg_map['feedback_position_start_reg']):
+    def get_joint_angles(self,start_reg=REGISTER_ADDRESSES['feedback_position_start_reg']):
         """Reads feedback data for a given feedback register range.
 
         Named ``get_joint_angles`` for consistency with the v1 API; actually
@@ -592,27 +940,19 @@ class ArtusAPI_V2:
 
         Raises:
             ValueError: If ``start_reg`` does not match a known key in
-                ``ModbusMap().modbus_reg_map``.
+                ``ModbusMap().modbus_reg_map``, or this robot has no
+                registers in that range (e.g. fingertip force sensors on a
+                robot without them).
         """
         if not self._check_awake():
             return
         # check starting reg
-        start_reg_confirmed = False
-        for key,value in ModbusMap().modbus_reg_map.items():
-            if value == start_reg:
-                start_reg_confirmed = key
-                break
-
-        if start_reg_confirmed is not None:
-            amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_confirmed] * self._robot_handler.robot.number_of_joints)
-            if start_reg_confirmed == 'feedback_voltage_start_reg':
-                amount_data = 2 # 1 float for voltage
-            elif start_reg_confirmed == 'slave_id_reg':
-                amount_data = 1
-            elif start_reg_confirmed == 'feedback_force_sensor_start_reg':
-                amount_data = 5 * 3 * 2 # 5 fingers, 3 axes per finger, 2 registers per float
-        else:
+        start_reg_confirmed = self._register_layout.key_for_address(start_reg)
+        if start_reg_confirmed is None:
             raise ValueError('Start Register is not recognized -- see ModbusMap.pdf in robot/$robot$/data')
+        amount_data = self._register_layout.read_sizes[start_reg_confirmed]
+        if amount_data == 0:
+            raise ValueError(f'{self._robot_handler.robot_type} has no {start_reg_confirmed} feedback to read')
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_confirmed)
@@ -627,6 +967,38 @@ class ArtusAPI_V2:
             return decoded_feedback_data[0]
         return self.helper_fill_dict_from_feedback_data(decoded_feedback_data)
 
+    def get_joint_feedback_array(self, feedback_type:str='feedback_position_start_reg'):
+        """Reads one per-joint feedback field and returns it as a NumPy array.
+
+        Array-out counterpart of ``get_joint_angles``: the decoded values
+        are stored in the robot's ``JointState`` and a copy of that array is
+        returned instead of a dict keyed by joint name.
+
+        Args:
+            feedback_type: Per-joint feedback key -- one of
+                'feedback_position_start_reg', 'feedback_force_start_reg',
+                'feedback_velocity_start_reg' or
+                'feedback_temperature_start_reg'.
+
+        Returns:
+            float64 array with one value per joint in joint index order.
+            None if the hand is not awake.
+
+        Raises:
+            ValueError: If ``feedback_type`` is not a per-joint feedback field.
+        """
+        if not self._check_awake():
+            return
+        if feedback_type not in FEEDBACK_FIELDS:
+            raise ValueError(f"{feedback_type} is not a per-joint feedback field, expected one of {list(FEEDBACK_FIELDS)}")
+
+        feedback_data = self._communication_handler.receive_data(amount_dat=self._register_layout.read_sizes[feedback_type],
+                                                                 start=self._register_layout.addresses[feedback_type])
+        decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=feedback_type)
+        joint_state = self._robot_handler.robot.joint_state
+        joint_state.set_feedback(feedback_type, decoded_feedback_data)
+        return getattr(joint_state, FEEDBACK_FIELDS[feedback_type]).copy()
+
     def helper_fill_dict_from_feedback_data(self,feedback_data:list):
         """Maps a decoded feedback list to a dict keyed by joint name.
 
@@ -684,10 +1056,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_force_start_reg']
         start_reg_key = 'feedback_force_start_reg'
-
-        amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_key] * self._robot_handler.robot.number_of_joints)
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key]
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -710,10 +1081,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_force_sensor_start_reg']
         start_reg_key = 'feedback_force_sensor_start_reg'
-
-        amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_key] * len(self._robot_handler.robot.force_sensors) * 3) # 5 fingers, 3 axes per finger
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key]
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -731,10 +1101,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_velocity_start_reg']
         start_reg_key = 'feedback_velocity_start_reg'
-
-        amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_key] * self._robot_handler.robot.number_of_joints)
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key]
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -754,10 +1123,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_temperature_start_reg']
         start_reg_key = 'feedback_temperature_start_reg'
-
-        amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_key] * self._robot_handler.robot.number_of_joints) 
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key]
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -776,10 +1144,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_avg_temperature_start_reg']
         start_reg_key = 'feedback_avg_temperature_start_reg'
-
-        amount_data = 1 # only 1 value
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key] # only 1 value
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -788,26 +1155,108 @@ class ArtusAPI_V2:
 
         return decoded_feedback_data[0]
         
-    def get_hand_feedback_data(self) -> bool:
-        """Reads all feedback types supported by the connected robot.
+    def get_hand_feedback_data(self):
+        """Reads all feedback types supported by the connected robot in one pass.
 
-        Iterates ``self._robot_handler.robot.available_feedback_types`` and
-        fetches each one, routing fingertip force sensor data through
-        ``get_fingertip_forces``.
+        Plans the fewest contiguous register reads (at most 125 registers
+        each) covering the status register and every entry of
+        ``self._robot_handler.robot.available_feedback_types``, then decodes
+        each field out of the returned buffers. ``hand_joints`` and
+        ``force_sensors`` are populated as a side effect, exactly as the
+        individual getters do.
 
         Returns:
-            True once all available feedback types have been read, or None
-            if the hand is not awake.
+            Snapshot dict with a ``timestamp`` (``time.time()`` once all
+            reads completed), the raw ``status`` byte (ActuatorState in the
+            low nibble, TrajectoryReturn in the high nibble) and one entry
+            per available feedback type: ``position``, ``force``,
+            ``velocity`` and ``temperature`` map joint name to value,
+            ``voltage`` is a float and ``fingertip_forces`` maps finger name
+            to ``{'x', 'y', 'z'}``. None if the hand is not awake.
         """
         if not self._check_awake():
             return
 
-        for feedback_type in self._robot_handler.robot.available_feedback_types:
-            if feedback_type == 'feedback_force_sensor_start_reg':
-                self.get_fingertip_forces()
-            else:
-                self.get_joint_angles(start_reg=ModbusMap().modbus_reg_map[feedback_type])
-        return True
+        layout = self._register_layout
+        feedback_types = ['feedback_register', *self._robot_handler.robot.available_feedback_types]
+        fields = [(key, layout.addresses[key], layout.read_sizes[key]) for key in feedback_types]
+
+        snapshot = {}
+        for start, count, members in self._read_planner.plan(fields):
+            registers = self._communication_handler.receive_data(amount_dat=count, start=start)
+            if isinstance(registers, int):
+                registers = [registers]
+            for key, offset, field_count in members:
+                snapshot[FEEDBACK_SNAPSHOT_FIELDS.get(key, key)] = self._decode_feedback_field(key, registers[offset:offset + field_count])
+        snapshot['timestamp'] = time.time()
+        if self._feedback_ring is not None:
+            self._write_feedback_ring(snapshot)
+        return snapshot
+
+    def enable_feedback_ring(self, capacity: int = 1024, name: str = None) -> FeedbackRing:
+        """Publishes every ``get_hand_feedback_data`` snapshot to a shared-memory ring buffer.
+
+        Other processes attach with ``FeedbackRing.attach(ring.name)`` and
+        read the latest record or a window of records as NumPy arrays,
+        without any serialization. The ring is removed by
+        ``disable_feedback_ring`` or ``disconnect``.
+
+        Args:
+            capacity: Number of records kept.
+            name: Shared memory name, or None for a generated one.
+
+        Returns:
+            The ``FeedbackRing`` being written.
+        """
+        self.disable_feedback_ring()
+        robot = self._robot_handler.robot
+        self._feedback_ring = FeedbackRing.create(len(robot.joint_state), len(robot.force_sensors or ()),
+                                                  capacity=capacity, name=name)
+        return self._feedback_ring
+
+    def disable_feedback_ring(self):
+        """Stops publishing feedback and removes the shared-memory ring, if any."""
+        if self._feedback_ring is not None:
+            self._feedback_ring.close()
+            self._feedback_ring = None
+
+    def _write_feedback_ring(self, snapshot: dict):
+        """Appends a feedback snapshot to the ring, straight from the joint state arrays.
+
+        Fields missing from the snapshot (feedback the robot does not
+        report) are written as NaN.
+        """
+        robot = self._robot_handler.robot
+        state = robot.joint_state
+        fingertip = None
+        if 'fingertip_forces' in snapshot and robot.force_sensors:
+            fingertip = [(sensor['data'].x, sensor['data'].y, sensor['data'].z) for sensor in robot.force_sensors.values()]
+        self._feedback_ring.write(snapshot['timestamp'], snapshot.get('status', 0),
+                                  position=state.feedback_angle if 'position' in snapshot else None,
+                                  velocity=state.feedback_velocity if 'velocity' in snapshot else None,
+                                  force=state.feedback_force if 'force' in snapshot else None,
+                                  temperature=state.feedback_temperature if 'temperature' in snapshot else None,
+                                  fingertip=fingertip)
+
+    def _decode_feedback_field(self, feedback_reg_key: str, registers: list):
+        """Decodes one feedback field and mirrors it into the robot model.
+
+        Args:
+            feedback_reg_key: Key in ``ModbusMap.modbus_reg_map``.
+            registers: Raw registers belonging to that field only.
+
+        Returns:
+            The value stored in the feedback snapshot for that field.
+        """
+        if feedback_reg_key == 'feedback_register':
+            return registers[0] & 0xFF
+        decoded_feedback_data = self._command_handler.get_decoded_feedback_data(registers, modbus_key=feedback_reg_key)
+        if feedback_reg_key == 'feedback_voltage_start_reg':
+            return decoded_feedback_data[0]
+        self._robot_handler.get_joint_angles(decoded_feedback_data, feedback_type=feedback_reg_key)
+        if feedback_reg_key == 'feedback_force_sensor_start_reg':
+            return self.helper_fill_dict_from_fingertip_forces(decoded_feedback_data)
+        return self.helper_fill_dict_from_feedback_data(decoded_feedback_data)
 
     def get_error_report(self):
         """Reads the per-joint actuator error bitfield report from the hand.
@@ -819,10 +1268,9 @@ class ArtusAPI_V2:
         if not self._check_awake():
             return
 
-        start_reg = ModbusMap().modbus_reg_map['feedback_actuator_error_reg']
         start_reg_key = 'feedback_actuator_error_reg'
-
-        amount_data = math.ceil(ModbusMap().data_type_multiplier_map[start_reg_key] * self._robot_handler.robot.number_of_joints)
+        start_reg = self._register_layout.addresses[start_reg_key]
+        amount_data = self._register_layout.read_sizes[start_reg_key]
 
         feedback_data = self._communication_handler.receive_data(amount_dat=amount_data,start=start_reg)
         decoded_feedback_data = self._command_handler.get_decoded_feedback_data(feedback_data,modbus_key=start_reg_key)
@@ -858,10 +1306,12 @@ class ArtusAPI_V2:
         reset_command = self._command_handler.get_reset_command(joints)
         self.wait_for_com_freq()
         self._communication_handler.send_data(reset_command)
-        self.last_time = time.perf_counter()
         
         # wait for hand state ready
-        if not self._communication_handler.wait_for_ready(vis=False):
+        ready = self._communication_handler.wait_for_ready(vis=False,settle_timeout=0.2)
+        # errors read while resetting are stale now
+        self._communication_handler.invalidate_register_cache()
+        if not ready:
             self.logger.error("Hand timed out waiting for ready")
         else:
             self.logger.info("Hand ready")
@@ -878,10 +1328,12 @@ class ArtusAPI_V2:
         soft_reset_command = self._command_handler.get_soft_reset_command(joints)
         self.wait_for_com_freq()
         self._communication_handler.send_data(soft_reset_command)
-        self.last_time = time.perf_counter()
         
         # wait for hand state ready
-        if not self._communication_handler.wait_for_ready(vis=False):
+        ready = self._communication_handler.wait_for_ready(vis=False,settle_timeout=0.2)
+        # errors read while resetting are stale now
+        self._communication_handler.invalidate_register_cache()
+        if not ready:
             self.logger.error("Hand timed out waiting for ready")
         else:
             self.logger.info("Hand ready")
@@ -925,7 +1377,7 @@ class ArtusAPI_V2:
         # send commmand
         firmware_cmd = self._command_handler.get_firmware_command(drivers_to_flash)
         self._communication_handler.send_data(firmware_cmd) # sent firmware upload command to command register
-        self.last_time = time.perf_counter()
+        self._pacer.mark_sent()
 
         # send firmware data
         # self._firmware_updater.update_firmware_piecewise(fw_size)
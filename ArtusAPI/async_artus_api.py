@@ -0,0 +1,549 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""asyncio-native counterpart of ArtusAPI_V2 for applications running several hands on one event loop."""
+
+import asyncio
+import logging
+import time
+from .artus_api_new import ArtusAPI_V2,FEEDBACK_SNAPSHOT_FIELDS
+from .common.ModbusMap import TrajectoryReturn
+from .common.register_layout import get_register_layout
+from .common.SlaveIDMap import expected_slave_id
+from .commands import NewCommands
+from .communication.async_communication import AsyncNewCommunication
+from .communication.new_communication import ActuatorState,CommandType
+from .communication.pacing_scheduler import PacingScheduler
+from .communication.read_planner import ReadPlanner
+from .communication.modbus_pdu import MAX_READ_WRITE_WRITE_COUNT
+from .robot import Robot
+from .robot.bldc_robot.joint_state import FEEDBACK_FIELDS
+
+
+class AsyncArtusAPI:
+    """asyncio mirror of ``ArtusAPI_V2``.
+
+    Every method that touches the bus is a coroutine, and communication
+    pacing, retries and ``wait_for_ready`` polling all ``await
+    asyncio.sleep`` instead of blocking, so several hands and e.g. a
+    camera pipeline can share one event loop without threads. Robot
+    modeling and register encoding are the same handlers ``ArtusAPI_V2``
+    uses.
+
+    Unlike ``ArtusAPI_V2`` the constructor does not connect and no SIGINT
+    handler is installed; use ``await hand.connect()`` or ``async with``.
+    """
+
+    # pure helpers (no I/O) shared with ArtusAPI_V2
+    string_to_registers = staticmethod(ArtusAPI_V2.string_to_registers)
+    helper_fill_dict_from_feedback_data = ArtusAPI_V2.helper_fill_dict_from_feedback_data
+    helper_fill_dict_from_fingertip_forces = ArtusAPI_V2.helper_fill_dict_from_fingertip_forces
+    _feedback_register_count = ArtusAPI_V2._feedback_register_count
+    _decode_feedback_field = ArtusAPI_V2._decode_feedback_field
+    _target_commands = ArtusAPI_V2._target_commands
+    _uses_target = ArtusAPI_V2._uses_target
+    _apply_pose = ArtusAPI_V2._apply_pose
+    last_time = ArtusAPI_V2.last_time
+    get_pacing_stats = ArtusAPI_V2.get_pacing_stats
+    get_transition_stats = ArtusAPI_V2.get_transition_stats
+    enable_feedback_ring = ArtusAPI_V2.enable_feedback_ring
+    disable_feedback_ring = ArtusAPI_V2.disable_feedback_ring
+    _write_feedback_ring = ArtusAPI_V2._write_feedback_ring
+
+    def __init__(self,
+                communication_method='RS485_RTU',
+                communication_channel_identifier='COM9',
+                robot_type='artus_talos',
+                hand_type='left',
+                communication_frequency = 50, # hz
+                logger = None,
+                baudrate = 115200,
+                combined_targets = False):
+        """Initializes the robot, command, and async communication handlers.
+
+        Args:
+            communication_method: Transport to use, 'RS485_RTU' or 'Modbus_TCP'.
+            communication_channel_identifier: Serial port (e.g. 'COM9') or
+                'host[:port]' for Modbus_TCP.
+            robot_type: Robot variant, e.g. 'artus_talos', 'artus_lite',
+                'artus_lite_plus', 'artus_scorpion', 'artus_dex'.
+            hand_type: Hand side, e.g. 'left' or 'right'.
+            communication_frequency: Maximum command send frequency in Hz.
+            logger: Optional logger instance shared across handlers; a module
+                logger is created if not provided.
+            baudrate: Serial baudrate (115200 for RS485, 250000 for UART).
+            combined_targets: If True, target blocks sent together are
+                merged into one register write when their span fits (see
+                ``ArtusAPI_V2``).
+        """
+        self.robot_type = robot_type
+        self.hand_type = hand_type
+
+        self.control_types = {
+            'position': 3,
+            'velocity': 2,
+            'torque': 1,
+        }
+        self.control_type = self.control_types['position']
+
+        self._communication_handler = AsyncNewCommunication(communication_method=communication_method,
+                                                            logger=logger, port=communication_channel_identifier,
+                                                            baudrate=baudrate, slave_address=expected_slave_id(robot_type, hand_type))
+        self._robot_handler = Robot(robot_type=robot_type,hand_type=hand_type,logger=logger)
+        self._command_handler = NewCommands(num_joints=len(self._robot_handler.robot.hand_joints),logger=logger)
+        self._register_layout = get_register_layout(self._robot_handler.robot.number_of_joints,
+                                                    len(self._robot_handler.robot.force_sensors or ()))
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self.state = ActuatorState.ACTUATOR_INITIALIZING.value
+        self._communication_period = 1 / communication_frequency
+        self._pacer = PacingScheduler(self._communication_period)
+        self.last_time = time.perf_counter()
+        # get_hand_feedback_data reads the same fields every call, plan them once
+        self._read_planner = ReadPlanner()
+        self._feedback_ring = None
+        self.awake = False
+        self.combined_targets = combined_targets
+
+    async def __aenter__(self):
+        """Connects on entering an ``async with`` block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Disconnects on leaving an ``async with`` block."""
+        self.disconnect()
+
+    async def connect(self):
+        """Opens the underlying communication channel to the hand."""
+        await self._communication_handler.open_connection()
+
+    def disconnect(self):
+        """Closes the communication channel and removes the feedback ring, if any."""
+        self.disable_feedback_ring()
+        self._communication_handler.close_connection()
+
+    def set_control_type(self,control_type:int):
+        """Sets the active control type of the hand.
+
+        Args:
+            control_type: Control type value from ``self.control_types``.
+
+        Returns:
+            True if the control type was valid and set, False otherwise.
+        """
+        if control_type not in self.control_types.values():
+            self.logger.error(f"Control type {control_type} is not valid")
+            return False
+        self.control_type = control_type
+        return True
+
+    async def wait_for_com_freq(self):
+        """Awaits the next send slot of the communication frequency.
+
+        The slot is reserved before awaiting, so coroutines sharing this
+        hand are handed consecutive slots instead of racing for one.
+
+        Returns:
+            True once it is safe to send the next command.
+        """
+        deadline = self._pacer.reserve()
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            self._pacer.record_wake(deadline)
+        return True
+
+    async def wait_for_ready(self, timeout=15, acceptable_state=None):
+        """Awaits until the hand reports an acceptable actuator state.
+
+        Args:
+            timeout: Maximum time in seconds to wait.
+            acceptable_state: Single ActuatorState value to wait for; None
+                accepts idle, error, ready and active.
+
+        Returns:
+            The masked actuator state, or None on timeout.
+        """
+        return await self._communication_handler.wait_for_ready(timeout=timeout, acceptable_state=acceptable_state)
+
+    async def wake_up(self,control_type:int=3):
+        """Wakes up the hand and sets its control type.
+
+        Args:
+            control_type: 3 for position, 2 for velocity, 1 for torque control.
+        """
+        wake_command = self._command_handler.get_robot_start_command(control_type=control_type)
+
+        self.control_type = control_type
+        await self._communication_handler.send_data(wake_command)
+        self._pacer.mark_sent()
+
+        ready_result = await self._communication_handler.wait_for_ready(timeout=30, settle_timeout=0.2)
+        if not ready_result:
+            self.logger.error("Hand timed out waiting for ready")
+        elif ready_result == ActuatorState.ACTUATOR_SLEEP.value:
+            await self.wake_up(control_type=control_type)
+        else:
+            self.logger.info("Hand ready")
+            self.state = ActuatorState.ACTUATOR_IDLE
+            self.awake = True
+
+    async def sleep(self):
+        """Sends the sleep command, putting the hand into a low-power/idle state."""
+        await self._communication_handler.send_data(self._command_handler.get_sleep_command())
+        self._pacer.mark_sent()
+
+    async def clear_errors(self):
+        """Explicitly clears latched actuator errors (see ``ArtusAPI_V2.clear_errors``)."""
+        await self._communication_handler.send_data(self._command_handler.get_clear_errors_command())
+        self._pacer.mark_sent()
+
+    async def get_robot_status(self):
+        """Reads and decodes the hand's current actuator and trajectory state.
+
+        Returns:
+            Tuple of (actuator_state_name, trajectory_return_name), or None
+            if the raw status value could not be decoded.
+        """
+        robot_state = await self._communication_handler._check_robot_state()
+        try:
+            actuator_state = ActuatorState((robot_state & 0b00001111)).name
+            trajectory_return = TrajectoryReturn((robot_state & 0b11110000) >> 4).name
+            return actuator_state, trajectory_return
+        except ValueError:
+            self.logger.error(f"Invalid actuator state: {robot_state}")
+            return None
+
+    async def calibrate(self,joint=0):
+        """Runs the calibration routine and awaits the hand becoming ready again.
+
+        Args:
+            joint: Joint index to calibrate; 0 calibrates all joints.
+        """
+        calibrate_cmd = self._command_handler.get_calibration_command()
+        if joint > 0:
+            calibrate_cmd.append(joint)
+        await self._communication_handler.send_data(calibrate_cmd)
+        self._pacer.mark_sent()
+        self.state = ActuatorState.ACTUATOR_CALIBRATING_STROKE.value
+
+        if not await self._communication_handler.wait_for_ready(timeout=13, settle_timeout=3):
+            self.logger.error("Hand timed out waiting for ready")
+        else:
+            self.logger.info("Hand ready")
+            self.state = ActuatorState.ACTUATOR_IDLE.value
+
+    async def set_joint_angles_by_list(self, joint_angles:list, control_type:int=3):
+        """Sends joint commands from an ordered list of values (see ``ArtusAPI_V2``).
+
+        Args:
+            joint_angles: Values in joint index order.
+            control_type: 3 for position, 2 for velocity, 1 for torque control.
+
+        Returns:
+            True if the command was sent, False otherwise.
+        """
+        joint_angles_dict = {f'{i}':{'target_angle':joint_angles[i]} for i in range(len(joint_angles))}
+        return await self.set_joint_angles(joint_angles_dict, injected_control_type=control_type)
+
+    async def set_joint_angles(self, joint_angles:dict, injected_control_type:int=None):
+        """Sends joint commands to the hand (see ``ArtusAPI_V2.set_joint_angles``).
+
+        Args:
+            joint_angles: Dict of joint targets keyed by joint name.
+            injected_control_type: Overrides the control bitmask implied by
+                ``joint_angles`` if given.
+
+        Returns:
+            True if the command was sent, False if the dict held no valid data.
+        """
+        available_control = self._robot_handler.set_joint_angles(joint_angles,name=True)
+        if available_control == 0:
+            self.logger.warning("No valid data in joint dictionary to send")
+            return False
+
+        if injected_control_type is not None:
+            available_control = (1 << injected_control_type)
+
+        await self._send_target_commands(available_control)
+        return True
+
+    async def set_joint_targets(self, positions=None, velocities=None, forces=None):
+        """Sends joint targets from ordered arrays (see ``ArtusAPI_V2.set_joint_targets``).
+
+        Args:
+            positions: Target angle per joint in index order, or None.
+            velocities: Target velocity per joint in index order, or None.
+            forces: Target force per joint in index order, or None.
+
+        Returns:
+            True if the commands were sent, False if no array was given.
+
+        Raises:
+            ValueError: If an array does not hold exactly one value per joint.
+        """
+        available_control = self._robot_handler.set_joint_targets(positions, velocities, forces)
+        if available_control == 0:
+            self.logger.warning("No joint target arrays given")
+            return False
+        await self._send_target_commands(available_control)
+        return True
+
+    async def _send_target_commands(self, available_control: int):
+        """Sends the packed targets, paced by the communication frequency."""
+        await self._send_commands(self._target_commands(available_control))
+
+    async def _send_commands(self, target_commands: list):
+        """Sends target commands, each in its own send slot (merged with ``combined_targets``)."""
+        if self.combined_targets and len(target_commands) > 1:
+            target_commands = self._command_handler.combine_target_commands(target_commands)
+        for set_joint_angles_cmd in target_commands:
+            await self.wait_for_com_freq()
+            await self._communication_handler.send_data(set_joint_angles_cmd,CommandType.TARGET_COMMAND.value)
+
+    async def execute_pose(self, pose, read_feedback: bool = False):
+        """Sends a pose precompiled by ``PoseLibrary`` (see ``ArtusAPI_V2.execute_pose``).
+
+        Args:
+            pose: ``CompiledPose`` for this hand's robot type and side.
+            read_feedback: If True, the last frame goes out as an FC 0x17
+                that also reads back the joint positions (frames merged
+                first with ``combined_targets``).
+
+        Returns:
+            True once the frames are sent; with ``read_feedback`` the
+            position feedback array instead.
+        """
+        frames = self._apply_pose(pose)
+        if not read_feedback:
+            await self._send_commands(frames)
+            return True
+
+        key = 'feedback_position_start_reg'
+        if not frames:
+            frames = [pose.frames['position']]
+        elif self.combined_targets:
+            frames = self._command_handler.combine_target_commands(frames, max_registers=MAX_READ_WRITE_WRITE_COUNT)
+        for frame in frames[:-1]:
+            await self.wait_for_com_freq()
+            await self._communication_handler.send_data(frame,CommandType.TARGET_COMMAND.value)
+        write_frame = frames[-1]
+        await self.wait_for_com_freq()
+        feedback_data = await self._communication_handler.send_receive_data(
+            self._register_layout.addresses[key], self._feedback_register_count(key),
+            write_frame[0], write_frame[1:])
+        if isinstance(feedback_data, int):
+            feedback_data = [feedback_data]
+        self._decode_feedback_field(key, feedback_data)
+        return self._robot_handler.robot.joint_state.feedback_angle.copy()
+
+    async def set_home_position(self):
+        """Moves the hand to its home position at the default velocity."""
+        self._robot_handler.set_home_position()
+        cmd = self._command_handler.get_target_position_command(self._robot_handler.robot.hand_joints)
+        await self.wait_for_com_freq()
+        await self._communication_handler.send_data(cmd,CommandType.TARGET_COMMAND.value)
+
+    async def _set_get_joint_field(self, joint_angles: dict, target_packer, feedback_reg_key: str):
+        """Shared FC 0x17 path: write one target field and read matching feedback.
+
+        Args:
+            joint_angles: Joint dict consumed by ``Robot.set_joint_angles``.
+            target_packer: ``NewCommands`` method packing ``[start_reg, *values]``.
+            feedback_reg_key: ModbusMap key for the feedback start register.
+
+        Returns:
+            Dict mapping joint name to decoded feedback, or False if no
+            valid joint data.
+        """
+        available_control = self._robot_handler.set_joint_angles(joint_angles, name=True)
+        if available_control == 0:
+            self.logger.warning("No valid data in joint dictionary to send")
+            return False
+
+        write_cmd = target_packer(self._robot_handler.robot.hand_joints)
+        read_start = self._register_layout.addresses[feedback_reg_key]
+        read_count = self._feedback_register_count(feedback_reg_key)
+
+        await self.wait_for_com_freq()
+        feedback_data = await self._communication_handler.send_receive_data(
+            read_start, read_count, write_cmd[0], write_cmd[1:]
+        )
+        if isinstance(feedback_data, int):
+            feedback_data = [feedback_data]
+        return self._decode_feedback_field(feedback_reg_key, feedback_data)
+
+    async def set_get_joint_angles(self, joint_angles: dict):
+        """Writes target positions and reads feedback positions in one FC 0x17."""
+        return await self._set_get_joint_field(joint_angles, self._command_handler.get_target_position_command, 'feedback_position_start_reg')
+
+    async def set_get_joint_speeds(self, joint_angles: dict):
+        """Writes target velocities and reads feedback velocities in one FC 0x17."""
+        return await self._set_get_joint_field(joint_angles, self._command_handler.get_target_velocity_command, 'feedback_velocity_start_reg')
+
+    async def set_get_joint_forces(self, joint_angles: dict):
+        """Writes target forces and reads feedback forces in one FC 0x17."""
+        return await self._set_get_joint_field(joint_angles, self._command_handler.get_target_force_command, 'feedback_force_start_reg')
+
+    async def _read_feedback_field(self, feedback_reg_key: str):
+        """Reads and decodes one feedback field.
+
+        Args:
+            feedback_reg_key: Key in ``ModbusMap.modbus_reg_map``.
+
+        Returns:
+            The decoded field, shaped like the matching ``ArtusAPI_V2`` getter.
+        """
+        feedback_data = await self._communication_handler.receive_data(
+            amount_dat=self._feedback_register_count(feedback_reg_key),
+            start=self._register_layout.addresses[feedback_reg_key])
+        if isinstance(feedback_data, int):
+            feedback_data = [feedback_data]
+        return self._decode_feedback_field(feedback_reg_key, feedback_data)
+
+    async def get_joint_feedback_array(self, feedback_type:str='feedback_position_start_reg'):
+        """Reads one per-joint feedback field as a NumPy array (see ``ArtusAPI_V2.get_joint_feedback_array``).
+
+        Args:
+            feedback_type: Per-joint feedback key, e.g.
+                'feedback_position_start_reg'.
+
+        Returns:
+            float64 array with one value per joint in joint index order.
+
+        Raises:
+            ValueError: If ``feedback_type`` is not a per-joint feedback field.
+        """
+        if feedback_type not in FEEDBACK_FIELDS:
+            raise ValueError(f"{feedback_type} is not a per-joint feedback field, expected one of {list(FEEDBACK_FIELDS)}")
+        await self._read_feedback_field(feedback_type)
+        return getattr(self._robot_handler.robot.joint_state, FEEDBACK_FIELDS[feedback_type]).copy()
+
+    async def get_joint_angles(self):
+        """Reads joint position feedback.
+
+        Returns:
+            Dict mapping joint name to feedback position.
+        """
+        return await self._read_feedback_field('feedback_position_start_reg')
+
+    async def get_joint_forces(self):
+        """Reads joint force feedback.
+
+        Returns:
+            Dict mapping joint name to feedback force.
+        """
+        return await self._read_feedback_field('feedback_force_start_reg')
+
+    async def get_joint_speeds(self):
+        """Reads joint velocity feedback.
+
+        Returns:
+            Dict mapping joint name to feedback velocity.
+        """
+        return await self._read_feedback_field('feedback_velocity_start_reg')
+
+    async def get_joint_temperatures(self):
+        """Reads per-joint temperature feedback.
+
+        Returns:
+            Dict mapping joint name to feedback temperature.
+        """
+        return await self._read_feedback_field('feedback_temperature_start_reg')
+
+    async def get_fingertip_forces(self):
+        """Reads the fingertip forces.
+
+        Returns:
+            Dict keyed by finger name of ``{'x', 'y', 'z'}`` forces.
+        """
+        return await self._read_feedback_field('feedback_force_sensor_start_reg')
+
+    async def get_voltage(self):
+        """Reads the hand's supply voltage.
+
+        Returns:
+            Decoded voltage as a float.
+        """
+        return await self._read_feedback_field('feedback_voltage_start_reg')
+
+    async def get_avg_temperature(self):
+        """Reads the hand's average temperature.
+
+        Returns:
+            Decoded average temperature.
+        """
+        feedback_data = await self._communication_handler.receive_data(
+            amount_dat=1, start=self._register_layout.addresses['feedback_avg_temperature_start_reg'])
+        return self._command_handler.get_decoded_feedback_data(feedback_data, modbus_key='feedback_avg_temperature_start_reg')[0]
+
+    async def get_error_report(self):
+        """Reads the per-joint actuator error bitfield report.
+
+        Returns:
+            Dict mapping joint name to its uint32 error report.
+        """
+        feedback_data = await self._communication_handler.receive_data(
+            amount_dat=self._feedback_register_count('feedback_actuator_error_reg'),
+            start=self._register_layout.addresses['feedback_actuator_error_reg'])
+        decoded = self._command_handler.get_decoded_feedback_data(feedback_data, modbus_key='feedback_actuator_error_reg')
+        return self.helper_fill_dict_from_feedback_data(decoded)
+
+    async def get_hand_feedback_data(self):
+        """Reads all available feedback types in the fewest contiguous reads.
+
+        Returns:
+            Timestamped snapshot dict, as ``ArtusAPI_V2.get_hand_feedback_data``.
+        """
+        layout = self._register_layout
+        feedback_types = ['feedback_register', *self._robot_handler.robot.available_feedback_types]
+        fields = [(key, layout.addresses[key], layout.read_sizes[key]) for key in feedback_types]
+
+        snapshot = {}
+        for start, count, members in self._read_planner.plan(fields):
+            registers = await self._communication_handler.receive_data(amount_dat=count, start=start)
+            if isinstance(registers, int):
+                registers = [registers]
+            for key, offset, field_count in members:
+                snapshot[FEEDBACK_SNAPSHOT_FIELDS.get(key, key)] = self._decode_feedback_field(key, registers[offset:offset + field_count])
+        snapshot['timestamp'] = time.time()
+        if self._feedback_ring is not None:
+            self._write_feedback_ring(snapshot)
+        return snapshot
+
+    async def reset(self,joints=0):
+        """Sends a reset command and awaits the hand becoming ready.
+
+        Args:
+            joints: Joint # to reset.
+        """
+        await self.wait_for_com_freq()
+        await self._communication_handler.send_data(self._command_handler.get_reset_command(joints))
+        if not await self._communication_handler.wait_for_ready(settle_timeout=0.2):
+            self.logger.error("Hand timed out waiting for ready")
+
+    async def soft_reset(self,joints=0):
+        """Sends a soft reset command and awaits the hand becoming ready.
+
+        Args:
+            joints: Joint # to soft reset; 0 for all.
+        """
+        await self.wait_for_com_freq()
+        await self._communication_handler.send_data(self._command_handler.get_soft_reset_command(joints))
+        if not await self._communication_handler.wait_for_ready(settle_timeout=0.2):
+            self.logger.error("Hand timed out waiting for ready")
+
@@ -0,0 +1,5 @@
+"""Local broker sharing one hand's session between several client processes."""
+from .hand_broker import DEFAULT_ADDRESS, DEFAULT_AUTHKEY_FILE, HandBroker, load_authkey
+from .broker_client import BrokerClient
+
+__all__ = ["DEFAULT_ADDRESS", "DEFAULT_AUTHKEY_FILE", "HandBroker", "BrokerClient", "load_authkey"]
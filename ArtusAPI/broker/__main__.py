@@ -0,0 +1,53 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Runs a hand broker: ``python -m ArtusAPI.broker --port /dev/ttyUSB0 --robot-type artus_lite``."""
+
+import argparse
+import logging
+
+from ..artus_api_new import ArtusAPI_V2
+from .hand_broker import DEFAULT_ADDRESS, DEFAULT_AUTHKEY_FILE, HandBroker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share one ARTUS hand with several local processes")
+    parser.add_argument("--communication-method", default="RS485_RTU")
+    parser.add_argument("--port", default="/dev/ttyUSB0", help="serial port or host:tcp_port of the hand")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--robot-type", default="artus_lite")
+    parser.add_argument("--hand-type", default="left")
+    parser.add_argument("--socket", default=DEFAULT_ADDRESS, help="socket path (or pipe name) clients connect to")
+    parser.add_argument("--authkey", help="shared secret clients must present; overrides --authkey-file")
+    parser.add_argument("--authkey-file", default=DEFAULT_AUTHKEY_FILE,
+                        help="file holding the shared secret; a random key is created if it does not exist")
+    parser.add_argument("--feedback-frequency", type=float, default=20.0, help="feedback reads per second; 0 disables")
+    parser.add_argument("--hold-time", type=float, default=0.5, help="seconds a writer holds the hand against lower priorities")
+    parser.add_argument("--wake-up", action="store_true", help="wake the hand up before serving clients")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    hand = ArtusAPI_V2(communication_method=args.communication_method, communication_channel_identifier=args.port,
+                       robot_type=args.robot_type, hand_type=args.hand_type, baudrate=args.baudrate)
+    if args.wake_up:
+        hand.wake_up()
+    authkey = args.authkey.encode() if args.authkey else None
+    try:
+        broker = HandBroker(hand, address=args.socket, authkey=authkey, authkey_file=args.authkey_file,
+                            feedback_frequency=args.feedback_frequency or None, hold_time=args.hold_time)
+        broker.serve_forever()
+    finally:
+        hand.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Client side of the hand broker: an ``ArtusAPI_V2`` stand-in for processes that share a hand."""
+
+import functools
+import itertools
+import logging
+import threading
+from multiprocessing.connection import Client
+
+from .hand_broker import DEFAULT_ADDRESS, DEFAULT_AUTHKEY_FILE, load_authkey
+
+
+class BrokerClient:
+    """Connects to a ``HandBroker`` and forwards API calls to its hand.
+
+    Any public ``ArtusAPI_V2`` method can be called on the client
+    (``client.set_joint_angles(...)``, ``client.get_robot_status()``...);
+    the call runs in the broker process and its return value or exception
+    comes back. Feedback snapshots pushed by the broker are kept as they
+    arrive, so reading feedback costs no bus time.
+
+    Attributes:
+        address: Socket path (or pipe name) of the broker.
+        priority: Write priority; higher priorities are served first and
+            pre-empt lower ones (see ``HandBroker``).
+        timeout: Seconds to wait for a call's result.
+        logger: Logger used for status and error messages.
+        on_feedback: Optional callable invoked with every snapshot, on the
+            client's receive thread.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, priority: int = 0, subscribe: bool = True,
+                 authkey: bytes = None, authkey_file: str = DEFAULT_AUTHKEY_FILE, timeout: float = 10.0,
+                 on_feedback=None, logger=None):
+        """Connects to the broker.
+
+        Args:
+            address: Socket path (or pipe name) the broker listens on.
+            priority: Write priority of this client.
+            subscribe: Whether to receive feedback snapshots.
+            authkey: Shared secret configured on the broker, or None to
+                use the key in ``authkey_file``.
+            authkey_file: Key file written by the broker, read when
+                ``authkey`` is None.
+            timeout: Seconds to wait for a call's result.
+            on_feedback: Optional callable invoked with every snapshot.
+            logger: Logger to use; a module-level logger is created if None.
+
+        Raises:
+            ConnectionError: If the broker is not running or its key file
+                does not exist.
+            multiprocessing.AuthenticationError: If the broker rejects the key.
+        """
+        self.address = address
+        self.priority = priority
+        self.timeout = timeout
+        self.on_feedback = on_feedback
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        if authkey is None:
+            try:
+                authkey = load_authkey(authkey_file)
+            except FileNotFoundError as e:
+                raise ConnectionError(f"No hand broker key at {authkey_file}; is the broker running?") from e
+        try:
+            self._conn = Client(address, authkey=authkey)
+        except (OSError, EOFError) as e:
+            raise ConnectionError(f"Could not connect to hand broker at {address}: {e}") from e
+        self._send_lock = threading.Lock()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count()
+        self._feedback = None
+        self._feedback_cond = threading.Condition()
+        self._feedback_count = 0
+        self._closed = False
+        self._send(('hello', priority, subscribe))
+        self._receiver = threading.Thread(target=self._receive_loop, name='BrokerClient', daemon=True)
+        self._receiver.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return functools.partial(self.call, name)
+
+    def _send(self, message: tuple):
+        with self._send_lock:
+            self._conn.send(message)
+
+    def call(self, method: str, *args, **kwargs):
+        """Runs a hand method in the broker and returns its result.
+
+        Args:
+            method: Public ``ArtusAPI_V2`` method name.
+            *args: Positional arguments (must be picklable).
+            **kwargs: Keyword arguments (must be picklable).
+
+        Returns:
+            The method's return value.
+
+        Raises:
+            PermissionError: If a higher-priority client holds the hand.
+            AttributeError: If the hand has no such method.
+            TimeoutError: If no result arrives within ``timeout``.
+            ConnectionError: If the broker connection is lost.
+            Exception: Whatever the method raised in the broker.
+        """
+        if self._closed:
+            raise ConnectionError("Broker connection is closed")
+        call_id = next(self._ids)
+        done = threading.Event()
+        slot = [done, False, None]
+        with self._pending_lock:
+            self._pending[call_id] = slot
+        try:
+            self._send(('call', call_id, method, args, kwargs))
+            if not done.wait(self.timeout):
+                raise TimeoutError(f"No reply from hand broker to {method} within {self.timeout} s")
+        except (OSError, EOFError) as e:
+            raise ConnectionError(f"Lost connection to hand broker: {e}") from e
+        finally:
+            with self._pending_lock:
+                self._pending.pop(call_id, None)
+        _, ok, value = slot
+        if not ok:
+            raise value
+        return value
+
+    def subscribe(self, enabled: bool = True):
+        """Starts or stops receiving feedback snapshots."""
+        self._send(('subscribe', enabled))
+
+    def get_feedback(self):
+        """Returns the latest feedback snapshot pushed by the broker, or None.
+
+        Returns:
+            Snapshot dict as returned by ``ArtusAPI_V2.get_hand_feedback_data``.
+        """
+        return self._feedback
+
+    def wait_for_feedback(self, timeout: float = None):
+        """Blocks until a snapshot newer than the current one arrives.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The new snapshot, or None on timeout.
+        """
+        with self._feedback_cond:
+            count = self._feedback_count
+            if not self._feedback_cond.wait_for(lambda: self._feedback_count != count or self._closed, timeout):
+                return None
+            return self._feedback if self._feedback_count != count else None
+
+    def close(self):
+        """Disconnects from the broker; pending calls fail with ConnectionError."""
+        if self._closed:
+            return
+        try:
+            self._send(('bye',))
+        except Exception:
+            pass
+        self._shutdown()
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        if self._receiver is not threading.current_thread():
+            self._receiver.join(timeout=1.0)
+
+    def _shutdown(self):
+        self._closed = True
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[1], slot[2] = False, ConnectionError("Hand broker connection closed")
+            slot[0].set()
+        with self._feedback_cond:
+            self._feedback_cond.notify_all()
+
+    def _receive_loop(self):
+        while not self._closed:
+            try:
+                kind, *args = self._conn.recv()
+            except (OSError, EOFError, TypeError):
+                break
+            if kind == 'result':
+                call_id, ok, value = args
+                with self._pending_lock:
+                    slot = self._pending.get(call_id)
+                if slot is not None:
+                    slot[1], slot[2] = ok, value
+                    slot[0].set()
+            elif kind == 'feedback':
+                with self._feedback_cond:
+                    self._feedback = args[0]
+                    self._feedback_count += 1
+                    self._feedback_cond.notify_all()
+                if self.on_feedback is not None:
+                    try:
+                        self.on_feedback(args[0])
+                    except Exception as e:
+                        self.logger.error(f"on_feedback callback failed: {e}")
+        self._shutdown()
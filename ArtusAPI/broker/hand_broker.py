@@ -0,0 +1,465 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Broker that owns one hand's session and shares it with several local client processes."""
+
+import heapq
+import itertools
+import logging
+import os
+import pickle
+import secrets
+import socket
+import tempfile
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Client, Listener
+from multiprocessing import AuthenticationError
+
+if os.name == 'nt':
+    DEFAULT_ADDRESS = r'\\.\pipe\artus_broker'
+else:
+    DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), 'artus_broker.sock')
+
+# shared secret of the broker and its clients; only the user running the broker can read it
+DEFAULT_AUTHKEY_FILE = os.path.join(os.path.expanduser('~'), '.artus_broker_key')
+
+# methods that only read from the hand; everything else is a write and is arbitrated
+READ_PREFIXES = ('get_',)
+
+
+def load_authkey(path: str = DEFAULT_AUTHKEY_FILE, create: bool = False) -> bytes:
+    """Reads the broker's shared secret from a key file.
+
+    Args:
+        path: Key file.
+        create: If True and the file does not exist, a random key is
+            generated and written to it, readable by the current user only.
+
+    Returns:
+        The key.
+
+    Raises:
+        FileNotFoundError: If the file does not exist and ``create`` is False.
+        ValueError: If the file is empty.
+    """
+    if create and not os.path.exists(path):
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass  # created by another broker meanwhile
+        else:
+            with os.fdopen(fd, 'w') as key_file:
+                key_file.write(secrets.token_hex(32))
+    with open(path, 'rb') as key_file:
+        authkey = key_file.read().strip()
+    if not authkey:
+        raise ValueError(f"Broker key file {path} is empty")
+    return authkey
+
+
+def _is_pipe(address: str) -> bool:
+    """Checks whether an address is a Windows named pipe rather than a socket path."""
+    return address.startswith('\\\\')
+
+
+def _knock(address: str) -> bool:
+    """Connects to a Unix socket path and hangs up at once.
+
+    Returns:
+        True if something is listening on ``address``.
+    """
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(address)
+        return True
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        probe.close()
+
+
+def _portable_error(error: Exception) -> Exception:
+    """Returns ``error`` if it can be sent to a client, else a RuntimeError describing it."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
+
+
+class _ClientSession:
+    """One connected client: its connection, settings and outgoing message queue.
+
+    Results are queued in order; feedback keeps only the latest snapshot, so
+    a slow client skips snapshots instead of stalling the fan-out.
+    """
+
+    def __init__(self, conn, number: int, logger):
+        self.conn = conn
+        self.number = number
+        self.logger = logger
+        self.priority = 0
+        self.subscribed = True
+        self.dropped_feedback = 0
+        self.closed = False
+        self._results = deque()
+        self._feedback = None
+        self._cond = threading.Condition()
+        self._sender = threading.Thread(target=self._send_loop, name=f'HandBroker-client{number}', daemon=True)
+        self._sender.start()
+
+    def __repr__(self):
+        return f'client {self.number} (priority {self.priority})'
+
+    def post_result(self, message: tuple):
+        with self._cond:
+            self._results.append(message)
+            self._cond.notify()
+
+    def post_feedback(self, message: tuple):
+        with self._cond:
+            if self._feedback is not None:
+                self.dropped_feedback += 1
+            self._feedback = message
+            self._cond.notify()
+
+    def _send_loop(self):
+        while True:
+            with self._cond:
+                while not self.closed and not self._results and self._feedback is None:
+                    self._cond.wait()
+                if self.closed:
+                    return
+                if self._results:
+                    message = self._results.popleft()
+                else:
+                    message, self._feedback = self._feedback, None
+            try:
+                self.conn.send(message)
+            except (OSError, EOFError, ValueError):
+                self.close()
+                return
+            except Exception as e:
+                self.logger.error(f"Could not send to {self}: {e}")
+
+    def close(self):
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self._cond.notify_all()
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+class HandBroker:
+    """Serves one connected hand to several local processes.
+
+    Only one process can open a hand's RS485 port. The broker is that
+    process: it owns the ``ArtusAPI_V2`` session and listens on a local
+    socket (a Unix socket, or a named pipe on Windows) for ``BrokerClient``
+    connections from the GUI, loggers, controllers and so on.
+
+    * Feedback is read once per cycle with ``get_hand_feedback_data`` and
+      the snapshot is sent to every subscribed client. Slow clients only
+      get the newest snapshot.
+    * Method calls from all clients go through one queue, served highest
+      priority first and in arrival order within a priority, so the hand
+      sees one command at a time.
+    * Writes (every method not starting with ``get_``) are arbitrated: the
+      client that last wrote holds the hand for ``hold_time`` seconds, and
+      writes from lower-priority clients are rejected with
+      ``PermissionError`` until the hold expires. Clients of equal or
+      higher priority take over immediately.
+
+    Clients authenticate with a shared secret before any message is read,
+    since messages are pickled. By default the secret is kept in
+    ``DEFAULT_AUTHKEY_FILE`` (created on first use, readable by the
+    current user only), where ``BrokerClient`` finds it. The socket itself
+    is also restricted to the current user.
+
+    Attributes:
+        hand: The ``ArtusAPI_V2`` (or same-interface object) being served.
+        address: Socket path (or pipe name) clients connect to.
+        feedback_frequency: Feedback reads per second, or None to disable
+            feedback polling.
+        hold_time: Seconds a writer keeps the hand against lower priorities.
+        logger: Logger used for status and error messages.
+        latest_feedback: Most recent feedback snapshot, or None.
+    """
+
+    def __init__(self, hand, address: str = DEFAULT_ADDRESS, authkey: bytes = None,
+                 authkey_file: str = DEFAULT_AUTHKEY_FILE, feedback_frequency: float = 20.0,
+                 hold_time: float = 0.5, logger=None):
+        """Creates the broker without listening yet (see ``start``).
+
+        Args:
+            hand: Connected ``ArtusAPI_V2``; the broker does not wake it up.
+            address: Socket path (or pipe name) to listen on. A stale socket
+                file at this path is removed.
+            authkey: Shared secret clients must present, or None to use
+                the key in ``authkey_file``.
+            authkey_file: Key file read (or created) when ``authkey`` is
+                None.
+            feedback_frequency: Feedback reads per second, or None.
+            hold_time: Seconds a writer keeps the hand against
+                lower-priority clients.
+            logger: Logger to use; a module-level logger is created if None.
+
+        Raises:
+            ValueError: If the key is empty.
+        """
+        if authkey is None:
+            authkey = load_authkey(authkey_file, create=True)
+        if not authkey:
+            raise ValueError("Hand broker needs a non-empty authkey")
+        self.hand = hand
+        self.address = address
+        self.authkey = authkey
+        self.feedback_frequency = feedback_frequency
+        self.hold_time = hold_time
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self.latest_feedback = None
+        self._listener = None
+        self._threads = []
+        self._stop = threading.Event()
+        self._hand_lock = threading.Lock()
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        self._queue = []
+        self._queue_cond = threading.Condition()
+        self._sequence = itertools.count()
+        self._numbers = itertools.count(1)
+        self._owner = None  # (session, priority, hold expiry)
+        self._stats = {'calls': 0, 'rejected': 0, 'errors': 0, 'feedback_cycles': 0, 'feedback_errors': 0}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """Starts listening and the accept, command and feedback threads.
+
+        Raises:
+            ConnectionError: If another broker is already listening on
+                ``address``.
+        """
+        if self._listener is not None:
+            return
+        if not _is_pipe(self.address) and os.path.exists(self.address):
+            if _knock(self.address):
+                raise ConnectionError(f"A hand broker is already listening on {self.address}")
+            os.unlink(self.address)  # left behind by a broker that did not stop cleanly
+        self._stop.clear()
+        self._listener = Listener(self.address, authkey=self.authkey)
+        if not _is_pipe(self.address):
+            os.chmod(self.address, 0o600)
+        self._threads = [threading.Thread(target=self._accept_loop, name='HandBroker-accept', daemon=True),
+                         threading.Thread(target=self._command_loop, name='HandBroker-commands', daemon=True)]
+        if self.feedback_frequency:
+            self._threads.append(threading.Thread(target=self._feedback_loop, name='HandBroker-feedback', daemon=True))
+        for thread in self._threads:
+            thread.start()
+        self.logger.info(f"Hand broker listening on {self.address}")
+
+    def stop(self):
+        """Disconnects every client and stops the threads; the hand stays connected."""
+        if self._listener is None:
+            return
+        self._stop.set()
+        try:
+            # accept() does not return when the listener is closed, so wake it with a last connection;
+            # on Unix a bare connection is enough and cannot block if the accept thread already left
+            if _is_pipe(self.address):
+                Client(self.address, authkey=self.authkey).close()
+            else:
+                _knock(self.address)
+        except Exception:
+            pass
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+        with self._queue_cond:
+            self._queue_cond.notify_all()
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for session in clients:
+            session.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        self._listener = None
+        self._threads = []
+
+    def serve_forever(self):
+        """Starts the broker and blocks until ``stop`` is called or Ctrl+C."""
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def get_stats(self) -> dict:
+        """Returns broker counters.
+
+        Returns:
+            Dict with ``clients`` (connected), ``calls``, ``rejected``
+            (arbitration refusals), ``errors`` (calls that raised),
+            ``feedback_cycles``, ``feedback_errors`` and
+            ``dropped_feedback`` (snapshots skipped by slow clients).
+        """
+        with self._clients_lock:
+            clients = list(self._clients)
+        return dict(self._stats, clients=len(clients),
+                    dropped_feedback=sum(session.dropped_feedback for session in clients))
+
+    # ------------------------------------------------------------------ clients
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError as e:
+                self.logger.warning(f"Rejected broker client: {e}")
+                continue
+            except (OSError, EOFError) as e:
+                if self._stop.is_set():
+                    return
+                self.logger.warning(f"Broker client dropped during handshake: {e}")
+                continue
+            if self._stop.is_set():
+                conn.close()
+                return
+            session = _ClientSession(conn, next(self._numbers), self.logger)
+            with self._clients_lock:
+                self._clients.append(session)
+            threading.Thread(target=self._client_loop, args=(session,), name=f'HandBroker-recv{session.number}',
+                             daemon=True).start()
+
+    def _client_loop(self, session: _ClientSession):
+        try:
+            while not self._stop.is_set():
+                kind, *args = session.conn.recv()
+                if kind == 'hello':
+                    session.priority, session.subscribed = args
+                    self.logger.info(f"Broker {session} connected")
+                    if session.subscribed and self.latest_feedback is not None:
+                        session.post_feedback(('feedback', self.latest_feedback))
+                elif kind == 'subscribe':
+                    session.subscribed = args[0]
+                elif kind == 'call':
+                    self._submit(session, *args)
+                elif kind == 'bye':
+                    break
+        except (OSError, EOFError, TypeError, ValueError):
+            pass
+        self._disconnect(session)
+
+    def _disconnect(self, session: _ClientSession):
+        session.close()
+        with self._clients_lock:
+            if session in self._clients:
+                self._clients.remove(session)
+        with self._queue_cond:
+            if self._owner is not None and self._owner[0] is session:
+                self._owner = None
+        self.logger.info(f"Broker {session} disconnected")
+
+    # ------------------------------------------------------------------ commands
+
+    def _submit(self, session: _ClientSession, call_id: int, method: str, args: tuple, kwargs: dict):
+        target = None if method.startswith('_') else getattr(self.hand, method, None)
+        if not callable(target):
+            session.post_result(('result', call_id, False, AttributeError(f"Hand has no method {method!r}")))
+            return
+        with self._queue_cond:
+            heapq.heappush(self._queue, (-session.priority, next(self._sequence), session, call_id, method, args, kwargs))
+            self._queue_cond.notify()
+
+    def _arbitrate(self, session: _ClientSession):
+        """Grants ``session`` the hand for a write, or raises if a higher priority holds it."""
+        now = time.monotonic()
+        with self._queue_cond:
+            owner = self._owner
+            if owner is not None and owner[0] is not session and owner[1] > session.priority and now < owner[2]:
+                raise PermissionError(f"Hand is held by {owner[0]} for another {owner[2] - now:.2f} s")
+            self._owner = (session, session.priority, now + self.hold_time)
+
+    def _command_loop(self):
+        while True:
+            with self._queue_cond:
+                while not self._queue and not self._stop.is_set():
+                    self._queue_cond.wait()
+                if self._stop.is_set():
+                    return
+                _, _, session, call_id, method, args, kwargs = heapq.heappop(self._queue)
+            if session.closed:
+                continue
+            self._stats['calls'] += 1
+            try:
+                if not method.startswith(READ_PREFIXES):
+                    self._arbitrate(session)
+                with self._hand_lock:
+                    result = getattr(self.hand, method)(*args, **kwargs)
+            except PermissionError as e:
+                self._stats['rejected'] += 1
+                session.post_result(('result', call_id, False, e))
+                continue
+            except Exception as e:
+                self._stats['errors'] += 1
+                session.post_result(('result', call_id, False, _portable_error(e)))
+                continue
+            try:
+                pickle.dumps(result)
+            except Exception as e:
+                result = None
+                self.logger.warning(f"Result of {method} cannot be sent to {session}: {e}")
+            session.post_result(('result', call_id, True, result))
+
+    # ------------------------------------------------------------------ feedback
+
+    def _feedback_loop(self):
+        period = 1.0 / self.feedback_frequency
+        deadline = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                with self._hand_lock:
+                    snapshot = self.hand.get_hand_feedback_data()
+            except Exception as e:
+                self._stats['feedback_errors'] += 1
+                self.logger.warning(f"Broker feedback read failed: {e}")
+                snapshot = None
+            if snapshot is not None:
+                self._stats['feedback_cycles'] += 1
+                self.latest_feedback = snapshot
+                message = ('feedback', snapshot)
+                with self._clients_lock:
+                    clients = [session for session in self._clients if session.subscribed]
+                for session in clients:
+                    session.post_feedback(message)
+            deadline = max(deadline + period, time.perf_counter())
+            self._stop.wait(deadline - time.perf_counter())
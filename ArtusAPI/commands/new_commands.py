@@ -10,12 +10,13 @@ Licensed under the Sarcomere Dynamics Software License.
 See the LICENSE file in the repository for full details.
 """
 
-from typing import Any
 import logging
-import struct
-import math
 
 from ..common.ModbusMap import ModbusMap
+from ..common import register_layout
+from . import register_codec
+from ..communication.modbus_pdu import MAX_WRITE_COUNT
+from ..communication.read_planner import plan_register_reads
 """
 New Commands Class based on Modbus RTU for RS485 Communication
 """
@@ -81,6 +82,27 @@ class NewCommands(ModbusMap):
         """
         return [self.commands['start_command'],control_type]
 
+    @staticmethod
+    def _target_values(hand_joints:dict, field:str) -> list:
+        """Collects one target field of every joint, unset targets as 0.
+
+        Reads the backing ``JointState`` array directly when ``hand_joints``
+        is a robot's ``HandJoints`` mapping, and falls back to per-joint
+        attribute access for plain dicts of joint objects.
+
+        Args:
+            hand_joints: Joint mapping in index order.
+            field: 'target_angle', 'target_velocity' or 'target_force'.
+
+        Returns:
+            List of target values in joint index order.
+        """
+        state = getattr(hand_joints, 'state', None)
+        if state is not None:
+            return state.targets_or_zero(field).tolist()
+        values = [getattr(joint_data, field) for joint_data in hand_joints.values()]
+        return [0 if value is None else value for value in values]
+
     def get_target_position_command(self,hand_joints:dict) -> list:
         """Packs target joint positions into Modbus register words.
 
@@ -95,34 +117,10 @@ class NewCommands(ModbusMap):
             (high byte, low byte). Out-of-range angles are clamped to the
             int8_t range with a warning logged.
         """
-        tmp_list = []
-        starting_reg = self.modbus_reg_map['target_position_start_reg'] # get starting register
-
-        for name, joint_data in hand_joints.items():
-            if joint_data.target_angle is not None:
-                # constrain target_angle to be size int8_t
-                int8_angle = int(joint_data.target_angle)
-                if int8_angle < -128 or int8_angle > 127:
-                    self.logger.warning(f"target_angle {int8_angle} out of int8_t range, will be truncated.")
-                    # Clamp the value to int8_t range
-                    int8_angle = max(-128, min(127, int8_angle))
-            else:
-                int8_angle = 0
-            tmp_list.append(int8_angle)
-        
-        command_list = []
-        command_list.append(starting_reg)
-
-        # if number of joints is 1, just fill with 0
-        if len(tmp_list) == 1:
-            tmp_list.append(0)
-        
-        for i in range(0, len(tmp_list), 2):
-            command_list.append((tmp_list[i] & 0xFF) << 8 | (tmp_list[i+1] & 0xFF))
-
-        # cast all elements to uint16_t
-        command_list = [x & 0xFFFF for x in command_list]
-        return command_list
+        values = self._target_values(hand_joints, 'target_angle')
+        words = register_codec.encode_int8_pairs(values, on_clamp=lambda bad: self.logger.warning(
+            f"target_angle {bad} out of int8_t range, will be truncated."))
+        return [self.modbus_reg_map['target_position_start_reg'], *words]
 
     def get_reset_command(self,joints=0):
         """Builds the command to reset the given number of joints.
@@ -160,22 +158,10 @@ class NewCommands(ModbusMap):
             are int16 velocities, one per joint. Out-of-range velocities
             are clamped to the int16_t range with a warning logged.
         """
-        tmp_list = []
-        starting_reg = self.modbus_reg_map['target_velocity_start_reg'] # get starting register
-        tmp_list.append(starting_reg)
-        for name,joint_data in hand_joints.items():
-            if joint_data.target_velocity is not None:
-                # constrain target_velocity to be size int16_t
-                int16_velocity = int(joint_data.target_velocity)
-                if int16_velocity < -32768 or int16_velocity > 32767:
-                    self.logger.warning(f"target_velocity {int16_velocity} out of int16_t range, will be truncated.")
-                    # Clamp the value to int16_t range
-                    int16_velocity = max(-32768, min(32767, int16_velocity))
-            else:
-                int16_velocity = 0
-            tmp_list.append(int16_velocity)
-
-        return tmp_list
+        values = self._target_values(hand_joints, 'target_velocity')
+        velocities = register_codec.encode_int16(values, on_clamp=lambda bad: self.logger.warning(
+            f"target_velocity {bad} out of int16_t range, will be truncated."))
+        return [self.modbus_reg_map['target_velocity_start_reg'], *velocities]
 
     def get_target_force_command(self,hand_joints:dict) -> list:
         """Packs target joint forces into Modbus register words.
@@ -191,33 +177,61 @@ class NewCommands(ModbusMap):
             encoding an IEEE 754 little-endian float rounded to 2 decimal
             places. Joints without a target force contribute (0, 0).
         """
-        tmp_list = []
-        starting_reg = self.modbus_reg_map['target_force_start_reg'] # get starting register
-        tmp_list.append(starting_reg)
-        for name,joint_data in hand_joints.items():
-            if joint_data.target_force is not None:
-                # round target force to 2 decimal places
-                tmp = round(joint_data.target_force, 2)
-                byte_representation = struct.pack('<f', tmp)  # Little-endian float to bytes
-                int_low = struct.unpack('<H', byte_representation[:2])[0]  # First 2 bytes as uint16
-                int_high = struct.unpack('<H', byte_representation[2:])[0]  # Last 2 bytes as uint16
-                tmp_list.append(int_high) # high byte is first (even register index)
-                tmp_list.append(int_low) # low byte is second (odd register index)
-            else:
-                tmp_list.append(0)
-                tmp_list.append(0)
-        return tmp_list
+        # joints without a target force are sent as 0.0, which encodes to (0, 0)
+        values = self._target_values(hand_joints, 'target_force')
+        return [self.modbus_reg_map['target_force_start_reg'], *register_codec.encode_float32_words(values)]
+
+    @staticmethod
+    def combine_target_commands(target_commands:list, max_registers:int=MAX_WRITE_COUNT) -> list:
+        """Merges target commands into as few contiguous register writes as fit in one PDU.
+
+        Commands are merged in address order while the merged span stays
+        within ``max_registers``; the reserved target registers between two
+        blocks (kept for hands with more joints) are written as 0. With the
+        default layout, position (1) + force (50) or force + velocity (150)
+        fit in one FC 0x10 write, all three blocks do not.
+
+        Args:
+            target_commands: ``[start_reg, *words]`` target commands.
+            max_registers: Largest register count a single write may carry
+                (123 for FC 0x10, 121 for the write part of FC 0x17).
+
+        Returns:
+            List of ``[start_reg, *words]`` commands, lowest address first.
+        """
+        fields = [(index, command[0], len(command) - 1) for index, command in enumerate(target_commands)]
+        combined = []
+        for start, count, members in plan_register_reads(fields, max_registers=max_registers):
+            words = [0] * count
+            for index, offset, length in members:
+                words[offset:offset + length] = target_commands[index][1:]
+            combined.append([start, *words])
+        return combined
+
+    @staticmethod
+    def combined_members(combined_command:list, target_commands:list) -> list:
+        """Returns the target commands a write from ``combine_target_commands`` carries.
+
+        Args:
+            combined_command: One command returned by ``combine_target_commands``.
+            target_commands: The commands that were combined.
+
+        Returns:
+            The commands whose registers start inside ``combined_command``.
+        """
+        start, end = combined_command[0], combined_command[0] + len(combined_command) - 1
+        return [command for command in target_commands if start <= command[0] < end]
 
     def get_decoded_feedback_data(self,feedback_data:list,modbus_key:str='feedback_register') -> list:
         """Decodes raw feedback register words into typed per-joint values.
 
-        Dispatches to the appropriate helper based on the data-type
-        multiplier registered for ``modbus_key`` in
-        ``ModbusMap.data_type_multiplier_map`` (0.5 -> packed int8 pairs,
-        1 -> signed int16, 2 -> IEEE 754 float), with special-cased
-        handling for ``slave_id_reg`` (single uint8) and
-        ``feedback_actuator_error_reg`` (uint32 bitfield rather than
-        float, despite sharing multiplier 2).
+        Dispatches to the appropriate helper based on the decoder compiled
+        for ``modbus_key`` in ``register_layout.REGISTER_DECODERS`` (derived
+        from ``ModbusMap.data_type_multiplier_map``: 0.5 -> packed int8
+        pairs, 1 -> signed int16, 2 -> IEEE 754 float), with
+        ``slave_id_reg`` decoded as a single uint8 and
+        ``feedback_actuator_error_reg`` as a uint32 bitfield rather than
+        float, despite sharing multiplier 2.
 
         Args:
             feedback_data: List (or single int) of uint16 values read
@@ -230,141 +244,34 @@ class NewCommands(ModbusMap):
             List of decoded data in the correct format for the given
             value type.
         """
-
-        def helper_decode_feedback_16b_8b(data:list) -> list:
-            """Decodes packed feedback/temperature values (splits 16-bit values into two signed 8-bit values).
-
-            Args:
-                data: List of uint16 values, each packing two 8-bit samples.
-
-            Returns:
-                List of signed 8-bit values (two per input element,
-                high byte first), trimmed by one trailing element if the
-                decoded length exceeds ``self.num_joints``.
-            """
-            decoded_data = []
-            for value in data:
-                # Split 16-bit value into two 8-bit bytes
-                high_byte = ((value >> 8) & 0xFF)  # Extract upper 8 bits
-                low_byte = (value & 0xFF)          # Extract lower 8 bits
-                
-                # Convert to signed 8-bit values using two's complement
-                high_byte = high_byte if high_byte < 128 else high_byte - 256
-                low_byte = low_byte if low_byte < 128 else low_byte - 256
-
-                decoded_data.append(high_byte)
-                decoded_data.append(low_byte)
-
-            # check length of decoded data and make sure it matches the number of joints, if not then remove last element
-            if len(decoded_data) != self.num_joints and len(decoded_data) > 0:
-                decoded_data.pop()
-            return decoded_data
-
-        def helper_decode_feedback_16b_float(data:list) -> list:
-            """Decodes pairs of uint16 registers into IEEE 754 floats.
-
-            Args:
-                data: List of uint16 values, consumed two at a time.
-
-            Returns:
-                List of floats, one per pair of input values, rounded to
-                2 decimal places.
-            """
-            decoded_data = []
-            for i in range(0, len(data), 2):
-                if i + 1 < len(data):
-                    # Pack two 16-bit values into 4 bytes and unpack as IEEE float
-                    # Device sends data in big-endian format (high word first)
-                    packed_bytes = struct.pack('<HH', data[i], data[i + 1])
-                    float_value = struct.unpack('<f', packed_bytes)[0]
-                    decoded_data.append(round(float_value, 2))
-            return decoded_data
-
-        def helper_decode_feedback_16b_uint32(data:list) -> list:
-            """Decodes bit-field fields transported as pairs of uint16 registers.
-
-            Firmware packs the low 16 bits at the even register and the
-            high 16 bits at the odd register (see
-            host_communication.c::get_word). Decoded as little-endian
-            uint32 per joint — do NOT reinterpret as IEEE float.
-
-            Args:
-                data: List of uint16 values, consumed two at a time
-                    (low word, high word).
-
-            Returns:
-                List of uint32 bitfield values, one per joint.
-            """
-            decoded_data = []
-            for i in range(0, len(data), 2):
-                if i + 1 < len(data):
-                    # low word first, high word second (matches get_word() on firmware)
-                    packed_bytes = struct.pack('<HH', data[i], data[i + 1])
-                    uint32_value = struct.unpack('<I', packed_bytes)[0]
-                    decoded_data.append(uint32_value)
-            return decoded_data
-
-        def helper_decode_feedback_signed_16b(data:Any) -> Any:
-            """Decodes uint16 value(s) into signed 16-bit integers.
-
-            Args:
-                data: A single uint16 value or a list of uint16 values.
-
-            Returns:
-                The signed 16-bit equivalent, as a list if a list was
-                passed in or a single value otherwise.
-            """
-            # each value is an item in list
-            if isinstance(data, list):
-                return [((v + 2**15) % 2**16 - 2**15) for v in data]
-            else:
-                return ((data + 2**15) % 2**16 - 2**15)
-
-
-            
-
-        # feedback type
-        estimated_feedback_type = None
-        # get size of feedback data
         if isinstance(feedback_data, int):
-            size_of_feedback_data = 1
             feedback_data = [feedback_data]
-        else:
-            size_of_feedback_data = len(feedback_data)
-        self.logger.info(f"Size of feedback data: {size_of_feedback_data} & num joints: {self.num_joints}")
+        self.logger.info(f"Size of feedback data: {len(feedback_data)} & num joints: {self.num_joints}")
 
         # only 1 data type is allowed to be sent back at a time
-
-        # do the actual decoding
-        # todo update with more feedbacks
         decoded_data = []
-        if modbus_key == "slave_id_reg":
-            if isinstance(feedback_data, int):
-                feedback_data = [feedback_data]
-            if not feedback_data:
-                return []
-            return [int(feedback_data[0]) & 0xFF]
-
-        # error_report is a 32-bit bitfield per joint transported as (low_word, high_word).
-        # Route it to the uint32 helper so bit flags like DRV_FAULT=0x20 survive intact —
-        # the multiplier=2 path would otherwise reinterpret the bytes as IEEE float.
-        if modbus_key == "feedback_actuator_error_reg":
-            decoded_data = helper_decode_feedback_16b_uint32(feedback_data)
-            return decoded_data
-
-        match ModbusMap().data_type_multiplier_map[modbus_key]:
-            case 0.5:
-                decoded_data = helper_decode_feedback_16b_8b(feedback_data)
-            case 2:
-                decoded_data = helper_decode_feedback_16b_float(feedback_data)
-            case 1:
-                # Ensure feedback_data is interpreted as int16_t (signed 16-bit integers)
-                decoded_data = [((v + 2**15) % 2**16 - 2**15) for v in feedback_data]
+        match register_layout.REGISTER_DECODERS[modbus_key]:
+            case register_layout.DECODE_UINT8:
+                if not feedback_data:
+                    return []
+                return [int(feedback_data[0]) & 0xFF]
+            case register_layout.DECODE_UINT32:
+                # error_report is a 32-bit bitfield per joint transported as (low_word, high_word).
+                # Decode it as uint32 so bit flags like DRV_FAULT=0x20 survive intact —
+                # the float path would otherwise reinterpret the bytes as IEEE float.
+                decoded_data = register_codec.decode_uint32(feedback_data)
+            case register_layout.DECODE_INT8_PAIRS:
+                decoded_data = register_codec.decode_int8_pairs(feedback_data)
+                # two samples per register: drop the padding byte when the joint count is odd
+                if len(decoded_data) != self.num_joints and len(decoded_data) > 0:
+                    decoded_data.pop()
+            case register_layout.DECODE_FLOAT32:
+                decoded_data = register_codec.decode_float32(feedback_data)
+            case register_layout.DECODE_INT16:
+                decoded_data = register_codec.decode_int16(feedback_data)
 
         return decoded_data
 
-
-
     def get_set_zero_command(self):
         """Builds the command to zero the current joint positions.
 
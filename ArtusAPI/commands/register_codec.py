@@ -0,0 +1,154 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Vectorized (NumPy) encoders and decoders for the ARTUS register formats.
+
+Every function produces exactly the register words / values of the scalar
+``struct``-based code it replaced in ``NewCommands``; results are returned
+as plain Python lists of ``int``/``float``. Rounding to 2 decimals still
+goes through Python's ``round`` because ``np.round`` is not correctly
+rounded and would break bit-identity for some inputs.
+"""
+
+import numpy as np
+
+INT8_MIN, INT8_MAX = -128, 127
+INT16_MIN, INT16_MAX = -32768, 32767
+
+
+def _truncate(values) -> np.ndarray:
+    """Converts values to int64 truncating toward zero, like ``int()``."""
+    return np.trunc(np.asarray(values, dtype=np.float64)).astype(np.int64)
+
+
+def _as_words(data) -> np.ndarray:
+    """Converts register values to uint16, wrapping modulo 2**16."""
+    return np.asarray(data, dtype=np.int64).astype(np.uint16)
+
+
+def _clamp(values, low: int, high: int, on_clamp) -> np.ndarray:
+    """Truncates values and clamps them to ``[low, high]``.
+
+    Args:
+        values: Sequence of numbers.
+        low: Smallest allowed value.
+        high: Largest allowed value.
+        on_clamp: Optional callable receiving the list of truncated values
+            that were out of range, called only if there are any.
+    """
+    truncated = _truncate(values)
+    if on_clamp is not None:
+        outside = (truncated < low) | (truncated > high)
+        if outside.any():
+            on_clamp(truncated[outside].tolist())
+    return np.clip(truncated, low, high)
+
+
+def encode_int8_pairs(values, on_clamp=None) -> list:
+    """Packs integers as int8 pairs into uint16 words (first value in the high byte).
+
+    Values are truncated toward zero and clamped to the int8 range; an odd
+    count is padded with a trailing 0.
+
+    Args:
+        values: Sequence of numbers, one per joint.
+        on_clamp: Optional callable receiving the out-of-range values.
+
+    Returns:
+        List of uint16 words, ``ceil(len(values) / 2)`` long.
+    """
+    clamped = _clamp(values, INT8_MIN, INT8_MAX, on_clamp).astype('>i1')
+    if clamped.size % 2:
+        clamped = np.append(clamped, np.int8(0)).astype('>i1')
+    return clamped.view('>u2').tolist()
+
+
+def encode_int16(values, on_clamp=None) -> list:
+    """Truncates and clamps values to the int16 range.
+
+    Args:
+        values: Sequence of numbers, one per joint.
+        on_clamp: Optional callable receiving the out-of-range values.
+
+    Returns:
+        List of signed ints in ``[-32768, 32767]``.
+    """
+    return _clamp(values, INT16_MIN, INT16_MAX, on_clamp).tolist()
+
+
+def encode_float32_words(values) -> list:
+    """Encodes floats as IEEE 754 singles, two words each (high word first).
+
+    Each value is first rounded to 2 decimal places.
+
+    Args:
+        values: Sequence of numbers, one per joint.
+
+    Returns:
+        List of uint16 words, two per value: ``[high, low, high, low, ...]``.
+    """
+    singles = np.array([round(v, 2) for v in values], dtype='<f4')
+    return singles.view('<u2').reshape(-1, 2)[:, ::-1].ravel().tolist()
+
+
+def decode_int8_pairs(data) -> list:
+    """Splits uint16 words into two signed bytes each, high byte first.
+
+    Args:
+        data: Sequence of uint16 register values.
+
+    Returns:
+        List of signed ints, two per word.
+    """
+    return _as_words(data).astype('>u2').view('>i1').tolist()
+
+
+def decode_int16(data) -> list:
+    """Reinterprets register values as signed 16-bit integers.
+
+    Args:
+        data: Sequence of register values.
+
+    Returns:
+        List of signed ints, one per register.
+    """
+    return _as_words(data).view(np.int16).tolist()
+
+
+def decode_float32(data) -> list:
+    """Decodes (low word, high word) register pairs as IEEE 754 floats.
+
+    A trailing unpaired register is ignored.
+
+    Args:
+        data: Sequence of uint16 register values.
+
+    Returns:
+        List of floats rounded to 2 decimal places, one per pair.
+    """
+    words = _as_words(data[:len(data) - len(data) % 2])
+    return [round(v, 2) for v in words.astype('<u2').view('<f4').tolist()]
+
+
+def decode_uint32(data) -> list:
+    """Decodes (low word, high word) register pairs as uint32 bitfields.
+
+    A trailing unpaired register is ignored.
+
+    Args:
+        data: Sequence of uint16 register values.
+
+    Returns:
+        List of unsigned ints, one per pair.
+    """
+    words = _as_words(data[:len(data) - len(data) % 2])
+    return words.astype('<u2').view('<u4').tolist()
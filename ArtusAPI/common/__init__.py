@@ -1,11 +1,13 @@
 """Common definitions shared across the ArtusAPI package.
 
-Exposes the Modbus register map (:class:`ModbusMap`), actuator/command
-enums, and the slave ID lookup helpers used to identify robot variants on
-the bus.
+Exposes the Modbus register map (:class:`ModbusMap`) and its compiled,
+per-robot form (:func:`get_register_layout`), actuator/command enums,
+and the slave ID lookup helpers used to identify robot variants on the
+bus.
 """
 
 from .ModbusMap import ModbusMap, ActuatorState, CommandType
+from .register_layout import REGISTER_ADDRESSES, RegisterField, RegisterLayout, get_register_layout
 from .SlaveIDMap import (
     SLAVE_ID_BY_ROBOT_HAND,
     SLAVE_ID_TO_ROBOT_HAND,
@@ -0,0 +1,144 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Compiled, immutable view of ``ModbusMap`` sized for one robot model.
+
+``ModbusMap`` is the editable source of truth for register addresses and
+encodings. ``get_register_layout`` turns it into a frozen ``RegisterLayout``
+once per (joint count, fingertip sensor count) so hot paths look up
+addresses, read sizes and decoders without constructing ``ModbusMap`` or
+scanning its dicts.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from .ModbusMap import ModbusMap
+
+# decoder names understood by NewCommands.get_decoded_feedback_data
+DECODE_INT8_PAIRS = 'int8_pairs'  # two signed bytes per register, high byte first
+DECODE_INT16 = 'int16'            # one signed 16-bit value per register
+DECODE_FLOAT32 = 'float32'        # IEEE 754 float from (low word, high word)
+DECODE_UINT32 = 'uint32'          # bitfield from (low word, high word)
+DECODE_UINT8 = 'uint8'            # low byte of a single register
+
+_DECODER_BY_MULTIPLIER = {0.5: DECODE_INT8_PAIRS, 1: DECODE_INT16, 2: DECODE_FLOAT32}
+
+# registers that are not sized per joint
+_FIXED_READ_SIZES = {
+    'command_register': 1,
+    'feedback_register': 1,
+    'slave_id_reg': 1,
+    'feedback_avg_temperature_start_reg': 1,
+    'feedback_voltage_start_reg': 2,  # 1 float
+}
+
+_base_map = ModbusMap()
+
+# address of every register key; identical for all robots
+REGISTER_ADDRESSES = MappingProxyType(dict(_base_map.modbus_reg_map))
+
+# decoder for every register key; identical for all robots
+REGISTER_DECODERS = MappingProxyType({
+    key: (DECODE_UINT32 if key == 'feedback_actuator_error_reg'
+          else DECODE_UINT8 if key == 'slave_id_reg'
+          else _DECODER_BY_MULTIPLIER[multiplier])
+    for key, multiplier in _base_map.data_type_multiplier_map.items()
+})
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    """One logical register block of the Modbus map.
+
+    Attributes:
+        key: ``ModbusMap`` key, e.g. ``'feedback_position_start_reg'``.
+        address: Starting holding register address.
+        count: Number of registers a full read of the block takes for the
+            robot the layout was compiled for.
+        words_per_value: 16-bit words per sample (0.5, 1 or 2), as in
+            ``ModbusMap.data_type_multiplier_map``.
+        decoder: One of the ``DECODE_*`` names.
+    """
+
+    key: str
+    address: int
+    count: int
+    words_per_value: float
+    decoder: str
+
+
+class RegisterLayout:
+    """Frozen register layout for a robot with a given joint and sensor count.
+
+    Obtain instances through ``get_register_layout``; they are shared and
+    must not be mutated.
+
+    Attributes:
+        num_joints: Joint count the read sizes were computed for.
+        num_force_sensors: Fingertip force sensor count (3 floats each).
+        fields: Read-only mapping of key to ``RegisterField``.
+        addresses: Read-only mapping of key to starting address.
+        read_sizes: Read-only mapping of key to full-read register count.
+        keys_by_address: Read-only reverse index of address to key.
+    """
+
+    def __init__(self, num_joints: int, num_force_sensors: int = 0):
+        """Compiles the layout from ``ModbusMap``.
+
+        Args:
+            num_joints: Number of joints on the robot.
+            num_force_sensors: Number of fingertip force sensors on the robot.
+        """
+        self.num_joints = num_joints
+        self.num_force_sensors = num_force_sensors
+        fields = {}
+        for key, address in REGISTER_ADDRESSES.items():
+            multiplier = _base_map.data_type_multiplier_map[key]
+            if key in _FIXED_READ_SIZES:
+                count = _FIXED_READ_SIZES[key]
+            elif key == 'feedback_force_sensor_start_reg':
+                count = math.ceil(multiplier * 3 * num_force_sensors)  # 3 axes per sensor
+            else:
+                count = math.ceil(multiplier * num_joints)
+            fields[key] = RegisterField(key, address, count, multiplier, REGISTER_DECODERS[key])
+        self.fields = MappingProxyType(fields)
+        self.addresses = REGISTER_ADDRESSES
+        self.read_sizes = MappingProxyType({key: field.count for key, field in fields.items()})
+        self.keys_by_address = MappingProxyType({field.address: key for key, field in fields.items()})
+
+    def key_for_address(self, address: int):
+        """Reverse-looks up the register key starting at ``address``.
+
+        Returns:
+            The ``ModbusMap`` key, or None if no block starts there.
+        """
+        return self.keys_by_address.get(address)
+
+    def __repr__(self):
+        return f"RegisterLayout(num_joints={self.num_joints}, num_force_sensors={self.num_force_sensors})"
+
+
+@lru_cache(maxsize=None)
+def get_register_layout(num_joints: int, num_force_sensors: int = 0) -> RegisterLayout:
+    """Returns the shared compiled layout for a joint/sensor count.
+
+    Args:
+        num_joints: Number of joints on the robot.
+        num_force_sensors: Number of fingertip force sensors on the robot.
+
+    Returns:
+        The cached ``RegisterLayout``; built on first use only.
+    """
+    return RegisterLayout(num_joints, num_force_sensors)
@@ -1,4 +1,5 @@
-"""Modbus TCP transport package exposing the ModbusTCP client."""
+"""Modbus TCP transport package exposing the ModbusTCP clients."""
 from .modbus_tcp import ModbusTCP
+from .pipelined_modbus_tcp import PipelinedModbusTCP
 
-__all__ = ["ModbusTCP"]
+__all__ = ["ModbusTCP", "PipelinedModbusTCP"]
@@ -33,6 +33,8 @@ class ModbusTCP:
         logger: Logger used for status and error messages.
         client: The underlying `pymodbus` `ModbusTcpClient` instance,
             created on the first call to `open`.
+        last_retries: Retries the most recent `send`/`receive`/`send_receive`
+            needed.
     """
 
     def __init__(self, host='192.168.2.8', port=502, timeout=1.0, logger=None, slave_address=1):
@@ -49,6 +51,7 @@ class ModbusTCP:
         self.port = port
         self.timeout = timeout
         self.slave_address = slave_address
+        self.last_retries = 0
 
         if not logger:
             self.logger = logging.getLogger(__name__)
@@ -130,6 +133,7 @@ class ModbusTCP:
             ConnectionException: If the final retry attempt still fails to
                 connect.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 if not self.is_connected():
@@ -164,6 +168,7 @@ class ModbusTCP:
             except (ModbusIOException, ConnectionException, ConnectionError) as e:
                 self.logger.warning(f"Modbus exception on attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to send after {max_retries} attempts")
@@ -194,6 +199,7 @@ class ModbusTCP:
             ConnectionException: If the final retry attempt still fails to
                 connect.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 if not self.is_connected():
@@ -210,6 +216,7 @@ class ModbusTCP:
             except (ModbusIOException, ConnectionException, ConnectionError) as e:
                 self.logger.warning(f"Modbus exception on receive attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to receive after {max_retries} attempts")
@@ -246,6 +253,7 @@ class ModbusTCP:
             ConnectionException: If the final retry attempt still fails to
                 connect.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 if not self.is_connected():
@@ -270,6 +278,7 @@ class ModbusTCP:
                     f"Modbus exception on send_receive attempt {attempt + 1}/{max_retries}: {e}"
                 )
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to send_receive after {max_retries} attempts")
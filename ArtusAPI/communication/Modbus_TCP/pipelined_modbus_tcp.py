@@ -0,0 +1,371 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from pymodbus.exceptions import ModbusIOException, ConnectionException
+import logging
+import socket
+import threading
+import time
+from ...common.ModbusMap import CommandType
+from .. import modbus_pdu
+
+
+class PipelinedModbusTCP:
+    """Modbus TCP transport that keeps several requests in flight on one socket.
+
+    ``ModbusTCP`` waits for each response before sending the next request,
+    so every transaction pays a full network round trip. This transport
+    tags each request with its own MBAP transaction id, writes it
+    immediately, and lets a receiver thread match responses back to their
+    requests in whatever order they arrive. Up to ``max_in_flight``
+    requests may be outstanding at once.
+
+    ``submit_*`` methods return ``concurrent.futures.Future`` objects;
+    ``batch`` submits several operations and waits for all of them, so e.g.
+    a position write, a fingertip-force read and a status read share one
+    round trip. ``send``/``receive``/``send_receive`` keep the blocking
+    contract of ``ModbusTCP`` (including retries) so this class is a
+    drop-in communicator for ``NewCommunication``.
+
+    Attributes:
+        host: Hostname or IP address of the Modbus TCP server.
+        port: TCP port of the Modbus TCP server.
+        timeout: Connect timeout and per-request response timeout in seconds.
+        slave_address: Modbus unit/device id of the target hand.
+        max_in_flight: Maximum number of outstanding requests.
+        logger: Logger used for status and error messages.
+    """
+
+    def __init__(self, host='192.168.2.8', port=502, timeout=1.0, logger=None, slave_address=1, max_in_flight=8):
+        """Initializes connection parameters without connecting.
+
+        Args:
+            host: Hostname or IP address of the Modbus TCP server.
+            port: TCP port of the Modbus TCP server.
+            timeout: Connect timeout and per-request response timeout in seconds.
+            logger: Logger to use; a module-level logger is created if None.
+            slave_address: Modbus unit/device id of the target hand.
+            max_in_flight: Maximum number of outstanding requests; further
+                submissions block until a response frees a slot.
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.slave_address = slave_address
+        self.max_in_flight = max_in_flight
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._sock = None
+        self._receiver = None
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}  # transaction id -> (future, function code)
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._next_tid = 0
+
+    def is_connected(self) -> bool:
+        """Checks whether the socket is open and its receiver thread is alive.
+
+        Returns:
+            True if requests can currently be submitted.
+        """
+        return self._sock is not None and self._receiver is not None and self._receiver.is_alive()
+
+    def open(self):
+        """Opens (or reopens) the TCP connection and starts the receiver thread.
+
+        No-op if already connected.
+
+        Raises:
+            ConnectionError: If the TCP connection could not be established.
+        """
+        if self.is_connected():
+            return
+        self.close()
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except OSError as e:
+            self.logger.error(e)
+            self.logger.error(f"Error opening TCP connection to {self.host}:{self.port}")
+            raise ConnectionError(f"Could not open Modbus TCP connection to {self.host}:{self.port}") from e
+        # Disable Nagle's algorithm so pipelined requests are not held back waiting for ACKs
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # the receiver blocks indefinitely; response timeouts are enforced on the futures
+        sock.settimeout(None)
+        self._sock = sock
+        self._receiver = threading.Thread(target=self._receive_loop, args=(sock,),
+                                          name="PipelinedModbusTCP-rx", daemon=True)
+        self._receiver.start()
+        self.logger.info(f"Opened pipelined TCP connection to {self.host}:{self.port} (max {self.max_in_flight} in flight)")
+
+    def close(self):
+        """Closes the connection and fails every outstanding request. Errors are suppressed."""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                sock.close()
+            except OSError:
+                pass
+        receiver, self._receiver = self._receiver, None
+        if receiver is not None and receiver is not threading.current_thread():
+            receiver.join(timeout=1.0)
+        self._fail_pending(ConnectionException(f"Connection to {self.host}:{self.port} closed"))
+
+    def _fail_pending(self, exc: Exception):
+        """Completes every outstanding future with ``exc``."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            try:
+                future.set_exception(exc)
+            except InvalidStateError:
+                pass
+
+    def _recv_exact(self, sock, size: int) -> bytearray:
+        """Reads exactly ``size`` bytes from ``sock``.
+
+        Raises:
+            ConnectionException: If the peer closed the connection.
+        """
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            n = sock.recv_into(view[received:])
+            if n == 0:
+                raise ConnectionException(f"Connection to {self.host}:{self.port} closed by peer")
+            received += n
+        return buf
+
+    def _receive_loop(self, sock):
+        """Receiver thread: reads MBAP frames and resolves the matching futures."""
+        try:
+            while True:
+                header = self._recv_exact(sock, modbus_pdu.MBAP_HEADER_SIZE)
+                transaction_id, _, pdu_length = modbus_pdu.decode_mbap(header)
+                pdu = self._recv_exact(sock, pdu_length)
+                with self._pending_lock:
+                    entry = self._pending.pop(transaction_id, None)
+                if entry is None:
+                    # response to a request that already timed out
+                    self.logger.debug(f"Dropping response for unknown transaction {transaction_id}")
+                    continue
+                future, function_code = entry
+                try:
+                    try:
+                        result = modbus_pdu.parse_response(function_code, pdu)
+                    except ModbusIOException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+                except InvalidStateError:
+                    pass  # the waiter timed out and cancelled it meanwhile
+        except (OSError, ModbusIOException, ConnectionException) as e:
+            if self._sock is sock:
+                self.logger.warning(f"Pipelined Modbus TCP receiver stopped: {e}")
+                self._sock = None
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            self._fail_pending(e if isinstance(e, ConnectionException) else ConnectionException(str(e)))
+
+    def _submit(self, pdu: bytes) -> Future:
+        """Sends one request PDU and returns the future of its response.
+
+        Blocks for at most ``timeout`` seconds while ``max_in_flight``
+        requests are outstanding.
+
+        Raises:
+            ConnectionException: If not connected or the socket write fails.
+            ModbusIOException: If no in-flight slot frees up in time.
+        """
+        if not self.is_connected():
+            raise ConnectionException(f"Not connected to {self.host}:{self.port}")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise ModbusIOException(f"{self.max_in_flight} requests still in flight after {self.timeout}s")
+        future = Future()
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._send_lock:
+            transaction_id = self._next_tid
+            self._next_tid = (self._next_tid + 1) & 0xFFFF
+            with self._pending_lock:
+                self._pending[transaction_id] = (future, pdu[0])
+            try:
+                self._sock.sendall(modbus_pdu.encode_mbap(transaction_id, self.slave_address, pdu))
+            except (OSError, AttributeError) as e:
+                with self._pending_lock:
+                    self._pending.pop(transaction_id, None)
+                future.set_exception(ConnectionException(f"Send to {self.host}:{self.port} failed: {e}"))
+        return future
+
+    def submit_read(self, start: int, count: int) -> Future:
+        """Submits an FC 0x03 read; the future resolves to a list of registers."""
+        return self._submit(modbus_pdu.build_read_holding_registers(start, count))
+
+    def submit_write_register(self, address: int, value: int) -> Future:
+        """Submits an FC 0x06 write; the future resolves to True."""
+        return self._submit(modbus_pdu.build_write_single_register(address, value))
+
+    def submit_write_registers(self, start: int, values: list) -> Future:
+        """Submits an FC 0x10 write; the future resolves to True."""
+        return self._submit(modbus_pdu.build_write_multiple_registers(start, values))
+
+    def submit_read_write(self, read_start: int, read_count: int, write_start: int, values: list) -> Future:
+        """Submits an FC 0x17 write-then-read; the future resolves to a list of registers."""
+        return self._submit(modbus_pdu.build_read_write_multiple_registers(read_start, read_count, write_start, values))
+
+    def submit_send(self, data: list, command: int) -> Future:
+        """Submits the write ``send`` would perform for ``data`` and ``command``.
+
+        Raises:
+            ValueError: If ``command`` is not a known CommandType.
+        """
+        if command == CommandType.SETUP_COMMANDS.value:
+            if len(data) != 1:
+                value = ((int(data[1]) & 0xFF) << 8) | (int(data[0]) & 0xFF)
+            else:
+                value = data[0]
+            return self.submit_write_register(0, value)
+        if command == CommandType.TARGET_COMMAND.value:
+            return self.submit_write_registers(data[0], data[1:])
+        if command in (CommandType.FIRMWARE_COMMAND.value, CommandType.CONFIG_COMMAND.value):
+            return self.submit_write_registers(0, data)
+        raise ValueError(f"Unknown command: {command}")
+
+    def _wait(self, future: Future, timeout=None):
+        """Returns the result of ``future``, turning a timeout into ModbusIOException."""
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            with self._pending_lock:
+                for transaction_id, (pending_future, _) in list(self._pending.items()):
+                    if pending_future is future:
+                        del self._pending[transaction_id]
+            future.cancel()
+            raise ModbusIOException(f"No response from {self.host}:{self.port} within {self.timeout}s")
+
+    def batch(self, operations: list, timeout=None) -> list:
+        """Pipelines several operations and waits for all of their responses.
+
+        Args:
+            operations: Sequence of tuples, each one of
+                ``('read', start, count)``,
+                ``('write', start, values)`` or
+                ``('read_write', read_start, read_count, write_start, values)``.
+            timeout: Seconds to wait for all responses; defaults to ``timeout``.
+
+        Returns:
+            One result per operation, in order: a list of registers for
+            reads, True for writes.
+
+        Raises:
+            ValueError: If an operation kind is unknown.
+            ModbusIOException: If any operation failed or timed out (raised
+                after every response has been collected).
+            ConnectionException: If the connection was lost.
+        """
+        if not self.is_connected():
+            self.open()
+        submitters = {
+            'read': self.submit_read,
+            'write': self.submit_write_registers,
+            'read_write': self.submit_read_write,
+        }
+        futures = []
+        for kind, *args in operations:
+            if kind not in submitters:
+                raise ValueError(f"Unknown batch operation: {kind}")
+            futures.append(submitters[kind](*args))
+
+        deadline = time.perf_counter() + (self.timeout if timeout is None else timeout)
+        results, first_error = [], None
+        for future in futures:
+            try:
+                results.append(self._wait(future, max(0.0, deadline - time.perf_counter())))
+            except (ModbusIOException, ConnectionException) as e:
+                results.append(None)
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def _call_with_retries(self, submit, name: str, max_retries: int, retry_delay: float):
+        """Runs ``submit()`` and waits for its future, reconnecting and retrying on errors."""
+        for attempt in range(max_retries):
+            try:
+                if not self.is_connected():
+                    self.open()
+                return self._wait(submit())
+            except (ModbusIOException, ConnectionException, ConnectionError) as e:
+                self.logger.warning(f"Modbus exception on {name} attempt {attempt + 1}/{max_retries}: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay)
+                else:
+                    self.logger.error(f"Failed to {name} after {max_retries} attempts")
+                    raise
+        return None
+
+    def send(self, data: list, command: int, max_retries=3, retry_delay=0.5):
+        """Writes register values to the hand and waits for the acknowledgement.
+
+        See ``ModbusTCP.send`` for the meaning of ``data`` per command type.
+
+        Returns:
+            True if the write succeeded, False for an unknown command type.
+
+        Raises:
+            ModbusIOException: If the final retry attempt still fails.
+            ConnectionException: If the final retry attempt still fails to connect.
+        """
+        if command not in (CommandType.SETUP_COMMANDS.value, CommandType.TARGET_COMMAND.value,
+                           CommandType.FIRMWARE_COMMAND.value, CommandType.CONFIG_COMMAND.value):
+            self.logger.error(f"Unknown command: {command}")
+            return False
+        return self._call_with_retries(lambda: self.submit_send(data, command), "send", max_retries, retry_delay)
+
+    def receive(self, data: list, max_retries=3, retry_delay=0.1):
+        """Reads holding registers from the hand.
+
+        Args:
+            data: Two-element list ``[start_register, count]``.
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        registers = self._call_with_retries(lambda: self.submit_read(data[0], data[1]), "receive", max_retries, retry_delay)
+        if registers is not None and len(registers) == 1:
+            return registers[0]
+        return registers
+
+    def send_receive(self, read_start: int, read_count: int, write_start: int, values: list,
+                     max_retries=3, retry_delay=0.1):
+        """Writes then reads registers in one FC 0x17 transaction.
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        registers = self._call_with_retries(
+            lambda: self.submit_read_write(read_start, read_count, write_start, values),
+            "send_receive", max_retries, retry_delay)
+        if registers is not None and len(registers) == 1:
+            return registers[0]
+        return registers
@@ -1 +1,3 @@
-from .rs485_rtu import RS485_RTU
\ No newline at end of file
+from .rs485_rtu import RS485_RTU
+from .rs485_rtu_raw import RS485_RTU_Raw
+from .rs485_bus import RS485Bus, RS485BusHandle
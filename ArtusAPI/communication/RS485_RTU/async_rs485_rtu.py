@@ -0,0 +1,257 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+from pymodbus.client import AsyncModbusSerialClient
+from pymodbus.exceptions import ModbusIOException, ConnectionException
+import asyncio
+import logging
+from ...common.ModbusMap import CommandType
+from .rs485_rtu import find_port_holders
+
+
+class AsyncRS485_RTU:
+    """asyncio counterpart of `RS485_RTU`, built on `AsyncModbusSerialClient`.
+
+    Exposes the same open/send/receive/send_receive/close contract as the
+    synchronous transport, with every bus operation (and every retry
+    delay) awaitable so several hands can share one event loop.
+
+    Attributes:
+        port: Serial device path (e.g. '/dev/ttyUSB0').
+        baudrate: Serial baud rate.
+        timeout: Serial read timeout in seconds.
+        slave_address: Modbus slave address of the target hand.
+        logger: Logger used for status and error messages.
+        client: The underlying `pymodbus` `AsyncModbusSerialClient`
+            instance, created on the first call to `open`.
+    """
+
+    def __init__(self, port='COM9', baudrate=115200, timeout=0.1, logger=None, slave_address=1):
+        """Initializes connection parameters without opening the port.
+
+        Args:
+            port: Serial device path to connect to.
+            baudrate: Serial baud rate.
+            timeout: Serial read timeout in seconds.
+            logger: Logger to use; a module-level logger is created if None.
+            slave_address: Modbus slave address of the target hand.
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.slave_address = slave_address
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+    async def open(self):
+        """Opens the RS485 serial connection.
+
+        Raises:
+            ConnectionError: If the port could not be opened; the error
+                message includes any processes found holding the port via
+                `find_port_holders`.
+        """
+        try:
+            # retries=0: retry behaviour is handled in send/receive below, same as RS485_RTU
+            self.client = AsyncModbusSerialClient(
+                port=self.port,
+                baudrate=self.baudrate,
+                bytesize=8,
+                parity='N',
+                stopbits=1,
+                timeout=self.timeout,
+                retries=0,
+            )
+            if not await self.client.connect():
+                holders = find_port_holders(self.port)
+                msg = f"Could not open {self.port} @ {self.baudrate} baudrate"
+                if holders:
+                    msg += f". Port is held by: {'; '.join(holders)}"
+                raise ConnectionError(msg)
+
+            self.logger.info(f"Opening {self.port} @ {self.baudrate} baudrate")
+        except Exception as e:
+            self.logger.error(e)
+            self.logger.error(f"Error opening {self.port} @ {self.baudrate} baudrate")
+            raise
+
+    async def send(self, data:list, command:int, max_retries=3, retry_delay=0.5):
+        """Writes register values to the hand, retrying on Modbus errors.
+
+        See `RS485_RTU.send` for the meaning of `data` per command type.
+
+        Args:
+            data: Register values to write.
+            command: CommandType enum value selecting the write operation.
+            max_retries: Number of times to retry on exception.
+            retry_delay: Delay in seconds between retries (awaited).
+
+        Returns:
+            True if the write succeeded. False if an unknown command type
+            was given, or if 8-bit value validation failed for
+            SETUP_COMMANDS.
+
+        Raises:
+            ModbusIOException: If the final retry attempt still receives an
+                error response.
+            ConnectionException: If the final retry attempt still fails.
+        """
+        for attempt in range(max_retries):
+            try:
+                if command == CommandType.SETUP_COMMANDS.value:
+                    if len(data) != 1:
+                        d0 = int(data[0]) & 0xFF
+                        d1 = int(data[1]) & 0xFF
+                        if not (0 <= d0 <= 255 and 0 <= d1 <= 255):
+                            self.logger.error(f"Values must be 8-bit (0-255). Got: {data[0]}, {data[1]}")
+                            return False
+                        value = (d1 << 8) | d0
+                    else:
+                        value = data[0]
+
+                    result = await self.client.write_register(0, value, device_id=self.slave_address)
+                elif command == CommandType.TARGET_COMMAND.value:
+                    result = await self.client.write_registers(data[0], data[1:], device_id=self.slave_address)
+                elif command in (CommandType.FIRMWARE_COMMAND.value, CommandType.CONFIG_COMMAND.value):
+                    result = await self.client.write_registers(0, data, device_id=self.slave_address)
+                else:
+                    self.logger.error(f"Unknown command: {command}")
+                    return False
+
+                if result.isError():
+                    raise ModbusIOException(f"Modbus error response: {result}")
+
+                return True
+
+            except (ModbusIOException, ConnectionException) as e:
+                self.logger.warning(f"Modbus exception on attempt {attempt + 1}/{max_retries}: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                else:
+                    self.logger.error(f"Failed to send after {max_retries} attempts")
+                    raise
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error: {e}")
+                raise
+
+        return False
+
+    async def receive(self, data:list, max_retries=3, retry_delay=0.1):
+        """Reads holding registers from the hand, retrying on Modbus errors.
+
+        Args:
+            data: Two-element list `[start_register, count]` describing the
+                registers to read.
+            max_retries: Number of times to retry on exception.
+            retry_delay: Delay in seconds between retries (awaited).
+
+        Returns:
+            A single int if one register was read, a list of ints if more
+            than one was read, or None if `max_retries` is 0.
+
+        Raises:
+            ModbusIOException: If the final retry attempt still receives an
+                error response.
+            ConnectionException: If the final retry attempt still fails.
+        """
+        for attempt in range(max_retries):
+            try:
+                result = await self.client.read_holding_registers(data[0], count=data[1], device_id=self.slave_address)
+                if result.isError():
+                    raise ModbusIOException(f"Modbus error response: {result}")
+
+                registers = result.registers
+                if len(registers) == 1:
+                    return registers[0]
+                return registers
+
+            except (ModbusIOException, ConnectionException) as e:
+                self.logger.warning(f"Modbus exception on receive attempt {attempt + 1}/{max_retries}: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                else:
+                    self.logger.error(f"Failed to receive after {max_retries} attempts")
+                    raise
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error during receive: {e}")
+                raise
+
+        return None
+
+    async def send_receive(self, read_start: int, read_count: int, write_start: int, values: list,
+                           max_retries=3, retry_delay=0.1):
+        """Atomically writes registers then reads registers via Modbus FC 0x17.
+
+        Args:
+            read_start: Starting holding-register address to read.
+            read_count: Number of registers to read.
+            write_start: Starting holding-register address to write.
+            values: List of uint16 register values to write.
+            max_retries: Number of times to retry on exception.
+            retry_delay: Delay in seconds between retries (awaited).
+
+        Returns:
+            A single int if one register was read, a list of ints if more
+            than one was read, or None if ``max_retries`` is 0.
+
+        Raises:
+            ModbusIOException: If the final retry attempt still receives an
+                error response.
+            ConnectionException: If the final retry attempt still fails.
+        """
+        for attempt in range(max_retries):
+            try:
+                result = await self.client.readwrite_registers(
+                    read_address=read_start,
+                    read_count=read_count,
+                    write_address=write_start,
+                    values=values,
+                    device_id=self.slave_address,
+                )
+                if result.isError():
+                    raise ModbusIOException(f"Modbus error response: {result}")
+
+                registers = result.registers
+                if len(registers) == 1:
+                    return registers[0]
+                return registers
+
+            except (ModbusIOException, ConnectionException) as e:
+                self.logger.warning(
+                    f"Modbus exception on send_receive attempt {attempt + 1}/{max_retries}: {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                else:
+                    self.logger.error(f"Failed to send_receive after {max_retries} attempts")
+                    raise
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error during send_receive: {e}")
+                raise
+
+        return None
+
+    def close(self):
+        """Closes the serial connection, if one is open. Errors are suppressed."""
+        client = getattr(self, "client", None)
+        if client is None:
+            return
+        try:
+            client.close()
+        except Exception:
+            pass
@@ -0,0 +1,266 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Shared multi-drop RS485 bus: one serial port, several hands, round-robin turns."""
+
+import logging
+import threading
+import time
+
+from .rs485_rtu import RS485_RTU
+
+
+class RS485Bus:
+    """Owns one RS485 serial port shared by several hands on a multi-drop bus.
+
+    Every hand model and side has its own slave ID (see ``SlaveIDMap``),
+    so several hands can hang off one adapter. Each hand session gets a
+    lightweight ``RS485BusHandle`` that exposes the usual transport
+    interface (``open``/``send``/``receive``/``send_receive``/``close``);
+    the bus serializes their transactions and, when several handles are
+    waiting, grants turns round-robin in attach order so one busy hand
+    cannot starve another.
+
+    The port is opened when the first handle opens and closed when the
+    last one closes. ``RS485Bus.shared`` returns one bus per port for the
+    whole process, which is what ``NewCommunication`` uses for
+    ``communication_method="RS485_RTU_Shared"``.
+
+    Attributes:
+        port: Serial device path (e.g. '/dev/ttyUSB0').
+        baudrate: Serial baud rate.
+        logger: Logger used for status and error messages.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, port='COM9', baudrate=115200, timeout=0.2, logger=None, transport_class=RS485_RTU):
+        """Creates the bus without opening the port.
+
+        Args:
+            port: Serial device path.
+            baudrate: Serial baud rate.
+            timeout: Serial read timeout in seconds.
+            logger: Logger to use; a module-level logger is created if None.
+            transport_class: Single-slave RTU transport used for the port,
+                ``RS485_RTU`` or ``RS485_RTU_Raw``.
+        """
+        self.port = port
+        self.baudrate = baudrate
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._transport = transport_class(port=port, baudrate=baudrate, timeout=timeout, logger=self.logger, slave_address=0)
+        self._condition = threading.Condition()
+        self._handles = []  # open handles in attach order
+        self._owner = None
+        self._last_served = -1
+
+    @classmethod
+    def shared(cls, port, baudrate=115200, timeout=0.2, logger=None):
+        """Returns the process-wide bus for ``port``, creating it on first use.
+
+        Args:
+            port: Serial device path.
+            baudrate: Serial baud rate; must match an existing bus on the port.
+            timeout: Serial read timeout in seconds, used when creating the bus.
+            logger: Logger used when creating the bus.
+
+        Returns:
+            The ``RS485Bus`` owning ``port``.
+
+        Raises:
+            ValueError: If the port already has a bus at another baud rate.
+        """
+        with cls._shared_lock:
+            bus = cls._shared.get(port)
+            if bus is None:
+                bus = cls._shared[port] = cls(port=port, baudrate=baudrate, timeout=timeout, logger=logger)
+            elif bus.baudrate != baudrate:
+                raise ValueError(f"{port} is already shared at {bus.baudrate} baud, not {baudrate}")
+            return bus
+
+    def handle(self, slave_address: int, logger=None):
+        """Creates a handle for one hand on this bus.
+
+        Args:
+            slave_address: Modbus slave address of the hand.
+            logger: Logger for the handle; the bus logger if None.
+
+        Returns:
+            An unopened ``RS485BusHandle``.
+        """
+        return RS485BusHandle(self, slave_address, logger=logger or self.logger)
+
+    def is_open(self) -> bool:
+        """Checks whether any handle currently has the port open."""
+        with self._condition:
+            return bool(self._handles)
+
+    def _attach(self, handle):
+        """Adds an opened handle to the rotation, opening the port for the first one.
+
+        Raises:
+            ValueError: If another open handle already uses the slave address.
+        """
+        with self._condition:
+            if handle in self._handles:
+                return
+            if any(h.slave_address == handle.slave_address for h in self._handles):
+                raise ValueError(f"Slave address {handle.slave_address} is already open on {self.port}")
+            if not self._handles:
+                self._transport.open()
+            self._handles.append(handle)
+
+    def _detach(self, handle):
+        """Removes a handle from the rotation, closing the port after the last one."""
+        with self._condition:
+            while self._owner is handle:
+                self._condition.wait()
+            if handle not in self._handles:
+                return
+            index = self._handles.index(handle)
+            self._handles.remove(handle)
+            if index <= self._last_served:
+                self._last_served -= 1
+            if not self._handles:
+                self._transport.close()
+            self._condition.notify_all()
+
+    def _next_in_turn(self):
+        """Returns the first waiting handle after the last one served, or None."""
+        count = len(self._handles)
+        for step in range(1, count + 1):
+            candidate = self._handles[(self._last_served + step) % count]
+            if candidate._waiting:
+                return candidate
+        return None
+
+    def _transact(self, handle, operation):
+        """Runs one transaction for ``handle`` once it is its turn on the bus.
+
+        Args:
+            handle: The requesting ``RS485BusHandle``.
+            operation: Callable receiving the shared transport, already
+                addressed to the handle's slave.
+
+        Returns:
+            Whatever ``operation`` returns.
+
+        Raises:
+            ConnectionError: If the handle is not open, or is closed while
+                waiting for its turn.
+        """
+        requested = time.perf_counter()
+        with self._condition:
+            if handle not in self._handles:
+                raise ConnectionError(f"Slave {handle.slave_address} on {self.port} is not open")
+            handle._waiting += 1
+            try:
+                while self._owner is not None or self._next_in_turn() is not handle:
+                    self._condition.wait()
+                    if handle not in self._handles:
+                        raise ConnectionError(f"Slave {handle.slave_address} on {self.port} was closed")
+            finally:
+                handle._waiting -= 1
+            self._owner = handle
+            self._last_served = self._handles.index(handle)
+        handle._record_wait(time.perf_counter() - requested)
+        try:
+            self._transport.slave_address = handle.slave_address
+            return operation(self._transport)
+        finally:
+            handle.last_retries = getattr(self._transport, 'last_retries', 0)
+            with self._condition:
+                self._owner = None
+                self._condition.notify_all()
+
+
+class RS485BusHandle:
+    """One hand's view of a shared ``RS485Bus``, usable wherever ``RS485_RTU`` is.
+
+    Attributes:
+        bus: The bus this handle transacts on.
+        slave_address: Modbus slave address of the hand.
+        logger: Logger used for status and error messages.
+        transactions: Number of bus turns granted to the handle.
+        total_wait: Total time in seconds spent waiting for a bus turn.
+        max_wait: Longest single wait for a bus turn, in seconds.
+        last_retries: Retries the handle's most recent transaction needed.
+    """
+
+    def __init__(self, bus: RS485Bus, slave_address: int, logger=None):
+        """Binds the handle to ``bus``; call ``open`` before transacting.
+
+        Args:
+            bus: The shared bus.
+            slave_address: Modbus slave address of the hand.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        self.bus = bus
+        self.slave_address = slave_address
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._waiting = 0
+        self.transactions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_retries = 0
+
+    def open(self):
+        """Joins the bus rotation, opening the serial port if no other hand has."""
+        self.bus._attach(self)
+        self.logger.info(f"Slave {self.slave_address} attached to shared bus {self.bus.port}")
+
+    def close(self):
+        """Leaves the bus rotation; the port closes once every hand has left."""
+        self.bus._detach(self)
+
+    def send(self, data:list, command:int, **kwargs):
+        """Writes register values to the hand (see ``RS485_RTU.send``)."""
+        return self.bus._transact(self, lambda transport: transport.send(data, command, **kwargs))
+
+    def receive(self, data:list, **kwargs):
+        """Reads holding registers from the hand (see ``RS485_RTU.receive``)."""
+        return self.bus._transact(self, lambda transport: transport.receive(data, **kwargs))
+
+    def send_receive(self, read_start: int, read_count: int, write_start: int, values: list, **kwargs):
+        """Writes then reads registers in one FC 0x17 (see ``RS485_RTU.send_receive``)."""
+        return self.bus._transact(self, lambda transport: transport.send_receive(
+            read_start, read_count, write_start, values, **kwargs))
+
+    def _record_wait(self, waited: float):
+        """Adds one granted turn to the wait statistics."""
+        self.transactions += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def get_stats(self) -> dict:
+        """Returns the handle's bus-sharing statistics.
+
+        Returns:
+            Dict with ``transactions``, ``mean_wait`` and ``max_wait``
+            (seconds spent waiting for a turn).
+        """
+        return {
+            'transactions': self.transactions,
+            'mean_wait': self.total_wait / self.transactions if self.transactions else 0.0,
+            'max_wait': self.max_wait,
+        }
@@ -70,6 +70,8 @@ class RS485_RTU:
         logger: Logger used for status and error messages.
         client: The underlying `pymodbus` `ModbusSerialClient` instance,
             created on the first call to `open`.
+        last_retries: Retries the most recent `send`/`receive`/`send_receive`
+            needed.
     """
 
     def __init__(self, port='COM9', baudrate=115200, timeout=0.1, logger=None, slave_address=1):
@@ -86,6 +88,7 @@ class RS485_RTU:
         self.baudrate = baudrate
         self.timeout = timeout
         self.slave_address = slave_address
+        self.last_retries = 0
 
         if not logger:
             self.logger = logging.getLogger(__name__)
@@ -152,6 +155,7 @@ class RS485_RTU:
                 error response.
             ConnectionException: If the final retry attempt still fails.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 if command == CommandType.SETUP_COMMANDS.value:
@@ -186,6 +190,7 @@ class RS485_RTU:
             except (ModbusIOException, ConnectionException) as e:
                 self.logger.warning(f"Modbus exception on attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to send after {max_retries} attempts")
@@ -215,6 +220,7 @@ class RS485_RTU:
                 error response.
             ConnectionException: If the final retry attempt still fails.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 result = self.client.read_holding_registers(data[0], count=data[1], device_id=self.slave_address)
@@ -230,6 +236,7 @@ class RS485_RTU:
             except (ModbusIOException, ConnectionException) as e:
                 self.logger.warning(f"Modbus exception on receive attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to receive after {max_retries} attempts")
@@ -265,6 +272,7 @@ class RS485_RTU:
                 error response.
             ConnectionException: If the final retry attempt still fails.
         """
+        self.last_retries = 0
         for attempt in range(max_retries):
             try:
                 result = self.client.readwrite_registers(
@@ -287,6 +295,7 @@ class RS485_RTU:
                     f"Modbus exception on send_receive attempt {attempt + 1}/{max_retries}: {e}"
                 )
                 if attempt < max_retries - 1:
+                    self.last_retries += 1
                     time.sleep(retry_delay)
                 else:
                     self.logger.error(f"Failed to send_receive after {max_retries} attempts")
@@ -0,0 +1,293 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+from pymodbus.exceptions import ModbusIOException, ConnectionException
+import logging
+import struct
+import time
+import serial
+from ...common.ModbusMap import CommandType
+from .. import modbus_pdu
+from .rs485_rtu import find_port_holders
+
+# an RTU ADU is at most 256 bytes: address + 253-byte PDU + CRC
+MAX_ADU_SIZE = 256
+
+_crc16 = modbus_pdu.crc16
+
+
+class RS485_RTU_Raw:
+    """Lean Modbus RTU transport that frames requests itself on top of pyserial.
+
+    Functionally equivalent to ``RS485_RTU`` but bypasses pymodbus'
+    request objects, framer and transaction manager: FC 0x03/0x06/0x10/0x17
+    frames are packed straight into a preallocated transmit buffer with a
+    table-driven CRC-16, and responses are read into a preallocated receive
+    buffer and validated through ``memoryview`` slices. The wire bytes are
+    identical to what pymodbus sends.
+
+    Attributes:
+        port: Serial device path (e.g. '/dev/ttyUSB0').
+        baudrate: Serial baud rate.
+        timeout: Serial read timeout in seconds.
+        slave_address: Modbus slave address of the target hand.
+        logger: Logger used for status and error messages.
+        serial: The underlying ``serial.Serial`` instance, created by ``open``.
+        last_retries: Retries the most recent ``send``/``receive``/
+            ``send_receive`` needed.
+    """
+
+    def __init__(self, port='COM9', baudrate=115200, timeout=0.1, logger=None, slave_address=1):
+        """Initializes connection parameters and frame buffers without opening the port.
+
+        Args:
+            port: Serial device path to connect to.
+            baudrate: Serial baud rate.
+            timeout: Serial read timeout in seconds.
+            logger: Logger to use; a module-level logger is created if None.
+            slave_address: Modbus slave address of the target hand.
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.slave_address = slave_address
+        self.serial = None
+        self.last_retries = 0
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._tx = bytearray(MAX_ADU_SIZE)
+        self._rx = bytearray(MAX_ADU_SIZE)
+        self._tx_view = memoryview(self._tx)
+        self._rx_view = memoryview(self._rx)
+
+    def open(self):
+        """Opens the RS485 serial connection.
+
+        Raises:
+            ConnectionError: If the port could not be opened; the error
+                message includes any processes found holding the port via
+                `find_port_holders`.
+        """
+        try:
+            self.serial = serial.Serial(port=self.port, baudrate=self.baudrate, bytesize=8,
+                                        parity='N', stopbits=1, timeout=self.timeout)
+        except (serial.SerialException, OSError) as e:
+            holders = find_port_holders(self.port)
+            msg = f"Could not open {self.port} @ {self.baudrate} baudrate: {e}"
+            if holders:
+                msg += f". Port is held by: {'; '.join(holders)}"
+            self.logger.error(msg)
+            raise ConnectionError(msg) from e
+        self.logger.info(f"Opening {self.port} @ {self.baudrate} baudrate (raw RTU framing)")
+
+    def close(self):
+        """Closes the serial connection, if one is open. Errors are suppressed."""
+        if self.serial is None:
+            return
+        try:
+            self.serial.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------ framing
+
+    def _finish_frame(self, pdu_length: int) -> int:
+        """Appends the CRC to the frame in the transmit buffer.
+
+        Args:
+            pdu_length: Length of address + PDU already packed in ``_tx``.
+
+        Returns:
+            The total frame length.
+        """
+        struct.pack_into('<H', self._tx, pdu_length, _crc16(self._tx_view[:pdu_length]))
+        return pdu_length + 2
+
+    def _pack_values(self, offset: int, values) -> int:
+        """Packs register values big-endian into the transmit buffer.
+
+        Returns:
+            The offset right after the packed values.
+        """
+        struct.pack_into(f'>{len(values)}H', self._tx, offset, *(int(v) & 0xFFFF for v in values))
+        return offset + 2 * len(values)
+
+    def build_read_frame(self, start: int, count: int) -> int:
+        """Packs an FC 0x03 request into the transmit buffer and returns its length."""
+        if not 1 <= count <= modbus_pdu.MAX_READ_COUNT:
+            raise ValueError(f"Read count must be 1-{modbus_pdu.MAX_READ_COUNT}, got {count}")
+        struct.pack_into('>BBHH', self._tx, 0, self.slave_address, modbus_pdu.READ_HOLDING_REGISTERS, start, count)
+        return self._finish_frame(6)
+
+    def build_write_single_frame(self, address: int, value: int) -> int:
+        """Packs an FC 0x06 request into the transmit buffer and returns its length."""
+        struct.pack_into('>BBHH', self._tx, 0, self.slave_address, modbus_pdu.WRITE_SINGLE_REGISTER,
+                         address, int(value) & 0xFFFF)
+        return self._finish_frame(6)
+
+    def build_write_multiple_frame(self, start: int, values) -> int:
+        """Packs an FC 0x10 request into the transmit buffer and returns its length."""
+        if not 1 <= len(values) <= modbus_pdu.MAX_WRITE_COUNT:
+            raise ValueError(f"Write count must be 1-{modbus_pdu.MAX_WRITE_COUNT}, got {len(values)}")
+        struct.pack_into('>BBHHB', self._tx, 0, self.slave_address, modbus_pdu.WRITE_MULTIPLE_REGISTERS,
+                         start, len(values), 2 * len(values))
+        return self._finish_frame(self._pack_values(7, values))
+
+    def build_read_write_frame(self, read_start: int, read_count: int, write_start: int, values) -> int:
+        """Packs an FC 0x17 request into the transmit buffer and returns its length."""
+        if not 1 <= read_count <= modbus_pdu.MAX_READ_COUNT:
+            raise ValueError(f"Read count must be 1-{modbus_pdu.MAX_READ_COUNT}, got {read_count}")
+        if not 1 <= len(values) <= modbus_pdu.MAX_READ_WRITE_WRITE_COUNT:
+            raise ValueError(f"Write count must be 1-{modbus_pdu.MAX_READ_WRITE_WRITE_COUNT}, got {len(values)}")
+        struct.pack_into('>BBHHHHB', self._tx, 0, self.slave_address, modbus_pdu.READ_WRITE_MULTIPLE_REGISTERS,
+                         read_start, read_count, write_start, len(values), 2 * len(values))
+        return self._finish_frame(self._pack_values(11, values))
+
+    def _read_exact(self, offset: int, size: int):
+        """Reads ``size`` bytes into the receive buffer at ``offset``.
+
+        Raises:
+            ModbusIOException: If the read times out before ``size`` bytes arrive.
+        """
+        end = offset + size
+        while offset < end:
+            n = self.serial.readinto(self._rx_view[offset:end])
+            if not n:
+                raise ModbusIOException(f"Timed out waiting for response from slave {self.slave_address}")
+            offset += n
+
+    def _transact(self, frame_length: int, response_length: int) -> memoryview:
+        """Writes the frame in the transmit buffer and reads back a validated response.
+
+        Args:
+            frame_length: Length of the request frame in ``_tx``.
+            response_length: Expected length of a normal response frame.
+
+        Returns:
+            A memoryview over the response frame (address through CRC).
+
+        Raises:
+            ModbusExceptionResponse: If the slave answered with an exception.
+            ModbusIOException: On timeout, CRC mismatch or a response from
+                another slave/function.
+            ConnectionException: If the port is not open or the write fails.
+        """
+        if self.serial is None:
+            raise ConnectionException(f"{self.port} is not open")
+        function_code = self._tx[1]
+        try:
+            self.serial.reset_input_buffer()
+            self.serial.write(self._tx_view[:frame_length])
+            # address, function, and either exception code + CRC or the first 3 data bytes
+            self._read_exact(0, 5)
+            rx = self._rx_view
+            if rx[1] == function_code | 0x80:
+                if _crc16(rx[:3]) != struct.unpack_from('<H', self._rx, 3)[0]:
+                    raise ModbusIOException("CRC mismatch in exception response")
+                raise modbus_pdu.ModbusExceptionResponse(function_code, rx[2])
+            self._read_exact(5, response_length - 5)
+        except serial.SerialException as e:
+            raise ConnectionException(f"Serial error on {self.port}: {e}") from e
+        if rx[0] != self.slave_address or rx[1] != function_code:
+            raise ModbusIOException(f"Unexpected response header {bytes(rx[:2]).hex()}")
+        if _crc16(rx[:response_length - 2]) != struct.unpack_from('<H', self._rx, response_length - 2)[0]:
+            raise ModbusIOException(f"CRC mismatch in response from slave {self.slave_address}")
+        return rx[:response_length]
+
+    def _registers(self, count: int):
+        """Decodes ``count`` registers from the validated response in the receive buffer."""
+        if self._rx[2] != 2 * count:
+            raise ModbusIOException(f"Expected {2 * count} data bytes, got {self._rx[2]}")
+        if count == 1:
+            return struct.unpack_from('>H', self._rx, 3)[0]
+        return list(struct.unpack_from(f'>{count}H', self._rx, 3))
+
+    # ------------------------------------------------------------------ transport contract
+
+    def _retry(self, operation, name: str, max_retries: int, retry_delay: float):
+        """Runs ``operation`` and retries on Modbus errors, like ``RS485_RTU``."""
+        self.last_retries = 0
+        for attempt in range(max_retries):
+            try:
+                return operation()
+            except (ModbusIOException, ConnectionException) as e:
+                self.logger.warning(f"Modbus exception on {name} attempt {attempt + 1}/{max_retries}: {e}")
+                if attempt < max_retries - 1:
+                    self.last_retries += 1
+                    time.sleep(retry_delay)
+                else:
+                    self.logger.error(f"Failed to {name} after {max_retries} attempts")
+                    raise
+        return None
+
+    def send(self, data:list, command:int, max_retries=3, retry_delay=0.5):
+        """Writes register values to the hand, retrying on Modbus errors.
+
+        See ``RS485_RTU.send`` for the meaning of ``data`` per command type.
+
+        Returns:
+            True if the write succeeded, False for an unknown command type.
+
+        Raises:
+            ModbusIOException: If the final retry attempt still fails.
+            ConnectionException: If the final retry attempt still fails.
+        """
+        if command == CommandType.SETUP_COMMANDS.value:
+            if len(data) != 1:
+                value = ((int(data[1]) & 0xFF) << 8) | (int(data[0]) & 0xFF)
+            else:
+                value = data[0]
+            build = lambda: self.build_write_single_frame(0, value)
+        elif command == CommandType.TARGET_COMMAND.value:
+            build = lambda: self.build_write_multiple_frame(data[0], data[1:])
+        elif command in (CommandType.FIRMWARE_COMMAND.value, CommandType.CONFIG_COMMAND.value):
+            build = lambda: self.build_write_multiple_frame(0, data)
+        else:
+            self.logger.error(f"Unknown command: {command}")
+            return False
+
+        def operation():
+            self._transact(build(), 8)
+            return True
+        return self._retry(operation, "send", max_retries, retry_delay)
+
+    def receive(self, data:list, max_retries=3, retry_delay=0.1):
+        """Reads holding registers from the hand, retrying on Modbus errors.
+
+        Args:
+            data: Two-element list ``[start_register, count]``.
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        start, count = data[0], data[1]
+
+        def operation():
+            self._transact(self.build_read_frame(start, count), 5 + 2 * count)
+            return self._registers(count)
+        return self._retry(operation, "receive", max_retries, retry_delay)
+
+    def send_receive(self, read_start: int, read_count: int, write_start: int, values: list,
+                     max_retries=3, retry_delay=0.1):
+        """Writes then reads registers in one FC 0x17 transaction.
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        def operation():
+            self._transact(self.build_read_write_frame(read_start, read_count, write_start, values), 5 + 2 * read_count)
+            return self._registers(read_count)
+        return self._retry(operation, "send_receive", max_retries, retry_delay)
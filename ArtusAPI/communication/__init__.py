@@ -1,4 +1,11 @@
 """Communication package exposing the NewCommunication transport wrapper."""
 from .new_communication import NewCommunication
+from .async_communication import AsyncNewCommunication
+from .setpoint_streamer import SetpointStreamer
+from .pacing_scheduler import PacingScheduler
+from .dirty_range_tracker import DirtyRangeTracker
+from .feedback_ring import FeedbackRing
+from .session_log import ReplayMismatchError, ReplayTransport, SessionRecorder, read_session_log
 
-__all__ = ["NewCommunication"]
+__all__ = ["NewCommunication", "AsyncNewCommunication", "SetpointStreamer", "PacingScheduler", "DirtyRangeTracker",
+           "FeedbackRing", "ReplayMismatchError", "ReplayTransport", "SessionRecorder", "read_session_log"]
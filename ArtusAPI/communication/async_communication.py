@@ -0,0 +1,211 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+import asyncio
+import logging
+
+from .RS485_RTU.async_rs485_rtu import AsyncRS485_RTU
+from .Modbus_TCP.async_modbus_tcp import AsyncModbusTCP
+from .ready_poller import ReadyPoll, TransitionStats
+from ..common.ModbusMap import ActuatorState,CommandType,TrajectoryReturn
+from ..common.register_layout import REGISTER_ADDRESSES
+
+class AsyncNewCommunication:
+    """asyncio counterpart of `NewCommunication` used by `AsyncArtusAPI`.
+
+    Selects and owns an async communicator (AsyncRS485_RTU or
+    AsyncModbusTCP) and exposes the same send/receive/state-polling
+    interface as `NewCommunication`, as coroutines. Transactions are
+    serialized with an `asyncio.Lock`, so several tasks may share one
+    instance without interleaving frames on the bus.
+
+    Attributes:
+        port: Serial device path (RS485_RTU) or `host`/`host:tcp_port`
+            string (Modbus_TCP).
+        baudrate: Serial baud rate, used only for RS485_RTU.
+        logger: Logger instance used for status and error messages.
+        slave_address: Modbus slave/unit address of the target hand.
+        communication_method: Either "RS485_RTU" or "Modbus_TCP".
+        communicator: The underlying async transport instance.
+        ntrips: Running count of state-polling round trips performed by
+            `wait_for_ready`.
+    """
+
+    def __init__(self, port='COM9', baudrate=115200, logger=None, slave_address=1, communication_method="RS485_RTU"):
+        """Initializes the communication wrapper and constructs the transport.
+
+        Args:
+            port: Serial device for RS485_RTU, or 'host' / 'host:tcp_port'
+                for Modbus_TCP.
+            baudrate: Serial baud rate, used only for RS485_RTU.
+            logger: Logger to use; a module-level logger is created if None.
+            slave_address: Modbus slave/unit address of the target hand.
+            communication_method: Transport to construct, either
+                "RS485_RTU" or "Modbus_TCP".
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.slave_address = slave_address
+        self.communication_method = communication_method
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._lock = None  # created lazily so it binds to the running event loop
+        self._setup_communication()
+
+        self.ntrips = 0
+        self._transition_stats = TransitionStats()
+
+    def _setup_communication(self):
+        """Instantiates the async communicator for `communication_method`.
+
+        Raises:
+            ValueError: If `communication_method` is not "RS485_RTU" or
+                "Modbus_TCP".
+        """
+        if self.communication_method == "RS485_RTU":
+            self.communicator = AsyncRS485_RTU(port=self.port, baudrate=self.baudrate, timeout=0.2, logger=self.logger, slave_address=self.slave_address)
+        elif self.communication_method == "Modbus_TCP":
+            host, _, tcp_port = str(self.port).partition(':')
+            self.communicator = AsyncModbusTCP(host=host, port=int(tcp_port) if tcp_port else 502,
+                                               timeout=0.5, logger=self.logger, slave_address=self.slave_address)
+        else:
+            raise ValueError(f"Unknown communication method: {self.communication_method}")
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Returns the transaction lock, creating it on first use."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def open_connection(self):
+        """Opens the underlying transport connection."""
+        await self.communicator.open()
+
+    async def send_data(self, data:list, command_type:int=CommandType.SETUP_COMMANDS.value):
+        """Sends a list of 16-bit register values to the hand.
+
+        Args:
+            data: Register values to write (see `NewCommunication.send_data`).
+            command_type: CommandType enum value selecting which Modbus
+                write operation the underlying transport should perform.
+        """
+        async with self._get_lock():
+            return await self.communicator.send(data, command_type)
+
+    async def receive_data(self, amount_dat:int=1, start:int=REGISTER_ADDRESSES['feedback_register']):
+        """Reads holding registers from the hand.
+
+        Args:
+            amount_dat: Number of consecutive registers to read.
+            start: Starting register address. Defaults to the feedback
+                register used to report robot state.
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        async with self._get_lock():
+            return await self.communicator.receive([start, amount_dat])
+
+    async def send_receive_data(self, read_start: int, read_count: int, write_start: int, values: list):
+        """Writes target registers and reads feedback in one Modbus FC 0x17 transaction.
+
+        Args:
+            read_start: Starting holding-register address to read.
+            read_count: Number of registers to read.
+            write_start: Starting holding-register address to write.
+            values: List of uint16 register values to write (no leading address).
+
+        Returns:
+            A single int if one register was read, otherwise a list of ints.
+        """
+        async with self._get_lock():
+            return await self.communicator.send_receive(read_start, read_count, write_start, values)
+
+    def close_connection(self):
+        """Closes the underlying transport connection."""
+        self.communicator.close()
+
+    async def _check_robot_state(self):
+        """Reads the combined robot/trajectory status byte.
+
+        Returns:
+            int: The low byte of the 16-bit status register (ActuatorState
+            in the low nibble, TrajectoryReturn in the high nibble).
+
+        Raises:
+            ValueError: If the received value is not a 16-bit integer.
+        """
+        ret = await self.receive_data()
+        if isinstance(ret, int) and ret <= 0xFFFF:
+            return ret & 0xFF
+        raise ValueError("Received data is not a 16-bit value")
+
+    async def wait_for_ready(self, timeout=15, acceptable_state=None, poll_interval=None, deadline=None,
+                             settle_timeout=0.0, initial_interval=0.005, max_interval=0.1, return_latency=False):
+        """Polls the hand until it reports an acceptable actuator state.
+
+        Same adaptive polling as `NewCommunication.wait_for_ready`, but
+        awaits between polls so other tasks on the loop keep running while
+        the hand transitions.
+
+        Args:
+            timeout: Maximum time in seconds to wait before giving up.
+            acceptable_state: ActuatorState value, or a collection of them,
+                to wait for. If None, waits for any of ACTUATOR_IDLE,
+                ACTUATOR_ERROR, ACTUATOR_READY, or ACTUATOR_ACTIVE.
+            poll_interval: If given, a fixed delay in seconds between polls
+                instead of the backoff.
+            deadline: Absolute ``time.perf_counter()`` time to give up at;
+                overrides ``timeout``.
+            settle_timeout: See `NewCommunication.wait_for_ready`.
+            initial_interval: Delay in seconds before the second poll.
+            max_interval: Cap in seconds on the delay between polls.
+            return_latency: If True, return ``(state, latency)`` instead of
+                the state alone.
+
+        Returns:
+            The masked actuator state (int) once it matches one of the
+            acceptable states, or None if the deadline passes first. With
+            ``return_latency``, a tuple of that and the observed transition
+            latency in seconds (None on timeout).
+        """
+        if poll_interval is not None:
+            initial_interval = max_interval = poll_interval
+        poll = ReadyPoll(timeout=timeout, acceptable_state=acceptable_state, deadline=deadline,
+                         settle_timeout=settle_timeout, initial_interval=initial_interval, max_interval=max_interval)
+        result = None
+        while True:
+            raw_state = await self._check_robot_state()
+            self.ntrips += 1
+            result, done, changed = poll.observe(raw_state)
+            if changed:
+                self.logger.info(f"Robot state: {ActuatorState(result).name}, Trajectory: {TrajectoryReturn((raw_state & 0b11110000) >> 4).name}")
+            if done:
+                self._transition_stats.record(result, poll.latency)
+                return (result, poll.latency) if return_latency else result
+            delay = poll.next_delay()
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        self.logger.error("Timeout waiting for robot ready")
+        if result == ActuatorState.ACTUATOR_BUSY.value:
+            self.logger.error(f"Robot Busy")
+        self._transition_stats.record_timeout()
+        return (None, None) if return_latency else None
+
+    def get_transition_stats(self):
+        """Returns timing statistics of the `wait_for_ready` calls so far."""
+        return self._transition_stats.get_stats()
@@ -0,0 +1,194 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Change tracking for target register blocks so only modified registers are rewritten."""
+
+import threading
+import time
+
+import numpy as np
+
+
+class DirtyRangeTracker:
+    """Remembers the last acknowledged words of each target block and trims writes to what changed.
+
+    A target command is ``[start_reg, *words]`` covering a whole block
+    (position, velocity or force). ``plan`` compares it with the words the
+    hand last acknowledged for that block and returns the smallest single
+    contiguous write covering every changed register, or None when nothing
+    changed. One write per command keeps the one-command-per-send-slot
+    pacing unchanged; unchanged registers between two changed ones are
+    rewritten with their current value.
+
+    A full frame is sent when the block has never been acknowledged, its
+    length changed, a previous write to it failed, or ``refresh_interval``
+    seconds have passed since its last full frame, so the firmware still
+    sees periodic complete frames.
+
+    Attributes:
+        refresh_interval: Maximum time in seconds between two full frames
+            of a block.
+        full_frames: Number of full frames planned.
+        partial_frames: Number of trimmed writes planned.
+        skipped: Number of commands skipped because nothing changed.
+        registers_saved: Registers not transmitted thanks to trimming and
+            skipping.
+    """
+
+    def __init__(self, refresh_interval: float = 1.0, clock=time.perf_counter):
+        """Starts with no acknowledged blocks.
+
+        Args:
+            refresh_interval: Maximum time in seconds between two full
+                frames of the same block.
+            clock: Monotonic clock returning seconds.
+        """
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._blocks = {}  # block start -> [acknowledged words, time of last full frame]
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped = 0
+        self.registers_saved = 0
+
+    def plan(self, command: list):
+        """Returns the write needed to bring the hand's block up to ``command``.
+
+        Args:
+            command: Full target command ``[start_reg, *words]``.
+
+        Returns:
+            ``command`` itself for a full frame, a shorter
+            ``[start_reg + offset, *changed_words]`` command, or None if
+            the hand already holds every word.
+        """
+        start, words = command[0], np.asarray(command[1:])
+        with self._lock:
+            block = self._blocks.get(start)
+            if (block is None or block[0] is None or len(block[0]) != len(words)
+                    or self._clock() - block[1] >= self.refresh_interval):
+                self.full_frames += 1
+                return command
+            changed = np.flatnonzero(block[0] != words)
+            if changed.size == 0:
+                self.skipped += 1
+                self.registers_saved += len(words)
+                return None
+            first, last = int(changed[0]), int(changed[-1]) + 1
+            if last - first == len(words):
+                self.full_frames += 1
+                return command
+            self.partial_frames += 1
+            self.registers_saved += len(words) - (last - first)
+            return [start + first, *command[1 + first:1 + last]]
+
+    def is_current(self, command: list) -> bool:
+        """Checks whether ``plan(command)`` would skip the write, without counting it.
+
+        Args:
+            command: Full target command ``[start_reg, *words]``.
+
+        Returns:
+            True if the hand holds every word of ``command`` and no full
+            frame is due.
+        """
+        start, words = command[0], np.asarray(command[1:])
+        with self._lock:
+            block = self._blocks.get(start)
+            return (block is not None and block[0] is not None and len(block[0]) == len(words)
+                    and self._clock() - block[1] < self.refresh_interval
+                    and bool(np.array_equal(block[0], words)))
+
+    def acknowledge(self, command: list, members: list = None):
+        """Records a successful write of target registers.
+
+        Every known block the write overlaps is updated, and a block it
+        covers entirely counts as having had a full frame. A write starting
+        where no block is known, and not contained in one, becomes the
+        block starting at its first register.
+
+        Args:
+            command: The command written, ``[start_reg, *words]``.
+            members: Full target commands merged into ``command`` (see
+                ``NewCommands.combine_target_commands``). Each becomes a
+                block with a fresh full frame, and no block is made of the
+                merged span, so the members stay individually current.
+        """
+        start, words = command[0], np.asarray(command[1:])
+        with self._lock:
+            now = self._clock()
+            contained = self._update_overlapping(start, words, now)
+            if members:
+                for member in members:
+                    self._blocks[member[0]] = [np.asarray(member[1:]).copy(), now]
+                return
+            block = self._blocks.get(start)
+            if not contained and (block is None or block[0] is None):
+                self._blocks[start] = [words.copy(), now]
+
+    def _update_overlapping(self, start: int, words: np.ndarray, now: float) -> bool:
+        """Copies written words into every known block they overlap; call with the lock held.
+
+        Returns:
+            True if a single known block contains the whole write.
+        """
+        end = start + len(words)
+        contained = False
+        for block_start, block in self._blocks.items():
+            known = block[0]
+            if known is None:
+                continue
+            block_end = block_start + len(known)
+            first, last = max(start, block_start), min(end, block_end)
+            if first >= last:
+                continue
+            known[first - block_start:last - block_start] = words[first - start:last - start]
+            if start <= block_start and block_end <= end:
+                block[1] = now
+            if block_start <= start and end <= block_end:
+                contained = True
+        return contained
+
+    def fail(self, command: list):
+        """Forgets the blocks a failed write went to, so their next writes are full frames.
+
+        Args:
+            command: The command whose write raised.
+        """
+        start, end = command[0], command[0] + len(command) - 1
+        with self._lock:
+            for block_start, block in self._blocks.items():
+                known = block[0]
+                if known is not None and block_start < end and start < block_start + len(known):
+                    block[0] = None
+            self._blocks.pop(start, None)
+
+    def invalidate(self):
+        """Forgets every block, e.g. after a reset or reconnection."""
+        with self._lock:
+            self._blocks.clear()
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the counters.
+
+        Returns:
+            Dict with ``full_frames``, ``partial_frames``, ``skipped`` and
+            ``registers_saved``.
+        """
+        with self._lock:
+            return {
+                'full_frames': self.full_frames,
+                'partial_frames': self.partial_frames,
+                'skipped': self.skipped,
+                'registers_saved': self.registers_saved,
+            }
@@ -0,0 +1,247 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Shared-memory ring buffer of fixed-layout feedback records for other processes to read."""
+
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+MAGIC = 0x53525446  # 'FTRS'
+VERSION = 1
+
+HEADER_DTYPE = np.dtype([('magic', '<u4'), ('version', '<u2'), ('num_joints', '<u2'), ('num_fingertips', '<u2'),
+                         ('capacity', '<u4'), ('record_size', '<u4'), ('count', '<u8')], align=True)
+HEADER_SIZE = 64
+
+
+def record_dtype(num_joints: int, num_fingertips: int = 0) -> np.dtype:
+    """Returns the structured dtype of one feedback record.
+
+    Args:
+        num_joints: Joints per record.
+        num_fingertips: Fingertip force sensors per record.
+
+    Returns:
+        Aligned dtype with ``sequence`` (seqlock word), ``timestamp``
+        (``time.time()``), ``status`` (raw status byte), ``position``,
+        ``velocity``, ``force``, ``temperature`` (float32 per joint) and
+        ``fingertip`` (float32 x/y/z per sensor). Feedback the robot does not
+        report is NaN.
+    """
+    joints = (num_joints,)
+    return np.dtype([('sequence', '<u8'), ('timestamp', '<f8'), ('status', '<u2'),
+                     ('position', '<f4', joints), ('velocity', '<f4', joints), ('force', '<f4', joints),
+                     ('temperature', '<f4', joints), ('fingertip', '<f4', (num_fingertips, 3))], align=True)
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing block without letting this process' resource tracker unlink it on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix':
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class FeedbackRing:
+    """Ring of the most recent feedback records in a ``multiprocessing.shared_memory`` block.
+
+    One process (the hand owner) creates the ring and writes a record per
+    feedback read; any number of processes attach by name and read the
+    latest record or a window of them straight out of shared memory, with
+    no serialization. Records are fixed-layout NumPy structs (see
+    ``record_dtype``).
+
+    Writes are lock-free: each record carries a sequence word that is odd
+    while the record is being written and ``2 * n + 2`` once write number
+    ``n`` is complete, and the header's ``count`` advances only after that.
+    Readers copy a record and check its sequence afterwards, so they never
+    return a torn or overwritten record.
+
+    Attributes:
+        name: Shared memory block name readers attach with.
+        capacity: Number of records kept.
+        num_joints: Joints per record.
+        num_fingertips: Fingertip sensors per record.
+        dtype: Record dtype.
+        records: Zero-copy structured array over the ring slots. Reading it
+            directly skips torn-read checks.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """Maps a shared memory block; use ``create`` or ``attach``."""
+        self._shm = shm
+        self._owner = owner
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        if int(self._header['magic']) != MAGIC or int(self._header['version']) != VERSION:
+            shm.close()
+            raise ValueError(f"Shared memory block {shm.name!r} is not a feedback ring")
+        self.name = shm.name
+        self.capacity = int(self._header['capacity'])
+        self.num_joints = int(self._header['num_joints'])
+        self.num_fingertips = int(self._header['num_fingertips'])
+        self.dtype = record_dtype(self.num_joints, self.num_fingertips)
+        self.records = np.ndarray((self.capacity,), dtype=self.dtype, buffer=shm.buf, offset=HEADER_SIZE)
+
+    @classmethod
+    def create(cls, num_joints: int, num_fingertips: int = 0, capacity: int = 1024, name: str = None):
+        """Creates a new ring; the creating process is its only writer.
+
+        Args:
+            num_joints: Joints per record.
+            num_fingertips: Fingertip force sensors per record.
+            capacity: Number of records kept.
+            name: Shared memory name, or None for a generated one.
+
+        Returns:
+            The ``FeedbackRing``; pass ``ring.name`` to readers.
+
+        Raises:
+            ValueError: If ``capacity`` is not positive.
+            FileExistsError: If a block called ``name`` already exists.
+        """
+        if capacity < 1:
+            raise ValueError(f"Ring capacity must be positive, got {capacity}")
+        dtype = record_dtype(num_joints, num_fingertips)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity * dtype.itemsize)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        header[()] = (MAGIC, VERSION, num_joints, num_fingertips, capacity, dtype.itemsize, 0)
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str):
+        """Maps an existing ring for reading.
+
+        Args:
+            name: Name of the ring's shared memory block.
+
+        Returns:
+            The ``FeedbackRing``.
+
+        Raises:
+            FileNotFoundError: If no block called ``name`` exists.
+            ValueError: If the block is not a feedback ring.
+        """
+        return cls(_attach_untracked(name), owner=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def count(self) -> int:
+        """Number of records written since the ring was created."""
+        return int(self._header['count'])
+
+    def write(self, timestamp: float, status: int = 0, position=None, velocity=None, force=None,
+              temperature=None, fingertip=None):
+        """Appends one record, overwriting the oldest once the ring is full.
+
+        Args:
+            timestamp: ``time.time()`` of the feedback.
+            status: Raw status byte.
+            position: Per-joint positions, or None for NaN.
+            velocity: Per-joint velocities, or None for NaN.
+            force: Per-joint forces, or None for NaN.
+            temperature: Per-joint temperatures, or None for NaN.
+            fingertip: ``(num_fingertips, 3)`` fingertip forces, or None for NaN.
+        """
+        n = int(self._header['count'])
+        record = self.records[n % self.capacity]
+        record['sequence'] = 2 * n + 1
+        record['timestamp'] = timestamp
+        record['status'] = status
+        for field, values in (('position', position), ('velocity', velocity), ('force', force),
+                              ('temperature', temperature), ('fingertip', fingertip)):
+            record[field] = np.nan if values is None else values
+        record['sequence'] = 2 * n + 2
+        self._header['count'] = n + 1
+
+    def _read(self, first: int, last: int) -> np.ndarray:
+        """Copies write numbers ``first`` to ``last - 1`` and drops any that changed meanwhile."""
+        numbers = np.arange(first, last, dtype=np.uint64)
+        slots = (numbers % self.capacity).astype(np.intp)
+        copied = self.records[slots]
+        expected = 2 * numbers + 2
+        valid = (copied['sequence'] == expected) & (self.records['sequence'][slots] == expected)
+        return copied[valid]
+
+    def latest(self, retries: int = 3):
+        """Returns a copy of the most recent complete record.
+
+        Args:
+            retries: Attempts if the writer overwrites the record during the copy.
+
+        Returns:
+            ``numpy.void`` record (index it like a dict: ``record['position']``),
+            or None if nothing has been written yet.
+        """
+        for _ in range(retries):
+            count = self.count
+            if count == 0:
+                return None
+            records = self._read(count - 1, count)
+            if len(records):
+                return records[0]
+        return None
+
+    def window(self, size: int) -> np.ndarray:
+        """Returns a copy of up to the ``size`` most recent records, oldest first.
+
+        Args:
+            size: Maximum number of records.
+
+        Returns:
+            Structured array of ``dtype``; ``result['position']`` is a
+            ``(records, num_joints)`` array.
+        """
+        count = self.count
+        return self._read(max(0, count - size, count - self.capacity), count)
+
+    def read_since(self, count: int) -> tuple:
+        """Returns the records written after a previous call, for consumers that want every sample.
+
+        Args:
+            count: ``count`` returned by the previous call (0 at first).
+
+        Returns:
+            Tuple ``(records, count)``. Records already overwritten before
+            this call are lost; compare ``records['sequence']`` with the
+            previous count to detect that.
+        """
+        current = self.count
+        return self._read(max(count, current - self.capacity), current), current
+
+    def close(self):
+        """Unmaps the ring; the creating process also removes the block."""
+        if self._shm is None:
+            return
+        self.records = None
+        self._header = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
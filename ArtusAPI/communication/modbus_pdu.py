@@ -0,0 +1,219 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Minimal Modbus PDU, MBAP and RTU CRC codec for the holding-register function codes the hands use."""
+
+import struct
+
+from pymodbus.exceptions import ModbusIOException
+
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+READ_WRITE_MULTIPLE_REGISTERS = 0x17
+
+# per-request register limits from the Modbus application protocol spec
+MAX_READ_COUNT = 125
+MAX_WRITE_COUNT = 123
+MAX_READ_WRITE_WRITE_COUNT = 121
+
+MBAP_HEADER = struct.Struct('>HHHB')  # transaction id, protocol id, length, unit id
+MBAP_HEADER_SIZE = MBAP_HEADER.size
+
+
+class ModbusExceptionResponse(ModbusIOException):
+    """Raised when the device answers with a Modbus exception response.
+
+    Attributes:
+        function_code: Function code of the rejected request.
+        exception_code: Modbus exception code (1 illegal function,
+            2 illegal address, 3 illegal value, ...).
+    """
+
+    def __init__(self, function_code: int, exception_code: int):
+        self.function_code = function_code
+        self.exception_code = exception_code
+        super().__init__(f"Modbus exception 0x{exception_code:02X} for function 0x{function_code:02X}")
+
+
+def _pack_values(values) -> bytes:
+    """Packs register values big-endian, wrapping signed values to uint16."""
+    return struct.pack(f'>{len(values)}H', *(int(v) & 0xFFFF for v in values))
+
+
+def build_read_holding_registers(start: int, count: int) -> bytes:
+    """Builds an FC 0x03 request PDU.
+
+    Raises:
+        ValueError: If ``count`` is outside 1..125.
+    """
+    if not 1 <= count <= MAX_READ_COUNT:
+        raise ValueError(f"Read count must be 1-{MAX_READ_COUNT}, got {count}")
+    return struct.pack('>BHH', READ_HOLDING_REGISTERS, start, count)
+
+
+def build_write_single_register(address: int, value: int) -> bytes:
+    """Builds an FC 0x06 request PDU."""
+    return struct.pack('>BHH', WRITE_SINGLE_REGISTER, address, int(value) & 0xFFFF)
+
+
+def build_write_multiple_registers(start: int, values) -> bytes:
+    """Builds an FC 0x10 request PDU.
+
+    Raises:
+        ValueError: If ``values`` holds outside 1..123 registers.
+    """
+    if not 1 <= len(values) <= MAX_WRITE_COUNT:
+        raise ValueError(f"Write count must be 1-{MAX_WRITE_COUNT}, got {len(values)}")
+    return struct.pack('>BHHB', WRITE_MULTIPLE_REGISTERS, start, len(values), 2 * len(values)) + _pack_values(values)
+
+
+def build_read_write_multiple_registers(read_start: int, read_count: int, write_start: int, values) -> bytes:
+    """Builds an FC 0x17 request PDU (the write is applied before the read).
+
+    Raises:
+        ValueError: If ``read_count`` is outside 1..125 or ``values`` holds
+            outside 1..121 registers.
+    """
+    if not 1 <= read_count <= MAX_READ_COUNT:
+        raise ValueError(f"Read count must be 1-{MAX_READ_COUNT}, got {read_count}")
+    if not 1 <= len(values) <= MAX_READ_WRITE_WRITE_COUNT:
+        raise ValueError(f"Write count must be 1-{MAX_READ_WRITE_WRITE_COUNT}, got {len(values)}")
+    return (struct.pack('>BHHHHB', READ_WRITE_MULTIPLE_REGISTERS, read_start, read_count,
+                        write_start, len(values), 2 * len(values)) + _pack_values(values))
+
+
+def parse_response(function_code: int, pdu: bytes):
+    """Decodes a response PDU for a request with ``function_code``.
+
+    Args:
+        function_code: Function code of the request being answered.
+        pdu: Response PDU bytes (function code first, no MBAP/CRC).
+
+    Returns:
+        List of register values for FC 0x03/0x17, True for FC 0x06/0x10.
+
+    Raises:
+        ModbusExceptionResponse: If the device returned an exception response.
+        ModbusIOException: If the PDU is truncated or answers another function.
+    """
+    if len(pdu) < 2:
+        raise ModbusIOException(f"Truncated response PDU: {bytes(pdu).hex()}")
+    if pdu[0] == function_code | 0x80:
+        raise ModbusExceptionResponse(function_code, pdu[1])
+    if pdu[0] != function_code:
+        raise ModbusIOException(f"Response function 0x{pdu[0]:02X} does not match request 0x{function_code:02X}")
+    if function_code in (READ_HOLDING_REGISTERS, READ_WRITE_MULTIPLE_REGISTERS):
+        byte_count = pdu[1]
+        if byte_count % 2 or len(pdu) < 2 + byte_count:
+            raise ModbusIOException(f"Malformed register response: {bytes(pdu).hex()}")
+        return list(struct.unpack_from(f'>{byte_count // 2}H', pdu, 2))
+    if len(pdu) < 5:
+        raise ModbusIOException(f"Truncated write response: {bytes(pdu).hex()}")
+    return True
+
+
+def parse_request(pdu: bytes):
+    """Decodes a request PDU, as seen by a Modbus server.
+
+    Args:
+        pdu: Request PDU bytes (function code first, no MBAP/CRC).
+
+    Returns:
+        Tuple of (function_code, fields) where fields is
+        ``(start, count)`` for FC 0x03, ``(address, value)`` for FC 0x06,
+        ``(start, values)`` for FC 0x10 and
+        ``(read_start, read_count, write_start, values)`` for FC 0x17.
+
+    Raises:
+        ModbusExceptionResponse: With exception code 1 for an unsupported
+            function, or 3 for a malformed request.
+    """
+    function_code = pdu[0] if pdu else 0
+    try:
+        if function_code in (READ_HOLDING_REGISTERS, WRITE_SINGLE_REGISTER):
+            return function_code, struct.unpack_from('>HH', pdu, 1)
+        if function_code == WRITE_MULTIPLE_REGISTERS:
+            start, count, byte_count = struct.unpack_from('>HHB', pdu, 1)
+            if byte_count != 2 * count:
+                raise struct.error("byte count mismatch")
+            return function_code, (start, list(struct.unpack_from(f'>{count}H', pdu, 6)))
+        if function_code == READ_WRITE_MULTIPLE_REGISTERS:
+            read_start, read_count, write_start, write_count, byte_count = struct.unpack_from('>HHHHB', pdu, 1)
+            if byte_count != 2 * write_count:
+                raise struct.error("byte count mismatch")
+            return function_code, (read_start, read_count, write_start,
+                                   list(struct.unpack_from(f'>{write_count}H', pdu, 10)))
+    except struct.error:
+        raise ModbusExceptionResponse(function_code, 0x03)
+    raise ModbusExceptionResponse(function_code, 0x01)
+
+
+def build_register_response(function_code: int, registers) -> bytes:
+    """Builds an FC 0x03/0x17 response PDU carrying ``registers``."""
+    return struct.pack('>BB', function_code, 2 * len(registers)) + _pack_values(registers)
+
+
+def build_write_response(function_code: int, address: int, value: int) -> bytes:
+    """Builds an FC 0x06/0x10 response PDU (echoes address and value/count)."""
+    return struct.pack('>BHH', function_code, address, value & 0xFFFF)
+
+
+def build_exception_response(function_code: int, exception_code: int) -> bytes:
+    """Builds an exception response PDU."""
+    return bytes((function_code | 0x80, exception_code))
+
+
+def _build_crc16_table() -> tuple:
+    """Precomputes the Modbus CRC-16 (poly 0xA001) lookup table."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_crc16_table()
+
+
+def crc16(data) -> int:
+    """Computes the Modbus RTU CRC-16 of ``data``.
+
+    The CRC is sent low byte first, i.e. ``struct.pack('<H', crc16(frame))``.
+    """
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def encode_mbap(transaction_id: int, unit_id: int, pdu: bytes) -> bytes:
+    """Prefixes ``pdu`` with a Modbus TCP MBAP header."""
+    return MBAP_HEADER.pack(transaction_id & 0xFFFF, 0, len(pdu) + 1, unit_id) + pdu
+
+
+def decode_mbap(header: bytes):
+    """Decodes a 7-byte MBAP header.
+
+    Returns:
+        Tuple of (transaction_id, unit_id, pdu_length).
+
+    Raises:
+        ModbusIOException: If the protocol id is not Modbus or the length is invalid.
+    """
+    transaction_id, protocol_id, length, unit_id = MBAP_HEADER.unpack(header)
+    if protocol_id != 0 or length < 2:
+        raise ModbusIOException(f"Invalid MBAP header: {bytes(header).hex()}")
+    return transaction_id, unit_id, length - 1
@@ -11,46 +11,85 @@ See the LICENSE file in the repository for full details.
 """
 
 import logging
+import threading
 import time
 import struct
 from tqdm import tqdm
 
 from .RS485_RTU.rs485_rtu import RS485_RTU
+from .RS485_RTU.rs485_rtu_raw import RS485_RTU_Raw
+from .RS485_RTU.rs485_bus import RS485Bus
 from .Modbus_TCP.modbus_tcp import ModbusTCP
-from ..common.ModbusMap import ModbusMap,ActuatorState,CommandType,TrajectoryReturn
+from .Modbus_TCP.pipelined_modbus_tcp import PipelinedModbusTCP
+from .ready_poller import ReadyPoll, TransitionStats
+from .dirty_range_tracker import DirtyRangeTracker
+from .read_planner import MAX_READ_REGISTERS, ReadPlanner
+from .register_cache import RegisterCache
+from .transaction_stats import TransactionStats, pdu_sizes
+from .session_log import RecordingTransport, ReplayTransport, SessionRecorder
+from ..common.ModbusMap import ActuatorState,CommandType,TrajectoryReturn
+from ..common.register_layout import REGISTER_ADDRESSES
 
 class NewCommunication:
     """Transport-agnostic wrapper used by ArtusAPI_V2 to talk to an ARTUS hand.
 
-    Selects and owns a concrete communicator (RS485_RTU or ModbusTCP) based on
+    Selects and owns a concrete communicator (RS485_RTU, RS485_RTU_Raw,
+    a shared-bus RS485BusHandle or ModbusTCP) based on
     `communication_method` and exposes a uniform send/receive/state-polling
     interface on top of it.
 
     Attributes:
-        port: Serial device path (RS485_RTU) or `host`/`host:tcp_port`
-            string (Modbus_TCP).
+        port: Serial device path (RS485_RTU), an `RS485Bus`
+            (RS485_RTU_Shared) or `host`/`host:tcp_port` string (Modbus_TCP).
         baudrate: Serial baud rate, used only for RS485_RTU.
         logger: Logger instance used for status and error messages.
         slave_address: Modbus slave/unit address of the target hand.
-        communication_method: Either "RS485_RTU" or "Modbus_TCP".
-        communicator: The underlying transport instance (RS485_RTU or
-            ModbusTCP) created by `_setup_communication`.
+        communication_method: "RS485_RTU", "RS485_RTU_Raw",
+            "RS485_RTU_Shared", "Modbus_TCP", "Modbus_TCP_Pipelined" or
+            "Replay".
+        communicator: The underlying transport instance (RS485_RTU,
+            RS485_RTU_Raw, RS485BusHandle, ModbusTCP or PipelinedModbusTCP)
+            created by
+            `_setup_communication`.
         ntrips: Running count of state-polling round trips performed by
             `wait_for_ready`.
+        read_planner: `ReadPlanner` used by `batch_receive_data`.
+
+    Every Modbus transaction is timed and counted per function code and
+    register range (see `get_transaction_stats`).
+
+    Every transaction holds an internal re-entrant lock, so one instance can
+    be shared between the caller and a background I/O thread (see
+    `SetpointStreamer`).
+
+    With `enable_dirty_range_writes`, target commands are compared with the
+    targets the hand last acknowledged and only the changed registers are
+    written (see `DirtyRangeTracker`). With `enable_register_cache`, reads
+    of slow-changing registers are served from memory for a short time
+    (see `RegisterCache`).
+
+    `start_recording` logs every transaction to a binary session log that
+    the "Replay" method plays back without hardware (see `ReplayTransport`).
     """
 
     def __init__(self, port='COM9', baudrate=115200, logger=None, slave_address=1, communication_method="RS485_RTU"):
         """Initializes the communication wrapper and constructs the transport.
 
         Args:
-            port: Serial device for RS485_RTU (e.g. '/dev/ttyUSB0'), or
+            port: Serial device for RS485_RTU (e.g. '/dev/ttyUSB0'), the
+                device or an `RS485Bus` for RS485_RTU_Shared, or
                 'host' / 'host:tcp_port' for Modbus_TCP (e.g.
                 '192.168.2.8:502').
             baudrate: Serial baud rate, used only for RS485_RTU.
             logger: Logger to use; a module-level logger is created if None.
             slave_address: Modbus slave/unit address of the target hand.
-            communication_method: Transport to construct, either
-                "RS485_RTU" or "Modbus_TCP".
+            communication_method: Transport to construct: "RS485_RTU",
+                "RS485_RTU_Raw" (pymodbus-free framing, see
+                `RS485_RTU_Raw`), "RS485_RTU_Shared" (several hands on one
+                multi-drop port, see `RS485Bus`), "Modbus_TCP", or
+                "Modbus_TCP_Pipelined" (several requests in flight, see
+                `PipelinedModbusTCP`), or "Replay" (``port`` is a session
+                log path or a `ReplayTransport`).
         """
         self.port = port
         self.baudrate = baudrate
@@ -62,33 +101,138 @@ class NewCommunication:
         else:
             self.logger = logger
 
+        self._lock = threading.RLock()
         self._setup_communication()
 
         self.ntrips = 0
+        self._transition_stats = TransitionStats()
+        self._dirty_ranges = None
+        self.read_planner = ReadPlanner()
+        self._register_cache = None
+        self._recorder = None
+        # RTU frames add address + CRC (3 bytes), TCP frames the MBAP header (7 bytes)
+        self._transaction_stats = TransactionStats(frame_overhead=7 if 'TCP' in communication_method else 3)
 
     
     def _setup_communication(self):
         """Instantiates the concrete communicator for `communication_method`.
 
         Raises:
-            ValueError: If `communication_method` is not "RS485_RTU" or
-                "Modbus_TCP".
+            ValueError: If `communication_method` is not "RS485_RTU",
+                "RS485_RTU_Raw", "RS485_RTU_Shared", "Modbus_TCP",
+                "Modbus_TCP_Pipelined" or "Replay".
         """
         if self.communication_method == "RS485_RTU":
             self.communicator = RS485_RTU(port=self.port, baudrate=self.baudrate, timeout=0.2, logger=self.logger, slave_address=self.slave_address)
+        elif self.communication_method == "RS485_RTU_Raw":
+            self.communicator = RS485_RTU_Raw(port=self.port, baudrate=self.baudrate, timeout=0.2, logger=self.logger, slave_address=self.slave_address)
+        elif self.communication_method == "RS485_RTU_Shared":
+            bus = self.port if isinstance(self.port, RS485Bus) else RS485Bus.shared(self.port, baudrate=self.baudrate, timeout=0.2, logger=self.logger)
+            self.communicator = bus.handle(self.slave_address, logger=self.logger)
         elif self.communication_method == "Modbus_TCP":
             host, _, tcp_port = str(self.port).partition(':')
             # 0.5s: first connect after idle needs firmware-side ARP resolution; 0.2s flakes
             self.communicator = ModbusTCP(host=host, port=int(tcp_port) if tcp_port else 502,
                                           timeout=0.5, logger=self.logger, slave_address=self.slave_address)
+        elif self.communication_method == "Modbus_TCP_Pipelined":
+            host, _, tcp_port = str(self.port).partition(':')
+            self.communicator = PipelinedModbusTCP(host=host, port=int(tcp_port) if tcp_port else 502,
+                                                   timeout=0.5, logger=self.logger, slave_address=self.slave_address)
+        elif self.communication_method == "Replay":
+            self.communicator = self.port if isinstance(self.port, ReplayTransport) else ReplayTransport(
+                self.port, logger=self.logger, slave_address=self.slave_address)
         else:
             raise ValueError(f"Unknown communication method: {self.communication_method}")
 
     def open_connection(self):
         """Opens the underlying transport connection."""
         self.communicator.open()
+        self._forget_targets()
+        self.invalidate_register_cache()
+
+    def enable_dirty_range_writes(self, refresh_interval: float = 1.0):
+        """Only writes the target registers that changed since the last acknowledged write.
+
+        Target commands (``CommandType.TARGET_COMMAND``) are trimmed to the
+        smallest contiguous range of changed registers, or skipped when
+        nothing changed. Each target block is still written in full at
+        least every ``refresh_interval`` seconds, and after a failed write,
+        a reconnection or any setup command (wake up, reset, calibrate...).
+
+        Args:
+            refresh_interval: Maximum time in seconds between two full
+                frames of a target block.
+        """
+        with self._lock:
+            if self._dirty_ranges is None:
+                self._dirty_ranges = DirtyRangeTracker(refresh_interval)
+            else:
+                self._dirty_ranges.refresh_interval = refresh_interval
+
+    def disable_dirty_range_writes(self):
+        """Goes back to writing every target command in full."""
+        with self._lock:
+            self._dirty_ranges = None
+
+    def get_dirty_range_stats(self):
+        """Returns the dirty-range counters (full_frames, partial_frames, skipped, registers_saved).
+
+        Returns:
+            Dict of counters, or None if dirty-range writes are disabled.
+        """
+        tracker = self._dirty_ranges
+        return None if tracker is None else tracker.get_stats()
+
+    def needs_write(self, data: list) -> bool:
+        """Checks whether a target command would write anything.
+
+        Args:
+            data: Target command ``[start_reg, *words]``.
+
+        Returns:
+            False only if dirty-range writes are enabled and the hand
+            already holds every register of ``data``.
+        """
+        tracker = self._dirty_ranges
+        return tracker is None or not tracker.is_current(data)
+
+    def enable_register_cache(self, ttls: dict = None):
+        """Serves repeated reads of slow-changing registers from a time-to-live cache.
 
-    def send_data(self, data:list,command_type:int=CommandType.SETUP_COMMANDS.value):
+        By default the slave ID, voltage, average temperature and error
+        report registers are cached (see `DEFAULT_REGISTER_TTLS`). Every
+        command written to the command register (clear errors, reset,
+        calibrate, wake up...) and every reconnection empties the cache.
+
+        Args:
+            ttls: Mapping of register key or address to time-to-live in
+                seconds, or None for the defaults.
+        """
+        with self._lock:
+            self._register_cache = RegisterCache(ttls)
+
+    def disable_register_cache(self):
+        """Sends every read to the hand again."""
+        with self._lock:
+            self._register_cache = None
+
+    def invalidate_register_cache(self):
+        """Drops every cached read, so the next ones go to the hand."""
+        cache = self._register_cache
+        if cache is not None:
+            cache.invalidate()
+
+    def get_register_cache_stats(self):
+        """Returns the register cache hit/miss counters.
+
+        Returns:
+            Dict of counters (see `RegisterCache.get_stats`), or None if the
+            cache is disabled.
+        """
+        cache = self._register_cache
+        return None if cache is None else cache.get_stats()
+
+    def send_data(self, data:list,command_type:int=CommandType.SETUP_COMMANDS.value, members:list=None):
         """Sends a list of 16-bit register values to the hand.
 
         Args:
@@ -96,12 +240,66 @@ class NewCommunication:
                 `command_type` (see `CommandType` in ModbusMap).
             command_type: CommandType enum value selecting which Modbus
                 write operation the underlying transport should perform.
+            members: Target commands merged into ``data`` by
+                ``NewCommands.combine_target_commands``; with dirty-range
+                writes, each is recorded as its own block.
+
+        Returns:
+            The transport result (True on success); True without any
+            transaction if dirty-range writes are enabled and the hand
+            already holds every target register in ``data``.
         """
         # if len(data) > 1 and len(data)%2 != 0:
         #     self.logger.error(f"Data length should be even")
-        self.communicator.send(data,command_type)
+        with self._lock:
+            if command_type != CommandType.TARGET_COMMAND.value:
+                # commands (clear errors, reset, calibrate...) change what the cached registers hold
+                self.invalidate_register_cache()
+            tracker = self._dirty_ranges
+            if tracker is None:
+                return self._send(data,command_type)
+            if command_type != CommandType.TARGET_COMMAND.value:
+                # setup commands (reset, wake up, calibrate...) may change what the hand holds
+                tracker.invalidate()
+                return self._send(data,command_type)
+
+            write = tracker.plan(data)
+            if write is None:
+                return True
+            try:
+                result = self._send(write,command_type)
+            except Exception:
+                tracker.fail(write)
+                raise
+            if result is False:
+                tracker.fail(write)
+            else:
+                tracker.acknowledge(write, members=members if write is data else None)
+            return result
+
+    def _acknowledge_targets(self, start: int, values: list, members: list = None):
+        """Records target registers written by another transaction type."""
+        if self._dirty_ranges is not None:
+            self._dirty_ranges.acknowledge([start, *values], members=members)
+
+    def _settle_targets(self, start: int, values: list, succeeded: bool):
+        """Acknowledges a completed target write, or forgets its block if the write failed."""
+        if succeeded:
+            self._acknowledge_targets(start, values)
+        else:
+            self._fail_targets(start, values)
+
+    def _fail_targets(self, start: int, values: list):
+        """Forgets the target block a failed write of another transaction type went to."""
+        if self._dirty_ranges is not None:
+            self._dirty_ranges.fail([start, *values])
 
-    def receive_data(self,amount_dat:int=1,start:int=ModbusMap().modbus_reg_map['feedback_register']): # default is receive robot state
+    def _forget_targets(self):
+        """Forces the next target writes to be full frames."""
+        if self._dirty_ranges is not None:
+            self._dirty_ranges.invalidate()
+
+    def receive_data(self,amount_dat:int=1,start:int=REGISTER_ADDRESSES['feedback_register']): # default is receive robot state
         """Reads holding registers from the hand.
 
         Args:
@@ -111,11 +309,57 @@ class NewCommunication:
 
         Returns:
             A single int if one register was read, otherwise a list of ints.
+            Served from the register cache when it is enabled and holds a
+            fresh copy of this read.
         """
         #self.logger.info(f"data received is {self.communicator.receive([start,amount_dat])}")
-        return self.communicator.receive([start,amount_dat])
+        with self._lock:
+            cache = self._register_cache
+            if cache is None or not cache.caches(start):
+                return self._receive(start,amount_dat)
+            registers = cache.get(start, amount_dat)
+            if registers is None:
+                registers = self._receive(start,amount_dat)
+                cache.put(start, amount_dat, registers)
+            return registers
+
+    def configure_read_planner(self, max_registers: int = MAX_READ_REGISTERS, max_gap: int = None):
+        """Sets how `batch_receive_data` coalesces reads; cached plans are dropped.
+
+        Args:
+            max_registers: Largest register count a single read may
+                request (at most 125 for FC 0x03).
+            max_gap: Largest number of unused registers read and discarded
+                to join two fields, or None to join any fields that fit in
+                one read.
+        """
+        with self._lock:
+            self.read_planner = ReadPlanner(max_registers=max_registers, max_gap=max_gap)
+
+    def batch_receive_data(self, fields) -> dict:
+        """Reads a set of scattered register fields in the fewest transactions.
 
-    def send_receive_data(self, read_start: int, read_count: int, write_start: int, values: list):
+        Fields are coalesced into contiguous reads by `read_planner` (the
+        plan is cached per distinct set of fields), the reads are issued
+        through `batch_data` (pipelined on "Modbus_TCP_Pipelined"), and each
+        field's registers are sliced back out.
+
+        Args:
+            fields: Iterable of ``(key, start, count)`` tuples, or
+                ``(start, count)`` tuples keyed by themselves.
+
+        Returns:
+            Dict mapping each field key to its list of registers.
+
+        Raises:
+            ValueError: If a field is larger than one read allows.
+        """
+        with self._lock:
+            plan = self.read_planner.plan(fields)
+            buffers = self.batch_data([('read', start, count) for start, count, _ in plan])
+        return ReadPlanner.split(plan, buffers)
+
+    def send_receive_data(self, read_start: int, read_count: int, write_start: int, values: list, members: list = None):
         """Writes target registers and reads feedback in one Modbus FC 0x17 transaction.
 
         Args:
@@ -123,16 +367,216 @@ class NewCommunication:
             read_count: Number of registers to read.
             write_start: Starting holding-register address to write.
             values: List of uint16 register values to write (no leading address).
+            members: Target commands merged into the write (see
+                ``send_data``).
 
         Returns:
             A single int if one register was read, otherwise a list of ints.
         """
-        return self.communicator.send_receive(read_start, read_count, write_start, values)
+        with self._lock:
+            try:
+                registers = self._send_receive(read_start, read_count, write_start, values)
+            except Exception:
+                self._fail_targets(write_start, values)
+                raise
+            self._acknowledge_targets(write_start, values, members=members)
+            return registers
+
+    def batch_data(self, operations: list) -> list:
+        """Runs several register operations, pipelined when the transport supports it.
+
+        With "Modbus_TCP_Pipelined" all operations are in flight at once and
+        share one network round trip; other transports run them back to back.
+
+        Args:
+            operations: Sequence of ``('read', start, count)``,
+                ``('write', start, values)`` or
+                ``('read_write', read_start, read_count, write_start, values)``
+                tuples.
+
+        Returns:
+            One result per operation, in order: a list of registers for
+            reads, True for writes.
+
+        Raises:
+            ValueError: If an operation kind is unknown.
+        """
+        with self._lock:
+            if hasattr(self.communicator, 'batch'):
+                began = time.perf_counter()
+                try:
+                    results = self.communicator.batch(operations)
+                except Exception as e:
+                    # which writes landed is unknown, so every target block is rewritten in full
+                    self._forget_targets()
+                    self._record_batch(operations, time.perf_counter() - began, e)
+                    raise
+                # the operations share one round trip, each is recorded with its wall time
+                self._record_batch(operations, time.perf_counter() - began)
+                for (kind, *args), result in zip(operations, results):
+                    if kind == 'write':
+                        self._settle_targets(args[0], args[1], result is not False)
+                    elif kind == 'read_write':
+                        self._acknowledge_targets(args[2], args[3])
+                return results
+            results = []
+            for kind, *args in operations:
+                if kind == 'read':
+                    registers = self._receive(args[0], args[1])
+                    results.append([registers] if isinstance(registers, int) else registers)
+                elif kind == 'write':
+                    try:
+                        result = self._send([args[0], *args[1]], CommandType.TARGET_COMMAND.value)
+                    except Exception:
+                        self._fail_targets(args[0], args[1])
+                        raise
+                    self._settle_targets(args[0], args[1], result is not False)
+                    results.append(result)
+                elif kind == 'read_write':
+                    try:
+                        registers = self._send_receive(*args)
+                    except Exception:
+                        self._fail_targets(args[2], args[3])
+                        raise
+                    self._acknowledge_targets(args[2], args[3])
+                    results.append([registers] if isinstance(registers, int) else registers)
+                else:
+                    raise ValueError(f"Unknown batch operation: {kind}")
+            return results
 
     def close_connection(self):
         """Closes the underlying transport connection."""
+        self.stop_transaction_stats_dump()
+        self.stop_recording()
         self.communicator.close()
 
+    def start_recording(self, path: str) -> SessionRecorder:
+        """Logs every following transaction to a binary session log.
+
+        Each send, receive and send_receive is written with its timestamp,
+        duration, request payload and result (or exception). Replay the log
+        with ``communication_method="Replay"``.
+
+        Args:
+            path: Log file to create (overwritten if it exists).
+
+        Returns:
+            The `SessionRecorder` writing the log.
+        """
+        with self._lock:
+            self.stop_recording()
+            self._recorder = SessionRecorder(path)
+            self.communicator = RecordingTransport(self.communicator, self._recorder)
+            return self._recorder
+
+    def stop_recording(self) -> int:
+        """Stops recording and closes the session log.
+
+        Returns:
+            Number of transactions recorded, or 0 if no recording was running.
+        """
+        with self._lock:
+            if self._recorder is None:
+                return 0
+            self.communicator = self.communicator.transport
+            self._recorder.close()
+            records, self._recorder = self._recorder.records, None
+            return records
+
+    def _timed(self, function_code: int, start: int, count: int, request_bytes: int, response_bytes: int, call):
+        """Runs one transport call and records it in the transaction statistics."""
+        began = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self._transaction_stats.record(function_code, start, count, time.perf_counter() - began,
+                                           request_bytes, 0, self._last_retries(), e)
+            raise
+        self._transaction_stats.record(function_code, start, count, time.perf_counter() - began,
+                                       request_bytes, response_bytes, self._last_retries())
+        return result
+
+    def _last_retries(self) -> int:
+        """Returns the retries of the transport's last call (0 if it does not report them)."""
+        retries = getattr(self.communicator, 'last_retries', 0)
+        return retries if isinstance(retries, int) else 0
+
+    @staticmethod
+    def _write_signature(data: list, command_type: int) -> tuple:
+        """Returns ``(function_code, start, count)`` of a `send_data` write."""
+        if command_type == CommandType.TARGET_COMMAND.value:
+            return 0x10, data[0], len(data) - 1
+        if command_type == CommandType.SETUP_COMMANDS.value:
+            return 0x06, 0, 1
+        return 0x10, 0, len(data)
+
+    def _send(self, data: list, command_type: int):
+        """Timed `communicator.send`."""
+        function_code, start, count = self._write_signature(data, command_type)
+        request_bytes, response_bytes = pdu_sizes(function_code, write_count=count)
+        return self._timed(function_code, start, count, request_bytes, response_bytes,
+                           lambda: self.communicator.send(data, command_type))
+
+    def _receive(self, start: int, count: int):
+        """Timed `communicator.receive`."""
+        request_bytes, response_bytes = pdu_sizes(0x03, read_count=count)
+        return self._timed(0x03, start, count, request_bytes, response_bytes,
+                           lambda: self.communicator.receive([start, count]))
+
+    def _send_receive(self, read_start: int, read_count: int, write_start: int, values: list):
+        """Timed `communicator.send_receive`, recorded under its read range."""
+        request_bytes, response_bytes = pdu_sizes(0x17, write_count=len(values), read_count=read_count)
+        return self._timed(0x17, read_start, read_count, request_bytes, response_bytes,
+                           lambda: self.communicator.send_receive(read_start, read_count, write_start, values))
+
+    def _record_batch(self, operations: list, latency: float, error: Exception = None):
+        """Records every operation of a pipelined batch with the batch's wall time."""
+        for kind, *args in operations:
+            if kind == 'read':
+                function_code, start, count = 0x03, args[0], args[1]
+                sizes = pdu_sizes(0x03, read_count=count)
+            elif kind == 'write':
+                function_code, start, count = 0x10, args[0], len(args[1])
+                sizes = pdu_sizes(0x10, write_count=count)
+            else:
+                function_code, start, count = 0x17, args[0], args[1]
+                sizes = pdu_sizes(0x17, write_count=len(args[3]), read_count=count)
+            self._transaction_stats.record(function_code, start, count, latency, *sizes, error=error)
+
+    def get_transaction_stats(self) -> dict:
+        """Returns latency histograms and counters of every transaction so far.
+
+        Returns:
+            Snapshot dict, see `TransactionStats.get_snapshot`: one row per
+            function code and register range (FC 0x17 rows use the read
+            range) with ``transactions``, ``request_bytes`` and
+            ``response_bytes`` (including framing), ``retries``,
+            ``timeouts``, ``errors`` and ``latency`` (count, mean, min, max,
+            p50, p90, p99, p999 in seconds).
+        """
+        return self._transaction_stats.get_snapshot()
+
+    def reset_transaction_stats(self):
+        """Clears the transaction statistics."""
+        self._transaction_stats.reset()
+
+    def start_transaction_stats_dump(self, interval: float = 10.0, path: str = None, logger=None):
+        """Writes a transaction statistics snapshot every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between two snapshots.
+            path: File to append snapshots to (JSON lines), or None.
+            logger: Logger to write snapshots to; this instance's logger if
+                neither ``path`` nor ``logger`` is given.
+        """
+        if path is None and logger is None:
+            logger = self.logger
+        self._transaction_stats.start_dump(interval, path=path, logger=logger)
+
+    def stop_transaction_stats_dump(self):
+        """Stops the periodic snapshot dump, if running."""
+        self._transaction_stats.stop_dump()
+
     def _check_robot_state(self):
         """Reads and unpacks the combined robot/trajectory status byte.
 
@@ -159,72 +603,76 @@ class NewCommunication:
             raise ValueError("Received data is not a 16-bit value")
         return None  # Continue waiting
     
-    def wait_for_ready(self,timeout=15,vis=False,acceptable_state=None):
+    def wait_for_ready(self,timeout=15,vis=False,acceptable_state=None,deadline=None,settle_timeout=0.0,
+                       initial_interval=0.005,max_interval=0.1,return_latency=False):
         """Polls the hand until it reports an acceptable actuator state.
 
-        Repeatedly calls `_check_robot_state` (roughly every 0.3s) and logs
-        the decoded ActuatorState/TrajectoryReturn on each poll, until the
-        masked state matches one of the acceptable states or `timeout`
-        elapses.
+        Polls `_check_robot_state` immediately and then with an exponential
+        backoff (``initial_interval`` doubling up to ``max_interval``), so a
+        transition that completes in tens of milliseconds is seen right
+        away. The decoded ActuatorState/TrajectoryReturn is logged only when
+        the status byte changes. Each completed wait is recorded in the
+        transition statistics (see `get_transition_stats`).
 
         Args:
             timeout: Maximum time in seconds to wait before giving up.
             vis: If True, display a tqdm progress bar while waiting.
-            acceptable_state: A single ActuatorState value to wait for. If
-                None, waits for any of ACTUATOR_IDLE, ACTUATOR_ERROR,
-                ACTUATOR_READY, or ACTUATOR_ACTIVE.
+            acceptable_state: ActuatorState value, or a collection of them,
+                to wait for. If None, waits for any of ACTUATOR_IDLE,
+                ACTUATOR_ERROR, ACTUATOR_READY, or ACTUATOR_ACTIVE.
+            deadline: Absolute ``time.perf_counter()`` time to give up at;
+                overrides ``timeout``.
+            settle_timeout: For commands that end in the state the hand is
+                already in (calibrate, reset): acceptable states are only
+                accepted after the hand was seen outside them, or once this
+                many seconds have passed.
+            initial_interval: Delay in seconds before the second poll.
+            max_interval: Cap in seconds on the delay between polls.
+            return_latency: If True, return ``(state, latency)`` instead of
+                the state alone.
 
         Returns:
             The masked actuator state (int) once it matches one of the
-            acceptable states, or None if the timeout elapses first.
+            acceptable states, or None if the deadline passes first. With
+            ``return_latency``, a tuple of that and the observed transition
+            latency in seconds (None on timeout).
         """
-        start_time = time.perf_counter()
-        time.sleep(0.2) 
-        #self.logger.info(f"the self state is: {acceptable_state}")
-        if not acceptable_state:
-            acceptable_states = [ActuatorState.ACTUATOR_IDLE.value,ActuatorState.ACTUATOR_ERROR.value,ActuatorState.ACTUATOR_READY.value,ActuatorState.ACTUATOR_ACTIVE.value]
-        else:
-            acceptable_states = [acceptable_state]
-        if vis:
-            with tqdm(total=timeout,unit="s",desc="Waiting for Robot Ready") as progresbar:
-                while 1:
-                    #self.logger.info(f"does it get here")
-
-                    raw_state = self._check_robot_state()
-                    result = raw_state & 0xF
-                    trajectory_state = (raw_state & 0b11110000) >> 4
-                    #self.logger.info(f"does it get here x2")
-                    self.logger.info(f"Robot state: {ActuatorState(result).name}, Trajectory: {TrajectoryReturn(trajectory_state).name}")
-                    time_diff = time.perf_counter() - start_time
-                    self.ntrips += 1
-                    if result in acceptable_states:
-                        return result
-                    # time.sleep(0.1)
-                    if progresbar.n + time_diff >= timeout:
-                        self.logger.error("Timeout waiting for robot ready")
-                        break
-                    progresbar.update(time_diff)
-                    time.sleep(0.3)
-                    start_time = time.perf_counter()
-                # self.logger.info(f"Roundtrip time: {self.ntrips/timeout} trips per second")
-                # print(f"Roundtrip time: {self.ntrips/timeout} trips per second")
-        else:
-            while 1:
+        poll = ReadyPoll(timeout=timeout, acceptable_state=acceptable_state, deadline=deadline,
+                         settle_timeout=settle_timeout, initial_interval=initial_interval, max_interval=max_interval)
+        progressbar = tqdm(total=round(poll.deadline - poll.start_time, 1), unit="s", desc="Waiting for Robot Ready") if vis else None
+        result = None
+        try:
+            while True:
                 raw_state = self._check_robot_state()
-                result = raw_state & 0xF
-                trajectory_state = (raw_state & 0b11110000) >> 4
-                #self.logger.info(f"enters else statement")
-                self.logger.info(f"Robot state: {ActuatorState(result).name}, Trajectory: {TrajectoryReturn(trajectory_state).name}")
                 self.ntrips += 1
-                if result in acceptable_states:
-                    return result
-                # time.sleep(0.1)
-                time.sleep(0.3)
-                if time.perf_counter() - start_time > timeout:
-                    self.logger.error("Timeout waiting for robot ready")
+                result, done, changed = poll.observe(raw_state)
+                if changed:
+                    self.logger.info(f"Robot state: {ActuatorState(result).name}, Trajectory: {TrajectoryReturn((raw_state & 0b11110000) >> 4).name}")
+                if done:
+                    self._transition_stats.record(result, poll.latency)
+                    return (result, poll.latency) if return_latency else result
+                delay = poll.next_delay()
+                if delay is None:
                     break
-
+                time.sleep(delay)
+                if progressbar is not None:
+                    progressbar.update(round(time.perf_counter() - poll.start_time - progressbar.n, 3))
+        finally:
+            if progressbar is not None:
+                progressbar.close()
+
+        self.logger.error("Timeout waiting for robot ready")
         if result == ActuatorState.ACTUATOR_BUSY.value:
             self.logger.error(f"Robot Busy")
-            # self.logger.info(f"Roundtrip time: {self.ntrips/timeout} trips per second")
-            # print(f"Roundtrip time: {self.ntrips/timeout} trips per second")
\ No newline at end of file
+        self._transition_stats.record_timeout()
+        return (None, None) if return_latency else None
+
+    def get_transition_stats(self):
+        """Returns timing statistics of the `wait_for_ready` calls so far.
+
+        Returns:
+            Dict with ``timeouts``, ``last_latency`` and per-ActuatorState
+            ``count``/``mean``/``max`` latencies, see
+            `TransitionStats.get_stats`.
+        """
+        return self._transition_stats.get_stats()
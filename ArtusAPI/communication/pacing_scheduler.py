@@ -0,0 +1,167 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Deadline-based pacing of commands to the configured communication frequency."""
+
+import math
+import threading
+import time
+
+
+class PacingScheduler:
+    """Hands out send slots one communication period apart on a monotonic clock.
+
+    Each slot is an absolute deadline: a caller that arrives early sleeps
+    once until its slot (the last ``spin_threshold`` seconds are spun on
+    the clock for sub-millisecond accuracy), and the following slot is
+    placed exactly one period after it, so wake-up latency does not
+    accumulate into drift. A caller that arrives after its slot is sent
+    immediately and the schedule is re-anchored at that moment, so two
+    commands are never closer than one period.
+
+    Slots are reserved under a lock, so one scheduler can pace several
+    threads sharing a bus (e.g. the API and its ``SetpointStreamer``).
+
+    Attributes:
+        period: Time in seconds between two slots.
+        spin_threshold: How long before a deadline to stop sleeping and
+            spin instead; 0 sleeps all the way.
+        last_send: Clock time of the last slot handed out or send
+            recorded with ``mark_sent``.
+    """
+
+    def __init__(self, period: float, spin_threshold: float = 0.001, clock=time.perf_counter, sleep=time.sleep):
+        """Initializes the scheduler with the first slot available immediately.
+
+        Args:
+            period: Time in seconds between two slots
+                (``1 / communication_frequency``).
+            spin_threshold: Final stretch before a deadline, in seconds,
+                that is busy-waited instead of slept.
+            clock: Monotonic clock returning seconds.
+            sleep: Sleep function taking seconds.
+        """
+        self.period = period
+        self.spin_threshold = spin_threshold
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_deadline = 0.0
+        self.last_send = 0.0
+        self.reset_stats()
+
+    def reset(self, last_send: float):
+        """Anchors the schedule so the next slot is one period after ``last_send``.
+
+        Args:
+            last_send: Clock time of the most recent send.
+        """
+        with self._lock:
+            self.last_send = last_send
+            self._next_deadline = last_send + self.period
+
+    def mark_sent(self, timestamp: float = None):
+        """Records a command that was sent without waiting for a slot.
+
+        The next slot is pushed back to at least one period after it.
+
+        Args:
+            timestamp: Clock time of the send; now if None.
+        """
+        now = self._clock() if timestamp is None else timestamp
+        with self._lock:
+            self.last_send = now
+            self._next_deadline = max(self._next_deadline, now + self.period)
+
+    def reserve(self) -> float:
+        """Claims the next slot without waiting for it.
+
+        Returns:
+            The slot's deadline on the scheduler clock; may be in the past
+            if the caller arrived late, in which case it is "now".
+        """
+        now = self._clock()
+        with self._lock:
+            deadline = self._next_deadline
+            if now >= deadline:
+                if deadline and now - deadline >= self.period:
+                    self.missed += 1
+                deadline = now
+            self._next_deadline = deadline + self.period
+            self.last_send = deadline
+            self.slots += 1
+        return deadline
+
+    def wait(self) -> float:
+        """Blocks until the next slot.
+
+        Returns:
+            The slot's deadline on the scheduler clock.
+        """
+        deadline = self.reserve()
+        remaining = deadline - self._clock()
+        if remaining <= 0:
+            return deadline
+        if remaining > self.spin_threshold:
+            self._sleep(remaining - self.spin_threshold)
+        while self._clock() < deadline:
+            pass
+        self.record_wake(deadline)
+        return deadline
+
+    def record_wake(self, deadline: float, woke: float = None):
+        """Adds one wake-up to the jitter statistics.
+
+        Used by ``wait`` and by callers that wait for a reserved slot
+        themselves (e.g. with ``asyncio.sleep``).
+
+        Args:
+            deadline: The slot deadline that was waited for.
+            woke: Clock time the caller resumed; now if None.
+        """
+        jitter = (self._clock() if woke is None else woke) - deadline
+        with self._lock:
+            self.waits += 1
+            self._jitter_sum += jitter
+            self._jitter_sq_sum += jitter * jitter
+            self.max_jitter = max(self.max_jitter, jitter)
+
+    def reset_stats(self):
+        """Zeroes the slot, missed-deadline and jitter counters."""
+        self.slots = 0
+        self.waits = 0
+        self.missed = 0
+        self.max_jitter = 0.0
+        self._jitter_sum = 0.0
+        self._jitter_sq_sum = 0.0
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the pacing statistics.
+
+        Returns:
+            Dict with ``slots`` (slots handed out), ``waits`` (slots that
+            had to be waited for), ``missed`` (slots that came at least one
+            full period late, i.e. a send slot was skipped), and
+            ``mean_jitter`` / ``max_jitter`` / ``std_jitter`` in seconds,
+            measured as wake-up time minus deadline over the waits.
+        """
+        with self._lock:
+            mean = self._jitter_sum / self.waits if self.waits else 0.0
+            variance = self._jitter_sq_sum / self.waits - mean * mean if self.waits else 0.0
+            return {
+                'slots': self.slots,
+                'waits': self.waits,
+                'missed': self.missed,
+                'mean_jitter': mean,
+                'max_jitter': self.max_jitter,
+                'std_jitter': math.sqrt(max(variance, 0.0)),
+            }
@@ -0,0 +1,141 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Plans contiguous holding-register reads covering several register fields."""
+
+# Modbus FC 0x03 caps a single read at 125 registers
+MAX_READ_REGISTERS = 125
+
+
+def plan_register_reads(fields, max_registers: int = MAX_READ_REGISTERS, max_gap: int = None) -> list:
+    """Groups register fields into the fewest contiguous read ranges.
+
+    Fields are sorted by address and merged greedily while the merged range
+    stays within ``max_registers``; registers between two fields are read
+    and discarded. Greedy merging in address order yields the minimum
+    number of ranges for a fixed size cap.
+
+    Args:
+        fields: Iterable of ``(key, start, count)`` tuples.
+        max_registers: Largest register count a single read may request.
+        max_gap: If given, never bridge more than this many unused
+            registers between two fields.
+
+    Returns:
+        List of ``(start, count, members)`` tuples, one per read, where
+        ``members`` is a list of ``(key, offset, count)`` locating each
+        field inside that read's register buffer.
+
+    Raises:
+        ValueError: If a single field is larger than ``max_registers``.
+    """
+    plan = []
+    for key, start, count in sorted(fields, key=lambda field: (field[1], field[2])):
+        if count > max_registers:
+            raise ValueError(f"Field {key} spans {count} registers, more than one read allows ({max_registers})")
+        if plan:
+            range_start, range_count, members = plan[-1]
+            range_end = range_start + range_count
+            new_end = max(range_end, start + count)
+            if new_end - range_start <= max_registers and (max_gap is None or start - range_end <= max_gap):
+                members.append((key, start - range_start, count))
+                plan[-1] = (range_start, new_end - range_start, members)
+                continue
+        plan.append((start, count, [(key, 0, count)]))
+    return plan
+
+
+class ReadPlanner:
+    """Caches read plans per request signature and slices the results back out per field.
+
+    The same sets of fields tend to be read every cycle (a feedback
+    snapshot, a status/voltage/temperature poll), so the plan of each
+    distinct request is computed once with ``plan_register_reads`` and
+    reused.
+
+    Attributes:
+        max_registers: Largest register count a single read may request.
+        max_gap: Largest number of unused registers bridged between two
+            fields, or None to bridge any gap that fits in one read.
+        hits: Number of plans served from the cache.
+        misses: Number of plans computed.
+    """
+
+    def __init__(self, max_registers: int = MAX_READ_REGISTERS, max_gap: int = None, max_cached: int = 64):
+        """Creates a planner with an empty cache.
+
+        Args:
+            max_registers: Largest register count a single read may
+                request (125 for FC 0x03).
+            max_gap: Largest number of unused registers to read and
+                discard between two fields, or None for no limit.
+            max_cached: Number of distinct request signatures kept; the
+                cache is cleared when it is exceeded.
+        """
+        self.max_registers = max_registers
+        self.max_gap = max_gap
+        self.max_cached = max_cached
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def plan(self, fields) -> tuple:
+        """Returns the (cached) read plan for a set of fields.
+
+        Args:
+            fields: Iterable of ``(key, start, count)`` tuples, or
+                ``(start, count)`` tuples keyed by themselves.
+
+        Returns:
+            Tuple of ``(start, count, members)`` reads, see
+            ``plan_register_reads``.
+
+        Raises:
+            ValueError: If a single field is larger than ``max_registers``.
+        """
+        signature = tuple((field, *field) if len(field) == 2 else tuple(field) for field in fields)
+        plan = self._cache.get(signature)
+        if plan is not None:
+            self.hits += 1
+            return plan
+        self.misses += 1
+        plan = tuple((start, count, tuple(members)) for start, count, members
+                     in plan_register_reads(signature, max_registers=self.max_registers, max_gap=self.max_gap))
+        if len(self._cache) >= self.max_cached:
+            self._cache.clear()
+        self._cache[signature] = plan
+        return plan
+
+    @staticmethod
+    def split(plan, buffers) -> dict:
+        """Slices the registers of each field out of the buffers read for a plan.
+
+        Args:
+            plan: Plan returned by ``plan``.
+            buffers: One register list per planned read, in plan order.
+
+        Returns:
+            Dict mapping each field key to its list of registers.
+        """
+        fields = {}
+        for (_, _, members), registers in zip(plan, buffers):
+            for key, offset, count in members:
+                fields[key] = registers[offset:offset + count]
+        return fields
+
+    def get_stats(self) -> dict:
+        """Returns the cache counters.
+
+        Returns:
+            Dict with ``hits``, ``misses`` and ``cached`` (signatures kept).
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'cached': len(self._cache)}
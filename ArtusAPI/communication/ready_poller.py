@@ -0,0 +1,162 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Adaptive status-register polling shared by the sync and async ``wait_for_ready``."""
+
+import time
+
+from ..common.ModbusMap import ActuatorState
+
+# states wait_for_ready accepts when the caller does not name any
+READY_STATES = frozenset((ActuatorState.ACTUATOR_IDLE.value, ActuatorState.ACTUATOR_ERROR.value,
+                          ActuatorState.ACTUATOR_READY.value, ActuatorState.ACTUATOR_ACTIVE.value))
+
+
+class ReadyPoll:
+    """State of one ``wait_for_ready`` call: target states, deadline and backoff.
+
+    The first poll happens immediately; the delay between polls starts at
+    ``initial_interval`` and grows by ``backoff`` up to ``max_interval``,
+    so fast transitions are seen within milliseconds and slow ones
+    (calibration) do not flood the bus.
+
+    With a ``settle_timeout``, an acceptable state only counts once the
+    hand has been seen moving (a state outside the acceptable set, or one
+    different from the first poll) or ``settle_timeout`` has passed. This
+    covers commands whose target is the state the hand is already in
+    (calibrate, reset: IDLE -> busy -> IDLE) without a fixed up-front sleep.
+
+    Attributes:
+        acceptable_states: Frozenset of masked ActuatorState values to wait for.
+        start_time: Clock time the wait started.
+        deadline: Clock time after which the wait gives up.
+        latency: Time from ``start_time`` to the poll that saw an accepted
+            state, or None while waiting.
+        polls: Number of status reads so far.
+    """
+
+    def __init__(self, timeout=15, acceptable_state=None, deadline=None, settle_timeout=0.0,
+                 initial_interval=0.005, max_interval=0.1, backoff=2.0, clock=time.perf_counter):
+        """Starts a wait.
+
+        Args:
+            timeout: Maximum time in seconds to wait; ignored if ``deadline``
+                is given.
+            acceptable_state: ActuatorState value, or a collection of them,
+                to wait for; ``READY_STATES`` if None.
+            deadline: Absolute clock time to give up at.
+            settle_timeout: Longest time in seconds to wait for the hand to
+                be seen moving before accepting its current state anyway.
+            initial_interval: Delay in seconds before the second poll.
+            max_interval: Cap in seconds on the delay between polls.
+            backoff: Factor the delay grows by after each poll.
+            clock: Monotonic clock returning seconds.
+        """
+        if acceptable_state is None:
+            self.acceptable_states = READY_STATES
+        elif isinstance(acceptable_state, int):
+            self.acceptable_states = frozenset((acceptable_state,))
+        else:
+            self.acceptable_states = frozenset(acceptable_state)
+        self._clock = clock
+        self.start_time = clock()
+        self.deadline = deadline if deadline is not None else self.start_time + timeout
+        self._settle_until = self.start_time + settle_timeout
+        self._moved = not settle_timeout
+        self._first_state = None
+        self._interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self.latency = None
+        self.polls = 0
+        self.last_raw_state = None
+
+    def observe(self, raw_state: int):
+        """Feeds one status read into the wait.
+
+        Args:
+            raw_state: Status byte (ActuatorState low nibble, TrajectoryReturn
+                high nibble).
+
+        Returns:
+            Tuple ``(state, done, changed)``: the masked ActuatorState,
+            whether the wait is satisfied, and whether the status byte
+            differs from the previous poll.
+        """
+        now = self._clock()
+        self.polls += 1
+        state = raw_state & 0xF
+        changed = raw_state != self.last_raw_state
+        self.last_raw_state = raw_state
+        if self._first_state is None:
+            self._first_state = state
+        elif state != self._first_state:
+            self._moved = True
+        if state not in self.acceptable_states:
+            self._moved = True
+            return state, False, changed
+        if self._moved or now >= self._settle_until:
+            self.latency = now - self.start_time
+            return state, True, changed
+        return state, False, changed
+
+    def next_delay(self):
+        """Returns how long to wait before the next poll.
+
+        Returns:
+            Delay in seconds, or None if the deadline has passed.
+        """
+        remaining = self.deadline - self._clock()
+        if remaining <= 0:
+            return None
+        delay = min(self._interval, remaining)
+        self._interval = min(self._interval * self._backoff, self._max_interval)
+        return delay
+
+
+class TransitionStats:
+    """Per-state timing statistics of completed ``wait_for_ready`` calls."""
+
+    def __init__(self):
+        """Starts with no recorded waits."""
+        self._by_state = {}
+        self.timeouts = 0
+        self.last_latency = None
+
+    def record(self, state: int, latency: float):
+        """Adds one completed wait.
+
+        Args:
+            state: Masked ActuatorState value the wait ended on.
+            latency: Observed transition latency in seconds.
+        """
+        count, total, worst = self._by_state.get(state, (0, 0.0, 0.0))
+        self._by_state[state] = (count + 1, total + latency, max(worst, latency))
+        self.last_latency = latency
+
+    def record_timeout(self):
+        """Counts one wait that hit its deadline."""
+        self.timeouts += 1
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the statistics.
+
+        Returns:
+            Dict with ``timeouts``, ``last_latency`` (seconds or None) and
+            ``states``, mapping ActuatorState name to ``count``, ``mean``
+            and ``max`` latency in seconds.
+        """
+        states = {}
+        for state, (count, total, worst) in self._by_state.items():
+            name = ActuatorState(state).name if state in ActuatorState._value2member_map_ else str(state)
+            states[name] = {'count': count, 'mean': total / count, 'max': worst}
+        return {'timeouts': self.timeouts, 'last_latency': self.last_latency, 'states': states}
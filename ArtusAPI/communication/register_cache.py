@@ -0,0 +1,114 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Time-to-live cache for slow-changing holding registers."""
+
+import threading
+import time
+
+from ..common.register_layout import REGISTER_ADDRESSES
+
+# seconds a read of each register key stays valid
+DEFAULT_REGISTER_TTLS = {
+    'slave_id_reg': 60.0,
+    'feedback_voltage_start_reg': 1.0,
+    'feedback_avg_temperature_start_reg': 1.0,
+    'feedback_actuator_error_reg': 0.25,
+}
+
+
+class RegisterCache:
+    """Serves repeated reads of slow-changing registers from memory for a short time.
+
+    Only reads starting at one of the configured registers are cached,
+    keyed by ``(start, count)``; every other read always goes to the bus.
+
+    Attributes:
+        ttls: Mapping of register address to time-to-live in seconds.
+    """
+
+    def __init__(self, ttls: dict = None, clock=time.perf_counter):
+        """Creates an empty cache.
+
+        Args:
+            ttls: Mapping of register key (``ModbusMap`` name) or address to
+                time-to-live in seconds; ``DEFAULT_REGISTER_TTLS`` if None.
+            clock: Monotonic clock returning seconds.
+        """
+        ttls = DEFAULT_REGISTER_TTLS if ttls is None else ttls
+        self.ttls = {REGISTER_ADDRESSES.get(key, key): ttl for key, ttl in ttls.items()}
+        self._names = {address: key for key, address in REGISTER_ADDRESSES.items() if address in self.ttls}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = {}  # (start, count) -> (registers, expiry time)
+        self._stats = {address: {'hits': 0, 'misses': 0} for address in self.ttls}
+        self.invalidations = 0
+
+    def caches(self, start: int) -> bool:
+        """Checks whether reads starting at ``start`` are cached."""
+        return start in self.ttls
+
+    def get(self, start: int, count: int):
+        """Returns the cached registers of a read, or None if absent or expired.
+
+        Args:
+            start: Starting register address.
+            count: Number of registers.
+
+        Returns:
+            What ``receive_data`` returned for that read, or None.
+        """
+        with self._lock:
+            entry = self._entries.get((start, count))
+            stats = self._stats[start]
+            if entry is None or self._clock() >= entry[1]:
+                stats['misses'] += 1
+                return None
+            stats['hits'] += 1
+            registers = entry[0]
+            return list(registers) if isinstance(registers, list) else registers
+
+    def put(self, start: int, count: int, registers):
+        """Stores the registers just read from the bus.
+
+        Args:
+            start: Starting register address.
+            count: Number of registers.
+            registers: What the transport returned (int or list).
+        """
+        with self._lock:
+            stored = list(registers) if isinstance(registers, list) else registers
+            self._entries[(start, count)] = (stored, self._clock() + self.ttls[start])
+
+    def invalidate(self):
+        """Drops every cached read, e.g. after a command changed the hand's state."""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Returns hit and miss counters.
+
+        Returns:
+            Dict with total ``hits``, ``misses`` and ``invalidations`` and
+            ``fields``, mapping each cached register (key name, or address
+            if it has none) to its own ``hits``/``misses``.
+        """
+        with self._lock:
+            fields = {self._names.get(address, address): dict(stats) for address, stats in self._stats.items()}
+            return {
+                'hits': sum(stats['hits'] for stats in fields.values()),
+                'misses': sum(stats['misses'] for stats in fields.values()),
+                'invalidations': self.invalidations,
+                'fields': fields,
+            }
@@ -0,0 +1,404 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Binary recording of Modbus sessions and a transport that replays them without hardware."""
+
+import logging
+import struct
+import threading
+import time
+from collections import namedtuple
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from ..common.ModbusMap import CommandType
+
+MAGIC = b'ARTUSREC'
+VERSION = 1
+
+# record kinds
+SEND = 1
+RECEIVE = 2
+SEND_RECEIVE = 3
+
+_FILE_HEADER = struct.Struct('<8sHd')      # magic, version, wall-clock start (time.time())
+_RECORD_HEADER = struct.Struct('<BBdd')    # kind, flags, start offset (s), duration (s)
+_FLAG_ERROR = 0x01
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+
+# result shapes
+_RESULT_FALSE, _RESULT_TRUE, _RESULT_NONE, _RESULT_INT, _RESULT_LIST = range(5)
+
+# exceptions re-raised on replay; anything else comes back as ModbusIOException
+_ERROR_TYPES = {cls.__name__: cls for cls in (ModbusIOException, ConnectionException, ConnectionError,
+                                               TimeoutError, ValueError)}
+
+SessionRecord = namedtuple('SessionRecord', 'kind start duration request result error')
+SessionRecord.__doc__ = """One recorded transaction.
+
+Attributes:
+    kind: ``SEND``, ``RECEIVE`` or ``SEND_RECEIVE``.
+    start: Seconds from the start of the recording to the call.
+    duration: Seconds the call took.
+    request: ``(command_type, data)`` for sends, ``(start, count)`` for
+        receives, ``(read_start, read_count, write_start, values)`` for
+        send_receive.
+    result: What the transport returned (None if it raised).
+    error: ``(exception class name, message)`` if the call raised, else None.
+"""
+
+
+def _pack_words(values) -> bytes:
+    values = [int(value) & 0xFFFF for value in values]
+    return _U16.pack(len(values)) + struct.pack(f'<{len(values)}H', *values)
+
+
+def _pack_text(text: str) -> bytes:
+    data = text.encode('utf-8')[:0xFFFF]
+    return _U16.pack(len(data)) + data
+
+
+def _pack_result(result) -> bytes:
+    if result is None:
+        return _U8.pack(_RESULT_NONE)
+    if result is True or result is False:
+        return _U8.pack(_RESULT_TRUE if result else _RESULT_FALSE)
+    if isinstance(result, int):
+        return _U8.pack(_RESULT_INT) + _U16.pack(result & 0xFFFF)
+    return _U8.pack(_RESULT_LIST) + _pack_words(result)
+
+
+class _Reader:
+    """Sequential decoder over the bytes of a session log."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def words(self) -> list:
+        (count,) = self.unpack(_U16)
+        values = list(struct.unpack_from(f'<{count}H', self.data, self.offset))
+        self.offset += 2 * count
+        return values
+
+    def text(self) -> str:
+        (length,) = self.unpack(_U16)
+        text = self.data[self.offset:self.offset + length].decode('utf-8')
+        self.offset += length
+        return text
+
+    def result(self):
+        (shape,) = self.unpack(_U8)
+        if shape == _RESULT_LIST:
+            return self.words()
+        if shape == _RESULT_INT:
+            return self.unpack(_U16)[0]
+        return {_RESULT_FALSE: False, _RESULT_TRUE: True, _RESULT_NONE: None}[shape]
+
+
+def read_session_log(path: str) -> tuple:
+    """Reads a session log written by ``SessionRecorder``.
+
+    Args:
+        path: Log file.
+
+    Returns:
+        Tuple ``(wall_start, records)``: the ``time.time()`` the recording
+        started at and the list of ``SessionRecord``.
+
+    Raises:
+        ValueError: If the file is not a session log of a known version.
+    """
+    with open(path, 'rb') as file:
+        reader = _Reader(file.read())
+    if len(reader.data) < _FILE_HEADER.size:
+        raise ValueError(f"{path} is not an ARTUS session log")
+    magic, version, wall_start = reader.unpack(_FILE_HEADER)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an ARTUS session log (version {VERSION})")
+
+    records = []
+    while reader.offset < len(reader.data):
+        kind, flags, start, duration = reader.unpack(_RECORD_HEADER)
+        if kind == SEND:
+            (command_type,) = reader.unpack(_U16)
+            request = (command_type, reader.words())
+        elif kind == RECEIVE:
+            request = reader.unpack(struct.Struct('<HH'))
+        elif kind == SEND_RECEIVE:
+            read_start, read_count, write_start = reader.unpack(struct.Struct('<HHH'))
+            request = (read_start, read_count, write_start, reader.words())
+        else:
+            raise ValueError(f"Unknown record kind {kind} in {path}")
+        if flags & _FLAG_ERROR:
+            records.append(SessionRecord(kind, start, duration, request, None, (reader.text(), reader.text())))
+        else:
+            records.append(SessionRecord(kind, start, duration, request, reader.result(), None))
+    return wall_start, records
+
+
+class SessionRecorder:
+    """Appends transactions to a compact binary session log.
+
+    Each record holds the call kind, its start offset and duration, the
+    request registers as uint16 words and either the result or the
+    exception raised. A receive of 8 registers takes about 40 bytes.
+
+    Attributes:
+        path: Log file being written.
+        records: Number of transactions recorded.
+    """
+
+    def __init__(self, path: str):
+        """Creates (truncates) the log file and writes its header.
+
+        Args:
+            path: Log file to write.
+        """
+        self.path = path
+        self.records = 0
+        self._file = open(path, 'wb')
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, time.time()))
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind: int, request: tuple, began: float, ended: float, result=None, error: Exception = None):
+        """Writes one transaction.
+
+        Args:
+            kind: ``SEND``, ``RECEIVE`` or ``SEND_RECEIVE``.
+            request: Request tuple, see ``SessionRecord.request``.
+            began: ``time.perf_counter()`` at the call.
+            ended: ``time.perf_counter()`` at the return.
+            result: What the transport returned.
+            error: Exception the transport raised, or None.
+        """
+        parts = [_RECORD_HEADER.pack(kind, _FLAG_ERROR if error is not None else 0, began - self._start, ended - began)]
+        if kind == SEND:
+            parts += [_U16.pack(request[0]), _pack_words(request[1])]
+        elif kind == RECEIVE:
+            parts.append(struct.pack('<HH', *request))
+        else:
+            parts += [struct.pack('<HHH', *request[:3]), _pack_words(request[3])]
+        if error is not None:
+            parts += [_pack_text(type(error).__name__), _pack_text(str(error))]
+        else:
+            parts.append(_pack_result(result))
+        with self._lock:
+            if self._file is not None:
+                self._file.write(b''.join(parts))
+                self.records += 1
+
+    def close(self):
+        """Flushes and closes the log file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingTransport:
+    """Transport wrapper that forwards every call and records it in a ``SessionRecorder``.
+
+    Any other attribute (``slave_address``, ``last_retries``...) is read
+    from the wrapped transport. Operations of a pipelined ``batch`` are
+    recorded as the equivalent send/receive/send_receive calls, so a
+    recording replays on any transport.
+
+    Attributes:
+        transport: The wrapped transport.
+        recorder: Where transactions are written.
+    """
+
+    def __init__(self, transport, recorder: SessionRecorder):
+        """Wraps ``transport``.
+
+        Args:
+            transport: Transport with the ``RS485_RTU`` interface.
+            recorder: Recorder the transactions are written to.
+        """
+        self.transport = transport
+        self.recorder = recorder
+        if hasattr(transport, 'batch'):
+            self.batch = self._batch
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+    def open(self):
+        return self.transport.open()
+
+    def close(self):
+        return self.transport.close()
+
+    def _call(self, kind: int, request: tuple, call):
+        began = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self.recorder.record(kind, request, began, time.perf_counter(), error=e)
+            raise
+        self.recorder.record(kind, request, began, time.perf_counter(), result=result)
+        return result
+
+    def send(self, data: list, command: int, **kwargs):
+        return self._call(SEND, (command, list(data)), lambda: self.transport.send(data, command, **kwargs))
+
+    def receive(self, data: list, **kwargs):
+        return self._call(RECEIVE, (data[0], data[1]), lambda: self.transport.receive(data, **kwargs))
+
+    def send_receive(self, read_start: int, read_count: int, write_start: int, values: list, **kwargs):
+        return self._call(SEND_RECEIVE, (read_start, read_count, write_start, list(values)),
+                          lambda: self.transport.send_receive(read_start, read_count, write_start, values, **kwargs))
+
+
+    def _batch(self, operations: list) -> list:
+        """Forwards a pipelined batch; each operation is recorded as the equivalent single call."""
+        began = time.perf_counter()
+        try:
+            results = self.transport.batch(operations)
+        except Exception as e:
+            ended = time.perf_counter()
+            for kind, *args in operations:
+                self.recorder.record(*self._batch_request(kind, args), began, ended, error=e)
+            raise
+        ended = time.perf_counter()
+        for (kind, *args), result in zip(operations, results):
+            self.recorder.record(*self._batch_request(kind, args), began, ended, result=result)
+        return results
+
+    @staticmethod
+    def _batch_request(kind: str, args: list) -> tuple:
+        if kind == 'read':
+            return RECEIVE, (args[0], args[1])
+        if kind == 'write':
+            return SEND, (CommandType.TARGET_COMMAND.value, [args[0], *args[1]])
+        return SEND_RECEIVE, (args[0], args[1], args[2], list(args[3]))
+
+
+class ReplayMismatchError(ValueError):
+    """A replayed call does not match the next recorded transaction."""
+
+
+class ReplayTransport:
+    """Fake transport that answers from a session log instead of a hand.
+
+    Calls are matched against the recorded transactions in order and get
+    the recorded result back (or the recorded exception raised). At
+    ``speed`` 1.0 every call returns when the recorded one did, relative to
+    the first call; higher speeds compress time, and ``speed=None``
+    answers immediately. Timing-sensitive code such as ``wait_for_ready``
+    therefore sees the same sequence of states as in the field.
+
+    Attributes:
+        path: Log file replayed.
+        speed: Time compression factor, or None for no waiting.
+        strict: If True, a call whose kind or request differs from the
+            recorded one raises ``ReplayMismatchError``; if False, the next
+            record of the same kind is returned whatever its request.
+        slave_address: Modbus slave address (informational).
+        position: Index of the next record to replay.
+        mismatches: Number of non-strict calls whose request differed.
+        last_retries: Always 0; retries are part of the recorded duration.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, strict: bool = True, logger=None, slave_address=1):
+        """Loads a session log.
+
+        Args:
+            path: Log written by ``SessionRecorder``.
+            speed: Replay speed factor, or None to answer immediately.
+            strict: Whether requests must match the recording exactly.
+            logger: Logger to use; a module-level logger is created if None.
+            slave_address: Modbus slave address (informational).
+        """
+        self.path = path
+        self.speed = speed
+        self.strict = strict
+        self.slave_address = slave_address
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self.wall_start, self._records = read_session_log(path)
+        self.position = 0
+        self.mismatches = 0
+        self.last_retries = 0
+        self._anchor = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def open(self):
+        """No-op: there is no port to open."""
+        self.logger.info(f"Replaying {len(self._records)} transactions from {self.path}")
+
+    def close(self):
+        """No-op: there is no port to close."""
+
+    def remaining(self) -> int:
+        """Returns how many recorded transactions are left."""
+        return len(self._records) - self.position
+
+    def _next(self, kind: int, request: tuple) -> SessionRecord:
+        """Finds the record answering this call and waits until it is due."""
+        position = self.position
+        while True:
+            if position >= len(self._records):
+                raise ConnectionError(f"Replay of {self.path} exhausted after {len(self._records)} transactions")
+            record = self._records[position]
+            position += 1
+            if record.kind == kind:
+                break
+            if self.strict:
+                raise ReplayMismatchError(f"Transaction {position - 1}: expected kind {record.kind}, got {kind}")
+        if tuple(record.request) != tuple(request):
+            if self.strict:
+                raise ReplayMismatchError(f"Transaction {position - 1}: recorded request {record.request}, got {request}")
+            self.mismatches += 1
+        self.position = position
+
+        if self.speed:
+            now = time.perf_counter()
+            if self._anchor is None:
+                self._anchor = now - record.start / self.speed
+            delay = self._anchor + (record.start + record.duration) / self.speed - now
+            if delay > 0:
+                time.sleep(delay)
+        return record
+
+    def _answer(self, kind: int, request: tuple):
+        record = self._next(kind, request)
+        if record.error is not None:
+            name, message = record.error
+            raise _ERROR_TYPES.get(name, ModbusIOException)(message)
+        result = record.result
+        return list(result) if isinstance(result, list) else result
+
+    def send(self, data: list, command: int, **kwargs):
+        """Returns the recorded result of the next send."""
+        return self._answer(SEND, (command, [int(value) & 0xFFFF for value in data]))
+
+    def receive(self, data: list, **kwargs):
+        """Returns the recorded registers of the next receive."""
+        return self._answer(RECEIVE, (data[0], data[1]))
+
+    def send_receive(self, read_start: int, read_count: int, write_start: int, values: list, **kwargs):
+        """Returns the recorded registers of the next send_receive."""
+        return self._answer(SEND_RECEIVE, (read_start, read_count, write_start, [int(value) & 0xFFFF for value in values]))
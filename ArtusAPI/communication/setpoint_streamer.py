@@ -0,0 +1,188 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Background I/O thread that streams joint setpoints through a latest-wins mailbox."""
+
+import logging
+import threading
+
+from ..common.ModbusMap import CommandType
+from .pacing_scheduler import PacingScheduler
+
+
+class SetpointStreamer:
+    """Streams target commands to the hand from a dedicated I/O thread.
+
+    Callers ``post`` encoded target commands and return immediately. The
+    mailbox holds at most one pending command per target block (keyed by
+    its starting register), so a newer position setpoint replaces an older
+    one that has not gone out yet instead of queueing behind it. The I/O
+    thread writes one pending block per send slot of its
+    ``PacingScheduler``, taking the freshest value at the moment it is
+    allowed to send.
+
+    Attributes:
+        communication_period: Minimum time in seconds between two writes.
+        pacer: ``PacingScheduler`` handing out the send slots.
+        logger: Logger used for status and error messages.
+        posted: Number of commands handed to ``post``.
+        sent: Number of commands written to the hand.
+        coalesced: Number of pending commands replaced by a newer one
+            before being sent.
+        errors: Number of writes that raised.
+        last_error: The most recent exception raised by a write, or None.
+    """
+
+    def __init__(self, communication_handler, communication_period: float, logger=None, pacer=None):
+        """Initializes the streamer without starting its thread.
+
+        Args:
+            communication_handler: ``NewCommunication`` instance used for
+                the writes; shared with the caller, so its calls must be
+                thread safe.
+            communication_period: Minimum time in seconds between two
+                writes (``1 / communication_frequency``).
+            logger: Logger to use; a module-level logger is created if None.
+            pacer: Scheduler to take send slots from, e.g. the one the
+                caller's own commands go through so both share one
+                cadence; a private one is created if None.
+        """
+        self._communication_handler = communication_handler
+        self.communication_period = communication_period
+        self.pacer = pacer if pacer is not None else PacingScheduler(communication_period)
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._pending = {}  # start register -> command list, insertion ordered
+        self._condition = threading.Condition()
+        self._stop_requested = False
+        self._thread = None
+
+        self.posted = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_error = None
+
+    def start(self):
+        """Starts the I/O thread. No-op if it is already running."""
+        if self.is_running():
+            return
+        with self._condition:
+            self._stop_requested = False
+        self._thread = threading.Thread(target=self._run, name="ArtusSetpointStreamer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Stops the I/O thread, dropping any setpoints that were not sent yet.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread to exit.
+        """
+        with self._condition:
+            self._stop_requested = True
+            self._pending.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Checks whether the I/O thread is alive.
+
+        Returns:
+            True if the thread has been started and has not exited.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def post(self, command: list):
+        """Drops a target command into the mailbox and returns immediately.
+
+        Args:
+            command: Register list as produced by ``NewCommands`` target
+                packers (``[start_reg, *values]``). A pending command with
+                the same start register is replaced.
+        """
+        with self._condition:
+            if command[0] in self._pending:
+                self.coalesced += 1
+            self._pending[command[0]] = command
+            self.posted += 1
+            self._condition.notify()
+
+    def clear(self):
+        """Drops all pending setpoints without sending them."""
+        with self._condition:
+            self._pending.clear()
+
+    def pending(self) -> int:
+        """Returns the number of target blocks waiting to be sent."""
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the streamer counters.
+
+        Returns:
+            Dict with ``posted``, ``sent``, ``coalesced``, ``errors`` and
+            ``pending`` counts.
+        """
+        with self._condition:
+            return {
+                'posted': self.posted,
+                'sent': self.sent,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'pending': len(self._pending),
+            }
+
+    def _take(self):
+        """Blocks until a command is pending and its send slot has come up.
+
+        Returns:
+            The oldest pending command (with its latest value), or None if
+            the streamer was stopped.
+        """
+        with self._condition:
+            while not self._pending and not self._stop_requested:
+                self._condition.wait()
+            if self._stop_requested:
+                return None
+
+        # wait outside the lock so callers keep posting (and coalescing) meanwhile
+        self.pacer.wait()
+
+        with self._condition:
+            if self._stop_requested or not self._pending:
+                return None
+            start_reg = next(iter(self._pending))
+            return self._pending.pop(start_reg)
+
+    def _run(self):
+        """I/O thread body: sends the freshest pending block once per period."""
+        while True:
+            with self._condition:
+                if self._stop_requested:
+                    break
+            command = self._take()
+            if command is None:
+                continue
+            try:
+                self._communication_handler.send_data(command, CommandType.TARGET_COMMAND.value)
+                self.sent += 1
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+                self.logger.error(f"Streaming write to register {command[0]} failed: {e}")
@@ -0,0 +1,256 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Per-transaction latency histograms and byte/retry/timeout counters for Modbus traffic."""
+
+import json
+import logging
+import threading
+import time
+
+# log-linear buckets: exact below 2**SUB_BUCKET_BITS microseconds, then
+# 2**(SUB_BUCKET_BITS - 1) buckets per power of two (at most ~3% relative error)
+SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS >> 1
+# covers up to 2**45 us (over a year) without growing
+_NUM_BUCKETS = _SUB_BUCKETS + _HALF * (45 - SUB_BUCKET_BITS + 1)
+
+# Modbus PDU sizes in bytes (function code included), without the ADU framing
+_PDU_SIZES = {
+    0x03: lambda write, read: (5, 2 + 2 * read),
+    0x06: lambda write, read: (5, 5),
+    0x10: lambda write, read: (6 + 2 * write, 5),
+    0x17: lambda write, read: (10 + 2 * write, 2 + 2 * read),
+}
+
+
+def pdu_sizes(function_code: int, write_count: int = 0, read_count: int = 0) -> tuple:
+    """Returns the request and response PDU sizes of a successful transaction.
+
+    Args:
+        function_code: Modbus function code (0x03, 0x06, 0x10 or 0x17).
+        write_count: Registers written.
+        read_count: Registers read.
+
+    Returns:
+        Tuple ``(request_bytes, response_bytes)``.
+    """
+    return _PDU_SIZES[function_code](write_count, read_count)
+
+
+def is_timeout(error: Exception) -> bool:
+    """Checks whether a transport exception means the hand did not answer in time."""
+    if isinstance(error, TimeoutError):
+        return True
+    message = str(error).lower()
+    return 'timed out' in message or 'timeout' in message or 'no response' in message
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return min(_SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF, _NUM_BUCKETS - 1)
+
+
+def _bucket_upper(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    shift = (index - _SUB_BUCKETS) // _HALF + 1
+    sub_bucket = (index - _SUB_BUCKETS) % _HALF + _HALF
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies with fixed log-linear buckets.
+
+    Values are recorded in whole microseconds into a preallocated list of
+    counters; recording is a bucket computation and one increment, with no
+    allocation and no lock (callers serialize recording, e.g. under the
+    transaction lock of ``NewCommunication``). Percentiles are reported as
+    the upper edge of their bucket, so they never understate a latency by
+    more than one bucket width (~3%).
+
+    Attributes:
+        count: Number of values recorded.
+        total: Sum of the recorded values, in seconds.
+        min: Smallest value recorded, in seconds (None if empty).
+        max: Largest value recorded, in seconds (None if empty).
+    """
+
+    def __init__(self):
+        """Creates an empty histogram."""
+        self._counts = [0] * _NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds: float):
+        """Adds one latency, in seconds."""
+        self._counts[_bucket_index(max(int(seconds * 1e6), 0))] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float):
+        """Returns the latency below which ``percent`` % of the values fall.
+
+        Args:
+            percent: Percentile in [0, 100].
+
+        Returns:
+            Latency in seconds (bucket upper edge, capped at ``max``), or
+            None if nothing was recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, int(round(percent / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(_bucket_upper(index) / 1e6, self.max)
+        return self.max
+
+    def get_stats(self) -> dict:
+        """Returns count, mean, min, max and p50/p90/p99/p999 latencies in seconds."""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+        }
+
+
+class TransactionStats:
+    """Counters and latency histograms per Modbus function code and register range.
+
+    Each ``(function_code, start, count)`` gets its own entry with a
+    ``LatencyHistogram`` of wall latencies (successful transactions only)
+    and totals of request/response bytes, retries, timeouts and other
+    errors. Recording is not locked; ``NewCommunication`` records inside
+    its transaction lock.
+
+    Attributes:
+        frame_overhead: Bytes added to each PDU by the transport framing
+            (3 for RTU: address and CRC; 7 for TCP: MBAP header).
+    """
+
+    def __init__(self, frame_overhead: int = 0):
+        """Creates empty statistics.
+
+        Args:
+            frame_overhead: Framing bytes added to every request and
+                response PDU.
+        """
+        self.frame_overhead = frame_overhead
+        self._entries = {}
+        self._started = time.time()
+        self._dump_thread = None
+        self._dump_stop = threading.Event()
+
+    def record(self, function_code: int, start: int, count: int, latency: float, request_bytes: int = 0,
+               response_bytes: int = 0, retries: int = 0, error: Exception = None):
+        """Records one transaction.
+
+        Args:
+            function_code: Modbus function code.
+            start: First register of the range (the read range for FC 0x17).
+            count: Number of registers in the range.
+            latency: Wall time of the transaction in seconds.
+            request_bytes: Request PDU size.
+            response_bytes: Response PDU size (ignored if ``error``).
+            retries: Retries the transport needed.
+            error: Exception the transaction ended with, or None.
+        """
+        entry = self._entries.get((function_code, start, count))
+        if entry is None:
+            entry = self._entries[(function_code, start, count)] = {
+                'transactions': 0, 'request_bytes': 0, 'response_bytes': 0,
+                'retries': 0, 'timeouts': 0, 'errors': 0, 'latency': LatencyHistogram(),
+            }
+        entry['transactions'] += 1
+        entry['retries'] += retries
+        entry['request_bytes'] += (request_bytes + self.frame_overhead) * (retries + 1)
+        if error is None:
+            entry['response_bytes'] += response_bytes + self.frame_overhead
+            entry['latency'].record(latency)
+        elif is_timeout(error):
+            entry['timeouts'] += 1
+        else:
+            entry['errors'] += 1
+
+    def reset(self):
+        """Drops every entry."""
+        self._entries = {}
+        self._started = time.time()
+
+    def get_snapshot(self) -> dict:
+        """Returns every entry with its latency percentiles.
+
+        Returns:
+            Dict with ``since`` (``time.time()`` of creation or the last
+            reset), ``timestamp`` and ``transactions``: a list of dicts,
+            one per function code and register range, holding
+            ``function_code``, ``start``, ``count``, the counters and a
+            ``latency`` dict (see ``LatencyHistogram.get_stats``).
+        """
+        transactions = []
+        for (function_code, start, count), entry in sorted(list(self._entries.items()), key=lambda item: item[0]):
+            row = {'function_code': function_code, 'start': start, 'count': count}
+            row.update({key: value for key, value in entry.items() if key != 'latency'})
+            row['latency'] = entry['latency'].get_stats()
+            transactions.append(row)
+        return {'since': self._started, 'timestamp': time.time(), 'transactions': transactions}
+
+    def start_dump(self, interval: float, path: str = None, logger=None):
+        """Periodically writes snapshots from a background thread.
+
+        Args:
+            interval: Seconds between two snapshots.
+            path: File to append snapshots to, one JSON object per line.
+            logger: Logger to write snapshots to at INFO level; the module
+                logger if neither ``path`` nor ``logger`` is given.
+        """
+        self.stop_dump()
+        if path is None and logger is None:
+            logger = logging.getLogger(__name__)
+        self._dump_stop = threading.Event()
+        self._dump_thread = threading.Thread(target=self._dump_loop, args=(interval, path, logger, self._dump_stop),
+                                             name="ArtusTransactionStatsDump", daemon=True)
+        self._dump_thread.start()
+
+    def stop_dump(self, timeout: float = 1.0):
+        """Stops the periodic dump, if running."""
+        self._dump_stop.set()
+        if self._dump_thread is not None:
+            self._dump_thread.join(timeout)
+            self._dump_thread = None
+
+    def _dump_loop(self, interval: float, path: str, logger, stop: threading.Event):
+        """Dump thread body."""
+        while not stop.wait(interval):
+            line = json.dumps(self.get_snapshot())
+            if path is not None:
+                with open(path, 'a') as file:
+                    file.write(line + '\n')
+            if logger is not None:
+                logger.info(f"Transaction stats: {line}")
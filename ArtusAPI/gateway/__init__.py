@@ -0,0 +1,4 @@
+"""Modbus TCP gateway sharing one RS485 hand between several network clients."""
+from .modbus_gateway import ModbusTCPGateway
+
+__all__ = ["ModbusTCPGateway"]
@@ -0,0 +1,49 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Runs a Modbus TCP gateway: ``python -m ArtusAPI.gateway --port /dev/ttyUSB0 --robot-type artus_lite``."""
+
+import argparse
+import asyncio
+import logging
+
+from ..common.SlaveIDMap import expected_slave_id
+from ..communication.RS485_RTU.rs485_rtu import RS485_RTU
+from .modbus_gateway import ModbusTCPGateway
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share one RS485 ARTUS hand with Modbus TCP clients")
+    parser.add_argument("--port", default="/dev/ttyUSB0", help="serial device of the hand")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--robot-type", default="artus_lite")
+    parser.add_argument("--hand-type", default="left")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--tcp-port", type=int, default=502)
+    parser.add_argument("--cache-ttl", type=float, default=0.02, help="seconds a read result may be reused; 0 disables")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    transport = RS485_RTU(port=args.port, baudrate=args.baudrate, timeout=0.2,
+                          slave_address=expected_slave_id(args.robot_type, args.hand_type))
+    transport.open()
+    gateway = ModbusTCPGateway(transport, host=args.host, port=args.tcp_port, cache_ttl=args.cache_ttl)
+    try:
+        asyncio.run(gateway.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transport.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Asyncio Modbus TCP server that shares one RS485 hand between many network clients."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from ..common.ModbusMap import CommandType
+from ..communication import modbus_pdu
+
+# Modbus exception codes answered by the gateway
+ILLEGAL_DATA_VALUE = 0x03
+SERVER_DEVICE_FAILURE = 0x04
+GATEWAY_TARGET_FAILED = 0x0B
+
+
+class ModbusTCPGateway:
+    """Modbus TCP front end for a hand on a serial transport.
+
+    Listens for Modbus TCP clients (``ModbusTCP``-mode ``ArtusAPI_V2``
+    instances, PLCs, dashboards...) and forwards their requests to one
+    upstream transport, normally ``RS485_RTU``. Upstream calls run one at
+    a time on a single worker thread, in arrival order, so clients never
+    collide on the bus. Any unit id is accepted; the hand's slave address
+    is the transport's.
+
+    Holding-register reads are answered from a short-lived cache when an
+    identical or enclosing read completed less than ``cache_ttl`` seconds
+    ago, and identical reads already waiting on the bus are answered by
+    the same upstream transaction. Every write empties the cache.
+
+    FC 0x03, 0x06, 0x10 and 0x17 are supported. FC 0x06 to register 0
+    goes upstream as a setup command; other single-register writes go
+    upstream as one-register FC 0x10 writes.
+
+    Attributes:
+        transport: Upstream transport with the ``RS485_RTU`` interface.
+        host: Interface the gateway listens on.
+        port: TCP port; 0 picks a free port, updated once started.
+        cache_ttl: Seconds a read result may be reused; 0 disables the cache.
+        logger: Logger used for status and error messages.
+    """
+
+    def __init__(self, transport, host: str = '0.0.0.0', port: int = 502, cache_ttl: float = 0.02, logger=None):
+        """Creates the gateway without listening yet.
+
+        Args:
+            transport: Opened upstream transport (``RS485_RTU``,
+                ``RS485_RTU_Raw``...).
+            host: Interface to listen on.
+            port: TCP port to listen on; 0 picks a free port.
+            cache_ttl: Seconds a read result may be reused; 0 disables the cache.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.cache_ttl = cache_ttl
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ModbusTCPGateway')
+        self._server = None
+        self._cache = {}      # (start, count) -> (registers, time)
+        self._in_flight = {}  # (start, count) -> future of an upstream read
+        self._generation = 0  # bumped by every write; stale reads are not cached
+        self._writers = set()
+        self._stats = {'requests': 0, 'upstream': 0, 'cache_hits': 0, 'coalesced': 0, 'errors': 0}
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+
+    @property
+    def address(self) -> str:
+        """'host:port' string accepted by ``NewCommunication``."""
+        return f"{self.host}:{self.port}"
+
+    def get_stats(self) -> dict:
+        """Returns gateway counters.
+
+        Returns:
+            Dict with ``clients`` (connected), ``requests`` (from clients),
+            ``upstream`` (transactions on the serial link), ``cache_hits``,
+            ``coalesced`` (reads answered by another client's in-flight read)
+            and ``errors`` (exception responses sent).
+        """
+        return dict(self._stats, clients=len(self._writers))
+
+    # ------------------------------------------------------------------ asyncio
+
+    async def start_serving(self):
+        """Binds the listening socket in the running event loop."""
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(f"Modbus TCP gateway listening on {self.address}")
+
+    async def serve_forever(self):
+        """Serves clients until cancelled."""
+        if self._server is None:
+            await self.start_serving()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stops listening and closes client connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    # ------------------------------------------------------------------ background thread
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """Runs the gateway on its own event loop in a background thread; returns once listening."""
+        if self._thread is not None:
+            return
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name='ModbusTCPGateway-loop', daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._server is None:
+            self._thread = None
+            raise ConnectionError(f"Could not start Modbus TCP gateway on {self.host}:{self.port}")
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self.start_serving())
+        except OSError as e:
+            self.logger.error(f"Could not listen on {self.host}:{self.port}: {e}")
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+    def stop(self):
+        """Stops the background thread started by ``start``; the transport stays open."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------ requests
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.add(writer)
+        peer = writer.get_extra_info('peername')
+        self.logger.info(f"Gateway client {peer} connected")
+        try:
+            while True:
+                header = await reader.readexactly(modbus_pdu.MBAP_HEADER_SIZE)
+                transaction_id, unit_id, pdu_length = modbus_pdu.decode_mbap(header)
+                pdu = await reader.readexactly(pdu_length)
+                response = await self.handle_pdu(pdu)
+                writer.write(modbus_pdu.encode_mbap(transaction_id, unit_id, response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ModbusIOException):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            self.logger.info(f"Gateway client {peer} disconnected")
+
+    async def handle_pdu(self, pdu: bytes) -> bytes:
+        """Answers one request PDU, going upstream unless the cache can answer.
+
+        Args:
+            pdu: Request PDU (function code first, no MBAP header).
+
+        Returns:
+            The response PDU, an exception response on failure.
+        """
+        self._stats['requests'] += 1
+        function_code = pdu[0] if pdu else 0
+        try:
+            function_code, fields = modbus_pdu.parse_request(pdu)
+            if function_code == modbus_pdu.READ_HOLDING_REGISTERS:
+                start, count = fields
+                if not 1 <= count <= modbus_pdu.MAX_READ_COUNT:
+                    raise modbus_pdu.ModbusExceptionResponse(function_code, ILLEGAL_DATA_VALUE)
+                return modbus_pdu.build_register_response(function_code, await self._read(start, count))
+            if function_code == modbus_pdu.WRITE_SINGLE_REGISTER:
+                address, value = fields
+                if address == 0:
+                    await self._write(self.transport.send, [value], CommandType.SETUP_COMMANDS.value)
+                else:
+                    await self._write(self.transport.send, [address, value], CommandType.TARGET_COMMAND.value)
+                return modbus_pdu.build_write_response(function_code, address, value)
+            if function_code == modbus_pdu.WRITE_MULTIPLE_REGISTERS:
+                start, values = fields
+                if not 1 <= len(values) <= modbus_pdu.MAX_WRITE_COUNT:
+                    raise modbus_pdu.ModbusExceptionResponse(function_code, ILLEGAL_DATA_VALUE)
+                await self._write(self.transport.send, [start, *values], CommandType.TARGET_COMMAND.value)
+                return modbus_pdu.build_write_response(function_code, start, len(values))
+            read_start, read_count, write_start, values = fields
+            if not 1 <= read_count <= modbus_pdu.MAX_READ_COUNT or \
+                    not 1 <= len(values) <= modbus_pdu.MAX_READ_WRITE_WRITE_COUNT:
+                raise modbus_pdu.ModbusExceptionResponse(function_code, ILLEGAL_DATA_VALUE)
+            registers = await self._write(self.transport.send_receive, read_start, read_count, write_start, values)
+            return modbus_pdu.build_register_response(function_code, _as_list(registers))
+        except modbus_pdu.ModbusExceptionResponse as e:
+            exception_code = e.exception_code
+        except (ModbusIOException, ConnectionException, ConnectionError, TimeoutError) as e:
+            self.logger.warning(f"Upstream request 0x{function_code:02X} failed: {e}")
+            exception_code = GATEWAY_TARGET_FAILED
+        except Exception as e:
+            self.logger.error(f"Gateway could not serve request 0x{function_code:02X}: {e}")
+            exception_code = SERVER_DEVICE_FAILURE
+        self._stats['errors'] += 1
+        return modbus_pdu.build_exception_response(function_code, exception_code)
+
+    async def _upstream(self, call, *args):
+        """Runs one transport call on the upstream worker thread."""
+        self._stats['upstream'] += 1
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call, *args)
+
+    def _cached(self, start: int, count: int):
+        """Returns cached registers covering ``start``..``start + count``, or None."""
+        now = time.monotonic()
+        for (cached_start, cached_count), (registers, stamp) in self._cache.items():
+            if now - stamp <= self.cache_ttl and cached_start <= start and start + count <= cached_start + cached_count:
+                return registers[start - cached_start:start - cached_start + count]
+        return None
+
+    async def _read(self, start: int, count: int) -> list:
+        if self.cache_ttl > 0:
+            registers = self._cached(start, count)
+            if registers is not None:
+                self._stats['cache_hits'] += 1
+                return registers
+        key = (start, count)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            registers = _as_list(await self._upstream(self.transport.receive, [start, count]))
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here so waiters alone decide whether it is logged
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        future.set_result(registers)
+        if self.cache_ttl > 0 and generation == self._generation:
+            now = time.monotonic()
+            self._cache = {cached: entry for cached, entry in self._cache.items() if now - entry[1] <= self.cache_ttl}
+            self._cache[key] = (registers, now)
+        return registers
+
+    async def _write(self, call, *args):
+        self._invalidate()
+        try:
+            return await self._upstream(call, *args)
+        finally:
+            self._invalidate()
+
+    def _invalidate(self):
+        """Empties the read cache and detaches in-flight reads from new requests."""
+        self._generation += 1
+        self._cache.clear()
+        self._in_flight.clear()
+
+
+def _as_list(registers) -> list:
+    """Transports return a bare int for one register; responses need a list."""
+    return [registers] if isinstance(registers, int) else list(registers)
@@ -0,0 +1,229 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Synchronized control of several ARTUS hands (bimanual setups, hand arrays)."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class HandGroup:
+    """Dispatches setpoints to, and reads feedback from, several hands at once.
+
+    Calling ``set_joint_angles`` on two ``ArtusAPI_V2`` objects one after
+    the other makes the second hand lag the first by a whole bus
+    transaction. ``HandGroup`` runs each hand's call on its own worker
+    thread and releases them together, so hands on separate ports or
+    sockets transact in parallel. Hands sharing one multi-drop port
+    (``communication_method="RS485_RTU_Shared"``) are interleaved by the
+    ``RS485Bus`` round-robin schedule, which keeps them one frame apart
+    instead of one full command sequence apart.
+
+    Every group call measures the spread between the hands' completion
+    times (the inter-hand skew) and keeps running statistics, see
+    ``get_skew_stats``.
+
+    Attributes:
+        hands: Dict mapping hand name (e.g. 'left', 'right') to its
+            ``ArtusAPI_V2`` instance, in dispatch order.
+        logger: Logger used for status and error messages.
+        last_skew: Skew in seconds of the most recent group call, or None.
+    """
+
+    def __init__(self, hands: dict, logger=None):
+        """Creates the group and its worker threads.
+
+        Args:
+            hands: Dict mapping hand name to a connected ``ArtusAPI_V2``
+                (or any object with the same methods).
+            logger: Logger to use; a module-level logger is created if None.
+
+        Raises:
+            ValueError: If ``hands`` is empty.
+        """
+        if not hands:
+            raise ValueError("HandGroup needs at least one hand")
+        self.hands = dict(hands)
+
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._executor = ThreadPoolExecutor(max_workers=len(self.hands), thread_name_prefix='HandGroup')
+        self._lock = threading.Lock()
+        self._skew = {}  # kind -> (count, total, max)
+        self.last_skew = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Stops the worker threads; the hands themselves stay connected."""
+        self._executor.shutdown(wait=True)
+
+    def run(self, calls: dict, kind: str = 'command'):
+        """Runs one callable per hand concurrently and waits for all of them.
+
+        Args:
+            calls: Dict mapping hand name to a callable taking that hand's
+                API object. Hands left out are not touched.
+            kind: Statistics bucket the measured skew is recorded under.
+
+        Returns:
+            Tuple ``(results, times)``: dicts mapping hand name to the
+            callable's return value and to the ``time.time()`` at which it
+            completed.
+
+        Raises:
+            KeyError: If a name is not a hand of the group.
+            Exception: The first exception raised by a hand, re-raised
+                once every hand has finished its call.
+        """
+        for name in calls:
+            if name not in self.hands:
+                raise KeyError(f"Unknown hand {name!r}, expected one of {list(self.hands)}")
+        if not calls:
+            return {}, {}
+
+        release = threading.Event()
+
+        def timed(name, call):
+            release.wait()
+            result = call(self.hands[name])
+            return result, time.perf_counter(), time.time()
+
+        futures = {name: self._executor.submit(timed, name, call) for name, call in calls.items()}
+        release.set()
+
+        results, finished, times, error = {}, {}, {}, None
+        for name, future in futures.items():
+            try:
+                results[name], finished[name], times[name] = future.result()
+            except Exception as e:
+                self.logger.error(f"Hand {name!r} failed: {e}")
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+        self._record_skew(kind, max(finished.values()) - min(finished.values()))
+        return results, times
+
+    def _record_skew(self, kind: str, skew: float):
+        """Adds one measured skew to the statistics of ``kind``."""
+        with self._lock:
+            count, total, worst = self._skew.get(kind, (0, 0.0, 0.0))
+            self._skew[kind] = (count + 1, total + skew, max(worst, skew))
+            self.last_skew = skew
+
+    def get_skew_stats(self) -> dict:
+        """Returns the inter-hand skew statistics.
+
+        Returns:
+            Dict with ``last`` (seconds or None) and one entry per call kind
+            ('command', 'feedback', ...) holding ``count``, ``mean`` and
+            ``max`` skew in seconds.
+        """
+        with self._lock:
+            stats = {kind: {'count': count, 'mean': total / count, 'max': worst}
+                     for kind, (count, total, worst) in self._skew.items()}
+            stats['last'] = self.last_skew
+        return stats
+
+    def wake_up(self, control_type: int = 3):
+        """Wakes up every hand with the same control type."""
+        results, _ = self.run({name: lambda hand: hand.wake_up(control_type=control_type) for name in self.hands},
+                              kind='startup')
+        return results
+
+    def set_joint_angles(self, joint_angles: dict):
+        """Sends one joint-angle dict per hand, all hands at once.
+
+        Args:
+            joint_angles: Dict mapping hand name to the ``joint_angles``
+                dict for ``ArtusAPI_V2.set_joint_angles``. Hands left out
+                keep their targets.
+
+        Returns:
+            Dict mapping hand name to that hand's return value.
+        """
+        results, _ = self.run({name: (lambda hand, pose=pose: hand.set_joint_angles(pose))
+                               for name, pose in joint_angles.items()})
+        return results
+
+    def set_joint_targets(self, positions=None, velocities=None, forces=None):
+        """Sends target arrays to every hand that has one, all hands at once.
+
+        Args:
+            positions: Dict mapping hand name to a position array, or None.
+            velocities: Dict mapping hand name to a velocity array, or None.
+            forces: Dict mapping hand name to a force array, or None.
+
+        Returns:
+            Dict mapping hand name to that hand's ``set_joint_targets``
+            return value.
+        """
+        positions, velocities, forces = positions or {}, velocities or {}, forces or {}
+        names = [name for name in self.hands if name in positions or name in velocities or name in forces]
+        for name in (*positions, *velocities, *forces):
+            if name not in self.hands:
+                raise KeyError(f"Unknown hand {name!r}, expected one of {list(self.hands)}")
+        results, _ = self.run({name: (lambda hand, name=name: hand.set_joint_targets(
+            positions.get(name), velocities.get(name), forces.get(name))) for name in names})
+        return results
+
+    def get_joint_feedback_array(self, feedback_type: str = 'feedback_position_start_reg'):
+        """Reads one per-joint feedback field from every hand at once.
+
+        Args:
+            feedback_type: Per-joint feedback key, see
+                ``ArtusAPI_V2.get_joint_feedback_array``.
+
+        Returns:
+            Snapshot dict with ``timestamp`` (mean ``time.time()`` at which
+            the reads completed), ``skew`` (seconds between the first and
+            last hand's read) and ``hands`` mapping hand name to its
+            feedback array.
+        """
+        results, times = self.run({name: lambda hand: hand.get_joint_feedback_array(feedback_type) for name in self.hands},
+                                  kind='feedback')
+        return self._snapshot(results, times)
+
+    def get_hand_feedback_data(self):
+        """Reads every feedback type from every hand at once.
+
+        Returns:
+            Snapshot dict with ``timestamp``, ``skew`` and ``hands`` mapping
+            hand name to its ``ArtusAPI_V2.get_hand_feedback_data`` snapshot.
+        """
+        results, times = self.run({name: lambda hand: hand.get_hand_feedback_data() for name in self.hands},
+                                  kind='feedback')
+        return self._snapshot(results, times)
+
+    def _snapshot(self, results: dict, times: dict) -> dict:
+        """Combines per-hand feedback into one aligned snapshot."""
+        return {
+            'timestamp': sum(times.values()) / len(times),
+            'skew': self.last_skew,
+            'hands': results,
+        }
+
+    def disconnect(self):
+        """Disconnects every hand and stops the worker threads."""
+        self.run({name: lambda hand: hand.disconnect() for name in self.hands}, kind='startup')
+        self.close()
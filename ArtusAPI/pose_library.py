@@ -0,0 +1,237 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Named hand poses loaded once and precompiled into ready-to-send register frames."""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from .robot.bldc_robot.joint_state import HandJoints, JointState
+
+# frame name -> ArtusAPI_V2 control bit, as in set_joint_angles
+FRAME_CONTROL_BITS = {'position': 0b100, 'velocity': 0b10, 'force': 0b1}
+
+
+@dataclass(frozen=True)
+class CompiledPose:
+    """One pose encoded for one hand model and side.
+
+    Attributes:
+        name: Pose name.
+        target_angle: Target angle per joint, rotation direction applied
+            and clamped to the joint limits.
+        target_velocity: Target velocity per joint.
+        target_force: Target force per joint.
+        frames: Mapping of 'position', 'velocity' and 'force' to the
+            ``[start_reg, *words]`` target command, exactly as the
+            ``NewCommands`` packers build it.
+        clamped: Names of the joints whose angle was clamped to its limits.
+    """
+
+    name: str
+    target_angle: np.ndarray
+    target_velocity: np.ndarray
+    target_force: np.ndarray
+    frames: dict
+    clamped: tuple = ()
+
+
+class PoseLibrary:
+    """A set of named poses (e.g. ``data/hand_poses``), encoded once per hand.
+
+    Poses are stored in the ``data/hand_poses`` JSON format: joint name ->
+    ``{'index', 'target_angle', 'target_velocity', 'target_force'}``.
+    ``compile`` validates every pose against a hand's robot model and
+    encodes its position, velocity and force target frames; the result is
+    cached per robot type and hand side, so executing a pose afterwards
+    (``ArtusAPI_V2.execute_pose``) sends prebuilt frames without
+    rebuilding joint dicts or packing registers.
+
+    In a compiled pose, joints the pose leaves out go to their default
+    angle, and a missing velocity or force falls back to the robot's
+    ``default_velocity``/``default_force``.
+
+    Attributes:
+        angles_only: If True, velocities and forces stored in the poses are
+            ignored and every joint gets the robot defaults.
+        logger: Logger used for status and error messages.
+    """
+
+    def __init__(self, directory=None, angles_only=False, logger=None):
+        """Creates the library, optionally loading a directory of poses.
+
+        Args:
+            directory: Directory of ``*.json`` pose files, or None.
+            angles_only: Use the robot's default velocity and force instead
+                of the values stored in the poses.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        self.angles_only = angles_only
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        self._poses = {}
+        self._compiled = {}  # (robot_type, hand_type) -> (name -> CompiledPose or error message)
+        self._lock = threading.Lock()
+        if directory is not None:
+            self.load(directory)
+
+    def load(self, directory) -> list:
+        """Loads every ``*.json`` pose file of a directory, named after the file.
+
+        Args:
+            directory: Directory to scan (not recursive).
+
+        Returns:
+            Names of the poses loaded.
+        """
+        names = []
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith('.json'):
+                continue
+            with open(os.path.join(directory, file_name), 'r') as file:
+                self.add(file_name[:-len('.json')], json.load(file))
+            names.append(file_name[:-len('.json')])
+        self.logger.info(f"Loaded {len(names)} poses from {directory}")
+        return names
+
+    def add(self, name: str, pose: dict):
+        """Adds or replaces a pose and drops its compiled frames.
+
+        Args:
+            name: Pose name.
+            pose: Pose dict in the ``data/hand_poses`` format.
+        """
+        with self._lock:
+            self._poses[name] = pose
+            for compiled in self._compiled.values():
+                compiled.pop(name, None)
+
+    def names(self) -> list:
+        """Returns the pose names in load order."""
+        return list(self._poses)
+
+    def get(self, name: str) -> dict:
+        """Returns a copy of a pose dict, e.g. for ``set_joint_angles``.
+
+        Raises:
+            KeyError: If there is no pose with that name.
+        """
+        return {joint: dict(entry) for joint, entry in self._poses[name].items()}
+
+    def __contains__(self, name):
+        return name in self._poses
+
+    def __len__(self):
+        return len(self._poses)
+
+    def compile(self, api) -> dict:
+        """Validates and encodes every pose for the hand behind ``api``.
+
+        Results are cached per ``(robot_type, hand_type)``; only poses added
+        since the last call are encoded.
+
+        Args:
+            api: ``ArtusAPI_V2`` (or ``AsyncArtusAPI``) of the hand.
+
+        Returns:
+            Dict mapping pose name to its ``CompiledPose``, for the poses
+            that are valid for this hand.
+        """
+        key = (api.robot_type, api.hand_type)
+        with self._lock:
+            compiled = self._compiled.setdefault(key, {})
+            for name, pose in self._poses.items():
+                if name not in compiled:
+                    try:
+                        compiled[name] = self._compile_pose(name, pose, api)
+                    except ValueError as e:
+                        self.logger.warning(f"Pose {name!r} is not valid for {key[0]} {key[1]}: {e}")
+                        compiled[name] = str(e)
+            return {name: pose for name, pose in compiled.items() if isinstance(pose, CompiledPose)}
+
+    def compiled_pose(self, api, name: str) -> CompiledPose:
+        """Returns one pose compiled for the hand behind ``api``.
+
+        Raises:
+            KeyError: If there is no pose with that name.
+            ValueError: If the pose is not valid for this hand.
+        """
+        if name not in self._poses:
+            raise KeyError(f"Unknown pose {name!r}")
+        self.compile(api)
+        result = self._compiled[(api.robot_type, api.hand_type)][name]
+        if not isinstance(result, CompiledPose):
+            raise ValueError(f"Pose {name!r} is not valid for {api.robot_type} {api.hand_type}: {result}")
+        return result
+
+    def execute(self, api, name: str, read_feedback: bool = False):
+        """Sends a named pose to a hand, see ``ArtusAPI_V2.execute_pose``."""
+        return api.execute_pose(self.compiled_pose(api, name), read_feedback=read_feedback)
+
+    def _compile_pose(self, name: str, pose: dict, api) -> CompiledPose:
+        """Encodes one pose through a scratch ``JointState`` and the hand's command packers.
+
+        Raises:
+            ValueError: If the pose names a joint the robot does not have,
+                gives it another index, or has no target angle at all.
+        """
+        robot = api._robot_handler.robot
+        live = robot.joint_state
+        scratch = JointState(live.joint_names, live.min_angle, live.max_angle,
+                             live.rotation_direction, live.default_angle)
+        angles = scratch.default_angle.astype(np.float64)
+        velocities = np.full(len(scratch), float(robot.default_velocity))
+        forces = np.full(len(scratch), float(robot.default_force))
+
+        has_angle = False
+        for joint, entry in pose.items():
+            if joint not in scratch.index_of:
+                raise ValueError(f"unknown joint {joint!r}")
+            index = scratch.index_of[joint]
+            if entry.get('index', index) != index:
+                raise ValueError(f"{joint} has index {entry['index']}, expected {index}")
+            if entry.get('target_angle') is not None:
+                angles[index] = entry['target_angle']
+                has_angle = True
+            if self.angles_only:
+                continue
+            if entry.get('target_velocity') is not None:
+                velocities[index] = entry['target_velocity']
+            if entry.get('target_force') is not None:
+                forces[index] = entry['target_force']
+        if not has_angle:
+            raise ValueError("no target_angle given")
+
+        scratch.set_target_array('target_angle', angles)
+        scratch.set_target_array('target_velocity', velocities)
+        scratch.set_target_array('target_force', forces)
+        clamped = tuple(scratch.joint_names[i] for i in scratch.clamp_target_angles())
+        if clamped:
+            self.logger.warning(f"Pose {name!r}: {', '.join(clamped)} clamped to joint limits")
+
+        commands = api._command_handler
+        hand_joints = HandJoints(scratch)
+        frames = {
+            'position': commands.get_target_position_command(hand_joints),
+            'velocity': commands.get_target_velocity_command(hand_joints),
+            'force': commands.get_target_force_command(hand_joints),
+        }
+        return CompiledPose(name, scratch.target_angle.copy(), scratch.target_velocity.copy(),
+                            scratch.target_force.copy(), frames, clamped)
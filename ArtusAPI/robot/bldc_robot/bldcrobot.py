@@ -12,10 +12,12 @@ See the LICENSE file in the repository for full details.
 
 import logging
 
+from .joint_state import FEEDBACK_FIELDS, TARGET_FIELDS, HandJoints, JointState
+
 """Base robot model shared by all ARTUS BLDC-actuated hand variants."""
 
 class BLDCRobot:
-    """Base class defining joint layout, limits, and the ``Joint`` data model.
+    """Base class defining joint layout, limits, and the joint state model.
 
     Subclasses (ArtusTalos, ArtusLite, ArtusScorpion, ArtusDex, ...) extend
     this with force sensor configuration and velocity/force defaults.
@@ -34,8 +36,10 @@ class BLDCRobot:
         number_of_joints: Total number of joints on the hand.
         number_of_controllers: Number of actuator controllers (defaults to
             ``number_of_joints`` if not given).
-        hand_joints: Dict mapping joint name to a ``Joint`` instance.
-        Joint: Inner class used to represent a single joint's state.
+        joint_state: ``JointState`` holding targets, limits and feedback
+            of all joints as NumPy arrays.
+        hand_joints: ``HandJoints`` dict mapping joint name to a
+            ``JointView`` of ``joint_state``, for per-joint attribute access.
     """
     def __init__(self,
                 joint_max_angles=[55,90,90,90,90,90],
@@ -87,42 +91,6 @@ class BLDCRobot:
         else:
             self.number_of_controllers = number_of_controllers
 
-        class Joint:
-            """Mutable state container for a single joint's targets and feedback."""
-            def __init__(self, index, min_angle, max_angle, default_angle, target_angle, target_force, temperature, joint_rotation_direction):
-                """Initializes a joint's limits, targets, and feedback fields.
-
-                Args:
-                    index: Zero-based joint index, matching Modbus ordering.
-                    min_angle: Minimum allowed target angle (or stroke).
-                    max_angle: Maximum allowed target angle (or stroke).
-                    default_angle: Default (home) angle.
-                    target_angle: Initial target angle.
-                    target_force: Initial target force.
-                    temperature: Initial feedback temperature value.
-                    joint_rotation_direction: +1/-1 multiplier applied to
-                        target angles.
-                """
-                self.index = index
-                self.min_angle = min_angle
-                self.max_angle = max_angle
-                self.default_angle = default_angle
-                self.target_angle = target_angle
-                self.target_force = target_force
-                self.target_velocity = None
-                self.feedback_angle = 0
-                self.feedback_current = 0
-                self.feedback_velocity = 0
-                self.feedback_force = 0.0
-                self.feedback_temperature = temperature
-                self.joint_rotation_direction = joint_rotation_direction
-
-            def __str__(self):
-                """Returns a short human-readable summary of index and target angle."""
-                return "Index: " + str(self.index)+"Target Angle: " +str(self.target_angle)
-
-        self.Joint = Joint
-
         self._create_hand()
 
     def _create_hand(self):
@@ -133,28 +101,77 @@ class BLDCRobot:
         ``joint_rotation_directions``, ``joint_forces``) after populating
         ``hand_joints``.
         """
-        self.hand_joints = {}
-        for joint_index,joint_name in enumerate(self.joint_names):
-            self.hand_joints[joint_name] = self.Joint(index=joint_index,
-                                                      min_angle=self.joint_min_angles[joint_index],
-                                                      max_angle=self.joint_max_angles[joint_index],
-                                                      default_angle=0,
-                                                      target_angle=0,
-                                                      target_force=0,
-                                                      temperature=0,
-                                                      joint_rotation_direction=self.joint_rotation_directions[joint_index])
+        self.joint_state = JointState(joint_names=self.joint_names,
+                                      min_angles=self.joint_min_angles,
+                                      max_angles=self.joint_max_angles,
+                                      rotation_directions=self.joint_rotation_directions)
+        self.hand_joints = HandJoints(self.joint_state)
 
         # free up mem
         del self.joint_max_angles, self.joint_min_angles, self.joint_default_angles, self.joint_rotation_directions, self.joint_forces
-        
 
+    def _apply_targets(self, indexed_targets) -> int:
+        """Writes targets into ``joint_state`` and clamps the angles.
+
+        Args:
+            indexed_targets: Iterable of ``(joint_index, target_data)`` pairs,
+                ``target_data`` holding any of ``target_angle``,
+                ``target_velocity``, ``target_force``. Later pairs win for
+                repeated indices.
+
+        Returns:
+            Bitmask of which control types were set (see ``set_joint_angles``).
+        """
+        updates = {field: ([], []) for field in TARGET_FIELDS}
+        for index, target_data in indexed_targets:
+            for field, (indices, values) in updates.items():
+                if field in target_data:
+                    indices.append(index)
+                    values.append(target_data[field])
+
+        available_control = 0
+        for bit, (field, (indices, values)) in zip((0b100, 0b10, 0b1), updates.items()):
+            if indices:
+                available_control |= bit
+                self.joint_state.set_targets(field, indices, values)
+                self.logger.debug(f"Setting {field} for {[self.joint_names[i] for i in indices]} to {values}")
+        self._check_joint_limits(self.hand_joints)
+        return available_control
+
+    def set_joint_targets(self, positions=None, velocities=None, forces=None) -> int:
+        """Sets target angle/velocity/force on every joint from ordered arrays.
+
+        Array counterpart of ``set_joint_angles``: each given array holds one
+        value per joint in index order and is written straight into
+        ``joint_state`` without building per-joint dicts. Rotation direction
+        and joint limits are applied as for the dict setters.
+
+        Args:
+            positions: Target angles, or None to leave them unchanged.
+            velocities: Target velocities, or None to leave them unchanged.
+            forces: Target forces, or None to leave them unchanged.
+
+        Returns:
+            Bitmask of which control types were set (see ``set_joint_angles``).
+
+        Raises:
+            ValueError: If an array does not hold one value per joint.
+        """
+        available_control = 0
+        for bit, field, values in zip((0b100, 0b10, 0b1), TARGET_FIELDS, (positions, velocities, forces)):
+            if values is not None:
+                self.joint_state.set_target_array(field, values)
+                available_control |= bit
+        if available_control & 0b100:
+            self._check_joint_limits(self.hand_joints)
+        return available_control
 
     def set_joint_angles(self, joint_angles:dict):
         """Sets target angle/velocity/force on joints, addressed by index.
 
-        Sorts the input by joint index (skipping the sort for a single-item
-        dict), applies each joint's rotation direction to target_angle, and
-        clamps the results to the configured joint limits.
+        Writes straight into ``joint_state`` by index (no sorting needed),
+        applies each joint's rotation direction to target_angle, and clamps
+        the results to the configured joint limits in one vectorized pass.
 
         Args:
             joint_angles: Dict keyed by arbitrary key, each value a dict
@@ -167,37 +184,13 @@ class BLDCRobot:
             target_angle, bit 1 (0b10) for target_velocity, bit 0 (0b1) for
             target_force.
         """
-        # verify that items are in order of index
-        available_control = 0
-        # INSERT_YOUR_CODE
-        if len(joint_angles) == 1:
-            sorted_items = joint_angles.items()
-        else:
-            sorted_items = sorted(joint_angles.items(), key=lambda x: x[1]['index'])
-        # sorted_items = sorted(joint_angles.items(), key=lambda x:x[1]['index'])
-        ordered_joint_angles = {key:value for key,value in sorted_items}
-        # set values based on index
-        for name,target_data in ordered_joint_angles.items():
+        indexed_targets = []
+        for target_data in joint_angles.values():
             if target_data['index'] >= self.number_of_joints: # if trying to give more than the available joints, skip
                 self.logger.debug(f"Trying to set joint {target_data['index']} which is greater than the available joints ({self.number_of_joints})")
                 continue
-
-            # fill data based on control type
-            if 'target_angle' in target_data:
-                available_control |= 0b100
-                self.hand_joints[self.joint_names[target_data['index']]].target_angle = target_data['target_angle'] * self.hand_joints[self.joint_names[target_data['index']]].joint_rotation_direction
-                self.logger.debug(f"Setting target angle for {self.joint_names[target_data['index']]} to {target_data['target_angle']}")
-            if 'target_velocity' in target_data:
-                available_control |= 0b10
-                self.hand_joints[self.joint_names[target_data['index']]].target_velocity = target_data['target_velocity']
-                self.logger.debug(f"Setting target velocity for {self.joint_names[target_data['index']]} to {target_data['target_velocity']}")
-            if 'target_force' in target_data:
-                available_control |= 0b1
-                self.hand_joints[self.joint_names[target_data['index']]].target_force = target_data['target_force']
-                self.logger.debug(f"Setting target force for {self.joint_names[target_data['index']]} to {target_data['target_force']}")
-        self._check_joint_limits(self.hand_joints)
-
-        return available_control
+            indexed_targets.append((target_data['index'], target_data))
+        return self._apply_targets(indexed_targets)
 
     def set_joint_angles_by_name(self, joint_angles:dict):
         """Sets target angle/velocity/force on joints, addressed by name.
@@ -216,54 +209,32 @@ class BLDCRobot:
             target_angle, bit 1 (0b10) for target_velocity, bit 0 (0b1) for
             target_force.
         """
-        available_control = 0
-        # set values based on names
+        indexed_targets = []
+        index_of = self.joint_state.index_of
         for name,target_data in joint_angles.items():
-            if name not in self.joint_names: # if trying to give more than the available joints, skip
-                self.logger.debug(f"Trying to set joint {target_data['index']} which is greater than the available joints ({self.number_of_joints})")
+            if name not in index_of: # if trying to give more than the available joints, skip
+                self.logger.debug(f"Trying to set joint {name} which is not one of {self.joint_names}")
                 continue
-
-
-            # fill data based on control type
-            if 'target_angle' in target_data:
-                available_control |= 0b100
-                self.hand_joints[name].target_angle = target_data['target_angle'] * self.hand_joints[name].joint_rotation_direction
-                self.logger.debug(f"Setting target angle for {name} to {target_data['target_angle']}")
-            if 'target_velocity' in target_data:
-                available_control |= 0b10
-                self.hand_joints[name].target_velocity = target_data['target_velocity']
-                self.logger.debug(f"Setting target velocity for {name} to {target_data['target_velocity']}")
-            if 'target_force' in target_data:
-                available_control |= 0b1
-                self.hand_joints[name].target_force = target_data['target_force']
-                self.logger.debug(f"Setting target force for {name} to {target_data['target_force']}")
-
-        self._check_joint_limits(self.hand_joints)
-
-        return available_control
+            indexed_targets.append((index_of[name], target_data))
+        return self._apply_targets(indexed_targets)
 
 
     def _check_joint_limits(self, joint_angles):
-        """Clamps each joint's target_angle to its configured min/max limits.
+        """Clamps every joint's target_angle to its configured min/max limits.
+
+        Operates on ``joint_state`` in one vectorized pass and logs a single
+        warning naming the clamped joints.
 
         Args:
-            joint_angles: Dict mapping joint name to ``Joint`` instance
-                (typically ``self.hand_joints``); mutated in place. Note the
-                lookup for limits is keyed against ``self.hand_joints``
-                regardless of the ``joint_angles`` argument passed in.
+            joint_angles: Kept for API compatibility; the limits are always
+                applied to ``self.hand_joints`` / ``self.joint_state``.
 
         Returns:
-            The same ``joint_angles`` dict, with target_angle clamped.
+            The same ``joint_angles`` argument.
         """
-        for name,joint in self.hand_joints.items():
-            if joint_angles[name].target_angle > joint.max_angle:
-                joint_angles[name].target_angle = joint.max_angle
-                self.logger.warning(f"Joint {name} target angle is greater than the max angle, setting to {joint.max_angle}")
-                # TODO logging
-            if joint_angles[name].target_angle < joint.min_angle:
-                joint_angles[name].target_angle = joint.min_angle
-                self.logger.warning(f"Joint {name} target angle is less than the min angle, setting to {joint.min_angle}")
-                # TODO logging
+        clamped = self.joint_state.clamp_target_angles()
+        if clamped.size:
+            self.logger.warning(f"Joint target angles outside their limits were clamped: {[self.joint_names[i] for i in clamped]}")
         return joint_angles
 
     def _check_joint_forces(self, joint_angles):
@@ -312,8 +283,8 @@ class BLDCRobot:
         Args:
             feedback_package: Decoded feedback values. For
                 ``feedback_force_sensor_start_reg`` this is a flat list of
-                x/y/z triples per force sensor; otherwise it is indexed per
-                joint via ``joint_data.index``.
+                x/y/z triples per force sensor; otherwise one value per
+                joint in index order, stored into ``joint_state``.
             modbus_key: Which feedback field to populate -- one of
                 'feedback_position_start_reg', 'feedback_force_start_reg',
                 'feedback_temperature_start_reg',
@@ -336,17 +307,8 @@ class BLDCRobot:
                     value['data'].y = feedback_package[i+1]
                     value['data'].z = feedback_package[i+2]
                     i+=3
-            else:
-                # normal loop through joint data and populate feedback fields
-                for name,joint_data in self.hand_joints.items():
-                    if modbus_key == 'feedback_position_start_reg':
-                        joint_data.feedback_angle = feedback_package[joint_data.index]
-                    elif modbus_key == 'feedback_force_start_reg':
-                        joint_data.feedback_force = feedback_package[joint_data.index]
-                    elif modbus_key == 'feedback_temperature_start_reg':
-                        joint_data.feedback_temperature = feedback_package[joint_data.index]
-                    elif modbus_key == 'feedback_velocity_start_reg':
-                        joint_data.feedback_velocity = feedback_package[joint_data.index]
+            elif modbus_key in FEEDBACK_FIELDS:
+                self.joint_state.set_feedback(modbus_key, feedback_package)
 
             # return feedback package no matter what -- ability to read control registers too
             return feedback_package
@@ -0,0 +1,216 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Structure-of-arrays joint state backing ``BLDCRobot.hand_joints``."""
+
+from types import MappingProxyType
+
+import numpy as np
+
+# feedback register key -> JointState array holding that feedback
+FEEDBACK_FIELDS = MappingProxyType({
+    'feedback_position_start_reg': 'feedback_angle',
+    'feedback_force_start_reg': 'feedback_force',
+    'feedback_velocity_start_reg': 'feedback_velocity',
+    'feedback_temperature_start_reg': 'feedback_temperature',
+})
+
+TARGET_FIELDS = ('target_angle', 'target_velocity', 'target_force')
+
+
+class JointState:
+    """Per-hand joint targets, limits and feedback stored as one NumPy array per field.
+
+    Row ``i`` of every array belongs to the joint at Modbus index ``i``.
+    Targets that have not been set are NaN (exposed as None through
+    ``JointView``). Limits keep the dtype of the robot's configuration
+    lists; targets and feedback are float64.
+
+    Attributes:
+        joint_names: Joint names in index order.
+        index_of: Read-only mapping of joint name to index.
+        min_angle: Minimum target angle per joint.
+        max_angle: Maximum target angle per joint.
+        default_angle: Home angle per joint.
+        rotation_direction: +1/-1 multiplier applied to target angles.
+        target_angle: Target angle per joint, rotation direction applied.
+        target_velocity: Target velocity per joint (NaN until set).
+        target_force: Target force per joint.
+        feedback_angle: Last position feedback per joint.
+        feedback_current: Last current feedback per joint.
+        feedback_velocity: Last velocity feedback per joint.
+        feedback_force: Last force feedback per joint.
+        feedback_temperature: Last temperature feedback per joint.
+    """
+
+    def __init__(self, joint_names, min_angles, max_angles, rotation_directions, default_angles=None):
+        """Allocates the arrays for a hand.
+
+        Args:
+            joint_names: Joint names in Modbus index order.
+            min_angles: Minimum angle per joint.
+            max_angles: Maximum angle per joint.
+            rotation_directions: +1/-1 multiplier per joint.
+            default_angles: Home angle per joint; zeros if None.
+        """
+        n = len(joint_names)
+        self.joint_names = tuple(joint_names)
+        self.index_of = MappingProxyType({name: index for index, name in enumerate(self.joint_names)})
+        self.min_angle = np.asarray(min_angles[:n])
+        self.max_angle = np.asarray(max_angles[:n])
+        self.rotation_direction = np.asarray(rotation_directions[:n])
+        self.default_angle = np.zeros(n) if default_angles is None else np.asarray(default_angles[:n])
+
+        self.target_angle = np.zeros(n)
+        self.target_velocity = np.full(n, np.nan)
+        self.target_force = np.zeros(n)
+
+        self.feedback_angle = np.zeros(n)
+        self.feedback_current = np.zeros(n)
+        self.feedback_velocity = np.zeros(n)
+        self.feedback_force = np.zeros(n)
+        self.feedback_temperature = np.zeros(n)
+
+    def __len__(self):
+        return len(self.joint_names)
+
+    def set_targets(self, field: str, indices, values):
+        """Writes one target field for a set of joints.
+
+        Target angles get the joints' rotation direction applied.
+
+        Args:
+            field: One of ``TARGET_FIELDS``.
+            indices: Joint indices to write.
+            values: One value per index; None clears the target.
+        """
+        values = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        indices = np.asarray(indices, dtype=np.intp)
+        if field == 'target_angle':
+            values = values * self.rotation_direction[indices]
+        getattr(self, field)[indices] = values
+
+    def set_target_array(self, field: str, values):
+        """Overwrites one target field for every joint from an ordered array.
+
+        Vectorized counterpart of ``set_targets`` for callers that already
+        hold one value per joint; target angles get the rotation direction
+        applied. NaN entries leave the joint's target unset.
+
+        Args:
+            field: One of ``TARGET_FIELDS``.
+            values: Array-like of one number per joint, in index order.
+
+        Raises:
+            ValueError: If ``values`` does not hold exactly one value per joint.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != (len(self.joint_names),):
+            raise ValueError(f"{field}: expected {len(self.joint_names)} values, got shape {values.shape}")
+        target = getattr(self, field)
+        if field == 'target_angle':
+            np.multiply(values, self.rotation_direction, out=target)
+        else:
+            target[:] = values
+
+    def clamp_target_angles(self) -> np.ndarray:
+        """Clamps every target angle to its joint limits in place.
+
+        Returns:
+            Indices of the joints whose target was clamped.
+        """
+        with np.errstate(invalid='ignore'):
+            outside = (self.target_angle > self.max_angle) | (self.target_angle < self.min_angle)
+        if outside.any():
+            np.clip(self.target_angle, self.min_angle, self.max_angle, out=self.target_angle)
+        return np.flatnonzero(outside)
+
+    def set_feedback(self, modbus_key: str, values):
+        """Stores one decoded feedback block.
+
+        Args:
+            modbus_key: Feedback register key, see ``FEEDBACK_FIELDS``.
+            values: Decoded values in joint order; extra trailing values
+                are ignored.
+
+        Raises:
+            IndexError: If fewer values than joints were given.
+            KeyError: If ``modbus_key`` is not a per-joint feedback field.
+        """
+        n = len(self.joint_names)
+        if len(values) < n:
+            raise IndexError(f"{modbus_key}: expected {n} values, got {len(values)}")
+        getattr(self, FEEDBACK_FIELDS[modbus_key])[:] = values[:n]
+
+    def targets_or_zero(self, field: str) -> np.ndarray:
+        """Returns a copy of a target array with unset (NaN) entries as 0."""
+        return np.nan_to_num(getattr(self, field), nan=0.0)
+
+
+def _array_property(field: str, optional: bool = False):
+    """Builds a property reading/writing row ``self.index`` of a ``JointState`` array."""
+    def getter(self):
+        value = getattr(self._state, field)[self.index].item()
+        if optional and value != value:  # NaN marks an unset target
+            return None
+        return value
+
+    def setter(self, value):
+        getattr(self._state, field)[self.index] = np.nan if value is None else value
+
+    return property(getter, setter, doc=f"``JointState.{field}`` of this joint.")
+
+
+class JointView:
+    """One joint of a ``JointState``, with the attribute API of the former ``Joint`` objects.
+
+    Reads and writes go straight to the shared arrays, so vectorized
+    updates and attribute access always agree.
+
+    Attributes:
+        index: Zero-based joint index, matching Modbus ordering.
+    """
+
+    def __init__(self, state: JointState, index: int):
+        """Binds the view to row ``index`` of ``state``."""
+        self._state = state
+        self.index = index
+
+    min_angle = _array_property('min_angle')
+    max_angle = _array_property('max_angle')
+    default_angle = _array_property('default_angle')
+    joint_rotation_direction = _array_property('rotation_direction')
+    target_angle = _array_property('target_angle', optional=True)
+    target_velocity = _array_property('target_velocity', optional=True)
+    target_force = _array_property('target_force', optional=True)
+    feedback_angle = _array_property('feedback_angle')
+    feedback_current = _array_property('feedback_current')
+    feedback_velocity = _array_property('feedback_velocity')
+    feedback_force = _array_property('feedback_force')
+    feedback_temperature = _array_property('feedback_temperature')
+
+    def __str__(self):
+        """Returns a short human-readable summary of index and target angle."""
+        return "Index: " + str(self.index)+"Target Angle: " +str(self.target_angle)
+
+
+class HandJoints(dict):
+    """``hand_joints`` mapping of joint name to ``JointView``, carrying the backing ``state``.
+
+    Attributes:
+        state: The ``JointState`` all views share.
+    """
+
+    def __init__(self, state: JointState):
+        """Creates one view per joint, in index order."""
+        super().__init__((name, JointView(state, index)) for index, name in enumerate(state.joint_names))
+        self.state = state
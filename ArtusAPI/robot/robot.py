@@ -120,6 +120,19 @@ class Robot:
         else:
             return self.robot.set_joint_angles(joint_angles)
 
+    def set_joint_targets(self, positions=None, velocities=None, forces=None):
+        """Sets the joint targets of the hand from ordered arrays.
+
+        Args:
+            positions: Target angle per joint in index order, or None.
+            velocities: Target velocity per joint in index order, or None.
+            forces: Target force per joint in index order, or None.
+
+        Returns:
+            Bitmask of available control types that were set (see
+            ``BLDCRobot.set_joint_targets``).
+        """
+        return self.robot.set_joint_targets(positions, velocities, forces)
 
     def set_home_position(self):
         """Moves the hand to its home position.
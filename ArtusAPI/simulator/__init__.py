@@ -0,0 +1,5 @@
+"""Hardware-free ARTUS hand simulator and the Modbus TCP / RTU servers that expose it."""
+from .hand_simulator import HandSimulator
+from .servers import ModbusTCPSimulatorServer, RTUSimulatorServer
+
+__all__ = ["HandSimulator", "ModbusTCPSimulatorServer", "RTUSimulatorServer"]
@@ -0,0 +1,55 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Runs a simulated hand: ``python -m ArtusAPI.simulator --robot-type artus_lite --tcp-port 5020``."""
+
+import argparse
+import logging
+import time
+
+from .hand_simulator import HandSimulator
+from .servers import ModbusTCPSimulatorServer, RTUSimulatorServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated ARTUS hand (Modbus TCP and/or RTU over a pty)")
+    parser.add_argument("--robot-type", default="artus_lite")
+    parser.add_argument("--hand-type", default="left")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--tcp-port", type=int, default=5020, help="Modbus TCP port; -1 disables TCP")
+    parser.add_argument("--rtu", action="store_true", help="also serve Modbus RTU on a pseudo-terminal")
+    parser.add_argument("--latency", type=float, default=0.0, help="fixed response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="max extra random response delay in seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = HandSimulator(robot_type=args.robot_type, hand_type=args.hand_type)
+    servers = []
+    if args.tcp_port >= 0:
+        servers.append(ModbusTCPSimulatorServer(simulator, host=args.host, port=args.tcp_port,
+                                                latency=args.latency, jitter=args.jitter))
+    if args.rtu:
+        servers.append(RTUSimulatorServer(simulator, latency=args.latency, jitter=args.jitter))
+    for server in servers:
+        server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
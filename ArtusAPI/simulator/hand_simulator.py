@@ -0,0 +1,378 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+import logging
+import math
+import struct
+import threading
+import time
+
+from ..common.ModbusMap import ModbusMap,ActuatorState,TrajectoryReturn
+from ..common.SlaveIDMap import expected_slave_id
+from ..communication import modbus_pdu
+from ..robot import Robot
+
+# command opcodes, low byte of a write to the command register (see NewCommands.commands)
+START_COMMAND = 0x0B
+CALIBRATE_COMMAND = 0x0D
+SLEEP_COMMAND = 0x0F
+FIRMWARE_UPDATE_COMMAND = 0x11
+RESET_COMMAND = 0x13
+SOFT_RESET_COMMAND = 0x35
+UPDATE_CONFIG_COMMAND = 0x44
+CLEAR_ERRORS_COMMAND = 0x1A
+
+POSITION_CONTROL = 3
+VELOCITY_CONTROL = 2
+TORQUE_CONTROL = 1
+
+
+def _float_to_words(value: float) -> tuple:
+    """Splits a float into the (low word, high word) pair the firmware reports."""
+    return struct.unpack('<HH', struct.pack('<f', value))
+
+
+def _pack_int8_pairs(values) -> list:
+    """Packs signed 8-bit samples two per register, first sample in the high byte."""
+    samples = [max(-128, min(127, int(round(v)))) & 0xFF for v in values]
+    if len(samples) % 2:
+        samples.append(0)
+    return [(samples[i] << 8) | samples[i + 1] for i in range(0, len(samples), 2)]
+
+
+class HandSimulator:
+    """In-process emulation of an ARTUS hand's Modbus register bank.
+
+    Implements the register layout from ``ModbusMap``, the command-register
+    state machine (start, sleep, calibrate, reset, clear errors, firmware
+    and onboard config flows), the ``ActuatorState``/``TrajectoryReturn``
+    status register and simple first-order joint dynamics, so the API can
+    be exercised and benchmarked without hardware. Serve it with
+    ``ModbusTCPSimulatorServer`` or ``RTUSimulatorServer``, or call
+    ``handle_pdu`` directly.
+
+    All state is updated lazily from ``clock`` whenever registers are
+    accessed; every public method is thread-safe.
+
+    Attributes:
+        robot_type: Simulated robot variant.
+        hand_type: Simulated hand side.
+        num_joints: Number of joints of the robot variant.
+        num_force_sensors: Number of fingertip force sensors.
+        slave_address: Modbus slave address the hand answers to.
+        state: Current ActuatorState value.
+        control_type: Control mode set by the last start command.
+        position: Simulated joint positions.
+        velocity: Simulated joint velocities.
+        force: Simulated joint forces.
+        error_reports: Per-joint uint32 error bitfields.
+        fingertip_forces: Flat list of x/y/z forces per fingertip sensor.
+        firmware_image: Bytes received through the firmware flow.
+        config: Strings received through the onboard config flow, keyed by
+            config type (1 WiFi SSID, 2 WiFi password).
+        stats: Counters of handled requests per function code.
+    """
+
+    REGISTER_COUNT = 1024
+
+    def __init__(self, robot_type='artus_lite', hand_type='left', time_constant=0.05,
+                 transition_time=0.05, calibration_time=0.5, flash_time=0.02,
+                 ambient_temperature=30, voltage=24.0, ip_address='192.168.4.2',
+                 logger=None, clock=time.monotonic):
+        """Initializes the register bank for a robot variant.
+
+        Args:
+            robot_type: Robot variant to simulate (e.g. 'artus_lite').
+            hand_type: Hand side to simulate, 'left' or 'right'.
+            time_constant: First-order time constant of the joints, in seconds.
+            transition_time: Time the hand reports ACTUATOR_BUSY/RESET after
+                a start or reset command, in seconds.
+            calibration_time: Duration of a calibration, in seconds.
+            flash_time: Time to acknowledge a firmware chunk, in seconds.
+            ambient_temperature: Reported joint and average temperature.
+            voltage: Reported supply voltage.
+            ip_address: IP reported after an onboard WiFi config write.
+            logger: Logger to use; a module-level logger is created if None.
+            clock: Monotonic time source in seconds; injectable for tests.
+        """
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+        robot = Robot(robot_type=robot_type, hand_type=hand_type, logger=self.logger).robot
+        self.robot_type = robot_type
+        self.hand_type = hand_type
+        self.num_joints = len(robot.hand_joints)
+        self.num_force_sensors = len(robot.force_sensors) if robot.force_sensors else 0
+        self.slave_address = expected_slave_id(robot_type, hand_type)
+
+        self.time_constant = time_constant
+        self.transition_time = transition_time
+        self.calibration_time = calibration_time
+        self.flash_time = flash_time
+        self.ambient_temperature = ambient_temperature
+        self.voltage = voltage
+        self.ip_address = ip_address
+        self._clock = clock
+        self._reg = ModbusMap().modbus_reg_map
+        self._lock = threading.RLock()
+
+        self.registers = [0] * self.REGISTER_COUNT
+        self.state = ActuatorState.ACTUATOR_IDLE.value
+        self.control_type = POSITION_CONTROL
+        self.position = [0.0] * self.num_joints
+        self.velocity = [0.0] * self.num_joints
+        self.force = [0.0] * self.num_joints
+        self.error_reports = [0] * self.num_joints
+        self.fingertip_forces = [0.0] * (3 * self.num_force_sensors)
+        self.firmware_image = bytearray()
+        self.config = {}
+        self.stats = {}
+
+        self._target_position = [0.0] * self.num_joints
+        self._target_velocity = [0] * self.num_joints
+        self._target_force = [0.0] * self.num_joints
+        self._pending_state = None  # (due time, ActuatorState value)
+        self._config_type = None
+        self._last_step = clock()
+        self._refresh_feedback()
+
+    # ------------------------------------------------------------------ requests
+
+    def handle_pdu(self, pdu: bytes) -> bytes:
+        """Serves one Modbus request PDU.
+
+        Args:
+            pdu: Request PDU (function code first, no MBAP/CRC).
+
+        Returns:
+            The response PDU, an exception response for unsupported
+            functions, malformed requests or out-of-range addresses.
+        """
+        try:
+            function_code, fields = modbus_pdu.parse_request(pdu)
+            with self._lock:
+                self.stats[function_code] = self.stats.get(function_code, 0) + 1
+                if function_code == modbus_pdu.READ_HOLDING_REGISTERS:
+                    return modbus_pdu.build_register_response(function_code, self.read_registers(*fields))
+                if function_code == modbus_pdu.WRITE_SINGLE_REGISTER:
+                    address, value = fields
+                    self.write_registers(address, [value], single=True)
+                    return modbus_pdu.build_write_response(function_code, address, value)
+                if function_code == modbus_pdu.WRITE_MULTIPLE_REGISTERS:
+                    start, values = fields
+                    self.write_registers(start, values)
+                    return modbus_pdu.build_write_response(function_code, start, len(values))
+                read_start, read_count, write_start, values = fields
+                self.write_registers(write_start, values)
+                return modbus_pdu.build_register_response(function_code, self.read_registers(read_start, read_count))
+        except modbus_pdu.ModbusExceptionResponse as e:
+            return modbus_pdu.build_exception_response(e.function_code, e.exception_code)
+        except IndexError:
+            return modbus_pdu.build_exception_response(pdu[0], 0x02)
+
+    def read_registers(self, start: int, count: int) -> list:
+        """Returns ``count`` registers from ``start`` after advancing the simulation.
+
+        Raises:
+            IndexError: If the range leaves the register bank.
+        """
+        if start < 0 or count < 1 or start + count > self.REGISTER_COUNT:
+            raise IndexError(f"Registers {start}..{start + count - 1} out of range")
+        with self._lock:
+            self.step()
+            return self.registers[start:start + count]
+
+    def write_registers(self, start: int, values: list, single: bool = False):
+        """Applies a register write, as FC 0x06 (``single``) or FC 0x10/0x17.
+
+        Writes to register 0 are commands: a single-register write carries
+        the opcode in the low byte and its argument in the high byte, a
+        multi-register write carries firmware or config payloads.
+
+        Raises:
+            IndexError: If the range leaves the register bank.
+        """
+        if start < 0 or not values or start + len(values) > self.REGISTER_COUNT:
+            raise IndexError(f"Registers {start}..{start + len(values) - 1} out of range")
+        with self._lock:
+            self.step()
+            values = [int(v) & 0xFFFF for v in values]
+            if start == self._reg['command_register']:
+                if single:
+                    self._handle_command(values[0] & 0xFF, values[0] >> 8)
+                else:
+                    self._handle_payload(values)
+                return
+            self.registers[start:start + len(values)] = values
+            self._decode_targets()
+
+    def set_fingertip_forces(self, forces: list):
+        """Sets the x/y/z forces reported by the fingertip sensors (flat list)."""
+        with self._lock:
+            self.fingertip_forces = [float(f) for f in forces][:3 * self.num_force_sensors]
+            self._refresh_feedback()
+
+    def inject_error(self, joint_index: int, error_bits: int):
+        """Latches an actuator error on a joint and enters ACTUATOR_ERROR."""
+        with self._lock:
+            self.error_reports[joint_index] |= error_bits
+            self.state = ActuatorState.ACTUATOR_ERROR.value
+            self._pending_state = None
+            self._refresh_feedback()
+
+    # ------------------------------------------------------------------ state machine
+
+    def _transition(self, state: ActuatorState, then: ActuatorState, delay: float):
+        """Enters ``state`` now and ``then`` after ``delay`` seconds."""
+        self.state = state.value
+        self._pending_state = (self._clock() + delay, then.value)
+
+    def _handle_command(self, opcode: int, argument: int):
+        """Runs the command-register state machine for one opcode."""
+        State = ActuatorState
+        if opcode == START_COMMAND:
+            self.control_type = argument or POSITION_CONTROL
+            self._target_position = list(self.position)
+            self._transition(State.ACTUATOR_BUSY, State.ACTUATOR_ACTIVE, self.transition_time)
+        elif opcode == SLEEP_COMMAND:
+            self.state = State.ACTUATOR_SLEEP.value
+            self._pending_state = None
+        elif opcode == CALIBRATE_COMMAND:
+            self._transition(State.ACTUATOR_CALIBRATING_STROKE, State.ACTUATOR_IDLE, self.calibration_time)
+            self.position = [0.0] * self.num_joints
+            self._target_position = [0.0] * self.num_joints
+        elif opcode in (RESET_COMMAND, SOFT_RESET_COMMAND):
+            self._transition(State.ACTUATOR_RESET, State.ACTUATOR_IDLE, self.transition_time)
+        elif opcode == CLEAR_ERRORS_COMMAND:
+            # firmware consumes this only in ERROR (recovery) or IDLE (no-op)
+            if self.state == State.ACTUATOR_ERROR.value:
+                self.error_reports = [0] * self.num_joints
+                self.state = State.ACTUATOR_IDLE.value
+        elif opcode == FIRMWARE_UPDATE_COMMAND:
+            self.firmware_image = bytearray()
+            self._transition(State.ACTUATOR_FLASHING, State.ACTUATOR_FLASHING_ACK, self.flash_time)
+        elif opcode == UPDATE_CONFIG_COMMAND:
+            self._config_type = argument
+            self.state = State.ACTUATOR_CONFIG.value
+            self._pending_state = None
+        else:
+            self.logger.debug(f"Simulator ignoring command 0x{opcode:02X}")
+        self._refresh_feedback()
+
+    def _handle_payload(self, values: list):
+        """Consumes a multi-register write to register 0 (firmware or config data)."""
+        State = ActuatorState
+        if self.state == State.ACTUATOR_CONFIG.value:
+            length, payload = values[0], values[1:]
+            raw = b"".join(struct.pack('>H', v) for v in payload)[:length]
+            self.config[self._config_type] = raw.decode('utf-8', errors='replace')
+            self.state = State.ACTUATOR_CONFIG_FINISH.value
+        elif self.state in (State.ACTUATOR_FLASHING.value, State.ACTUATOR_FLASHING_ACK.value):
+            if values == [0, 0]:
+                # end of image: "flash" it, then come back idle
+                self._transition(State.ACTUATOR_FLASHING, State.ACTUATOR_IDLE, self.flash_time)
+            else:
+                self.firmware_image += b"".join(struct.pack('>H', v) for v in values[1:])
+                self._transition(State.ACTUATOR_FLASHING, State.ACTUATOR_FLASHING_ACK, self.flash_time)
+        else:
+            self._handle_command(values[0] & 0xFF, values[1] if len(values) > 1 else 0)
+        self._refresh_feedback()
+
+    # ------------------------------------------------------------------ dynamics
+
+    def _decode_targets(self):
+        """Re-reads the target blocks of the register bank into joint targets."""
+        n = self.num_joints
+        position_regs = self.registers[self._reg['target_position_start_reg']:][:math.ceil(n / 2)]
+        samples = []
+        for word in position_regs:
+            for byte in ((word >> 8) & 0xFF, word & 0xFF):
+                samples.append(byte - 256 if byte > 127 else byte)
+        self._target_position = [float(v) for v in samples[:n]]
+
+        velocity_regs = self.registers[self._reg['target_velocity_start_reg']:][:n]
+        self._target_velocity = [v - 0x10000 if v > 0x7FFF else v for v in velocity_regs]
+
+        force_regs = self.registers[self._reg['target_force_start_reg']:][:2 * n]
+        # targets are sent high word first (see NewCommands.get_target_force_command)
+        self._target_force = [struct.unpack('<f', struct.pack('<HH', force_regs[i + 1], force_regs[i]))[0]
+                              for i in range(0, 2 * n, 2)]
+
+    def step(self, now: float = None):
+        """Advances state transitions and joint dynamics to ``now``."""
+        with self._lock:
+            now = self._clock() if now is None else now
+            dt = max(0.0, now - self._last_step)
+            self._last_step = now
+            if self._pending_state is not None and now >= self._pending_state[0]:
+                self.state = self._pending_state[1]
+                self._pending_state = None
+            if self.state == ActuatorState.ACTUATOR_ACTIVE.value and dt > 0:
+                self._integrate(dt)
+            else:
+                self.velocity = [0.0] * self.num_joints
+            self._refresh_feedback()
+
+    def _integrate(self, dt: float):
+        """First-order response of every joint over ``dt`` seconds."""
+        alpha = 1.0 - math.exp(-dt / self.time_constant) if self.time_constant > 0 else 1.0
+        for i in range(self.num_joints):
+            previous = self.position[i]
+            if self.control_type == VELOCITY_CONTROL:
+                self.velocity[i] += (self._target_velocity[i] - self.velocity[i]) * alpha
+                self.position[i] = max(-128.0, min(127.0, previous + self.velocity[i] * dt))
+                continue
+            if self.control_type == POSITION_CONTROL:
+                step = (self._target_position[i] - previous) * alpha
+                limit = abs(self._target_velocity[i]) * dt
+                if limit > 0:
+                    step = max(-limit, min(limit, step))
+                self.position[i] = previous + step
+                self.velocity[i] = step / dt
+            self.force[i] += (self._target_force[i] - self.force[i]) * alpha
+
+    def _trajectory(self) -> int:
+        """Returns the TrajectoryReturn nibble for the current motion."""
+        if self.state != ActuatorState.ACTUATOR_ACTIVE.value:
+            return TrajectoryReturn.TRAJECTORY_STOPPED.value
+        if self.control_type == POSITION_CONTROL and any(
+                abs(t - p) > 0.5 for t, p in zip(self._target_position, self.position)):
+            return TrajectoryReturn.TRAJECTORY_RUNNING.value
+        return TrajectoryReturn.TRAJECTORY_COMPLETE.value
+
+    def _write_block(self, key: str, words: list):
+        """Stores ``words`` at the register block ``key``."""
+        start = self._reg[key]
+        self.registers[start:start + len(words)] = words
+
+    def _refresh_feedback(self):
+        """Re-encodes every feedback register from the simulated state."""
+        reg = self._reg
+        self.registers[reg['feedback_register']] = self.state | (self._trajectory() << 4)
+        if self.state in (ActuatorState.ACTUATOR_CONFIG.value, ActuatorState.ACTUATOR_CONFIG_FINISH.value):
+            # the assigned IP is reported in the position block during config
+            octets = [int(o) for o in self.ip_address.split('.')]
+            self._write_block('feedback_position_start_reg', [(octets[0] << 8) | octets[1], (octets[2] << 8) | octets[3]])
+        else:
+            self._write_block('feedback_position_start_reg', _pack_int8_pairs(self.position))
+        self._write_block('feedback_force_start_reg', [w for f in self.force for w in _float_to_words(f)])
+        self._write_block('feedback_velocity_start_reg', [int(round(v)) & 0xFFFF for v in self.velocity])
+        self._write_block('feedback_temperature_start_reg', _pack_int8_pairs([self.ambient_temperature] * self.num_joints))
+        self._write_block('feedback_actuator_error_reg', [w for e in self.error_reports for w in (e & 0xFFFF, e >> 16)])
+        self._write_block('feedback_atuator_motor_mode_reg', _pack_int8_pairs([self.control_type] * self.num_joints))
+        if self.fingertip_forces:
+            self._write_block('feedback_force_sensor_start_reg', [w for f in self.fingertip_forces for w in _float_to_words(f)])
+        self._write_block('feedback_voltage_start_reg', list(_float_to_words(self.voltage)))
+        self.registers[reg['feedback_avg_temperature_start_reg']] = int(self.ambient_temperature) & 0xFFFF
+        self.registers[reg['slave_id_reg']] = self.slave_address
@@ -0,0 +1,315 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+import random
+import select
+import socket
+import struct
+import threading
+import time
+
+from ..communication import modbus_pdu
+
+
+class _SimulatorServer(ABC):
+    """Shared lifecycle and response-delay handling of the simulator servers.
+
+    Subclasses open their endpoint in ``_open`` and answer requests in
+    ``_serve``, which ``start`` runs on a worker thread.
+
+    Attributes:
+        simulator: The served ``HandSimulator`` (or anything with ``handle_pdu``).
+        latency: Fixed delay before each response, in seconds.
+        jitter: Upper bound of an extra uniformly distributed delay, in seconds.
+        requests: Number of requests served.
+    """
+
+    def __init__(self, simulator, latency=0.0, jitter=0.0, seed=None, logger=None):
+        """Initializes the server without starting it.
+
+        Args:
+            simulator: The ``HandSimulator`` to serve.
+            latency: Fixed delay before each response, in seconds.
+            jitter: Upper bound of an extra random delay per response, in seconds.
+            seed: Seed for the jitter generator, for reproducible runs.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        self.simulator = simulator
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._stop_event = threading.Event()
+        self._threads = []
+        if not logger:
+            self.logger = logging.getLogger(__name__)
+        else:
+            self.logger = logger
+
+    def __enter__(self):
+        """Starts the server on entering a ``with`` block."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Stops the server on leaving a ``with`` block."""
+        self.stop()
+
+    def _respond(self, pdu: bytes) -> bytes:
+        """Applies the configured latency/jitter, then lets the simulator answer."""
+        delay = self.latency + (self._random.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        self.requests += 1
+        return self.simulator.handle_pdu(pdu)
+
+    def _spawn(self, target, *args):
+        """Starts a daemon worker thread and tracks it for ``stop``."""
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def start(self):
+        """Opens the endpoint and starts serving it on a background thread."""
+        self._stop_event.clear()
+        endpoint = self._open()
+        self._spawn(self._serve)
+        self.logger.info(f"Simulated {self.simulator.robot_type} serving {endpoint}")
+
+    @abstractmethod
+    def _open(self) -> str:
+        """Opens the endpoint clients connect to.
+
+        Returns:
+            Description of the endpoint for the startup log message.
+        """
+
+    @abstractmethod
+    def _serve(self):
+        """Serves the endpoint until ``_stop_event`` is set."""
+
+    def stop(self):
+        """Stops serving and joins the worker threads."""
+        self._stop_event.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+        self._threads = []
+
+
+class ModbusTCPSimulatorServer(_SimulatorServer):
+    """Modbus TCP slave serving a ``HandSimulator``.
+
+    Requests on one connection are answered in order; any unit id is
+    accepted. Use ``address`` as the ``communication_channel_identifier``
+    with ``communication_method='Modbus_TCP'``.
+
+    Attributes:
+        host: Interface the server listens on.
+        port: TCP port; 0 picks a free port, updated by ``start``.
+    """
+
+    def __init__(self, simulator, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, seed=None, logger=None):
+        """Initializes the server without starting it.
+
+        Args:
+            simulator: The ``HandSimulator`` to serve.
+            host: Interface to listen on.
+            port: TCP port to listen on; 0 picks a free port.
+            latency: Fixed delay before each response, in seconds.
+            jitter: Upper bound of an extra random delay per response, in seconds.
+            seed: Seed for the jitter generator.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        super().__init__(simulator, latency=latency, jitter=jitter, seed=seed, logger=logger)
+        self.host = host
+        self.port = port
+        self._listener = None
+        self._connections = []
+
+    @property
+    def address(self) -> str:
+        """'host:port' string accepted by ``NewCommunication``."""
+        return f"{self.host}:{self.port}"
+
+    def _open(self) -> str:
+        """Binds the listening socket."""
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.port))
+        self._listener.listen()
+        self._listener.settimeout(0.1)
+        self.port = self._listener.getsockname()[1]
+        return f"Modbus TCP on {self.address}"
+
+    def stop(self):
+        """Closes the listener and every open connection."""
+        self._stop_event.set()
+        for sock in [self._listener, *self._connections]:
+            if sock is None:
+                continue
+            try:
+                sock.close()
+            except OSError:
+                pass
+        self._connections = []
+        super().stop()
+
+    def _serve(self):
+        """Accepts connections until stopped."""
+        while not self._stop_event.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.settimeout(None)
+            self._connections.append(conn)
+            self._spawn(self._serve_connection, conn)
+
+    def _recv_exact(self, conn, size: int) -> bytes:
+        """Reads exactly ``size`` bytes; raises ConnectionError on EOF."""
+        buf = b""
+        while len(buf) < size:
+            chunk = conn.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("client closed the connection")
+            buf += chunk
+        return buf
+
+    def _serve_connection(self, conn):
+        """Answers MBAP-framed requests on one connection until it closes."""
+        try:
+            while not self._stop_event.is_set():
+                header = self._recv_exact(conn, modbus_pdu.MBAP_HEADER_SIZE)
+                transaction_id, unit_id, pdu_length = modbus_pdu.decode_mbap(header)
+                pdu = self._recv_exact(conn, pdu_length)
+                conn.sendall(modbus_pdu.encode_mbap(transaction_id, unit_id, self._respond(pdu)))
+        except (ConnectionError, OSError, modbus_pdu.ModbusIOException):
+            pass
+        finally:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+
+class RTUSimulatorServer(_SimulatorServer):
+    """Modbus RTU slave serving a ``HandSimulator`` over a pseudo-terminal (POSIX only).
+
+    ``start`` creates a pty pair and serves its master side; ``port`` is
+    the slave device path to pass as ``communication_channel_identifier``
+    with ``communication_method='RS485_RTU'``. Frames addressed to another
+    slave, broadcasts and frames with a bad CRC are dropped, as on a real
+    bus.
+
+    Attributes:
+        port: Device path of the pty slave, set by ``start``.
+    """
+
+    def __init__(self, simulator, latency=0.0, jitter=0.0, seed=None, logger=None):
+        """Initializes the server without starting it.
+
+        Args:
+            simulator: The ``HandSimulator`` to serve.
+            latency: Fixed delay before each response, in seconds.
+            jitter: Upper bound of an extra random delay per response, in seconds.
+            seed: Seed for the jitter generator.
+            logger: Logger to use; a module-level logger is created if None.
+        """
+        super().__init__(simulator, latency=latency, jitter=jitter, seed=seed, logger=logger)
+        self.port = None
+        self._master_fd = None
+        self._slave_fd = None
+
+    def _open(self) -> str:
+        """Creates the pty pair.
+
+        Raises:
+            OSError: If pseudo-terminals are unavailable on this platform.
+        """
+        if not hasattr(os, 'openpty'):
+            raise OSError("RTUSimulatorServer needs POSIX pseudo-terminals")
+        import tty
+        self._master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self._master_fd)
+        tty.setraw(self._slave_fd)
+        self.port = os.ttyname(self._slave_fd)
+        return f"Modbus RTU on {self.port}"
+
+    def stop(self):
+        """Stops serving and closes the pty pair."""
+        super().stop()
+        for fd in (self._master_fd, self._slave_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master_fd = self._slave_fd = None
+
+    @staticmethod
+    def _frame_length(buf: bytearray):
+        """Returns the length of the RTU request frame at the start of ``buf``.
+
+        Returns:
+            The frame length including address and CRC, None if more bytes
+            are needed, or 0 for an unsupported function code.
+        """
+        if len(buf) < 2:
+            return None
+        function_code = buf[1]
+        if function_code in (modbus_pdu.READ_HOLDING_REGISTERS, modbus_pdu.WRITE_SINGLE_REGISTER):
+            return 8
+        if function_code == modbus_pdu.WRITE_MULTIPLE_REGISTERS:
+            return 9 + buf[6] if len(buf) > 6 else None
+        if function_code == modbus_pdu.READ_WRITE_MULTIPLE_REGISTERS:
+            return 13 + buf[10] if len(buf) > 10 else None
+        return 0
+
+    def _serve(self):
+        """Reads request frames from the pty master and writes back responses."""
+        buf = bytearray()
+        while not self._stop_event.is_set():
+            try:
+                readable, _, _ = select.select([self._master_fd], [], [], 0.1)
+                if not readable:
+                    # inter-frame silence: drop any partial frame
+                    buf.clear()
+                    continue
+                buf += os.read(self._master_fd, 512)
+            except (OSError, ValueError, TypeError):
+                return
+            while True:
+                length = self._frame_length(buf)
+                if length is None or len(buf) < length:
+                    break
+                if length == 0:
+                    buf.clear()
+                    break
+                frame, buf = bytes(buf[:length]), buf[length:]
+                if modbus_pdu.crc16(frame[:-2]) != struct.unpack('<H', frame[-2:])[0]:
+                    self.logger.debug(f"Simulator dropping frame with bad CRC: {frame.hex()}")
+                    buf.clear()
+                    break
+                if frame[0] != self.simulator.slave_address:
+                    continue
+                response = bytes([frame[0]]) + self._respond(frame[1:-2])
+                try:
+                    os.write(self._master_fd, response + struct.pack('<H', modbus_pdu.crc16(response)))
+                except (OSError, TypeError):
+                    return
@@ -0,0 +1,2 @@
+from .trajectory import Trajectory, PROFILES
+from .trajectory_player import TrajectoryPlayer, pose_to_array
@@ -0,0 +1,264 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Time-parameterized joint trajectories (minimum-jerk and cubic spline), vectorized across joints."""
+
+import numpy as np
+
+PROFILES = ('minimum_jerk', 'cubic')
+
+# peak velocity of a rest-to-rest segment, in units of (distance / duration)
+_PEAK_VELOCITY_FACTOR = {'minimum_jerk': 1.875, 'cubic': 1.5}
+_MAX_RETIMING_PASSES = 8
+
+
+class Trajectory:
+    """Piecewise polynomial joint trajectory, one polynomial per segment and joint.
+
+    Segment ``s`` covers ``breaks[s] <= t <= breaks[s + 1]`` and holds
+    power-basis coefficients in the local time ``t - breaks[s]``, shape
+    ``(segments, 6, joints)``. All evaluations are vectorized across
+    joints (and across times when given an array). Before ``t = 0`` the
+    trajectory holds its start, after ``duration`` it holds its last
+    waypoint at rest.
+
+    Build trajectories with ``from_waypoints``; ``TrajectoryPlayer``
+    streams them to a hand.
+
+    Attributes:
+        breaks: Segment boundary times in seconds, starting at 0.
+        coefficients: Polynomial coefficients, shape (segments, 6, joints).
+        lower: Per-joint lower position bound applied on evaluation, or None.
+        upper: Per-joint upper position bound applied on evaluation, or None.
+    """
+
+    def __init__(self, breaks, coefficients, lower=None, upper=None):
+        """Wraps precomputed segments.
+
+        Args:
+            breaks: Increasing segment boundary times, shape (segments + 1,).
+            coefficients: Power-basis coefficients, shape (segments, order + 1, joints).
+            lower: Per-joint lower position bound, or None.
+            upper: Per-joint upper position bound, or None.
+        """
+        self.breaks = np.asarray(breaks, dtype=np.float64)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.lower = None if lower is None else np.asarray(lower, dtype=np.float64)
+        self.upper = None if upper is None else np.asarray(upper, dtype=np.float64)
+        self._derivatives = [self.coefficients]
+
+    @property
+    def duration(self) -> float:
+        """Total duration in seconds."""
+        return float(self.breaks[-1])
+
+    @property
+    def num_joints(self) -> int:
+        """Number of joints the trajectory drives."""
+        return self.coefficients.shape[2]
+
+    @classmethod
+    def from_waypoints(cls, waypoints, times=None, profile='minimum_jerk', max_velocity=None,
+                       lower=None, upper=None, start_velocity=None, start_acceleration=None,
+                       min_segment_time=0.02):
+        """Builds a trajectory through a sequence of joint-space waypoints.
+
+        ``'minimum_jerk'`` joins waypoints with quintic segments (zero
+        acceleration at every waypoint, zero velocity at the ends, and a
+        pass-through velocity at interior waypoints that keep moving in the
+        same direction). ``'cubic'`` fits a C2 cubic spline clamped to rest
+        at the end.
+
+        Without ``times`` each segment is timed so that no joint exceeds
+        ``max_velocity``; the whole schedule is then stretched until the
+        sampled velocity stays within the limit.
+
+        Args:
+            waypoints: Array-like of shape (points, joints); the first row is
+                the start. At least two points.
+            times: Arrival time in seconds of every waypoint, starting at 0,
+                or None to derive them from ``max_velocity``.
+            profile: 'minimum_jerk' or 'cubic'.
+            max_velocity: Scalar or per-joint speed limit (units/s), required
+                if ``times`` is None.
+            lower: Per-joint lower position bound; waypoints are clipped to it.
+            upper: Per-joint upper position bound; waypoints are clipped to it.
+            start_velocity: Per-joint velocity at the start (blending from a
+                trajectory in flight); zero if None.
+            start_acceleration: Per-joint acceleration at the start; zero if
+                None. Ignored by the cubic profile.
+            min_segment_time: Shortest segment when timing from
+                ``max_velocity``, in seconds.
+
+        Returns:
+            The ``Trajectory``.
+
+        Raises:
+            ValueError: On an unknown profile, fewer than two waypoints,
+                times that are not increasing or do not match the
+                waypoints, or neither ``times`` nor ``max_velocity``.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown trajectory profile {profile!r}, expected one of {PROFILES}")
+        points = np.array(waypoints, dtype=np.float64, ndmin=2)
+        if points.shape[0] < 2:
+            raise ValueError("A trajectory needs at least two waypoints")
+        if lower is not None or upper is not None:
+            np.clip(points, lower, upper, out=points)
+        joints = points.shape[1]
+        v0 = np.zeros(joints) if start_velocity is None else np.asarray(start_velocity, dtype=np.float64)
+        a0 = np.zeros(joints) if start_acceleration is None else np.asarray(start_acceleration, dtype=np.float64)
+        build = _quintic_segments if profile == 'minimum_jerk' else _cubic_segments
+
+        if times is not None:
+            times = np.asarray(times, dtype=np.float64)
+            if times.shape != (points.shape[0],) or times[0] != 0 or np.any(np.diff(times) <= 0):
+                raise ValueError("times must start at 0, increase, and give one time per waypoint")
+            return cls(times, build(points, np.diff(times), v0, a0), lower, upper)
+
+        if max_velocity is None:
+            raise ValueError("Either times or max_velocity is required")
+        max_velocity = np.broadcast_to(np.asarray(max_velocity, dtype=np.float64), (joints,))
+        distance = np.abs(np.diff(points, axis=0)) / max_velocity
+        durations = np.maximum(_PEAK_VELOCITY_FACTOR[profile] * distance.max(axis=1), min_segment_time)
+        for _ in range(_MAX_RETIMING_PASSES):
+            trajectory = cls(np.concatenate(([0.0], np.cumsum(durations))), build(points, durations, v0, a0), lower, upper)
+            overshoot = trajectory.peak_velocity() / max_velocity
+            worst = overshoot.max()
+            if worst <= 1.0 + 1e-6:
+                break
+            durations = durations * worst * 1.01
+        return trajectory
+
+    def _coefficients(self, derivative: int) -> np.ndarray:
+        """Returns (and caches) the coefficients of the given time derivative."""
+        while len(self._derivatives) <= derivative:
+            c = self._derivatives[-1]
+            powers = np.arange(1, c.shape[1]).reshape(1, -1, 1)
+            self._derivatives.append(c[:, 1:] * powers if c.shape[1] > 1 else np.zeros_like(c))
+        return self._derivatives[derivative]
+
+    def evaluate(self, t, derivative: int = 0) -> np.ndarray:
+        """Evaluates the trajectory or one of its time derivatives.
+
+        Args:
+            t: Time in seconds, scalar or 1-D array.
+            derivative: 0 for position, 1 for velocity, 2 for acceleration.
+
+        Returns:
+            Array of shape (joints,) for a scalar ``t``, (times, joints)
+            otherwise. Positions are clipped to ``lower``/``upper``.
+        """
+        scalar = np.ndim(t) == 0
+        t = np.clip(np.atleast_1d(np.asarray(t, dtype=np.float64)), 0.0, self.duration)
+        segment = np.clip(np.searchsorted(self.breaks, t, side='right') - 1, 0, len(self.breaks) - 2)
+        tau = (t - self.breaks[segment])[:, None]
+        c = self._coefficients(derivative)[segment]  # (times, order + 1, joints)
+        value = c[:, -1]
+        for k in range(c.shape[1] - 2, -1, -1):
+            value = value * tau + c[:, k]
+        if derivative == 0 and (self.lower is not None or self.upper is not None):
+            value = np.clip(value, self.lower, self.upper)
+        return value[0] if scalar else value
+
+    def position(self, t) -> np.ndarray:
+        """Joint positions at ``t`` (see ``evaluate``)."""
+        return self.evaluate(t, 0)
+
+    def velocity(self, t) -> np.ndarray:
+        """Joint velocities at ``t`` (see ``evaluate``)."""
+        return self.evaluate(t, 1)
+
+    def acceleration(self, t) -> np.ndarray:
+        """Joint accelerations at ``t`` (see ``evaluate``)."""
+        return self.evaluate(t, 2)
+
+    def sample(self, rate: float):
+        """Samples the whole trajectory at a fixed rate.
+
+        Args:
+            rate: Samples per second, e.g. the communication frequency.
+
+        Returns:
+            Tuple ``(times, positions)`` with shapes (samples,) and
+            (samples, joints); the last sample is at ``duration``.
+        """
+        times = np.arange(0.0, self.duration, 1.0 / rate)
+        times = np.append(times, self.duration)
+        return times, self.position(times)
+
+    def peak_velocity(self, samples_per_segment: int = 64) -> np.ndarray:
+        """Largest absolute velocity per joint, sampled densely over every segment."""
+        fractions = np.linspace(0.0, 1.0, samples_per_segment)
+        times = (self.breaks[:-1, None] + np.diff(self.breaks)[:, None] * fractions).ravel()
+        return np.abs(self.velocity(times)).max(axis=0)
+
+
+def _quintic_segments(points, durations, v0, a0):
+    """Quintic (minimum-jerk) segments through ``points``.
+
+    Interior waypoints get the mean of the adjacent segment slopes as
+    velocity when both slopes have the same sign, and rest otherwise, so
+    a joint only stops where it changes direction.
+    """
+    slopes = np.diff(points, axis=0) / durations[:, None]
+    velocities = np.zeros_like(points)
+    velocities[0] = v0
+    if len(points) > 2:
+        same_direction = np.sign(slopes[:-1]) == np.sign(slopes[1:])
+        velocities[1:-1] = np.where(same_direction, (slopes[:-1] + slopes[1:]) / 2, 0.0)
+    accelerations = np.zeros_like(points)
+    accelerations[0] = a0
+
+    T = durations[:, None]
+    h = np.diff(points, axis=0)
+    p0, v_start, v_end = points[:-1], velocities[:-1], velocities[1:]
+    a_start, a_end = accelerations[:-1], accelerations[1:]
+    c = np.empty((len(durations), 6, points.shape[1]))
+    c[:, 0] = p0
+    c[:, 1] = v_start
+    c[:, 2] = a_start / 2
+    c[:, 3] = (20 * h - (8 * v_end + 12 * v_start) * T - (3 * a_start - a_end) * T ** 2) / (2 * T ** 3)
+    c[:, 4] = (-30 * h + (14 * v_end + 16 * v_start) * T + (3 * a_start - 2 * a_end) * T ** 2) / (2 * T ** 4)
+    c[:, 5] = (12 * h - 6 * (v_end + v_start) * T + (a_end - a_start) * T ** 2) / (2 * T ** 5)
+    return c
+
+
+def _cubic_segments(points, durations, v0, a0):
+    """C2 cubic spline segments through ``points``, clamped to ``v0`` at the start and rest at the end."""
+    count = len(points)
+    h = durations
+    slopes = np.diff(points, axis=0) / h[:, None]
+    velocities = np.zeros_like(points)
+    velocities[0] = v0
+    if count > 2:
+        # continuity of the second derivative at each interior knot
+        n = count - 2
+        system = np.zeros((n, n))
+        rhs = 3 * (h[1:, None] * slopes[:-1] + h[:-1, None] * slopes[1:])
+        for i in range(n):
+            system[i, i] = 2 * (h[i] + h[i + 1])
+            if i > 0:
+                system[i, i - 1] = h[i + 1]
+            if i < n - 1:
+                system[i, i + 1] = h[i]
+        rhs[0] -= h[1] * velocities[0]
+        velocities[1:-1] = np.linalg.solve(system, rhs)
+
+    T = h[:, None]
+    v_start, v_end = velocities[:-1], velocities[1:]
+    c = np.zeros((count - 1, 6, points.shape[1]))
+    c[:, 0] = points[:-1]
+    c[:, 1] = v_start
+    c[:, 2] = (3 * slopes - 2 * v_start - v_end) / T
+    c[:, 3] = (v_start + v_end - 2 * slopes) / T ** 2
+    return c
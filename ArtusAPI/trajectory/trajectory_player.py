@@ -0,0 +1,342 @@
+"""
+Sarcomere Dynamics Software License Notice
+------------------------------------------
+This software is developed by Sarcomere Dynamics Inc. for use with the ARTUS family of robotic products,
+including ARTUS Lite, ARTUS+, ARTUS Dex, and Hyperion.
+
+Copyright (c) 2023–2026, Sarcomere Dynamics Inc. All rights reserved.
+
+Licensed under the Sarcomere Dynamics Software License.
+See the LICENSE file in the repository for full details.
+"""
+
+"""Background thread streaming trajectory setpoints to a hand at its communication frequency."""
+
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ..communication.pacing_scheduler import PacingScheduler
+from .trajectory import Trajectory
+
+
+def pose_to_array(pose, joint_names, base) -> np.ndarray:
+    """Converts a pose to one target angle per joint.
+
+    Args:
+        pose: Array-like of one angle per joint; a dict in the
+            ``data/hand_poses`` format (joint name -> ``{'index',
+            'target_angle', ...}``) or joint name -> angle; or the path of a
+            pose JSON file.
+        joint_names: Joint names in index order.
+        base: Angles used for joints the pose leaves out.
+
+    Returns:
+        float64 array with one angle per joint.
+
+    Raises:
+        ValueError: If an array pose has the wrong length or a dict pose
+            names an unknown joint.
+    """
+    if isinstance(pose, str):
+        with open(pose, 'r') as file:
+            pose = json.load(file)
+    if not isinstance(pose, dict):
+        angles = np.asarray(pose, dtype=np.float64)
+        if angles.shape != (len(joint_names),):
+            raise ValueError(f"Expected {len(joint_names)} joint angles, got shape {angles.shape}")
+        return angles
+
+    angles = np.array(base, dtype=np.float64)
+    index_of = {name: index for index, name in enumerate(joint_names)}
+    for name, entry in pose.items():
+        if isinstance(entry, dict):
+            if 'target_angle' not in entry:
+                continue
+            index = entry.get('index', index_of.get(name))
+            value = entry['target_angle']
+        else:
+            index, value = index_of.get(name), entry
+        if index is None or not 0 <= index < len(joint_names):
+            raise ValueError(f"Unknown joint {name!r} in pose")
+        angles[index] = value
+    return angles
+
+
+class TrajectoryPlayer:
+    """Streams ``Trajectory`` setpoints to one hand from a background thread.
+
+    Each send slot of the hand's communication frequency gets the
+    trajectory position at the time the slot goes out, through
+    ``ArtusAPI_V2.set_joint_targets`` (so joint limits, rotation direction
+    and streaming mode behave as for any other setpoint). Starting a new
+    motion while one is in flight preempts it: the new trajectory starts
+    from the current position, velocity and acceleration of the old one,
+    so the hand blends into it without a jump.
+
+    Attributes:
+        api: The ``ArtusAPI_V2`` the setpoints are sent through.
+        profile: Default profile for ``move_to``/``follow``.
+        max_velocity: Per-joint speed limit used to time motions.
+        lower: Per-joint lower position bound in command units.
+        upper: Per-joint upper position bound in command units.
+        logger: Logger used for status and error messages.
+        sent: Number of setpoints sent.
+        completed: Number of trajectories played to the end.
+        preempted: Number of trajectories replaced while in flight.
+        errors: Number of sends that raised.
+        last_error: The most recent exception raised by a send, or None.
+    """
+
+    def __init__(self, api, profile='minimum_jerk', max_velocity=None, logger=None):
+        """Sets up the player for ``api`` without starting its thread.
+
+        Args:
+            api: Connected, awake ``ArtusAPI_V2``.
+            profile: Default profile, 'minimum_jerk' or 'cubic'.
+            max_velocity: Scalar or per-joint speed limit; the robot
+                model's ``max_velocity`` if None.
+            logger: Logger to use; the API's logger if None.
+        """
+        self.api = api
+        self.profile = profile
+        self.logger = logger or getattr(api, 'logger', None) or logging.getLogger(__name__)
+
+        robot = api._robot_handler.robot
+        self._joint_state = robot.joint_state
+        state = self._joint_state
+        # limits are enforced after the rotation direction is applied
+        flipped = state.rotation_direction < 0
+        self.lower = np.where(flipped, -state.max_angle, state.min_angle).astype(np.float64)
+        self.upper = np.where(flipped, -state.min_angle, state.max_angle).astype(np.float64)
+        self.max_velocity = np.broadcast_to(
+            np.asarray(robot.max_velocity if max_velocity is None else max_velocity, dtype=np.float64),
+            (len(state),)).copy()
+
+        self._period = api._communication_period
+        self._pacer = PacingScheduler(self._period)
+        self._condition = threading.Condition()
+        self._active = None
+        self._start_time = 0.0
+        self._stop_requested = False
+        self._thread = None
+
+        self.sent = 0
+        self.completed = 0
+        self.preempted = 0
+        self.errors = 0
+        self.last_error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """Starts the streaming thread. No-op if it is already running."""
+        if self.is_running():
+            return
+        with self._condition:
+            self._stop_requested = False
+        self._thread = threading.Thread(target=self._run, name="ArtusTrajectoryPlayer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Stops the thread; the hand holds the last setpoint sent.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread to exit.
+        """
+        with self._condition:
+            self._stop_requested = True
+            self._active = None
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Checks whether the streaming thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_moving(self) -> bool:
+        """Checks whether a trajectory is being played."""
+        with self._condition:
+            return self._active is not None
+
+    def cancel(self):
+        """Stops the current motion; the hand holds the last setpoint sent."""
+        with self._condition:
+            if self._active is not None:
+                self.preempted += 1
+            self._active = None
+            self._condition.notify_all()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Blocks until the current motion has been played to the end.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None for no limit.
+
+        Returns:
+            True if no motion is in flight anymore, False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._active is None, timeout)
+
+    def current_state(self):
+        """Returns where the commanded motion is right now.
+
+        Returns:
+            Tuple ``(position, velocity, acceleration)`` of per-joint
+            arrays: sampled from the trajectory in flight, or the hand's
+            current target angles at rest.
+        """
+        with self._condition:
+            trajectory, start = self._active, self._start_time
+        if trajectory is None:
+            position = self._joint_state.target_angle * self._joint_state.rotation_direction
+            zeros = np.zeros(len(position))
+            return position, zeros, zeros.copy()
+        t = time.perf_counter() - start
+        return trajectory.position(t), trajectory.velocity(t), trajectory.acceleration(t)
+
+    def move_to(self, pose, duration: float = None, profile: str = None) -> Trajectory:
+        """Moves smoothly to a pose, blending out of any motion in flight.
+
+        Args:
+            pose: Target pose, see ``pose_to_array``; joints it leaves out
+                keep their current position.
+            duration: Motion time in seconds, or None to go as fast as
+                ``max_velocity`` allows.
+            profile: 'minimum_jerk' or 'cubic'; the player default if None.
+
+        Returns:
+            The ``Trajectory`` being played.
+        """
+        position, velocity, acceleration = self.current_state()
+        goal = pose_to_array(pose, self._joint_state.joint_names, position)
+        times = None if duration is None else [0.0, duration]
+        return self._play_from([position, goal], times, profile, velocity, acceleration)
+
+    def follow(self, waypoints, times=None, profile: str = None) -> Trajectory:
+        """Moves through a sequence of poses, blending out of any motion in flight.
+
+        Args:
+            waypoints: Sequence of poses (see ``pose_to_array``); joints a
+                pose leaves out keep the previous waypoint's value.
+            times: Arrival time in seconds of each waypoint, counted from
+                now, or None to time them from ``max_velocity``.
+            profile: 'minimum_jerk' or 'cubic'; the player default if None.
+
+        Returns:
+            The ``Trajectory`` being played.
+        """
+        position, velocity, acceleration = self.current_state()
+        points = [position]
+        for pose in waypoints:
+            points.append(pose_to_array(pose, self._joint_state.joint_names, points[-1]))
+        if times is not None:
+            times = [0.0, *times]
+        return self._play_from(points, times, profile, velocity, acceleration)
+
+    def _play_from(self, points, times, profile, velocity, acceleration) -> Trajectory:
+        """Builds the trajectory from the current motion state and plays it."""
+        trajectory = Trajectory.from_waypoints(points, times=times, profile=profile or self.profile,
+                                               max_velocity=self.max_velocity, lower=self.lower, upper=self.upper,
+                                               start_velocity=velocity, start_acceleration=acceleration)
+        self.play(trajectory)
+        return trajectory
+
+    def play(self, trajectory: Trajectory):
+        """Plays a prebuilt trajectory from now, replacing any motion in flight.
+
+        The trajectory is played as given; use ``move_to``/``follow`` to
+        blend from the current motion.
+
+        Args:
+            trajectory: ``Trajectory`` with one column per joint.
+
+        Raises:
+            ValueError: If the trajectory drives a different number of joints.
+        """
+        if trajectory.num_joints != len(self._joint_state):
+            raise ValueError(f"Trajectory drives {trajectory.num_joints} joints, the hand has {len(self._joint_state)}")
+        self.start()
+        with self._condition:
+            if self._active is not None:
+                self.preempted += 1
+            self._active = trajectory
+            self._start_time = time.perf_counter()
+            self._condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the player counters.
+
+        Returns:
+            Dict with ``sent``, ``completed``, ``preempted`` and ``errors``
+            counts and ``moving`` (bool).
+        """
+        with self._condition:
+            return {
+                'sent': self.sent,
+                'completed': self.completed,
+                'preempted': self.preempted,
+                'errors': self.errors,
+                'moving': self._active is not None,
+            }
+
+    def _next_send_time(self) -> float:
+        """Returns when the next setpoint will go out, waiting for it if streaming.
+
+        Outside streaming mode ``set_joint_targets`` waits for the API's
+        own send slot, so the slot time is predicted from its pacer; in
+        streaming mode the setpoint is posted immediately and the player
+        paces itself.
+        """
+        if self.api.is_streaming():
+            return self._pacer.wait()
+        return max(time.perf_counter(), self.api.last_time + self._period)
+
+    def _run(self):
+        """Thread body: sends the trajectory position for every send slot."""
+        while True:
+            with self._condition:
+                while self._active is None and not self._stop_requested:
+                    self._condition.wait()
+                if self._stop_requested:
+                    break
+                trajectory, start = self._active, self._start_time
+
+            t = self._next_send_time() - start
+            try:
+                result = self.api.set_joint_targets(positions=trajectory.position(t))
+            except Exception as e:
+                result = False
+                self.errors += 1
+                self.last_error = e
+                self.logger.error(f"Trajectory setpoint failed: {e}")
+            else:
+                if result is not None:
+                    self.sent += 1
+
+            if result is None:
+                # hand not awake: nothing was sent (or paced), drop the motion
+                self.logger.error("Trajectory dropped, the hand is not awake")
+                self._finish(trajectory, completed=False)
+            elif t >= trajectory.duration:
+                self._finish(trajectory, completed=True)
+
+    def _finish(self, trajectory: Trajectory, completed: bool):
+        """Clears ``trajectory`` unless it was preempted meanwhile, and wakes ``wait``."""
+        with self._condition:
+            if self._active is trajectory:
+                self._active = None
+                if completed:
+                    self.completed += 1
+                self._condition.notify_all()
@@ -30,6 +30,7 @@ print("Project Root", PROJECT_ROOT)
 sys.path.append(PROJECT_ROOT)
 from examples.config.configuration import ArtusConfig
 from examples.Tracking.hand_tracking_data import HandTrackingData
+from ArtusAPI import HandGroup
 
 # set up logger
 if not logging.getLogger().handlers:
@@ -79,21 +80,18 @@ class ManusGloveController:
         time.sleep(5)
 
     def _initialize_api(self):
-        """Creates the ArtusAPI instance for whichever hand(s) are connected.
+        """Creates an ArtusAPI instance per connected hand and groups them.
 
         Reads robot_config.robots.left_hand_robot / right_hand_robot and,
-        for each side marked robot_connected, assigns self.artus_api via
-        ArtusConfig.return_api. If both sides are connected, self.artus_api
-        ends up referencing only the right hand's API (the left hand's
-        assignment is overwritten).
+        for each side marked robot_connected, builds its API via
+        ArtusConfig.return_api. The connected hands are wrapped in a
+        HandGroup so both receive their joint angles concurrently.
         """
-        # Check and print configuration for left hand robot
-        if self.robot_config.config.robots.left_hand_robot.robot_connected:
-            self.artus_api = self.robot_config.return_api(robot_cfg=self.robot_config.config.robots.left_hand_robot,logger=logger)
-            
-        # Check and print configuration for right hand robot
-        if self.robot_config.config.robots.right_hand_robot.robot_connected:
-            self.artus_api = self.robot_config.return_api(robot_cfg=self.robot_config.config.robots.right_hand_robot,logger=logger)
+        hand_configs = {'left': self.robot_config.config.robots.left_hand_robot,
+                        'right': self.robot_config.config.robots.right_hand_robot}
+        hands = {side: self.robot_config.return_api(robot_cfg=robot_cfg, logger=logger)
+                 for side, robot_cfg in hand_configs.items() if robot_cfg.robot_connected}
+        self.hand_group = HandGroup(hands, logger=logger)
 
     def start_streaming(self):
         """Continuously reads glove data and forwards it to the ARTUS hand(s).
@@ -114,7 +112,7 @@ class ManusGloveController:
                 pass
 
     def _send_joint_angles(self, joint_angles_left=None, joint_angles_right=None):
-        """Sends joint angle lists to the connected ARTUS hand(s).
+        """Sends joint angle lists to the connected ARTUS hand(s) concurrently.
 
         Args:
             joint_angles_left: Joint angles list for the left hand, or
@@ -122,18 +120,14 @@ class ManusGloveController:
             joint_angles_right: Joint angles list for the right hand, or
                 None if no right-hand data is available (logs a warning).
         """
-        if joint_angles_left is not None:
-            if self.artus_api is not None:
-                self.artus_api.set_joint_angles_by_list(joint_angles_list=joint_angles_left)
-        else:
-            logging.warning("No joint angles received for left hand")
-
-        if joint_angles_right is not None:
-            if self.artus_api is not None:
-                self.artus_api.set_joint_angles_by_list(joint_angles_list=joint_angles_right)
-        else:
-            logging.warning("No joint angles received for right hand")
-    
+        joint_angles = {}
+        for side, angles in (('left', joint_angles_left), ('right', joint_angles_right)):
+            if angles is None:
+                logging.warning(f"No joint angles received for {side} hand")
+            elif side in self.hand_group.hands:
+                joint_angles[side] = angles
+        self.hand_group.run({side: (lambda api, angles=angles: api.set_joint_angles_by_list(angles))
+                             for side, angles in joint_angles.items()})
 
 
 def both_hands_control_manus_gloves():
@@ -18,6 +18,7 @@ from pymodbus.exceptions import ModbusException
 import serial.tools.list_ports
 
 from ArtusAPI.artus_api_new import ArtusAPI_V2
+from ArtusAPI.hand_group import HandGroup
 from ArtusAPI.common.SlaveIDMap import (
     SLAVE_ID_BY_ROBOT_HAND,
     expected_slave_id,
@@ -151,6 +152,29 @@ class ArtusConfig:
         robot_cfg = self._preflight(robot_cfg, logger)
         return self.return_api(robot_cfg=robot_cfg, logger=logger)
 
+    def get_hand_group(self, logger=None):
+        """Builds a HandGroup of every connected hand, for bimanual setups.
+
+        Runs the same pre-flight checks as get_api for each connected hand.
+
+        Args:
+            logger: Optional logger passed through to the API instances and
+                the group.
+
+        Returns:
+            A HandGroup keyed by 'left' / 'right'.
+
+        Raises:
+            ValueError: If no robot is connected.
+        """
+        hand_configs = {'left': self.config.robots.left_hand_robot,
+                        'right': self.config.robots.right_hand_robot}
+        hands = {side: self.return_api(robot_cfg=self._preflight(robot_cfg, logger), logger=logger)
+                 for side, robot_cfg in hand_configs.items() if robot_cfg.robot_connected}
+        if not hands:
+            raise ValueError("No robot connected")
+        return HandGroup(hands, logger=logger)
+
     # ------------------------------------------------------------------
     # Pre-flight helpers
     # ------------------------------------------------------------------
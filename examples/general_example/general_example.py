@@ -22,7 +22,7 @@ error reports).
 # ---------------------------- Import Libraries --------------------------------
 # ------------------------------------------------------------------------------
 import time
-import json
+from functools import lru_cache
 # Add the desired path to the system path
 import os
 import sys
@@ -35,6 +35,7 @@ from examples.config.configuration import ArtusConfig
 
 # new version of ArtusAPI use local version
 from ArtusAPI.common import ModbusMap
+from ArtusAPI.pose_library import PoseLibrary
 
 # ------------------------------------------------------------------------------
 # -------------------------------- Main Menu -----------------------------------
@@ -113,6 +114,20 @@ def setup_logger(level='ERROR',format='%(asctime)s - %(name)s - %(levelname)s -
 # -------------------------------------------------------------------------------
 # ------------------------------ Command Dispatch --------------------------------
 # -------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _pose_library(hand_poses_path):
+    """Loads the saved hand poses once; frames are encoded on first use per hand.
+
+    Args:
+        hand_poses_path: Directory containing the saved hand pose JSON files.
+
+    Returns:
+        A PoseLibrary that sends the poses' angles with the robot's default
+        velocity and force.
+    """
+    return PoseLibrary(hand_poses_path, angles_only=True)
+
+
 def handle_command(artusapi, user_input, logger, hand_poses_path):
     """Dispatches a single main_menu() selection against an ArtusAPI_V2 instance.
 
@@ -147,23 +162,13 @@ def handle_command(artusapi, user_input, logger, hand_poses_path):
                 return
             artusapi.calibrate(n)
         case '6':
-            with open(os.path.join(hand_poses_path ,'grasp_example.json'),'r') as file:
-                grasp_example_dict = json.load(file)
-            logger.info(f"Setting joint angles to: {grasp_example_dict} and setting velocity and force to defaults")
-            for key,value in grasp_example_dict.items():
-                grasp_example_dict[key]['target_velocity'] = artusapi._robot_handler.robot.default_velocity
-                grasp_example_dict[key]['target_force'] = artusapi._robot_handler.robot.default_force
-            artusapi.set_joint_angles(grasp_example_dict)
+            logger.info("Sending grasp_example with default velocity and force")
+            _pose_library(hand_poses_path).execute(artusapi, 'grasp_example')
         case '7':
             logger.info(artusapi.get_robot_status())
         case '8':
-            with open(os.path.join(hand_poses_path ,'grasp_open.json'),'r') as file:
-                grasp_dict = json.load(file)
-            logger.info(f"Setting joint angles to: {grasp_dict} and setting velocity and force to defaults")
-            for key,value in grasp_dict.items():
-                grasp_dict[key]['target_velocity'] = artusapi._robot_handler.robot.default_velocity
-                grasp_dict[key]['target_force'] = artusapi._robot_handler.robot.default_force
-            artusapi.set_joint_angles(grasp_dict)
+            logger.info("Sending grasp_open with default velocity and force")
+            _pose_library(hand_poses_path).execute(artusapi, 'grasp_open')
         case '9':
             artusapi.get_joint_angles()
         case '10':